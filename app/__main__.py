@@ -1,7 +1,20 @@
-from modules.app import MyApplication
+import sys
 
 
 def main() -> None:
+    # Any argument selects the headless CLI, which never imports GTK
+    if len(sys.argv) > 1:
+        if __package__:
+            from .modules.hyprparser.cli import main as cli_main
+        else:
+            from modules.hyprparser.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+
+    if __package__:
+        from .modules.app import MyApplication
+    else:
+        from modules.app import MyApplication
+
     try:
         MyApplication.run()
     except KeyboardInterrupt:
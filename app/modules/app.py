@@ -4,7 +4,9 @@ from .app_pages import (
     decoration_page,
 )
 from .imports import Adw, Gdk, Gio, Gtk
-from .widgets import Icon, ToastOverlay, MyBezierEditorWindow
+from .events import EventListener
+from .watcher import MyConfigWatcher
+from .widgets import Icon, ToastOverlay, MyBezierEditorWindow, ProfileSwitcher
 from .constants import (
     APP_ID, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, 
     MOBILE_BREAKPOINT, CSS_FILE
@@ -37,6 +39,8 @@ class ApplicationWindow(Adw.ApplicationWindow):
         self.main_content_top_bar_title = Adw.WindowTitle.new(
             'General', 'Gaps, borders, colors, cursor and other settings.'
         )
+        self.profile_switcher = ProfileSwitcher()
+        self.main_content_top_bar.pack_end(self.profile_switcher)
 
         self.main_content.add_top_bar(self.main_content_top_bar)
         self.main_content_top_bar.set_title_widget(
@@ -160,6 +164,8 @@ class Application(Adw.Application):
     def do_activate(self) -> None:
         if not self.window:
             self.window = ApplicationWindow(self)
+            EventListener.start()
+            MyConfigWatcher.start()
         return self.window.present()
 
 
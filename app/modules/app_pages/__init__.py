@@ -6,6 +6,7 @@ from .gestures import gestures_page
 from .group import group_page
 from .idle import idle_page
 from .input import input_page
+from .lock import lock_page
 from .misc import misc_page
 from .variables import variables_page
 from .wallpaper import wallpaper_page
@@ -22,6 +23,7 @@ PAGES_DICT = {
     'Variables': variables_page,
     'Wallpaper': wallpaper_page,
     'Idle': idle_page,
+    'Lock': lock_page,
 }
 
 PAGES_LIST = [
@@ -3,9 +3,11 @@ from ..widgets import (
     SwitchRow,
     BezierGroup,
     InfoButton,
-    ExpanderRow,
+    AnimationPreview,
+    AnimationExpanderRow,
 )
-from ..imports import Adw
+from ..imports import Adw, List
+from ..hyprparser.animations import ANIMATION_CHILDREN
 
 
 animations_page = Adw.PreferencesPage.new()
@@ -28,37 +30,45 @@ settings_animations.add(
     )
 )
 
+settings_preview = PreferencesGroup(
+    "Preview",
+    "How windows, fades, workspaces and the border angle animate.",
+)
+animation_preview = AnimationPreview()
+settings_preview.add(animation_preview)
+
 settings_bezier = BezierGroup()
 settings_anim_tree = PreferencesGroup(
     "Animation Tree",
-    "Animation tree for windows, layers, border and workspaces.",
-)
-settings_anim_tree_windows = ExpanderRow("Windows", "")
-settings_anim_tree_windows_windowsIn = ExpanderRow("Windows In", "Window open")
-settings_anim_tree_windows_windowsOut = ExpanderRow("Windows Out", "Window close")
-settings_anim_tree_windows_windowsMove = ExpanderRow(
-    "Windows In", "Everything in between, moving, dragging and resizing."
+    "Animation tree for windows, layers, fades, borders and workspaces.",
 )
 
-
 settings_anim_tree.set_header_suffix(
     InfoButton(
         "The animations are a tree. If an animation is unset, it will inherit its parent’s values."
     )
 )
 
-for i in [
-    settings_anim_tree_windows_windowsIn,
-    settings_anim_tree_windows_windowsOut,
-    settings_anim_tree_windows_windowsMove,
-]:
-    settings_anim_tree_windows.add_row(i)
 
-for i in [
-    settings_anim_tree_windows,
-]:
-    settings_anim_tree.add(i)
+# Rows of every node, filled by create_animation_row
+animation_rows = {}
+
+
+def on_animations_changed(nodes: List[str]) -> None:
+    for node in nodes:
+        animation_rows[node].refresh()
+    animation_preview.update()
+
+
+def create_animation_row(name: str) -> AnimationExpanderRow:
+    row = animation_rows[name] = AnimationExpanderRow(name, on_animations_changed)
+    for child in ANIMATION_CHILDREN[name]:
+        row.add_row(create_animation_row(child))
+    return row
+
+
+settings_anim_tree.add(create_animation_row("global"))
 
 
-for i in [settings_animations, settings_bezier, settings_anim_tree]:
+for i in [settings_animations, settings_preview, settings_bezier, settings_anim_tree]:
     animations_page.add(i)
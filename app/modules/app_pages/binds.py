@@ -1,5 +1,6 @@
 from ..imports import Adw, Gtk
 from ..widgets import (
+    BindListView,
     PreferencesGroup,
     SwitchRow,
 )
@@ -20,6 +21,32 @@ settings_resolve_binds_by_sym = SwitchRow(
 # Add general settings to group
 settings_general.add(settings_resolve_binds_by_sym)
 
+# Keybinds of the config and the files it sources
+settings_binds = PreferencesGroup(
+    "Keybinds", "Every bind, in config order. Binds marked with a warning use a key combination that is already bound."
+)
+
+bind_list = BindListView()
+bind_list.set_margin_top(12)
+bind_list.set_margin_bottom(12)
+
+bind_list_row = Adw.PreferencesRow()
+bind_list_row.set_activatable(False)
+bind_list_row.set_child(bind_list)
+
+add_bind_row = Adw.EntryRow()
+add_bind_row.set_title("Add bind (MODIFIERS, KEY, DISPATCHER, PARAMS)")
+add_bind_row.set_show_apply_button(True)
+
+def on_add_bind_applied(row):
+    if bind_list.add_bind(row.get_text()):
+        row.set_text("")
+
+add_bind_row.connect("apply", on_add_bind_applied)
+
+settings_binds.add(bind_list_row)
+settings_binds.add(add_bind_row)
+
 # Information Section
 settings_info = PreferencesGroup(
     "Keybinding Information", "Quick reference for Hyprland keybinding syntax and common patterns."
@@ -63,9 +90,8 @@ info_text = """<b>Hyprland Keybinding Syntax:</b>
 <tt>bindm = SUPER, mouse:272, movewindow</tt>
 <tt>bindm = SUPER, mouse:273, resizewindow</tt>
 
-<b>Note:</b> This page shows general settings only. 
-For detailed keybinding management, edit your <tt>hyprland.conf</tt> file directly.
-You can view current binds with: <tt>hyprctl binds</tt>"""
+<b>Note:</b> Binds added here go to the end of <tt>hyprland.conf</tt>.
+You can view the binds Hyprland has loaded with: <tt>hyprctl binds</tt>"""
 
 # Create a scrollable text view for the information
 info_scrolled = Gtk.ScrolledWindow()
@@ -179,6 +205,7 @@ settings_commands.add(commands_row)
 # Add all groups to the page
 for group in [
     settings_general,
+    settings_binds,
     settings_info,
     settings_commands,
 ]:
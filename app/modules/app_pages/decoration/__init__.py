@@ -39,64 +39,54 @@ settings_opacity_active = SpinRow(
     "Active Opacity",
     "Opacity of active windows.",
     "decoration:active_opacity",
-    data_type=float,
-    max=1.0,
 )
 
 settings_opacity_inactive = SpinRow(
     "Inactive Opacity",
     "Opacity of inactive windows.",
     "decoration:inactive_opacity",
-    data_type=float,
-    max=1.0,
 )
 settings_opacity_fullscreen = SpinRow(
     "Fullscreen Opacity",
     "Opacity of fullscreen windows.",
     "decoration:fullscreen_opacity",
-    data_type=float,
-    max=1.0,
 )
 
 settings_shadow = PreferencesGroup("Shadow", "Drop shadow, range, power and colors.")
 settings_shadow_drop_shadow = SwitchRow(
-    "Drop Shadow", "Enable drop shadows on windows.", "decoration:drop_shadow"
+    "Drop Shadow", "Enable drop shadows on windows.", "decoration:shadow:enabled"
 )
 settings_shadow_range = SpinRow(
     "Shadow Range",
     "Shadow range (“size”) in layout px.",
-    "decoration:shadow_range",
+    "decoration:shadow:range",
 )
 settings_shadow_render_power = SpinRow(
     "Shadow Render Power",
     "In what power to render the falloff (more power, the faster the falloff).",
-    "decoration:shadow_render_power",
-    min=1,
-    max=4,
+    "decoration:shadow:render_power",
 )
 
 
 settings_shadow_ignore_window = SwitchRow(
     "Shadow Ignore Window",
     "If enabled, the shadow will not be rendered behind the window itself, only around it.",
-    "decoration:shadow_ignore_window",
+    "decoration:shadow:ignore_window",
 )
 settings_shadow_color = ColorEntryRow(
     "Shadow's Color",
     "Shadow's color. Alpha dictates shadow’s opacity.",
-    "decoration:col.shadow",
+    "decoration:shadow:color",
 )
 settings_shadow_color_inactive = ColorEntryRow(
     "Inactive Shadow Color",
-    "Inactive shadow color. If not set, will fall back to <b><tt>col.shadow</tt></b>.",
-    "decoration:col.shadow_inactive",
+    "Inactive shadow color. If not set, will fall back to <b><tt>color</tt></b>.",
+    "decoration:shadow:color_inactive",
 )
 settings_shadow_scale = SpinRow(
     "Shadow's Scale",
     "Shadow's scale.",
-    "decoration:shadow_scale",
-    max=1.0,
-    data_type=float,
+    "decoration:shadow:scale",
 )
 settings_dim = PreferencesGroup("Dim", "Change dim settings.")
 settings_dim_inactive_window = SwitchRow(
@@ -108,22 +98,16 @@ settings_dim_strenght = SpinRow(
     "Dim Strenght",
     "How much inactive windows should be dimmed.",
     "decoration:dim_strength",
-    data_type=float,
-    max=1.0,
 )
 settings_dim_special = SpinRow(
     "Dim Special",
     "How much to dim the rest of the screen by when a special workspace is open.",
     "decoration:dim_special",
-    data_type=float,
-    max=1.0,
 )
 settings_dim_around = SpinRow(
     "Dim Around",
     "How much the <b><tt>dimaround</tt></b> window rule should dim by.",
     "decoration:dim_around",
-    data_type=float,
-    max=1.0,
 )
 
 for i in [
@@ -9,14 +9,11 @@ blur_page_content: Adw.PreferencesPage = blur_page.get_child()  # type: ignore
 
 settings_blur = PreferencesGroup("", "")
 
-settings_blur_size = SpinRow(
-    "Blur Size", "Blur size (distance).", "decoration:blur:size", min=1
-)
+settings_blur_size = SpinRow("Blur Size", "Blur size (distance).", "decoration:blur:size")
 settings_blur_passes = SpinRow(
     "Blur Passes",
     "The amount of passes to perform.",
     "decoration:blur:passes",
-    min=1,
 )
 
 settings_blur_ignore_opacity = SwitchRow(
@@ -39,40 +36,30 @@ settings_blur_noise = SpinRow(
     "Blur Noise",
     "How much noise to apply.",
     "decoration:blur:noise",
-    data_type=float,
-    max=1,
     decimal_digits=4,
 )
 settings_blur_contrast = SpinRow(
     "Blur Contrast",
     "Contrast modulation for blur.",
     "decoration:blur:contrast",
-    data_type=float,
-    max=2,
     decimal_digits=4,
 )
 settings_blur_brightness = SpinRow(
     "Blur Brightness",
     "Brightness modulation for blur.",
     "decoration:blur:brightness",
-    data_type=float,
-    max=2,
     decimal_digits=4,
 )
 settings_blur_vibrancy = SpinRow(
     "Vibrancy",
     "Increase saturation of blurred colors.",
     "decoration:blur:vibrancy",
-    data_type=float,
-    max=1,
     decimal_digits=4,
 )
 settings_blur_vibrancy_darkness = SpinRow(
     "Vibrancy Darkness",
     "How strong the effect of <b><tt>vibrancy</tt></b> is on dark areas.",
     "decoration:blur:vibrancy_darkness",
-    data_type=float,
-    max=1,
     decimal_digits=4,
 )
 settings_blur_special = SwitchRow(
@@ -89,8 +76,6 @@ settings_blur_popups_ignorealpha = SpinRow(
     "Popups Ignore Alpha",
     "Works like ignorealpha in layer rules. If pixel opacity is below set value, will not blur.",
     "decoration:blur:popups_ignorealpha",
-    data_type=float,
-    max=1,
 )
 
 
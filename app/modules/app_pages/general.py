@@ -1,4 +1,4 @@
-from ..imports import Setting, Adw, Gtk, HyprData
+from ..imports import Adw, Gtk, Workspace
 
 from ..widgets import (
     CheckButtonImage,
@@ -140,13 +140,7 @@ settings_other_layout_checkbutton_master.checkbutton.set_group(
 )
 
 
-default = HyprData.get_option("general:layout")
-
-if not default:
-    HyprData.new_option(Setting("general:layout", "dwindle"))
-    default = "dwindle"  # type: ignore
-else:
-    default = default.value
+default = Workspace.get_value("general:layout", "dwindle")
 
 if default == "master":
     settings_other_layout_checkbutton_master.checkbutton.set_active(True)
@@ -22,16 +22,12 @@ settings_workspace_swipe_fingers = SpinRow(
     "Swipe Fingers",
     "Number of fingers required for the workspace swipe gesture.",
     "gestures:workspace_swipe_fingers",
-    min=2,
-    max=5,
 )
 
 settings_workspace_swipe_distance = SpinRow(
     "Swipe Distance",
     "Distance in pixels for the workspace swipe gesture.",
     "gestures:workspace_swipe_distance",
-    min=100,
-    max=2000,
 )
 
 settings_workspace_swipe_invert = SwitchRow(
@@ -44,17 +40,12 @@ settings_workspace_swipe_min_speed_to_force = SpinRow(
     "Min Speed to Force",
     "Minimum speed in px per timepoint to force the change ignoring cancel ratio. Set to 0 to disable.",
     "gestures:workspace_swipe_min_speed_to_force",
-    min=0,
-    max=100,
 )
 
 settings_workspace_swipe_cancel_ratio = SpinRow(
     "Cancel Ratio",
     "How much the swipe has to proceed to commence it (0.0-1.0). If > ratio * distance, switch workspace, otherwise revert.",
     "gestures:workspace_swipe_cancel_ratio",
-    data_type=float,
-    min=0.0,
-    max=1.0,
 )
 
 settings_workspace_swipe_create_new = SwitchRow(
@@ -73,8 +64,6 @@ settings_workspace_swipe_direction_lock_threshold = SpinRow(
     "Direction Lock Threshold",
     "In px, the distance to travel before direction lock activates.",
     "gestures:workspace_swipe_direction_lock_threshold",
-    min=10,
-    max=500,
 )
 
 settings_workspace_swipe_forever = SwitchRow(
@@ -60,8 +60,6 @@ settings_groupbar_font_size = SpinRow(
     "Font Size",
     "Font size for the groupbar text.",
     "group:groupbar:font_size",
-    min=6,
-    max=72,
 )
 
 settings_groupbar_gradients = SwitchRow(
@@ -74,16 +72,12 @@ settings_groupbar_height = SpinRow(
     "Groupbar Height",
     "Height of the groupbar.",
     "group:groupbar:height",
-    min=10,
-    max=200,
 )
 
 settings_groupbar_priority = SpinRow(
     "Priority",
     "Priority of the groupbar over other decorations. Higher values mean higher priority.",
     "group:groupbar:priority",
-    min=0,
-    max=10,
 )
 
 settings_groupbar_render_titles = SwitchRow(
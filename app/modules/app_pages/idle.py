@@ -1,9 +1,16 @@
-from ..imports import Adw, Gtk
+from ..imports import Adw, Gtk, Workspace
 from ..widgets import (
+    BlockExpanderRow,
+    ButtonRow,
     PreferencesGroup,
     SwitchRow,
+    TextEntryRow,
+    ToastOverlay,
 )
 
+# hypridle.conf, edited through the workspace
+hypridle = Workspace.manager("hypridle")
+
 idle_page = Adw.PreferencesPage.new()
 
 # General Idle Settings
@@ -14,21 +21,85 @@ settings_general = PreferencesGroup(
 settings_ignore_dbus_inhibit = SwitchRow(
     "Ignore DBus Inhibit",
     "Ignore dbus-sent idle inhibit events (e.g., from Firefox or Steam).",
-    "hypridle:ignore_dbus_inhibit",
+    "hypridle:general:ignore_dbus_inhibit",
 )
 
 settings_ignore_systemd_inhibit = SwitchRow(
     "Ignore Systemd Inhibit",
     "Ignore systemd-inhibit --what=idle inhibitors.",
-    "hypridle:ignore_systemd_inhibit",
+    "hypridle:general:ignore_systemd_inhibit",
 )
 
 settings_ignore_wayland_inhibit = SwitchRow(
     "Ignore Wayland Inhibit",
     "Ignore Wayland protocol idle inhibitors.",
-    "hypridle:ignore_wayland_inhibit",
+    "hypridle:general:ignore_wayland_inhibit",
+)
+
+settings_lock_cmd = TextEntryRow(
+    "Lock Command",
+    "Command to run on the dbus lock event (e.g., loginctl lock-session).",
+    "hypridle:general:lock_cmd",
+    "pidof hyprlock || hyprlock",
+)
+
+settings_unlock_cmd = TextEntryRow(
+    "Unlock Command",
+    "Command to run on the dbus unlock event.",
+    "hypridle:general:unlock_cmd",
+)
+
+settings_before_sleep_cmd = TextEntryRow(
+    "Before Sleep Command",
+    "Command to run before the system goes to sleep.",
+    "hypridle:general:before_sleep_cmd",
+    "loginctl lock-session",
+)
+
+settings_after_sleep_cmd = TextEntryRow(
+    "After Sleep Command",
+    "Command to run after the system wakes up.",
+    "hypridle:general:after_sleep_cmd",
+    "hyprctl dispatch dpms on",
 )
 
+# Listeners, one `listener { }` block each
+LISTENER_OPTIONS = (
+    ("timeout", "Timeout (seconds)", "int"),
+    ("on-timeout", "On Timeout", "text"),
+    ("on-resume", "On Resume", "text"),
+)
+
+settings_listeners = PreferencesGroup(
+    "Listeners", "Commands to run after being idle for a while, and when activity resumes."
+)
+
+
+def listener_row(block_id: int) -> BlockExpanderRow:
+    row = BlockExpanderRow(hypridle, block_id, LISTENER_OPTIONS, remove_listener_row)
+    timeout = hypridle.get_block(block_id).get("timeout")
+    row.set_title(f"After {timeout} seconds" if timeout is not None else "Listener")
+    return row
+
+
+def remove_listener_row(row: BlockExpanderRow) -> None:
+    settings_listeners.remove(row)
+
+
+def add_listener(*_) -> None:
+    block = hypridle.add_block("listener", {"timeout": 300})
+    settings_listeners.add(listener_row(block.id))
+    ToastOverlay.add_change()
+
+
+settings_add_listener = ButtonRow(
+    "list-add-symbolic", "Add Listener", "Adds a listener with a 5 minute timeout.", add_listener
+)
+settings_listeners.add(settings_add_listener)
+
+for listener in hypridle.get_blocks("listener"):
+    settings_listeners.add(listener_row(listener.id))
+
 # Information Section
 settings_info = PreferencesGroup(
     "Hypridle Configuration", "Guide for setting up idle management with hypridle."
@@ -240,10 +311,15 @@ settings_commands.add(commands_row)
 settings_general.add(settings_ignore_dbus_inhibit)
 settings_general.add(settings_ignore_systemd_inhibit)
 settings_general.add(settings_ignore_wayland_inhibit)
+settings_general.add(settings_lock_cmd)
+settings_general.add(settings_unlock_cmd)
+settings_general.add(settings_before_sleep_cmd)
+settings_general.add(settings_after_sleep_cmd)
 
 # Add all groups to the page
 for group in [
     settings_general,
+    settings_listeners,
     settings_info,
     settings_commands,
 ]:
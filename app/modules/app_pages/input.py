@@ -1,9 +1,11 @@
 from ..imports import Setting, Adw, Gtk, HyprData
 from ..widgets import (
+    DeviceExpanderRow,
     PreferencesGroup,
     SpinRow,
     SwitchRow,
     TextEntryRow,
+    ToastOverlay,
 )
 
 input_page = Adw.PreferencesPage.new()
@@ -48,16 +50,12 @@ settings_keyboard_repeat_rate = SpinRow(
     "Repeat Rate",
     "The rate of repeating keys in Hz.",
     "input:repeat_rate",
-    min=1,
-    max=100,
 )
 
 settings_keyboard_repeat_delay = SpinRow(
     "Repeat Delay", 
     "Delay before a key starts repeating (in ms).",
     "input:repeat_delay",
-    min=100,
-    max=2000,
 )
 
 settings_keyboard_numlock_by_default = SwitchRow(
@@ -75,9 +73,6 @@ settings_mouse_sensitivity = SpinRow(
     "Mouse Sensitivity",
     "Sets the mouse sensitivity. Value between -1.0 and 1.0.",
     "input:sensitivity",
-    data_type=float,
-    min=-1.0,
-    max=1.0,
 )
 
 settings_mouse_accel_profile = TextEntryRow(
@@ -110,8 +105,6 @@ settings_mouse_scroll_button = SpinRow(
     "Scroll Button",
     "Sets the scroll button. Has to be an int, cannot be a string.",
     "input:scroll_button",
-    min=0,
-    max=10,
 )
 
 settings_mouse_natural_scroll = SwitchRow(
@@ -129,8 +122,6 @@ settings_focus_follow_mouse = SpinRow(
     "Follow Mouse",
     "Cursor focus mode. 0 - disabled, 1 - loose, 2 - strict, 3 - always on top.",
     "input:follow_mouse",
-    min=0,
-    max=3,
 )
 
 settings_focus_mouse_refocus = SwitchRow(
@@ -202,9 +193,6 @@ settings_touchpad_scroll_factor = SpinRow(
     "Scroll Factor",
     "Multiplier applied to the amount of scroll movement.",
     "input:touchpad:scroll_factor",
-    data_type=float,
-    min=0.1,
-    max=10.0,
 )
 
 # Special Keys and Advanced Settings
@@ -221,17 +209,13 @@ settings_special_resolve_binds_by_sym = SwitchRow(
 settings_special_emulate_discrete_scroll = SpinRow(
     "Emulate Discrete Scroll",
     "Emulate discrete scrolling from high resolution scrolling. 0 to disable, 1 for logitech mice, 2 for other mice.",
-    "input:emulate_discrete_scroll", 
-    min=0,
-    max=2,
+    "input:emulate_discrete_scroll",
 )
 
 settings_special_off_window_axis_events = SpinRow(
     "Off Window Axis Events",
     "Handles axis events around windows. 0 ignores axis events outside of windows, 1 sends them to the window below cursor, 2 sends them to the focused window.",
     "input:off_window_axis_events",
-    min=0,
-    max=2,
 )
 
 # Add all widgets to their respective groups
@@ -296,6 +280,37 @@ for widget in touchpad_widgets:
 for widget in special_widgets:
     settings_special.add(widget)
 
+# Per-device settings, one `device { }` block each
+settings_devices = PreferencesGroup(
+    "Devices", "Override input options for single devices. Names are listed by hyprctl devices."
+)
+
+settings_add_device = Adw.EntryRow(title="Add device by name")
+settings_add_device.set_show_apply_button(True)
+
+
+def remove_device_row(row: DeviceExpanderRow) -> None:
+    settings_devices.remove(row)
+
+
+def add_device(entry: Adw.EntryRow) -> None:
+    name = entry.get_text().strip()
+    try:
+        block = HyprData.add_block("device", {"name": name})
+    except ValueError as e:
+        ToastOverlay.show_message(str(e))
+        return
+    entry.set_text("")
+    settings_devices.add(DeviceExpanderRow(block.id, remove_device_row))
+    ToastOverlay.add_change()
+
+
+settings_add_device.connect("apply", add_device)
+settings_devices.add(settings_add_device)
+
+for device in HyprData.get_blocks("device"):
+    settings_devices.add(DeviceExpanderRow(device.id, remove_device_row))
+
 # Add all groups to the page
 for group in [
     settings_keyboard,
@@ -303,5 +318,6 @@ for group in [
     settings_focus,
     settings_touchpad,
     settings_special,
+    settings_devices,
 ]:
     input_page.add(group)
\ No newline at end of file
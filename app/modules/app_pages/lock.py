@@ -0,0 +1,64 @@
+from ..imports import Adw
+from ..widgets import (
+    PreferencesGroup,
+    SpinRow,
+    SwitchRow,
+)
+
+lock_page = Adw.PreferencesPage.new()
+
+# General Lock Settings, written to hyprlock.conf
+settings_general = PreferencesGroup(
+    "General Lock Settings", "Configure the general behavior of hyprlock."
+)
+
+settings_hide_cursor = SwitchRow(
+    "Hide Cursor",
+    "Hide the cursor instead of making it visible.",
+    "hyprlock:general:hide_cursor",
+)
+
+settings_grace = SpinRow(
+    "Grace Period",
+    "Seconds after locking during which any input unlocks the session.",
+    "hyprlock:general:grace",
+    int,
+    0,
+    3600,
+)
+
+settings_ignore_empty_input = SwitchRow(
+    "Ignore Empty Input",
+    "Skip validation when no password is provided.",
+    "hyprlock:general:ignore_empty_input",
+)
+
+settings_immediate_render = SwitchRow(
+    "Immediate Render",
+    "Make hyprlock render immediately, without waiting for screenshots.",
+    "hyprlock:general:immediate_render",
+)
+
+settings_fail_timeout = SpinRow(
+    "Fail Timeout",
+    "Milliseconds before the input field is cleared after a failed attempt.",
+    "hyprlock:general:fail_timeout",
+    int,
+    0,
+    10000,
+)
+
+for widget in [
+    settings_hide_cursor,
+    settings_grace,
+    settings_ignore_empty_input,
+    settings_immediate_render,
+    settings_fail_timeout,
+]:
+    settings_general.add(widget)
+
+# Add all groups to the page
+for group in [
+    settings_general,
+]:
+    lock_page.add(group)
@@ -1,5 +1,6 @@
 from ..imports import Adw
 from ..widgets import (
+    ColorEntryRow,
     PreferencesGroup,
     SpinRow,
     SwitchRow,
@@ -23,8 +24,6 @@ settings_vrr = SpinRow(
     "Variable Refresh Rate (VRR)",
     "0 = disabled, 1 = always enabled, 2 = only for fullscreen applications.",
     "misc:vrr",
-    min=0,
-    max=2,
 )
 
 settings_no_direct_scanout = SwitchRow(
@@ -126,8 +125,6 @@ settings_force_default_wallpaper = SpinRow(
     "Force Default Wallpaper",
     "-1 = default, 0 or 1 = disable the anime mascot wallpapers.",
     "misc:force_default_wallpaper",
-    min=-1,
-    max=1,
 )
 
 settings_disable_hyprland_logo = SwitchRow(
@@ -136,12 +133,10 @@ settings_disable_hyprland_logo = SwitchRow(
     "misc:disable_hyprland_logo",
 )
 
-settings_background_color = SpinRow(
+settings_background_color = ColorEntryRow(
     "Background Color",
-    "Background color in hex format (0xRRGGBB or 0xRRGGBBAA).",
+    "Color shown behind the wallpaper, or instead of it.",
     "misc:background_color",
-    min=0,
-    max=4294967295,  # 0xFFFFFFFF
 )
 
 # Performance and Rendering
@@ -159,8 +154,6 @@ settings_render_ahead_safezone = SpinRow(
     "Render Ahead Safezone",
     "How many milliseconds of safezone to add to rendering ahead of time.",
     "misc:render_ahead_safezone",
-    min=0,
-    max=100,
 )
 
 settings_allow_session_lock_restore = SwitchRow(
@@ -1,12 +1,24 @@
-from ..imports import Adw, Gtk
+from ..imports import Adw, Gtk, HyprData, Scanner
 from ..widgets import (
     PreferencesGroup,
     TextEntryRow,
     SwitchRow,
+    VariableEntryRow,
 )
+import os
 
 variables_page = Adw.PreferencesPage.new()
 
+# $variables defined in the config
+settings_config_variables = PreferencesGroup(
+    "Config Variables",
+    "Values of $variables used in options, binds and rules. Options that use a variable are updated when it changes.",
+)
+
+for name in HyprData.variables:
+    settings_config_variables.add(VariableEntryRow(name))
+settings_config_variables.set_visible(bool(HyprData.variables))
+
 # Toolkit Backend Variables
 settings_toolkit = PreferencesGroup(
     "Toolkit Backends", "Configure application toolkit backends for Wayland compatibility."
@@ -130,6 +142,51 @@ settings_hyprcursor_size = TextEntryRow(
     "24"
 )
 
+# Cursor themes are folders with a cursors/ directory in the icon paths
+CURSOR_THEME_DIRS = [
+    os.path.expanduser("~/.local/share/icons"),
+    os.path.expanduser("~/.icons"),
+] + [
+    os.path.join(data_dir, "icons")
+    for data_dir in (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    if data_dir
+]
+
+cursor_theme_names = Gtk.StringList.new(["Choose an installed theme"])
+cursor_themes_found = set()
+
+settings_cursor_theme_picker = Adw.ComboRow(
+    title="Installed Cursor Themes",
+    subtitle="Sets the X cursor theme.",
+    model=cursor_theme_names,
+)
+
+
+def is_cursor_theme(entry) -> bool:
+    # Stats every theme folder, so it runs on the scanner's worker
+    return entry.is_dir and os.path.isdir(os.path.join(entry.path, "cursors"))
+
+
+def add_cursor_themes(entries) -> None:
+    names = [entry.name for entry in entries if entry.name not in cursor_themes_found]
+    cursor_themes_found.update(names)
+    cursor_theme_names.splice(cursor_theme_names.get_n_items(), 0, names)
+
+
+def on_cursor_theme_selected(row: Adw.ComboRow, *_) -> None:
+    position = row.get_selected()
+    if position == 0 or position == Gtk.INVALID_LIST_POSITION:
+        return
+    settings_xcursor_theme.entry.set_text(cursor_theme_names.get_string(position))
+    settings_xcursor_theme.save_value()
+
+
+settings_cursor_theme_picker.connect("notify::selected", on_cursor_theme_selected)
+
+for icon_dir in dict.fromkeys(CURSOR_THEME_DIRS):
+    if os.path.isdir(icon_dir):
+        Scanner.scan(icon_dir, add_cursor_themes, accept=is_cursor_theme)
+
 settings_gtk_theme = TextEntryRow(
     "GTK Theme",
     "GTK theme name for manual theme setting.",
@@ -269,6 +326,7 @@ for widget in xdg_widgets:
 # Add all theming widgets to the group
 theming_widgets = [
     settings_xcursor_theme,
+    settings_cursor_theme_picker,
     settings_xcursor_size,
     settings_hyprcursor_theme,
     settings_hyprcursor_size,
@@ -299,6 +357,7 @@ for widget in aquamarine_widgets:
 
 # Add all groups to the page
 for group in [
+    settings_config_variables,
     settings_toolkit,
     settings_qt,
     settings_xdg,
@@ -1,8 +1,13 @@
 from ..imports import Adw, Gtk
 from ..widgets import (
+    Palette,
     PreferencesGroup,
+    SpinRow,
     SwitchRow,
+    ToastOverlay,
+    WallpaperGrid,
 )
+import os
 
 wallpaper_page = Adw.PreferencesPage.new()
 
@@ -23,6 +28,76 @@ settings_disable_hyprland_logo = SwitchRow(
     "misc:disable_hyprland_logo",
 )
 
+# hyprpaper.conf, edited through the workspace
+settings_hyprpaper = PreferencesGroup(
+    "Hyprpaper", "Options of hyprpaper.conf. Wallpapers are set with preload and wallpaper lines."
+)
+
+settings_ipc = SwitchRow(
+    "IPC",
+    "Allow changing wallpapers at runtime with hyprctl hyprpaper.",
+    "hyprpaper:ipc",
+)
+
+settings_splash = SwitchRow(
+    "Splash Text",
+    "Render the Hyprland splash text over the wallpaper.",
+    "hyprpaper:splash",
+)
+
+settings_splash_offset = SpinRow(
+    "Splash Offset",
+    "How far up the splash text is shown, in percent of the screen height.",
+    "hyprpaper:splash_offset",
+    float,
+    0,
+    100,
+    1,
+)
+
+settings_hyprpaper.add(settings_ipc)
+settings_hyprpaper.add(settings_splash)
+settings_hyprpaper.add(settings_splash_offset)
+
+# Wallpaper picker
+settings_picker = PreferencesGroup(
+    "Wallpapers", "Click an image to show it with hyprpaper on every monitor. Color options then suggest its colors."
+)
+
+
+def default_wallpaper_folder() -> str:
+    for folder in ("~/Pictures/Wallpapers", "~/Pictures/wallpapers", "~/Pictures"):
+        folder = os.path.expanduser(folder)
+        if os.path.isdir(folder):
+            return folder
+    return os.path.expanduser("~")
+
+
+def set_wallpaper(path: str) -> None:
+    import subprocess
+    try:
+        subprocess.run(["hyprctl", "hyprpaper", "preload", path], check=True, capture_output=True)
+        subprocess.run(["hyprctl", "hyprpaper", "wallpaper", f",{path}"], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        ToastOverlay.show_message("Cannot set the wallpaper, is hyprpaper running?")
+        return
+    # Border and background colors on the other pages suggest its colors
+    Palette.extract(path)
+
+
+settings_wallpaper_folder = Adw.EntryRow(title="Folder")
+settings_wallpaper_folder.set_show_apply_button(True)
+settings_wallpaper_folder.set_text(default_wallpaper_folder())
+
+wallpaper_grid = WallpaperGrid(set_wallpaper)
+settings_wallpaper_folder.connect(
+    "apply", lambda entry: wallpaper_grid.set_folder(os.path.expanduser(entry.get_text().strip()))
+)
+wallpaper_grid.set_folder(settings_wallpaper_folder.get_text())
+
+settings_picker.add(settings_wallpaper_folder)
+settings_picker.add(wallpaper_grid)
+
 # Information Section
 settings_info = PreferencesGroup(
     "Hyprpaper Configuration", "Guide for setting up wallpapers with hyprpaper."
@@ -200,6 +275,8 @@ settings_wallpaper.add(settings_disable_hyprland_logo)
 # Add all groups to the page
 for group in [
     settings_wallpaper,
+    settings_picker,
+    settings_hyprpaper,
     settings_info,
     settings_commands,
 ]:
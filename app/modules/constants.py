@@ -51,4 +51,8 @@ MAX_GAP_VALUE = 100
 MAX_BORDER_SIZE = 20
 MAX_SHADOW_RANGE = 50
 MAX_OPACITY = 1.0
-MIN_OPACITY = 0.0
\ No newline at end of file
+MIN_OPACITY = 0.0
+
+# Animation Preview
+ANIMATION_PREVIEW_HEIGHT = 150
+ANIMATION_PREVIEW_HOLD_MS = 700
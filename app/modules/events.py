@@ -0,0 +1,44 @@
+from .imports import GLib, HyprData
+from .hyprparser.ipc import EventBus, EventSocketReader
+
+
+class HyprEventListener:
+    """Reads Hyprland's event socket from inside the GLib main loop."""
+
+    def __init__(self, bus: EventBus) -> None:
+        self.bus = bus
+        self.reader = EventSocketReader(bus)
+        self._watch_id = 0
+
+    def start(self) -> bool:
+        if self._watch_id or not self.reader.connect():
+            return bool(self._watch_id)
+
+        self._watch_id = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            self.reader.fileno(),
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self.on_readable,
+        )
+        return True
+
+    def stop(self) -> None:
+        if self._watch_id:
+            GLib.source_remove(self._watch_id)
+            self._watch_id = 0
+        self.reader.close()
+
+    def on_readable(self, _fd: int, condition: GLib.IOCondition) -> bool:
+        alive = self.reader.read_available()
+
+        if not alive or condition & (GLib.IOCondition.HUP | GLib.IOCondition.ERR):
+            # Returning False removes the watch
+            self._watch_id = 0
+            self.reader.close()
+            return False
+        return True
+
+
+HyprEvents = EventBus()
+EventListener = HyprEventListener(HyprEvents)
+HyprData.attach_events(HyprEvents)
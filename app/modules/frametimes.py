@@ -0,0 +1,63 @@
+"""
+Frame time measurements for the widgets that draw themselves.
+
+Run with HYPRSET_FRAME_TIMES=1 to have them print how long their draw
+function took, e.g. after each drag in the bezier editor. Without it
+nothing is recorded.
+"""
+
+import os
+from collections import deque
+from typing import Deque, Dict, Optional
+
+ENV_VARIABLE = 'HYPRSET_FRAME_TIMES'
+
+# Frames kept per widget
+MAX_SAMPLES = 600
+
+
+class FrameTimes:
+    """Durations of the latest frames of one widget."""
+
+    def __init__(self, name: str, max_samples: int = MAX_SAMPLES):
+        self.name = name
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+    @classmethod
+    def from_environment(cls, name: str) -> Optional['FrameTimes']:
+        """Get a recorder if HYPRSET_FRAME_TIMES is set, None otherwise."""
+        if os.environ.get(ENV_VARIABLE, '') in ('', '0'):
+            return None
+        return cls(name)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Summarize the frames recorded so far.
+
+        Returns:
+            frames, and mean, p95 and max in milliseconds (empty if no frame was recorded)
+        """
+        if not self.samples:
+            return {}
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return {
+            'frames': len(ordered),
+            'mean': sum(ordered) / len(ordered) * 1000,
+            'p95': p95 * 1000,
+            'max': ordered[-1] * 1000,
+        }
+
+    def report(self) -> str:
+        """Describe the frames recorded since the last report, and start over."""
+        stats = self.stats()
+        self.samples.clear()
+        if not stats:
+            return f"{self.name}: no frames"
+        return (
+            f"{self.name}: {stats['frames']:.0f} frames, mean {stats['mean']:.2f} ms, "
+            f"p95 {stats['p95']:.2f} ms, max {stats['max']:.2f} ms"
+        )
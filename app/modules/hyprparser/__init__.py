@@ -5,7 +5,12 @@ A replacement for hyprparser-py with full Hyprland config format support.
 Provides backward-compatible API for seamless integration.
 """
 
+from .binds import Bind, format_modmask
 from .data_types import Setting, Color, Bezier, Gradient
+from .defaults import DEFAULTS
 from .manager import HyprData
+from .profiles import ProfileError
+from .schema import OptionSpec, get_spec
+from .workspace import HyprWorkspace, Workspace
 
-__all__ = ['Setting', 'Color', 'Bezier', 'Gradient', 'HyprData']
\ No newline at end of file
+__all__ = ['Setting', 'Color', 'Bezier', 'Gradient', 'Bind', 'format_modmask', 'HyprData', 'DEFAULTS', 'OptionSpec', 'ProfileError', 'get_spec', 'HyprWorkspace', 'Workspace']
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""Generated by `python -m app.modules.hyprparser.defaults` from `hyprctl descriptions -j`. Do not edit."""
+
+from .data_types import Color
+
+
+VALUES = {
+    'general:border_size': 1,
+    'general:no_border_on_floating': False,
+    'general:gaps_in': 5,
+    'general:gaps_out': 20,
+    'general:gaps_workspaces': 0,
+    'general:col.inactive_border': Color(68, 68, 68, 255),
+    'general:col.active_border': Color(255, 255, 255, 255),
+    'general:col.nogroup_border': Color(255, 170, 255, 255),
+    'general:col.nogroup_border_active': Color(255, 0, 255, 255),
+    'general:layout': 'dwindle',
+    'general:no_focus_fallback': False,
+    'general:resize_on_border': False,
+    'general:extend_border_grab_area': 15,
+    'general:hover_icon_on_border': True,
+    'general:allow_tearing': False,
+    'general:resize_corner': 0,
+    'general:snap:enabled': False,
+    'general:snap:window_gap': 10,
+    'general:snap:monitor_gap': 10,
+    'general:snap:border_overlap': False,
+    'decoration:rounding': 0,
+    'decoration:rounding_power': 2.0,
+    'decoration:active_opacity': 1.0,
+    'decoration:inactive_opacity': 1.0,
+    'decoration:fullscreen_opacity': 1.0,
+    'decoration:dim_inactive': False,
+    'decoration:dim_strength': 0.5,
+    'decoration:dim_special': 0.2,
+    'decoration:dim_around': 0.4,
+    'decoration:screen_shader': '',
+    'decoration:border_part_of_window': True,
+    'decoration:blur:enabled': True,
+    'decoration:blur:size': 8,
+    'decoration:blur:passes': 1,
+    'decoration:blur:ignore_opacity': True,
+    'decoration:blur:new_optimizations': True,
+    'decoration:blur:xray': False,
+    'decoration:blur:noise': 0.0117,
+    'decoration:blur:contrast': 0.8916,
+    'decoration:blur:brightness': 0.8172,
+    'decoration:blur:vibrancy': 0.1696,
+    'decoration:blur:vibrancy_darkness': 0.0,
+    'decoration:blur:special': False,
+    'decoration:blur:popups': False,
+    'decoration:blur:popups_ignorealpha': 0.2,
+    'decoration:blur:input_methods': False,
+    'decoration:blur:input_methods_ignorealpha': 0.2,
+    'decoration:shadow:enabled': True,
+    'decoration:shadow:range': 4,
+    'decoration:shadow:render_power': 3,
+    'decoration:shadow:sharp': False,
+    'decoration:shadow:ignore_window': True,
+    'decoration:shadow:color': Color(26, 26, 26, 238),
+    'decoration:shadow:offset': '0 0',
+    'decoration:shadow:scale': 1.0,
+    'animations:enabled': True,
+    'animations:first_launch_animation': True,
+    'animations:workspace_wraparound': False,
+    'input:kb_model': '',
+    'input:kb_layout': 'us',
+    'input:kb_variant': '',
+    'input:kb_options': '',
+    'input:kb_rules': '',
+    'input:kb_file': '',
+    'input:numlock_by_default': False,
+    'input:resolve_binds_by_sym': False,
+    'input:repeat_rate': 25,
+    'input:repeat_delay': 600,
+    'input:sensitivity': 0.0,
+    'input:accel_profile': '',
+    'input:force_no_accel': False,
+    'input:left_handed': False,
+    'input:scroll_points': '',
+    'input:scroll_method': '',
+    'input:scroll_button': 0,
+    'input:scroll_button_lock': False,
+    'input:scroll_factor': 1.0,
+    'input:natural_scroll': False,
+    'input:follow_mouse': 1,
+    'input:focus_on_close': 0,
+    'input:mouse_refocus': True,
+    'input:float_switch_override_focus': 1,
+    'input:special_fallthrough': False,
+    'input:off_window_axis_events': 1,
+    'input:emulate_discrete_scroll': 1,
+    'input:touchpad:disable_while_typing': True,
+    'input:touchpad:natural_scroll': False,
+    'input:touchpad:scroll_factor': 1.0,
+    'input:touchpad:middle_button_emulation': False,
+    'input:touchpad:tap_button_map': '',
+    'input:touchpad:clickfinger_behavior': False,
+    'input:touchpad:tap-to-click': True,
+    'input:touchpad:drag_lock': False,
+    'input:touchpad:tap-and-drag': True,
+    'input:touchdevice:transform': -1,
+    'input:touchdevice:output': '[[Auto]]',
+    'input:touchdevice:enabled': True,
+    'input:tablet:transform': -1,
+    'input:tablet:output': '',
+    'input:tablet:region_position': '0 0',
+    'input:tablet:absolute_region_position': False,
+    'input:tablet:region_size': '0 0',
+    'input:tablet:relative_input': False,
+    'input:tablet:left_handed': False,
+    'input:tablet:active_area_size': '0 0',
+    'input:tablet:active_area_position': '0 0',
+    'gestures:workspace_swipe': False,
+    'gestures:workspace_swipe_fingers': 3,
+    'gestures:workspace_swipe_min_fingers': False,
+    'gestures:workspace_swipe_distance': 300,
+    'gestures:workspace_swipe_touch': False,
+    'gestures:workspace_swipe_invert': True,
+    'gestures:workspace_swipe_touch_invert': False,
+    'gestures:workspace_swipe_min_speed_to_force': 30,
+    'gestures:workspace_swipe_cancel_ratio': 0.5,
+    'gestures:workspace_swipe_create_new': True,
+    'gestures:workspace_swipe_direction_lock': True,
+    'gestures:workspace_swipe_direction_lock_threshold': 10,
+    'gestures:workspace_swipe_forever': False,
+    'gestures:workspace_swipe_use_r': False,
+    'group:auto_group': True,
+    'group:insert_after_current': True,
+    'group:focus_removed_window': True,
+    'group:drag_into_group': 1,
+    'group:merge_groups_on_drag': True,
+    'group:merge_groups_on_groupbar': True,
+    'group:merge_floated_into_tiled_on_groupbar': False,
+    'group:group_on_movetoworkspace': False,
+    'group:col.border_active': Color(255, 255, 0, 102),
+    'group:col.border_inactive': Color(119, 119, 0, 102),
+    'group:col.border_locked_active': Color(255, 85, 0, 102),
+    'group:col.border_locked_inactive': Color(119, 85, 0, 102),
+    'group:groupbar:enabled': True,
+    'group:groupbar:font_family': '',
+    'group:groupbar:font_size': 8,
+    'group:groupbar:gradients': True,
+    'group:groupbar:height': 14,
+    'group:groupbar:stacked': False,
+    'group:groupbar:priority': 3,
+    'group:groupbar:render_titles': True,
+    'group:groupbar:scrolling': True,
+    'group:groupbar:text_color': Color(255, 255, 255, 255),
+    'group:groupbar:col.active': Color(255, 255, 0, 102),
+    'group:groupbar:col.inactive': Color(119, 119, 0, 102),
+    'group:groupbar:col.locked_active': Color(255, 85, 0, 102),
+    'group:groupbar:col.locked_inactive': Color(119, 85, 0, 102),
+    'misc:disable_hyprland_logo': False,
+    'misc:disable_splash_rendering': False,
+    'misc:col.splash': Color(255, 255, 255, 255),
+    'misc:font_family': 'Sans',
+    'misc:splash_font_family': '',
+    'misc:force_default_wallpaper': -1,
+    'misc:vfr': True,
+    'misc:vrr': 0,
+    'misc:mouse_move_enables_dpms': False,
+    'misc:key_press_enables_dpms': False,
+    'misc:always_follow_on_dnd': True,
+    'misc:layers_hog_keyboard_focus': True,
+    'misc:animate_manual_resizes': False,
+    'misc:animate_mouse_windowdragging': False,
+    'misc:disable_autoreload': False,
+    'misc:enable_swallow': False,
+    'misc:swallow_regex': '',
+    'misc:swallow_exception_regex': '',
+    'misc:focus_on_activate': False,
+    'misc:mouse_move_focuses_monitor': True,
+    'misc:render_ahead_of_time': False,
+    'misc:render_ahead_safezone': 1,
+    'misc:allow_session_lock_restore': False,
+    'misc:background_color': Color(17, 17, 17, 255),
+    'misc:close_special_on_empty': True,
+    'misc:new_window_takes_over_fullscreen': 0,
+    'misc:exit_window_retains_fullscreen': False,
+    'misc:initial_workspace_tracking': 1,
+    'misc:middle_click_paste': True,
+    'misc:render_unfocused_fps': 15,
+    'misc:disable_xdg_env_checks': False,
+    'misc:disable_hyprland_qtutils_check': False,
+    'misc:lockdead_screen_delay': 1000,
+    'misc:enable_anr_dialog': True,
+    'misc:anr_missed_pings': 1,
+    'binds:pass_mouse_when_bound': False,
+    'binds:scroll_event_delay': 300,
+    'binds:workspace_back_and_forth': False,
+    'binds:hide_special_on_workspace_change': False,
+    'binds:allow_workspace_cycles': False,
+    'binds:workspace_center_on': 0,
+    'binds:focus_preferred_method': 0,
+    'binds:ignore_group_lock': False,
+    'binds:movefocus_cycles_fullscreen': False,
+    'binds:movefocus_cycles_groupfirst': False,
+    'binds:disable_keybind_grabbing': False,
+    'binds:window_direction_monitor_fallback': True,
+    'binds:allow_pin_fullscreen': False,
+    'binds:drag_threshold': 0,
+    'xwayland:enabled': True,
+    'xwayland:use_nearest_neighbor': True,
+    'xwayland:force_zero_scaling': False,
+    'xwayland:create_abstract_socket': False,
+    'opengl:nvidia_anti_flicker': True,
+    'render:explicit_sync': 2,
+    'render:explicit_sync_kms': 2,
+    'render:direct_scanout': 0,
+    'render:expand_undersized_textures': True,
+    'render:xp_mode': False,
+    'render:ctm_animation': 2,
+    'render:cm_fs_passthrough': 2,
+    'render:cm_enabled': True,
+    'render:send_content_type': True,
+    'render:cm_auto_hdr': 1,
+    'render:new_render_scheduling': False,
+    'cursor:sync_gsettings_theme': True,
+    'cursor:no_hardware_cursors': 2,
+    'cursor:no_break_fs_vrr': 2,
+    'cursor:min_refresh_rate': 24,
+    'cursor:hotspot_padding': 1,
+    'cursor:inactive_timeout': 0.0,
+    'cursor:no_warps': False,
+    'cursor:persistent_warps': False,
+    'cursor:warp_on_change_workspace': 0,
+    'cursor:warp_on_toggle_special': 0,
+    'cursor:default_monitor': '',
+    'cursor:zoom_factor': 1.0,
+    'cursor:zoom_rigid': False,
+    'cursor:enable_hyprcursor': True,
+    'cursor:hide_on_key_press': False,
+    'cursor:hide_on_touch': True,
+    'cursor:use_cpu_buffer': 2,
+    'cursor:warp_back_after_non_mouse_input': False,
+    'ecosystem:no_update_news': False,
+    'ecosystem:no_donation_nag': False,
+    'ecosystem:enforce_permissions': False,
+    'quirks:prefer_hdr': 0,
+    'debug:overlay': False,
+    'debug:damage_blink': False,
+    'debug:disable_logs': True,
+    'debug:disable_time': True,
+    'debug:damage_tracking': 2,
+    'debug:enable_stdout_logs': False,
+    'debug:manual_crash': 0,
+    'debug:suppress_errors': False,
+    'debug:watchdog_timeout': 5,
+    'debug:disable_scale_checks': False,
+    'debug:error_limit': 5,
+    'debug:error_position': 0,
+    'debug:colored_stdout_logs': True,
+    'debug:pass': False,
+    'debug:full_cm_proto': False,
+    'dwindle:pseudotile': False,
+    'dwindle:force_split': 0,
+    'dwindle:preserve_split': False,
+    'dwindle:smart_split': False,
+    'dwindle:smart_resizing': True,
+    'dwindle:permanent_direction_override': False,
+    'dwindle:special_scale_factor': 1.0,
+    'dwindle:split_width_multiplier': 1.0,
+    'dwindle:use_active_for_splits': True,
+    'dwindle:default_split_ratio': 1.0,
+    'dwindle:split_bias': 0,
+    'dwindle:precise_mouse_move': False,
+    'master:allow_small_split': False,
+    'master:special_scale_factor': 1.0,
+    'master:mfact': 0.55,
+    'master:new_status': 'slave',
+    'master:new_on_top': False,
+    'master:new_on_active': 'none',
+    'master:orientation': 'left',
+    'master:inherit_fullscreen': True,
+    'master:slave_count_for_center_master': 2,
+    'master:center_master_fallback': 'left',
+    'master:smart_resizing': True,
+    'master:drop_at_cursor': True,
+    'master:always_keep_position': False,
+    'experimental:xx_color_management_v4': False,
+}
@@ -0,0 +1,295 @@
+"""
+Animation lines parsed into records, and how they play.
+
+`animation = NAME, ONOFF, SPEED, CURVE [,STYLE]` lines become `Animation`s.
+Hyprland's animations form a tree (see ANIMATION_TREE): a node that is
+not set takes the values of its parent, up to `global`.
+
+`AnimationTree` keeps the nodes the config sets, and remembers the
+values every node resolves to. Setting or unsetting a node only forgets
+the values of that node and the nodes under it.
+
+Speed is in Hyprland's units, where 1 is 100 ms. Styles keep their
+argument, so `popin 80%` is the style "popin" with the value 0.8.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+# Duration of one speed unit
+SPEED_UNIT_MS = 100.0
+
+# Every node and its parent, in Hyprland's order
+ANIMATION_TREE: Dict[str, Optional[str]] = {
+    'global': None,
+    'windows': 'global',
+    'windowsIn': 'windows',
+    'windowsOut': 'windows',
+    'windowsMove': 'windows',
+    'layers': 'global',
+    'layersIn': 'layers',
+    'layersOut': 'layers',
+    'fade': 'global',
+    'fadeIn': 'fade',
+    'fadeOut': 'fade',
+    'fadeSwitch': 'fade',
+    'fadeShadow': 'fade',
+    'fadeDim': 'fade',
+    'fadeLayers': 'fade',
+    'fadeLayersIn': 'fadeLayers',
+    'fadeLayersOut': 'fadeLayers',
+    'fadePopups': 'fade',
+    'fadePopupsIn': 'fadePopups',
+    'fadePopupsOut': 'fadePopups',
+    'fadeDpms': 'fade',
+    'border': 'global',
+    'borderangle': 'global',
+    'workspaces': 'global',
+    'workspacesIn': 'workspaces',
+    'workspacesOut': 'workspaces',
+    'specialWorkspace': 'workspaces',
+    'specialWorkspaceIn': 'specialWorkspace',
+    'specialWorkspaceOut': 'specialWorkspace',
+    'zoomFactor': 'global',
+    'monitorAdded': 'global',
+}
+
+# Children of every node, in the same order
+ANIMATION_CHILDREN: Dict[str, List[str]] = {
+    name: [child for child, parent in ANIMATION_TREE.items() if parent == name] for name in ANIMATION_TREE
+}
+
+# Curves Hyprland defines without a `bezier =` line
+BUILTIN_BEZIERS: Dict[str, Tuple[float, float, float, float]] = {
+    'default': (0.0, 0.75, 0.15, 1.0),
+}
+
+
+class Animation:
+    """One `animation =` line."""
+
+    __slots__ = ('name', 'enabled', 'speed', 'bezier', 'style')
+
+    def __init__(self, name: str, enabled: bool = True, speed: float = 8.0,
+                 bezier: str = 'default', style: str = ''):
+        self.name = name
+        self.enabled = enabled
+        self.speed = speed
+        self.bezier = bezier
+        self.style = style
+
+    @property
+    def duration_ms(self) -> float:
+        """How long the animation plays."""
+        return self.speed * SPEED_UNIT_MS
+
+    @property
+    def style_name(self) -> str:
+        """The style without its argument, e.g. "popin"."""
+        return self.style.split(' ', 1)[0]
+
+    @property
+    def style_value(self) -> Optional[float]:
+        """The style's argument (`popin 80%` gives 0.8), if it has one."""
+        parts = self.style.split()
+        if len(parts) < 2:
+            return None
+        text = parts[1]
+        try:
+            if text.endswith('%'):
+                return float(text[:-1]) / 100
+            return float(text)
+        except ValueError:
+            return None
+
+    def time_at(self, elapsed_ms: float) -> float:
+        """Time through the animation (0-1) after elapsed_ms; a disabled one is done at once."""
+        if not self.enabled:
+            return 1.0
+        return min(max(elapsed_ms / self.duration_ms, 0.0), 1.0)
+
+    @property
+    def value(self) -> str:
+        """The line's value: name, onoff, speed, curve[, style]"""
+        if not self.enabled:
+            return f"{self.name}, 0"
+        value = f"{self.name}, 1, {self.speed:g}, {self.bezier}"
+        if self.style:
+            value += f", {self.style}"
+        return value
+
+    def to_config_string(self) -> str:
+        """Convert to Hyprland config format: animation = name, onoff, speed, curve[, style]"""
+        return f"animation = {self.value}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Animation):
+            return NotImplemented
+        return (self.name, self.enabled, self.speed, self.bezier, self.style) == \
+            (other.name, other.enabled, other.speed, other.bezier, other.style)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.enabled, self.speed, self.bezier, self.style))
+
+    def __repr__(self) -> str:
+        return f"Animation({self.value})"
+
+
+def parse_animation(value: str) -> Animation:
+    """
+    Parse the value of an `animation =` line.
+
+    Args:
+        value: e.g. "windows, 1, 7, myBezier, popin 80%", variables expanded
+
+    Raises:
+        ValueError: If the line is malformed or names an unknown animation
+    """
+    parts = [part.strip() for part in value.split(',')]
+    name = parts[0]
+    if name not in ANIMATION_TREE:
+        raise ValueError(f"Unknown animation: {name}")
+    if len(parts) < 2 or parts[1] not in ('0', '1'):
+        raise ValueError(f"Animation {name} must be enabled (1) or disabled (0)")
+    if parts[1] == '0':
+        # Speed and curve are optional when disabled
+        return Animation(name, False)
+    if len(parts) < 4:
+        raise ValueError(f"Animation {name} needs a speed and a curve")
+    try:
+        speed = float(parts[2])
+    except ValueError:
+        raise ValueError(f"Invalid speed for animation {name}: {parts[2]}")
+    if speed <= 0:
+        raise ValueError(f"Speed of animation {name} must be positive")
+    return Animation(name, True, speed, parts[3], ', '.join(parts[4:]))
+
+
+class AnimationTree:
+    """The animations a config sets, resolved through Hyprland's node hierarchy."""
+
+    def __init__(self, explicit: Optional[Dict[str, Animation]] = None):
+        # Nodes set by an `animation =` line
+        self.explicit: Dict[str, Animation] = dict(explicit or {})
+        # Resolved values, filled on demand
+        self._effective: Dict[str, Animation] = {}
+
+    def is_explicit(self, name: str) -> bool:
+        return name in self.explicit
+
+    def get(self, name: str) -> Animation:
+        """
+        Get how a node plays, taking unset values from its parents.
+
+        Raises:
+            KeyError: If the node is not in ANIMATION_TREE
+        """
+        animation = self._effective.get(name)
+        if animation is not None:
+            return animation
+        parent = ANIMATION_TREE[name]
+        source = self.explicit.get(name)
+        if source is None:
+            source = self.get(parent) if parent is not None else Animation('global')
+        animation = self._effective[name] = Animation(
+            name, source.enabled, source.speed, source.bezier, source.style
+        )
+        return animation
+
+    def source_of(self, name: str) -> str:
+        """Get the node a node takes its values from ('global' if none is set)."""
+        node: Optional[str] = name
+        while node is not None:
+            if node in self.explicit:
+                return node
+            node = ANIMATION_TREE[node]
+        return 'global'
+
+    def subtree(self, name: str) -> List[str]:
+        """Get a node and every node under it, parents first."""
+        nodes = [name]
+        for node in nodes:
+            nodes.extend(ANIMATION_CHILDREN[node])
+        return nodes
+
+    def set(self, animation: Animation) -> List[str]:
+        """
+        Set a node explicitly.
+
+        Returns:
+            The nodes whose values may have changed
+        """
+        if animation.name not in ANIMATION_TREE:
+            raise ValueError(f"Unknown animation: {animation.name}")
+        self.explicit[animation.name] = animation
+        return self._invalidate(animation.name)
+
+    def unset(self, name: str) -> List[str]:
+        """
+        Make a node inherit from its parent again.
+
+        Returns:
+            The nodes whose values may have changed (none if it was not set)
+        """
+        if self.explicit.pop(name, None) is None:
+            return []
+        return self._invalidate(name)
+
+    def _invalidate(self, name: str) -> List[str]:
+        nodes = self.subtree(name)
+        for node in nodes:
+            self._effective.pop(node, None)
+        return nodes
+
+    def __len__(self) -> int:
+        return len(self.explicit)
+
+    def __repr__(self) -> str:
+        return f"AnimationTree({sorted(self.explicit)})"
+
+
+def collect_animations(parser) -> AnimationTree:
+    """
+    Get the animations set by a config and the files it sources.
+
+    Like Hyprland, a later line for the same animation replaces the
+    earlier one. Lines that cannot be parsed are skipped.
+    """
+    animations: Dict[str, Animation] = {}
+    _collect(parser, animations)
+    return AnimationTree(animations)
+
+
+def _collect(parser, animations: Dict[str, Animation]):
+    for keyword in parser.keywords:
+        if keyword.name == 'source':
+            for path in parser.resolve_source_paths(keyword.value):
+                child = parser.sourced.get(path)
+                if child is not None:
+                    _collect(child, animations)
+        elif keyword.name == 'animation':
+            try:
+                animation = parse_animation(parser.expand(keyword.value))
+            except ValueError:
+                continue
+            animations[animation.name] = animation
+
+
+def playback_phase(elapsed_ms: float, duration_ms: float, hold_ms: float) -> Tuple[bool, float]:
+    """
+    Where a looping in-and-out preview is at.
+
+    One cycle plays in, holds, plays out and holds again.
+
+    Args:
+        elapsed_ms: Time since the preview started
+        duration_ms: Duration of the longest animation played
+        hold_ms: Pause after each half
+
+    Returns:
+        (whether it is playing in, time since that half started in ms)
+    """
+    half = duration_ms + hold_ms
+    position = elapsed_ms % (2 * half)
+    if position < half:
+        return True, position
+    return False, position - half
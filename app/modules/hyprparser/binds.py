@@ -0,0 +1,440 @@
+"""
+Keybinds parsed into records, with an index for conflict detection.
+
+Every `bind*` line becomes a `Bind` with its flags, the modifiers as a
+bitmask (the same values Hyprland and xkb use), the key, the dispatcher
+and its arguments, the submap it belongs to and where it was read from.
+
+`BindIndex` keeps the binds hashed by (modmask, key, submap), so a
+duplicate or shadowed bind is found when it is added instead of by
+comparing every pair of binds.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .data_types import Keyword
+from .submaps import SubmapGraph, parse_submap_line
+from .variables import VariableCycleError
+
+# Modifier bits, as in wlr_keyboard_modifier
+MOD_SHIFT = 1 << 0
+MOD_CAPS = 1 << 1
+MOD_CTRL = 1 << 2
+MOD_ALT = 1 << 3
+MOD_MOD2 = 1 << 4
+MOD_MOD3 = 1 << 5
+MOD_SUPER = 1 << 6
+MOD_MOD5 = 1 << 7
+
+# Names Hyprland looks for in the modifier field, in display order.
+# Like Hyprland, they are found anywhere in the field, so SUPER_SHIFT,
+# SUPER SHIFT and SUPERSHIFT are the same.
+MOD_NAMES: Tuple[Tuple[int, Tuple[str, ...]], ...] = (
+    (MOD_SUPER, ('SUPER', 'WIN', 'LOGO', 'MOD4', 'META')),
+    (MOD_CTRL, ('CTRL', 'CONTROL')),
+    (MOD_ALT, ('ALT', 'MOD1')),
+    (MOD_SHIFT, ('SHIFT',)),
+    (MOD_CAPS, ('CAPS',)),
+    (MOD_MOD2, ('MOD2',)),
+    (MOD_MOD3, ('MOD3',)),
+    (MOD_MOD5, ('MOD5',)),
+)
+
+# Flags that may follow `bind`, see the Hyprland wiki
+BIND_FLAGS = frozenset('lrocegnmtidspuk')
+
+CONFLICT_DUPLICATE = 'duplicate'
+CONFLICT_SHADOWED = 'shadowed'
+
+
+def parse_modmask(text: str) -> int:
+    """
+    Convert a modifier field like "SUPER SHIFT" to a bitmask.
+
+    Args:
+        text: Modifier field of a bind, with variables expanded
+
+    Returns:
+        Bitmask of MOD_* values
+    """
+    text = text.upper()
+    mask = 0
+    for bit, names in MOD_NAMES:
+        if any(name in text for name in names):
+            mask |= bit
+    return mask
+
+
+def format_modmask(mask: int) -> str:
+    """Convert a modifier bitmask back to names, e.g. "SUPER SHIFT"."""
+    return ' '.join(names[0] for bit, names in MOD_NAMES if mask & bit)
+
+
+def normalize_key(text: str) -> Tuple[str, Optional[int]]:
+    """
+    Normalize the key field of a bind.
+
+    Keysym names are matched case-insensitively by Hyprland, so they
+    are lower-cased.
+
+    Args:
+        text: Key field, e.g. "Q", "code:24" or "mouse:272"
+
+    Returns:
+        The normalized key and the keycode for `code:` keys (else None)
+    """
+    key = text.strip().lower()
+    if key.startswith('code:'):
+        try:
+            keycode = int(key[5:])
+        except ValueError:
+            return key, None
+        return f"code:{keycode}", keycode
+    return key, None
+
+
+class Bind:
+    """A single parsed keybind."""
+
+    __slots__ = (
+        'flags', 'mods', 'key', 'keycode', 'dispatcher', 'args',
+        'description', 'submap', 'source', 'line', 'keyword',
+    )
+
+    def __init__(
+        self,
+        flags: str,
+        mods: int,
+        key: str,
+        dispatcher: str,
+        args: str = '',
+        description: str = '',
+        submap: str = '',
+        source: str = '',
+        line: int = 0,
+        keycode: Optional[int] = None,
+        keyword: Optional[Keyword] = None,
+    ):
+        # Letters after `bind`, e.g. 'el' for bindel
+        self.flags = flags
+        # Bitmask of MOD_* values
+        self.mods = mods
+        self.key = key
+        self.keycode = keycode
+        self.dispatcher = dispatcher
+        self.args = args
+        # Only set for bindd
+        self.description = description
+        # '' outside of any submap
+        self.submap = submap
+        # Config file and 1-based line the bind was read from
+        self.source = source
+        self.line = line
+        # Line the bind was parsed from, for editing it
+        self.keyword = keyword
+
+    @property
+    def kind(self) -> str:
+        """Mouse ('m') and release ('r') binds trigger separately from presses."""
+        return ''.join(flag for flag in 'mr' if flag in self.flags)
+
+    @property
+    def index_key(self) -> Tuple[int, str, str, str]:
+        """Key of the bind in a BindIndex."""
+        return self.mods, self.key, self.submap, self.kind
+
+    @property
+    def combo(self) -> str:
+        """Modifiers and key as text, e.g. "SUPER SHIFT, q"."""
+        return f"{format_modmask(self.mods)}, {self.key}"
+
+    def to_dict(self) -> Dict[str, object]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            'flags': self.flags,
+            'mods': self.mods,
+            'key': self.key,
+            'keycode': self.keycode,
+            'dispatcher': self.dispatcher,
+            'args': self.args,
+            'description': self.description,
+            'submap': self.submap,
+            'source': self.source,
+            'line': self.line,
+        }
+
+    def __str__(self) -> str:
+        args = f" {self.args}" if self.args else ''
+        return f"Bind({self.combo} -> {self.dispatcher}{args})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def _expand_with(expand: Optional[Callable[[str], str]], text: str) -> str:
+    if expand is None:
+        return text
+    try:
+        return expand(text)
+    except VariableCycleError:
+        return text
+
+
+def parse_combo(value: str, expand: Optional[Callable[[str], str]] = None) -> Optional[Tuple[int, str]]:
+    """
+    Get the modifiers and key of a bind or unbind value.
+
+    Args:
+        value: Raw value, e.g. "$mainMod, Q, killactive,"
+        expand: Function that expands $variables
+
+    Returns:
+        (modmask, normalized key), or None if the value has no key
+    """
+    parts = value.split(',', 2)
+    if len(parts) < 2:
+        return None
+    key = normalize_key(_expand_with(expand, parts[1]))[0]
+    if not key:
+        return None
+    return parse_modmask(_expand_with(expand, parts[0])), key
+
+
+def parse_bind(
+    keyword: Keyword,
+    submap: str = '',
+    expand: Optional[Callable[[str], str]] = None,
+    source: str = '',
+) -> Optional[Bind]:
+    """
+    Parse a `bind*` line.
+
+    Args:
+        keyword: The line, e.g. Keyword('binde', '$mainMod, L, resizeactive, 10 0')
+        submap: Submap the line is in
+        expand: Function that expands $variables
+        source: Config file the line was read from
+
+    Returns:
+        The bind, or None if the line is not a valid bind
+    """
+    name = keyword.name
+    if not name.startswith('bind'):
+        return None
+    flags = name[4:]
+    if not set(flags) <= BIND_FLAGS:
+        return None
+
+    # bindd has a description before the dispatcher
+    fields = 5 if 'd' in flags else 4
+    parts = [part.strip() for part in _expand_with(expand, keyword.value).split(',', fields - 1)]
+    if len(parts) < fields - 1:
+        return None
+    parts.extend([''] * (fields - len(parts)))
+
+    key, keycode = normalize_key(parts[1])
+    if not key:
+        return None
+    description = parts.pop(2) if 'd' in flags else ''
+    dispatcher, args = parts[2], parts[3]
+    if not dispatcher:
+        return None
+    return Bind(
+        flags, parse_modmask(parts[0]), key, dispatcher, args,
+        description=description, submap=submap, source=source,
+        line=keyword.line, keycode=keycode, keyword=keyword,
+    )
+
+
+class BindConflict:
+    """A bind that collides with one added before it."""
+
+    __slots__ = ('kind', 'bind', 'other')
+
+    def __init__(self, kind: str, bind: Bind, other: Bind):
+        # CONFLICT_DUPLICATE: same modifiers and key
+        # CONFLICT_SHADOWED: `other` ignores modifiers (bindi) on the same key
+        self.kind = kind
+        self.bind = bind
+        self.other = other
+
+    def __str__(self) -> str:
+        return f"BindConflict({self.kind}, {self.bind}, {self.other})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class BindIndex:
+    """Binds in file order, hashed by (modmask, key, submap) for conflict lookups."""
+
+    def __init__(self):
+        self.binds: List[Bind] = []
+        self.conflicts: List[BindConflict] = []
+        self._by_combo: Dict[Tuple[int, str, str, str], List[Bind]] = {}
+        # Binds by (key, submap, kind), to find those bindi shadows
+        self._by_key: Dict[Tuple[str, str, str], List[Bind]] = {}
+        self._ignoring_mods: Dict[Tuple[str, str, str], List[Bind]] = {}
+        # Transitions between submaps, kept up to date with the binds
+        self.submaps = SubmapGraph()
+
+    def __len__(self) -> int:
+        return len(self.binds)
+
+    def __iter__(self) -> Iterator[Bind]:
+        return iter(self.binds)
+
+    def find(self, mods: int, key: str, submap: str = '', kind: str = '') -> List[Bind]:
+        """
+        Get the binds of a key combination.
+
+        Args:
+            mods: Bitmask of MOD_* values
+            key: Key, normalized with normalize_key
+            submap: Submap, '' for the global one
+            kind: 'm' for mouse binds, 'r' for release binds
+
+        Returns:
+            Matching binds in file order
+        """
+        return list(self._by_combo.get((mods, key, submap, kind), ()))
+
+    def add(self, bind: Bind) -> List[BindConflict]:
+        """
+        Add a bind, checking it against the binds added so far.
+
+        Args:
+            bind: Bind to add
+
+        Returns:
+            Conflicts with earlier binds (also appended to `conflicts`)
+        """
+        combo = bind.index_key
+        key = (bind.key, bind.submap, bind.kind)
+        found = []
+        for other in self._by_combo.get(combo, ()):
+            found.append(BindConflict(CONFLICT_DUPLICATE, bind, other))
+        for other in self._ignoring_mods.get(key, ()):
+            if other.mods != bind.mods:
+                found.append(BindConflict(CONFLICT_SHADOWED, bind, other))
+        if 'i' in bind.flags:
+            for other in self._by_key.get(key, ()):
+                if other.mods != bind.mods:
+                    found.append(BindConflict(CONFLICT_SHADOWED, other, bind))
+            self._ignoring_mods.setdefault(key, []).append(bind)
+
+        self.binds.append(bind)
+        self._by_combo.setdefault(combo, []).append(bind)
+        self._by_key.setdefault(key, []).append(bind)
+        self.submaps.add(bind)
+        self.conflicts.extend(found)
+        return found
+
+    def remove(self, bind: Bind) -> bool:
+        """
+        Remove a bind and the conflicts it was part of.
+
+        Args:
+            bind: Bind to remove, as returned by iteration or find()
+
+        Returns:
+            True if the bind was in the index
+        """
+        combo = self._by_combo.get(bind.index_key)
+        if not combo or not any(other is bind for other in combo):
+            return False
+        key = (bind.key, bind.submap, bind.kind)
+        for table, table_key in ((self._by_combo, bind.index_key), (self._by_key, key), (self._ignoring_mods, key)):
+            entries = table.get(table_key)
+            if entries is None:
+                continue
+            entries[:] = [other for other in entries if other is not bind]
+            if not entries:
+                del table[table_key]
+        self.binds = [other for other in self.binds if other is not bind]
+        self.submaps.remove(bind)
+        self.conflicts = [
+            conflict for conflict in self.conflicts
+            if conflict.bind is not bind and conflict.other is not bind
+        ]
+        return True
+
+    def replace(self, old: Bind, new: Bind) -> List[BindConflict]:
+        """
+        Replace a bind, keeping its position.
+
+        Only the submap graph of the submaps of `old` and `new` is
+        analyzed again.
+
+        Args:
+            old: Bind in the index
+            new: Bind to put in its place
+
+        Returns:
+            Conflicts of the new bind with the other binds
+        """
+        position = next((i for i, bind in enumerate(self.binds) if bind is old), None)
+        if position is None:
+            raise KeyError(old)
+        self.remove(old)
+        found = self.add(new)
+        self.binds.insert(position, self.binds.pop())
+        return found
+
+    def unbind(self, mods: int, key: str, submap: str = '') -> List[Bind]:
+        """
+        Remove every bind of a key combination, like `unbind` does.
+
+        Returns:
+            The removed binds
+        """
+        removed = []
+        for kind in ('', 'm', 'r', 'mr'):
+            for bind in self.find(mods, key, submap, kind):
+                self.remove(bind)
+                removed.append(bind)
+        return removed
+
+
+def collect_binds(parser) -> BindIndex:
+    """
+    Parse the binds of a config and the files it sources, in order.
+
+    The submap set by `submap =` carries over into and out of sourced
+    files, as it does in Hyprland.
+
+    Args:
+        parser: HyprlandConfigParser that has loaded the config
+
+    Returns:
+        Index of every bind
+    """
+    index = BindIndex()
+    state = {'submap': ''}
+    _collect(parser, index, state)
+    return index
+
+
+def _collect(parser, index: BindIndex, state: Dict[str, str]):
+    source = parser.config_path
+    expand = parser.expand
+    for keyword in parser.keywords:
+        name = keyword.name
+        if name == 'submap':
+            submap, fallback = parse_submap_line(_expand_with(expand, keyword.value))
+            if submap:
+                index.submaps.declare(submap, fallback)
+            state['submap'] = submap
+        elif name == 'unbind':
+            combo = parse_combo(keyword.value, expand)
+            if combo is not None:
+                index.unbind(combo[0], combo[1], state['submap'])
+        elif name == 'source':
+            for path in parser.resolve_source_paths(keyword.value):
+                child = parser.sourced.get(path)
+                if child is not None:
+                    _collect(child, index, state)
+        elif name.startswith('bind'):
+            bind = parse_bind(keyword, state['submap'], expand, source)
+            if bind is not None:
+                index.add(bind)
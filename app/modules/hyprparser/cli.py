@@ -0,0 +1,422 @@
+"""
+Headless command line interface for hyprset.
+
+Reads and edits Hyprland configs without starting GTK, e.g.
+
+    python -m app get general:gaps_in
+    python -m app set general:gaps_in 8
+    python -m app export --json
+    python -m app apply patch.json
+    python -m app fleet patch.toml '/home/*/.config/hypr' --dry-run
+    python -m app audit '/home/*/.config/hypr' --format sarif
+    python -m app profile switch battery
+    python -m app rules --clients clients.json
+
+Only the hyprparser package is imported, so commands need neither a
+display nor the GTK startup cost.
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .manager import HyprDataManager
+from .patch import PatchError, apply_patch, load_patch, to_json_value
+from .profiles import NO_PROFILE, ProfileError
+from .schema import get_spec, validate_option
+from .windowrules import load_clients
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for every subcommand."""
+    parser = argparse.ArgumentParser(
+        prog='hyprset',
+        description='Read and edit Hyprland configuration without the GUI.',
+    )
+    config_help = 'Path to hyprland.conf (default: $XDG_CONFIG_HOME/hypr/hyprland.conf)'
+    parser.add_argument('-c', '--config', help=config_help)
+
+    # Also accept --config after the subcommand
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-c', '--config', default=argparse.SUPPRESS, help=config_help)
+
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    get = commands.add_parser('get', parents=[common], help='Print the value of an option')
+    get.add_argument('path', help='Option path like general:gaps_in')
+    get.add_argument('--json', action='store_true', help='Print the value as JSON')
+
+    set_ = commands.add_parser('set', parents=[common], help='Set an option and save')
+    set_.add_argument('path', help='Option path like general:gaps_in')
+    set_.add_argument('value', help='New value, written as in hyprland.conf')
+    add_sparse_argument(set_)
+
+    export = commands.add_parser('export', parents=[common], help='Print the whole configuration')
+    export.add_argument('--json', action='store_true', help='Export as JSON')
+
+    describe = commands.add_parser('describe', help="Show an option's type, range and default")
+    describe.add_argument('path', help='Option path like general:gaps_in')
+    describe.add_argument('--json', action='store_true', help='Print as JSON')
+
+    apply = commands.add_parser('apply', parents=[common], help='Apply a JSON patch and save')
+    apply.add_argument('patch', help='Path to the patch file')
+    add_sparse_argument(apply)
+
+    fleet = commands.add_parser(
+        'fleet', help='Apply a patch to many configs in parallel, printing JSON lines'
+    )
+    fleet.add_argument('patch', help='Path to a JSON or TOML patch file')
+    add_roots_arguments(fleet)
+    fleet.add_argument('-n', '--dry-run', action='store_true',
+                       help='Write nothing; include a unified diff in each result')
+    add_sparse_argument(fleet)
+    fleet.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+
+    audit = commands.add_parser('audit', help='Lint many configs in parallel')
+    add_roots_arguments(audit)
+    audit.add_argument('--format', choices=('jsonl', 'sarif'), default='jsonl',
+                       help='One JSON object per config, or a single SARIF log')
+    audit.add_argument('--rules', help='Comma separated rule ids to run (default: all)')
+    audit.add_argument('--list-rules', action='store_true', help='List the available rules and exit')
+    audit.add_argument('--stats', action='store_true', help='Print files per second to stderr')
+    audit.add_argument('-j', '--jobs', type=int, help='Worker processes (default: CPU count)')
+
+    profile = commands.add_parser('profile', parents=[common], help='Manage and switch config profiles')
+    actions = profile.add_subparsers(dest='action', required=True)
+    actions.add_parser('list', parents=[common], help='List profiles, marking the active one')
+    show = actions.add_parser('show', parents=[common], help="Print a profile's options")
+    show.add_argument('name')
+    save = actions.add_parser('save', parents=[common], help='Create or replace a profile')
+    save.add_argument('name')
+    save.add_argument('options', nargs='+', metavar='PATH=VALUE',
+                      help='Options to override, values written as in hyprland.conf')
+    delete = actions.add_parser('delete', parents=[common], help='Delete a profile')
+    delete.add_argument('name')
+    diff = actions.add_parser('diff', parents=[common], help='Print the options a switch would change')
+    diff.add_argument('old', help=f"Current profile, or '{NO_PROFILE}'")
+    diff.add_argument('new', help=f"Profile to switch to, or '{NO_PROFILE}'")
+    switch = actions.add_parser('switch', parents=[common], help='Switch profile and apply it to Hyprland')
+    switch.add_argument('name', help=f"Profile to switch to, or '{NO_PROFILE}' for the plain config")
+    switch.add_argument('--no-apply', action='store_true',
+                        help='Only record the switch; do not send the changes to Hyprland')
+
+    rules = commands.add_parser('rules', parents=[common], help='Show the window rules that apply to each window')
+    rules.add_argument('--clients', metavar='FILE',
+                       help="Output of `hyprctl clients -j` ('-' for stdin; default: ask the running Hyprland)")
+    rules.add_argument('--json', action='store_true', help='Print as JSON')
+
+    return parser
+
+
+def add_sparse_argument(parser: argparse.ArgumentParser):
+    """Add the option that leaves default values out of the saved config."""
+    parser.add_argument('--sparse', action='store_true',
+                        help="Leave out options set to Hyprland's default value")
+
+
+def add_roots_arguments(parser: argparse.ArgumentParser):
+    """Add the arguments that select many configs."""
+    parser.add_argument('roots', nargs='*', help='Config files, directories or glob patterns')
+    parser.add_argument('--from', dest='roots_file', metavar='FILE',
+                        help="Read more roots from FILE, one per line ('-' for stdin)")
+
+
+def read_roots(args: argparse.Namespace) -> List[str]:
+    """Collect the config roots given on the command line and with --from."""
+    roots = list(args.roots)
+    if args.roots_file == '-':
+        roots.extend(line.strip() for line in sys.stdin)
+    elif args.roots_file:
+        with open(args.roots_file, 'r', encoding='utf-8') as f:
+            roots.extend(line.strip() for line in f)
+    return [root for root in roots if root]
+
+
+def export_json(data: HyprDataManager) -> dict:
+    """Convert the parsed model to a JSON-serializable dictionary."""
+    return {
+        'settings': {
+            path: to_json_value(setting.value)
+            for path, setting in data.get_all_settings().items()
+        },
+        'variables': dict(data.parser.variables),
+        'beziers': {
+            name: list(bezier.points) for name, bezier in data.beziers.items()
+        },
+        'keywords': [
+            {'name': k.name, 'value': k.value, 'section': k.section}
+            for k in data.parser.keywords
+        ],
+    }
+
+
+def run_fleet(args: argparse.Namespace) -> int:
+    """Run the fleet command, streaming one JSON object per config."""
+    from .fleet import apply_fleet, find_configs
+
+    try:
+        patch = load_patch(args.patch)
+        paths = find_configs(read_roots(args))
+    except (OSError, PatchError) as e:
+        print(f"hyprset: {e}", file=sys.stderr)
+        return 1
+
+    if not paths:
+        print("hyprset: no config roots given", file=sys.stderr)
+        return 2
+
+    failed = 0
+    for result in apply_fleet(paths, patch, dry_run=args.dry_run, sparse=args.sparse, jobs=args.jobs):
+        failed += result['status'] == 'error'
+        print(json.dumps(result), flush=True)
+    return 1 if failed else 0
+
+
+def run_audit(args: argparse.Namespace) -> int:
+    """Run the audit command. Exits with 1 if anything was found."""
+    import time
+    from .fleet import find_configs
+    from .lint import RULES, Linter, audit_fleet, to_sarif
+
+    if args.list_rules:
+        for rule_id, rule in RULES.items():
+            print(f"{rule_id:20} {rule.severity:8} {rule.description}")
+        return 0
+
+    rule_ids = [r.strip() for r in args.rules.split(',') if r.strip()] if args.rules else None
+    try:
+        Linter(rule_ids)
+        paths = find_configs(read_roots(args))
+    except (OSError, ValueError) as e:
+        print(f"hyprset: {e}", file=sys.stderr)
+        return 1
+
+    if not paths:
+        print("hyprset: no config roots given", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = audit_fleet(paths, rule_ids, jobs=args.jobs)
+    found = False
+    if args.format == 'sarif':
+        # SARIF is a single document, so only the findings are kept around
+        results = [result for result in results if result['findings']]
+        found = bool(results)
+        json.dump(to_sarif(results, rule_ids), sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        for result in results:
+            found = found or bool(result['findings'])
+            print(json.dumps(result), flush=True)
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(f"{len(paths)} files in {elapsed:.2f}s ({len(paths) / elapsed:.0f} files/s)", file=sys.stderr)
+
+    return 1 if found else 0
+
+
+def run_describe(args: argparse.Namespace) -> int:
+    """Print what the schema knows about an option."""
+    spec = get_spec(args.path)
+    if spec is None:
+        print(f"hyprset: unknown option '{args.path}'", file=sys.stderr)
+        return 1
+
+    info = {
+        'path': spec.path,
+        'type': spec.type,
+        'default': to_json_value(spec.default),
+        'min': spec.min,
+        'max': spec.max,
+        'choices': list(spec.choices) if spec.choices is not None else None,
+        'replaced_by': spec.replaced_by,
+        'removed': spec.removed,
+        'description': spec.description,
+    }
+    if args.json:
+        print(json.dumps(info))
+    else:
+        for key, value in info.items():
+            # 0 is a meaningful default, unlike an unset field
+            if value is not None and value is not False and value != '':
+                print(f"{key}: {value}")
+    return 0
+
+
+def run_profile(data: HyprDataManager, args: argparse.Namespace) -> int:
+    """Run a profile action."""
+    def profile_name(name: str) -> Optional[str]:
+        return None if name == NO_PROFILE else name
+
+    def print_values(values: dict):
+        for path, value in values.items():
+            print(f"{path} = {'(config)' if value is None else data.parser._format_value(value)}")
+
+    try:
+        profiles = data.profiles
+        if args.action == 'list':
+            for name in profiles.names:
+                print(f"{'*' if name == profiles.active else ' '} {name}")
+            return 0
+
+        if args.action == 'show':
+            print_values(profiles.get(args.name))
+            return 0
+
+        if args.action == 'save':
+            values = {}
+            for option in args.options:
+                path, sep, value = option.partition('=')
+                if not sep:
+                    print(f"hyprset: expected PATH=VALUE, got '{option}'", file=sys.stderr)
+                    return 2
+                try:
+                    values[path.strip()] = to_json_value(data.parser._parse_value(value))
+                except ValueError as e:
+                    print(f"hyprset: {e}", file=sys.stderr)
+                    return 1
+            profiles.set_profile(args.name, values)
+            profiles.save()
+            return 0
+
+        if args.action == 'delete':
+            if not profiles.remove_profile(args.name):
+                print(f"hyprset: unknown profile '{args.name}'", file=sys.stderr)
+                return 1
+            profiles.save()
+            return 0
+
+        if args.action == 'diff':
+            print_values(profiles.diff(profile_name(args.old), profile_name(args.new)))
+            return 0
+
+        if args.action == 'switch':
+            changed = data.switch_profile(profile_name(args.name))
+            print_values(changed)
+            if not args.no_apply and not data.apply_to_hyprland(changed):
+                print("hyprset: could not apply the changes to the running Hyprland", file=sys.stderr)
+                return 1
+            return 0
+    except (OSError, ProfileError) as e:
+        print(f"hyprset: {e}", file=sys.stderr)
+        return 1
+
+    return 2
+
+
+def run_rules(data: HyprDataManager, args: argparse.Namespace) -> int:
+    """Print the window rules matching each open window."""
+    try:
+        if args.clients == '-':
+            clients = load_clients(sys.stdin.read())
+        elif args.clients:
+            with open(args.clients, 'r', encoding='utf-8') as f:
+                clients = load_clients(f.read())
+        else:
+            from .ipc import get_clients
+            clients = get_clients()
+            if clients is None:
+                print("hyprset: could not get the window list from Hyprland", file=sys.stderr)
+                return 1
+    except (OSError, ValueError) as e:
+        print(f"hyprset: {e}", file=sys.stderr)
+        return 1
+
+    rules = data.window_rules
+    for keyword, error in rules.errors:
+        print(f"hyprset: {error} (line {keyword.line})", file=sys.stderr)
+    matches = rules.match_clients(clients)
+
+    if args.json:
+        json.dump({
+            address: [
+                {'rule': str(rule), 'effect': rule.effect, 'source': rule.source, 'line': rule.line}
+                for rule in matched
+            ]
+            for address, matched in matches.items()
+        }, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return 0
+
+    for client in clients:
+        print(f"{client.get('address', '')} {client.get('class', '')}: {client.get('title', '')}")
+        for rule in matches[client.get('address', '')]:
+            print(f"    {rule.line}: {rule}")
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run a parsed command. Returns the process exit code."""
+    if args.command == 'fleet':
+        return run_fleet(args)
+    if args.command == 'audit':
+        return run_audit(args)
+    if args.command == 'describe':
+        return run_describe(args)
+
+    data = HyprDataManager(args.config, lazy=True)
+    # Never write hyprset's default config just to read an option
+    data.parser.create_default = False
+
+    if args.command == 'get':
+        setting = data.get_option(args.path)
+        if setting is None:
+            print(f"hyprset: option '{args.path}' is not set", file=sys.stderr)
+            return 1
+        if args.json:
+            print(json.dumps(to_json_value(setting.value)))
+        else:
+            print(data.parser._format_value(setting.value))
+        return 0
+
+    if args.command == 'set':
+        # The config's $variables are needed to parse the value
+        data.load()
+        try:
+            value = data.parser._parse_value(args.value)
+            validate_option(args.path, value)
+        except ValueError as e:
+            print(f"hyprset: {e}", file=sys.stderr)
+            return 1
+        spec = get_spec(args.path)
+        if spec is not None and spec.replaced_by:
+            print(f"hyprset: warning: {args.path} is deprecated, use {spec.replaced_by}", file=sys.stderr)
+        # Values using $variables are stored as written, so they keep them
+        if not data.set_option(args.path, args.value if '$' in args.value else value):
+            return 1
+        return 0 if data.save_all(sparse=args.sparse) else 1
+
+    if args.command == 'export':
+        if args.json:
+            json.dump(export_json(data), sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            sys.stdout.write(data.export_config())
+        return 0
+
+    if args.command == 'profile':
+        return run_profile(data, args)
+
+    if args.command == 'rules':
+        return run_rules(data, args)
+
+    if args.command == 'apply':
+        try:
+            patch = load_patch(args.patch)
+            changes = apply_patch(data, patch)
+        except (OSError, PatchError) as e:
+            print(f"hyprset: {e}", file=sys.stderr)
+            return 1
+        for change in changes:
+            print(change)
+        return 0 if data.save_all(sparse=args.sparse) else 1
+
+    return 2
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for `python -m app <command>`."""
+    args = build_parser().parse_args(argv)
+    return run(args)
@@ -0,0 +1,236 @@
+"""
+Evaluation of animation bezier curves.
+
+A Hyprland bezier maps the elapsed time of an animation to its progress:
+the curve runs from (0, 0) to (1, 1) through the control points (x0, y0)
+and (x1, y1), and the progress at time x is y(t) for the t where
+x(t) = x. Like Hyprland, t is solved numerically, with Newton's method and
+bisection where the curve is too flat for it.
+
+Every curve also gets a lookup table of the progress at LUT_SIZE + 1
+evenly spaced times, built once per set of points. Previews sampling
+each frame, curve comparisons and overshoot checks read the table.
+
+NumPy is used when installed, to solve and sample many times at once. It
+is imported on first use so the CLI does not pay for it at startup.
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+# Intervals of the lookup table
+LUT_SIZE = 256
+
+EPSILON = 1e-7
+NEWTON_ITERATIONS = 8
+BISECTION_ITERATIONS = 64
+
+Points = Tuple[float, float, float, float]
+
+_np = None
+_np_checked = False
+
+
+def _numpy():
+    """Get numpy if it is installed, importing it on first use."""
+    global _np, _np_checked
+    if not _np_checked:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+        _np_checked = True
+    return _np
+
+
+def _coord(t, a: float, b: float):
+    """One coordinate of the curve at t, for control values a and b (works on arrays too)."""
+    # 3a t (1-t)^2 + 3b t^2 (1-t) + t^3, in Horner form
+    return (((1 - 3 * b + 3 * a) * t + (3 * b - 6 * a)) * t + 3 * a) * t
+
+
+def _slope(t, a: float, b: float):
+    return (3 * (1 - 3 * b + 3 * a) * t + 2 * (3 * b - 6 * a)) * t + 3 * a
+
+
+def solve_t(x: float, a: float, b: float) -> float:
+    """
+    Find the t where the curve's x coordinate is x.
+
+    Args:
+        x: Time, between 0 and 1
+        a, b: x of the two control points
+    """
+    t = x
+    for _ in range(NEWTON_ITERATIONS):
+        error = _coord(t, a, b) - x
+        if abs(error) < EPSILON:
+            return t
+        slope = _slope(t, a, b)
+        if abs(slope) < 1e-6:
+            break
+        t -= error / slope
+
+    low, high, t = 0.0, 1.0, x
+    for _ in range(BISECTION_ITERATIONS):
+        value = _coord(t, a, b)
+        if abs(value - x) < EPSILON:
+            break
+        if value < x:
+            low = t
+        else:
+            high = t
+        t = (low + high) / 2
+    return t
+
+
+def _solve_array(np, xs, a: float, b: float):
+    t = xs.copy()
+    for _ in range(NEWTON_ITERATIONS):
+        slope = _slope(t, a, b)
+        steep = np.abs(slope) >= 1e-6
+        t = np.where(steep, t - (_coord(t, a, b) - xs) / np.where(steep, slope, 1.0), t)
+    t = np.clip(t, 0.0, 1.0)
+
+    # Bisection for what Newton did not converge on
+    unsolved = np.abs(_coord(t, a, b) - xs) >= EPSILON
+    if unsolved.any():
+        target = xs[unsolved]
+        low = np.zeros_like(target)
+        high = np.ones_like(target)
+        for _ in range(BISECTION_ITERATIONS):
+            middle = (low + high) / 2
+            below = _coord(middle, a, b) < target
+            low = np.where(below, middle, low)
+            high = np.where(below, high, middle)
+        t[unsolved] = (low + high) / 2
+    return t
+
+
+class BezierCurve:
+    """A bezier with its lookup table. Get one through `curve_for` to share tables."""
+
+    def __init__(self, points: Sequence[float]):
+        self.points: Points = tuple(float(p) for p in points)  # type: ignore
+        self._lut = None
+
+    @property
+    def x0(self) -> float:
+        return self.points[0]
+
+    @property
+    def y0(self) -> float:
+        return self.points[1]
+
+    @property
+    def x1(self) -> float:
+        return self.points[2]
+
+    @property
+    def y1(self) -> float:
+        return self.points[3]
+
+    def progress(self, time: float) -> float:
+        """Solve the progress at a time (0-1) exactly."""
+        time = min(max(time, 0.0), 1.0)
+        return _coord(solve_t(time, self.x0, self.x1), self.y0, self.y1)
+
+    @property
+    def lut(self):
+        """Progress at LUT_SIZE + 1 evenly spaced times, built on first use."""
+        if self._lut is None:
+            np = _numpy()
+            if np is not None:
+                times = np.linspace(0.0, 1.0, LUT_SIZE + 1)
+                self._lut = _coord(_solve_array(np, times, self.x0, self.x1), self.y0, self.y1)
+            else:
+                self._lut = [self.progress(i / LUT_SIZE) for i in range(LUT_SIZE + 1)]
+        return self._lut
+
+    def at(self, time: float) -> float:
+        """Get the progress at a time from the lookup table."""
+        lut = self.lut
+        position = min(max(time, 0.0), 1.0) * LUT_SIZE
+        index = min(int(position), LUT_SIZE - 1)
+        fraction = position - index
+        return float(lut[index] + (lut[index + 1] - lut[index]) * fraction)
+
+    def sample(self, times: Sequence[float]):
+        """
+        Get the progress at many times from the lookup table.
+
+        Returns:
+            A numpy array if numpy is installed, a list otherwise
+        """
+        np = _numpy()
+        if np is None:
+            return [self.at(time) for time in times]
+        grid = np.linspace(0.0, 1.0, LUT_SIZE + 1)
+        return np.interp(np.clip(np.asarray(times, dtype=float), 0.0, 1.0), grid, self.lut)
+
+    @property
+    def extent(self) -> Tuple[float, float]:
+        """Lowest and highest progress the curve reaches."""
+        # Where dy/dt = 0, besides the ends
+        ts = [0.0, 1.0]
+        a, b = self.y0, self.y1
+        qa, qb, qc = 3 * (1 - 3 * b + 3 * a), 2 * (3 * b - 6 * a), 3 * a
+        if abs(qa) < 1e-12:
+            if abs(qb) > 1e-12:
+                ts.append(-qc / qb)
+        else:
+            discriminant = qb * qb - 4 * qa * qc
+            if discriminant >= 0:
+                root = math.sqrt(discriminant)
+                ts.extend(((-qb + root) / (2 * qa), (-qb - root) / (2 * qa)))
+        values = [_coord(t, a, b) for t in ts if 0.0 <= t <= 1.0]
+        return min(values), max(values)
+
+    @property
+    def overshoots(self) -> bool:
+        """Whether the progress goes below 0 or above 1 (a bounce)."""
+        low, high = self.extent
+        return low < -1e-9 or high > 1 + 1e-9
+
+    def difference(self, other: 'BezierCurve') -> float:
+        """Largest progress difference between two curves over the animation."""
+        np = _numpy()
+        if np is not None:
+            return float(np.max(np.abs(self.lut - other.lut)))
+        return max(abs(a - b) for a, b in zip(self.lut, other.lut))
+
+    def __repr__(self) -> str:
+        return f"BezierCurve{self.points}"
+
+
+@lru_cache(maxsize=256)
+def _curve(points: Points) -> BezierCurve:
+    return BezierCurve(points)
+
+
+def curve_for(points: Sequence[float]) -> BezierCurve:
+    """Get the shared curve (and lookup table) of a set of control points."""
+    return _curve(tuple(float(p) for p in points))
+
+
+def similar_curves(curves: dict, tolerance: float = 0.01) -> List[Tuple[str, str, float]]:
+    """
+    Find pairs of named curves that animate (almost) the same.
+
+    Args:
+        curves: Name -> BezierCurve
+        tolerance: Largest progress difference still counted as the same
+
+    Returns:
+        (name, other name, difference) for each pair, in name order
+    """
+    names = sorted(curves)
+    pairs = []
+    for i, name in enumerate(names):
+        for other in names[i + 1:]:
+            difference = curves[name].difference(curves[other])
+            if difference <= tolerance:
+                pairs.append((name, other, difference))
+    return pairs
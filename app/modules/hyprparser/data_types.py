@@ -2,19 +2,28 @@
 Data type classes for Hyprland configuration values.
 
 Provides Setting, Color, Bezier, and Gradient classes that match
-the hyprparser-py API for backward compatibility.
+the hyprparser-py API for backward compatibility, plus Keyword and
+Block for lines and sections that may appear more than once.
 """
 
-from typing import Any, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+import copy
+import itertools
 import re
 
+if TYPE_CHECKING:
+    from .curves import BezierCurve
+
 
 class Setting:
     """Represents a single configuration setting with a path and value."""
     
-    def __init__(self, section: str, value: Any):
+    def __init__(self, section: str, value: Any, raw: Optional[str] = None):
         self.section = section
         self.value = value
+        # Text as written in the config when it uses $variables, so
+        # the references survive a save; None for literal values
+        self.raw = raw
     
     def __str__(self) -> str:
         return f"Setting({self.section}, {self.value})"
@@ -62,7 +71,12 @@ class Color:
     
     @classmethod
     def from_rgba_string(cls, rgba_str: str) -> 'Color':
-        """Create Color from rgba(r,g,b,a) string."""
+        """Create Color from rgba(r,g,b,a), rgba(rrggbbaa) or rgb(rrggbb) string."""
+        inner = rgba_str.strip()
+        inner = inner[inner.find('(') + 1:].rstrip(')').strip()
+        if ',' not in inner and len(inner) in (6, 8) and all(c in '0123456789abcdefABCDEF' for c in inner):
+            return cls.from_hex(inner)
+        
         # Extract numbers from rgba string
         numbers = re.findall(r'\d+\.?\d*', rgba_str)
         if len(numbers) >= 3:
@@ -75,6 +89,14 @@ class Color:
         """Convert to rgba(r,g,b,a) string format."""
         return f"rgba({self.r},{self.g},{self.b},{self.a/255:.2f})"
     
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+        return (self.r, self.g, self.b, self.a) == (other.r, other.g, other.b, other.a)
+    
+    def __hash__(self) -> int:
+        return hash((self.r, self.g, self.b, self.a))
+    
     def __str__(self) -> str:
         return f"#{self.hex}"
     
@@ -105,6 +127,12 @@ class Bezier:
     def y1(self) -> float:
         return self.points[3]
     
+    @property
+    def curve(self) -> 'BezierCurve':
+        """The evaluated curve, shared by every bezier with the same points."""
+        from .curves import curve_for
+        return curve_for(self.points)
+    
     def to_config_string(self) -> str:
         """Convert to Hyprland config format: bezier = name, x0, y0, x1, y1"""
         return f"bezier = {self.name}, {self.x0}, {self.y0}, {self.x1}, {self.y1}"
@@ -120,6 +148,14 @@ class Bezier:
             return cls(name, points)
         raise ValueError(f"Invalid bezier config: {config_line}")
     
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Bezier):
+            return NotImplemented
+        return self.name == other.name and tuple(self.points) == tuple(other.points)
+    
+    def __hash__(self) -> int:
+        return hash((self.name, tuple(self.points)))
+    
     def __str__(self) -> str:
         return f"Bezier({self.name}, {self.points})"
     
@@ -127,6 +163,100 @@ class Bezier:
         return self.__str__()
 
 
+class Keyword:
+    """
+    Represents a repeatable keyword line such as bind, exec-once or source.
+    
+    Unlike settings, keywords are not unique per path, so they are kept
+    in file order with their raw (unexpanded) value. `line` is the
+    1-based line it was read from (0 if it was not read from a file) and
+    is not part of equality.
+    """
+    
+    def __init__(self, name: str, value: str, section: str = "", line: int = 0):
+        self.name = name
+        self.value = value
+        self.section = section
+        self.line = line
+    
+    def to_config_string(self) -> str:
+        """Convert to Hyprland config format: name = value"""
+        return f"{self.name} = {self.value}"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Keyword):
+            return NotImplemented
+        return (self.name, self.value, self.section) == (other.name, other.value, other.section)
+    
+    def __hash__(self) -> int:
+        return hash((self.name, self.value, self.section))
+    
+    def __str__(self) -> str:
+        return f"Keyword({self.name}, {self.value})"
+    
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+# Ids of Block instances; never reused within a process
+_block_ids = itertools.count(1)
+
+
+class Block:
+    """
+    Represents one instance of a section that may appear many times,
+    such as `device { }` in hyprland.conf or `listener { }` in hypridle.conf.
+    
+    Options are kept per instance in file order. `id` is unique and
+    never reused, so it keeps referring to the same block while others
+    are added or removed; it is not part of equality.
+    """
+    
+    def __init__(self, name: str, options: Optional[Dict[str, Setting]] = None, line: int = 0):
+        self.name = name
+        self.options: Dict[str, Setting] = options if options is not None else {}
+        self.line = line
+        self.id = next(_block_ids)
+    
+    @property
+    def key(self) -> Optional[str]:
+        """The block's `name` option (e.g. the device name), if it has one."""
+        setting = self.options.get('name')
+        return str(setting.value) if setting is not None else None
+    
+    def get(self, option: str, fallback: Any = None) -> Any:
+        """Get the value of an option of this block."""
+        setting = self.options.get(option)
+        return setting.value if setting is not None else fallback
+    
+    def copy(self) -> 'Block':
+        """Copy the block and its values (widgets edit some in place), keeping its id."""
+        block = Block(self.name, {
+            key: Setting(setting.section, copy.copy(setting.value), setting.raw)
+            for key, setting in self.options.items()
+        }, self.line)
+        block.id = self.id
+        return block
+    
+    def _values(self) -> Dict[str, Any]:
+        return {key: setting.value for key, setting in self.options.items()}
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Block):
+            return NotImplemented
+        return self.name == other.name and self._values() == other._values()
+    
+    def __hash__(self) -> int:
+        return hash((self.name, self.key))
+    
+    def __str__(self) -> str:
+        key = self.key
+        return f"Block({self.name}, {key})" if key is not None else f"Block({self.name}, #{self.id})"
+    
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
 class Gradient:
     """Represents a gradient with multiple colors."""
     
@@ -0,0 +1,135 @@
+"""
+Hyprland's built-in option defaults.
+
+`DEFAULTS` is a frozen table of the values Hyprland uses for options that
+are not set in any config file. It lives in `_default_values.py`, which is
+generated from the output of `hyprctl descriptions -j` kept in
+tests/fixtures/hyprctl_descriptions.json. After a Hyprland release:
+
+    hyprctl descriptions -j > tests/fixtures/hyprctl_descriptions.json
+    python -m app.modules.hyprparser.defaults tests/fixtures/hyprctl_descriptions.json
+"""
+
+import json
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ._default_values import VALUES
+from .data_types import Color
+
+
+DEFAULTS: Mapping[str, Any] = MappingProxyType(VALUES)
+
+# Option types reported by `hyprctl descriptions`
+TYPE_BOOL = 0
+TYPE_INT = 1
+TYPE_FLOAT = 2
+TYPE_STRING_SHORT = 3
+TYPE_STRING_LONG = 4
+TYPE_COLOR = 5
+TYPE_CHOICE = 6
+TYPE_GRADIENT = 7
+TYPE_VECTOR = 8
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_default_values.py')
+
+
+def _argb(value: int) -> Color:
+    """Convert a color stored as a 0xAARRGGBB integer."""
+    return Color((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, (value >> 24) & 0xFF)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def default_from_description(entry: Dict[str, Any]) -> Any:
+    """
+    Get the default value of one `hyprctl descriptions` entry.
+
+    Values are converted to what the parser produces for the same text
+    in hyprland.conf, so they compare equal to parsed settings.
+
+    Args:
+        entry: One element of the descriptions list
+
+    Returns:
+        The default value
+
+    Raises:
+        ValueError: If the entry has an unknown type
+    """
+    kind = entry['type']
+    data = entry['data']
+
+    if kind == TYPE_BOOL:
+        return bool(data['value'])
+    if kind == TYPE_INT:
+        return int(data['value'])
+    if kind == TYPE_FLOAT:
+        return float(data['value'])
+    if kind in (TYPE_STRING_SHORT, TYPE_STRING_LONG):
+        return data['value']
+    if kind == TYPE_COLOR:
+        return _argb(data['value'])
+    if kind == TYPE_CHOICE:
+        return data['choices'].split(',')[data['firstIndex']]
+    if kind == TYPE_GRADIENT:
+        # A single color is read as a plain color, like in the config
+        parts = data['value'].split()
+        if len(parts) == 1 and parts[0].startswith('0x'):
+            return _argb(int(parts[0], 16))
+        return data['value']
+    if kind == TYPE_VECTOR:
+        return f"{_number(data['x'])} {_number(data['y'])}"
+    raise ValueError(f"{entry['value']} has unknown option type {kind}")
+
+
+def from_descriptions(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the defaults table from `hyprctl descriptions -j` output.
+
+    Args:
+        entries: The parsed JSON list
+
+    Returns:
+        Dictionary of option path to default value
+    """
+    return {entry['value']: default_from_description(entry) for entry in entries}
+
+
+def render_table(values: Dict[str, Any]) -> str:
+    """Render a defaults table as the source of `_default_values.py`."""
+    lines = [
+        '"""Generated by `python -m app.modules.hyprparser.defaults` from `hyprctl descriptions -j`. Do not edit."""',
+        '',
+        'from .data_types import Color',
+        '',
+        '',
+        'VALUES = {',
+    ]
+    for path, value in values.items():
+        lines.append(f"    {path!r}: {value!r},")
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Regenerate `_default_values.py` from a descriptions file."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m app.modules.hyprparser.defaults DESCRIPTIONS.json", file=sys.stderr)
+        return 2
+
+    with open(argv[0], 'r', encoding='utf-8') as f:
+        values = from_descriptions(json.load(f))
+    with open(TABLE_PATH, 'w', encoding='utf-8') as f:
+        f.write(render_table(values))
+    print(f"Wrote {len(values)} defaults to {TABLE_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
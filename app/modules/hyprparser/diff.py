@@ -0,0 +1,339 @@
+"""
+Diffs of parsed configuration state and of config text.
+
+Used to preview what a save, an import or a profile switch will change.
+
+Entries are matched by hashing, so every diff here runs in linear time,
+also on configs with 100k lines. Ordered sequences (repeatable keywords,
+lines of text) use Heckel's algorithm: lines that occur exactly once on
+both sides anchor the match, which is then grown to neighbouring equal
+lines. For the usual edits (changed, added or removed lines) the result
+is the minimal edit script; lines that moved are reported as removed and
+added again.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .data_types import Setting
+
+
+class Edit:
+    """A single step of an edit script."""
+
+    __slots__ = ('op', 'kind', 'key', 'old', 'new')
+
+    def __init__(self, op: str, kind: str, key: Any, old: Any = None, new: Any = None):
+        # 'add', 'remove' or 'change'
+        self.op = op
+        # 'setting', 'block', 'keyword', 'bezier', 'variable' or 'line'
+        self.kind = kind
+        # Option path or name; the position in the new sequence for
+        # additions to ordered sequences, in the old one for removals
+        self.key = key
+        self.old = old
+        self.new = new
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary, with values as strings."""
+        return {
+            'op': self.op,
+            'kind': self.kind,
+            'key': self.key,
+            'old': None if self.old is None else str(self.old),
+            'new': None if self.new is None else str(self.new),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Edit):
+            return NotImplemented
+        return (self.op, self.kind, self.key, self.old, self.new) == \
+            (other.op, other.kind, other.key, other.old, other.new)
+
+    def __str__(self) -> str:
+        if self.op == 'add':
+            return f"+ {self.kind} {self.key}: {self.new}"
+        if self.op == 'remove':
+            return f"- {self.kind} {self.key}: {self.old}"
+        return f"~ {self.kind} {self.key}: {self.old} -> {self.new}"
+
+    def __repr__(self) -> str:
+        return f"Edit({self.op}, {self.kind}, {self.key!r}, {self.old!r}, {self.new!r})"
+
+
+def diff_mappings(old: Mapping[str, Any], new: Mapping[str, Any], kind: str) -> List[Edit]:
+    """
+    Diff keyed entries (settings, beziers, variables).
+
+    Args:
+        old: Previous key -> value mapping
+        new: Current key -> value mapping
+        kind: Label of the edits
+
+    Returns:
+        Changes and additions in the order of `new`, then removals in
+        the order of `old`
+    """
+    missing = object()
+    edits = []
+    for key, value in new.items():
+        previous = old.get(key, missing)
+        if previous is missing:
+            edits.append(Edit('add', kind, key, new=value))
+        elif previous != value:
+            edits.append(Edit('change', kind, key, previous, value))
+    edits.extend(Edit('remove', kind, key, old=value) for key, value in old.items() if key not in new)
+    return edits
+
+
+def match_sequences(old: Sequence[Hashable], new: Sequence[Hashable]) -> List[Tuple[int, int]]:
+    """
+    Find equal entries of two sequences, in linear time (Heckel's algorithm).
+
+    Args:
+        old: Previous entries
+        new: Current entries
+
+    Returns:
+        Increasing (old index, new index) pairs of matching entries
+    """
+    # Common prefix and suffix are matched without hashing
+    start = 0
+    end_old, end_new = len(old), len(new)
+    while start < end_old and start < end_new and old[start] == new[start]:
+        start += 1
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+
+    # Entries that occur once on each side are certain matches
+    old_count = Counter(old[start:end_old])
+    new_count = Counter(new[start:end_new])
+    old_index = {old[i]: i for i in range(start, end_old)}
+    new_to_old: Dict[int, int] = {}
+    for j in range(start, end_new):
+        entry = new[j]
+        if new_count[entry] == 1 and old_count[entry] == 1:
+            new_to_old[j] = old_index[entry]
+    matched_old = set(new_to_old.values())
+
+    # Grow each match to equal neighbours, forwards then backwards
+    for j in range(start, end_new - 1):
+        i = new_to_old.get(j)
+        if i is not None and j + 1 not in new_to_old and i + 1 < end_old \
+                and i + 1 not in matched_old and old[i + 1] == new[j + 1]:
+            new_to_old[j + 1] = i + 1
+            matched_old.add(i + 1)
+    for j in range(end_new - 1, start, -1):
+        i = new_to_old.get(j)
+        if i is not None and j - 1 not in new_to_old and i - 1 >= start \
+                and i - 1 not in matched_old and old[i - 1] == new[j - 1]:
+            new_to_old[j - 1] = i - 1
+            matched_old.add(i - 1)
+
+    # Keep the matches that preserve order; the others are moves
+    pairs = [(i, i) for i in range(start)]
+    last = start - 1
+    for j in range(start, end_new):
+        i = new_to_old.get(j)
+        if i is not None and i > last:
+            pairs.append((i, j))
+            last = i
+    pairs.extend(zip(range(end_old, len(old)), range(end_new, len(new))))
+    return pairs
+
+
+def diff_sequences(old: Sequence[Hashable], new: Sequence[Hashable], kind: str) -> List[Edit]:
+    """
+    Diff ordered, repeatable entries (keywords such as bind or exec-once).
+
+    Args:
+        old: Previous entries
+        new: Current entries
+        kind: Label of the edits
+
+    Returns:
+        Ordered edit script turning `old` into `new`. Removals carry their
+        index in `old`, additions their index in `new`.
+    """
+    edits = []
+    i = j = 0
+    for old_index, new_index in match_sequences(old, new) + [(len(old), len(new))]:
+        edits.extend(Edit('remove', kind, index, old=old[index]) for index in range(i, old_index))
+        edits.extend(Edit('add', kind, index, new=new[index]) for index in range(j, new_index))
+        i, j = old_index + 1, new_index + 1
+    return edits
+
+
+def _opcodes(old: Sequence[Hashable], new: Sequence[Hashable]) -> List[Tuple[str, int, int, int, int]]:
+    """Get difflib style (tag, i1, i2, j1, j2) runs of equal and changed lines."""
+    codes: List[Tuple[str, int, int, int, int]] = []
+    i = j = 0
+    for old_index, new_index in match_sequences(old, new):
+        if i < old_index or j < new_index:
+            codes.append(('replace', i, old_index, j, new_index))
+        if codes and codes[-1][0] == 'equal':
+            tag, i1, _, j1, _ = codes[-1]
+            codes[-1] = (tag, i1, old_index + 1, j1, new_index + 1)
+        else:
+            codes.append(('equal', old_index, old_index + 1, new_index, new_index + 1))
+        i, j = old_index + 1, new_index + 1
+    if i < len(old) or j < len(new):
+        codes.append(('replace', i, len(old), j, len(new)))
+    return codes
+
+
+def _grouped_opcodes(codes: List[Tuple[str, int, int, int, int]], context: int) -> Iterator[list]:
+    """Split opcodes into hunks with `context` equal lines around changes."""
+    if not codes:
+        return
+    codes = list(codes)
+    if codes[0][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+    if codes[-1][0] == 'equal':
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == 'equal' and i2 - i1 > 2 * context:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == 'equal'):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def unified_diff(old: str, new: str, fromfile: str = '', tofile: str = '', context: int = 3) -> str:
+    """
+    Get a unified diff between two texts, in linear time.
+
+    The output has the same format as `difflib.unified_diff`.
+
+    Args:
+        old: Previous text
+        new: Current text
+        fromfile: Name shown for the previous text
+        tofile: Name shown for the current text (default: `fromfile`)
+        context: Number of unchanged lines around each change
+
+    Returns:
+        The diff, or an empty string if the texts are equal
+    """
+    a = old.splitlines(keepends=True)
+    b = new.splitlines(keepends=True)
+    out = []
+    for group in _grouped_opcodes(_opcodes(a, b), context):
+        if not out:
+            out.append(f"--- {fromfile}\n")
+            out.append(f"+++ {tofile or fromfile}\n")
+        first, last = group[0], group[-1]
+        out.append(f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@\n")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                out.extend(' ' + line for line in a[i1:i2])
+            else:
+                out.extend('-' + line for line in a[i1:i2])
+                out.extend('+' + line for line in b[j1:j2])
+    return ''.join(out)
+
+
+class ConfigDiff:
+    """Differences between two states of a config, grouped by kind."""
+
+    def __init__(
+        self,
+        settings: Optional[List[Edit]] = None,
+        keywords: Optional[List[Edit]] = None,
+        beziers: Optional[List[Edit]] = None,
+        variables: Optional[List[Edit]] = None,
+        text: str = '',
+        blocks: Optional[List[Edit]] = None,
+    ):
+        self.settings = settings or []
+        self.keywords = keywords or []
+        self.beziers = beziers or []
+        self.variables = variables or []
+        # Options of repeatable blocks, keyed like "device[mouse]:sensitivity"
+        self.blocks = blocks or []
+        # Unified diff of the config file, if known
+        self.text = text
+
+    def __iter__(self) -> Iterator[Edit]:
+        yield from self.variables
+        yield from self.settings
+        yield from self.blocks
+        yield from self.beziers
+        yield from self.keywords
+
+    def __len__(self) -> int:
+        return len(self.settings) + len(self.blocks) + len(self.keywords) + len(self.beziers) + len(self.variables)
+
+    def __bool__(self) -> bool:
+        # Formatting-only differences of the text do not count
+        return len(self) > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {'edits': [edit.to_dict() for edit in self], 'text': self.text}
+
+    def __str__(self) -> str:
+        return f"ConfigDiff({len(self)} edits)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def _values(settings: Mapping[str, Setting]) -> Dict[str, Any]:
+    return {path: setting.value for path, setting in settings.items()}
+
+
+def _block_values(blocks) -> Dict[str, Any]:
+    """Flatten blocks to "name[key]:option" -> value; unnamed blocks are numbered."""
+    values: Dict[str, Any] = {}
+    counts: Counter = Counter()
+    for block in blocks:
+        key = block.key
+        if key is None:
+            key = f"#{counts[block.name]}"
+            counts[block.name] += 1
+        for option, setting in block.options.items():
+            values[f"{block.name}[{key}]:{option}"] = setting.value
+    return values
+
+
+def diff_parsers(old, new, text: bool = True) -> ConfigDiff:
+    """
+    Diff two parsed configs.
+
+    Args:
+        old: HyprlandConfigParser with the previous state
+        new: HyprlandConfigParser with the current state
+        text: Also diff the config file both would write
+
+    Returns:
+        The differences
+    """
+    return ConfigDiff(
+        settings=diff_mappings(_values(old.settings), _values(new.settings), 'setting'),
+        keywords=diff_sequences(old.keywords, new.keywords, 'keyword'),
+        beziers=diff_mappings(old.beziers, new.beziers, 'bezier'),
+        variables=diff_mappings(old.variables, new.variables, 'variable'),
+        text=unified_diff(
+            old._generate_config_content(), new._generate_config_content(), new.config_path,
+        ) if text else '',
+        blocks=diff_mappings(_block_values(old.blocks), _block_values(new.blocks), 'block'),
+    )
@@ -0,0 +1,174 @@
+"""
+Apply one patch to many config trees at once.
+
+Meant for hosts that manage lots of user config directories. Every
+config is loaded, patched and saved by its own HyprDataManager in a
+worker process, so throughput scales with the number of cores. Each
+outcome is a small JSON-serializable dict, reported as soon as it is
+ready:
+
+    {"path": "/home/a/.config/hypr/hyprland.conf", "status": "changed",
+     "changes": ["set general:gaps_in"]}
+"""
+
+import contextlib
+import glob
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from .diff import unified_diff
+from .manager import HyprDataManager
+from .patch import apply_patch
+
+CONFIG_NAME = 'hyprland.conf'
+
+# Tasks queued per worker; bounds memory however many configs there are
+IN_FLIGHT_PER_WORKER = 4
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def find_configs(roots: Iterable[str]) -> List[str]:
+    """
+    Expand config roots into config file paths.
+
+    Args:
+        roots: Files, directories containing hyprland.conf, or glob
+            patterns matching either
+
+    Returns:
+        Absolute config paths in the given order, without duplicates
+    """
+    configs = []
+    seen = set()
+    for root in roots:
+        matches = sorted(glob.glob(os.path.expanduser(root))) or [root]
+        for match in matches:
+            if os.path.isdir(match):
+                match = os.path.join(match, CONFIG_NAME)
+            path = os.path.abspath(match)
+            if path not in seen:
+                seen.add(path)
+                configs.append(path)
+    return configs
+
+
+def map_in_processes(worker: Callable[[T], R], items: Iterable[T], jobs: Optional[int] = None) -> Iterator[R]:
+    """
+    Map a picklable function over items in worker processes.
+
+    Results come back in input order. Only a few tasks per worker are
+    queued at a time, so `items` can be a lazy iterator of any length.
+
+    Args:
+        worker: Module-level function to call for each item
+        items: Inputs to the worker
+        jobs: Number of worker processes (default: number of CPUs)
+
+    Yields:
+        The worker's result for each item
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if isinstance(items, list):
+        jobs = min(jobs, len(items))
+
+    if jobs <= 1:
+        yield from map(worker, items)
+        return
+
+    limit = jobs * IN_FLIGHT_PER_WORKER
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(worker, item))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def apply_to_config(
+    path: str,
+    patch: Dict[str, Any],
+    dry_run: bool = False,
+    sparse: bool = False,
+) -> Dict[str, Any]:
+    """
+    Apply a patch to a single config file.
+
+    Args:
+        path: Path to hyprland.conf
+        patch: Validated patch
+        dry_run: Do not write anything, report a diff instead
+        sparse: Also remove options set to Hyprland's default value
+
+    Returns:
+        Outcome with the path, a status of "changed", "unchanged" or
+        "error", and the changes, diff or error message
+    """
+    result: Dict[str, Any] = {'path': path}
+
+    if not os.path.isfile(path):
+        result.update(status='error', error='config file not found')
+        return result
+
+    # The parser reports problems with print(); keep them out of the
+    # JSON lines stream and attach them to the result instead
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        try:
+            data = HyprDataManager(path, lazy=True)
+            data.parser.create_default = False
+            # Patching a config that failed to load would overwrite it
+            if not data.reload():
+                raise OSError(messages.getvalue().strip() or 'failed to load config')
+            changes = apply_patch(data, patch)
+            if sparse:
+                changes.extend(f"remove default {key}" for key in data.prune_defaults())
+
+            if not data.dirty:
+                result.update(status='unchanged', changes=[])
+            elif dry_run:
+                old = data.parser.base_text or ''
+                new = data.parser._generate_config_content()
+                result.update(status='changed', changes=changes, diff=unified_diff(old, new, path))
+            elif data.save_all():
+                result.update(status='changed', changes=changes)
+            else:
+                result.update(status='error', error=messages.getvalue().strip() or 'save failed')
+        except Exception as e:
+            result.update(status='error', error=str(e))
+
+    return result
+
+
+def apply_fleet(
+    paths: Iterable[str],
+    patch: Dict[str, Any],
+    dry_run: bool = False,
+    sparse: bool = False,
+    jobs: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Apply a patch to many configs in parallel.
+
+    Results are yielded in the order of `paths`, each one as soon as it
+    and the ones before it are done.
+
+    Args:
+        paths: Config files, e.g. from `find_configs`
+        patch: Validated patch
+        dry_run: Do not write anything, report diffs instead
+        sparse: Also remove options set to Hyprland's default value
+        jobs: Number of worker processes (default: number of CPUs)
+
+    Yields:
+        One outcome per path, see `apply_to_config`
+    """
+    worker = partial(apply_to_config, patch=patch, dry_run=dry_run, sparse=sparse)
+    yield from map_in_processes(worker, paths, jobs)
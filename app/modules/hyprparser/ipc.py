@@ -0,0 +1,428 @@
+"""
+Hyprland IPC helpers.
+
+Provides socket path resolution, an incremental parser for the event
+socket (.socket2.sock), a small event bus that dispatches typed events
+to subscribers and requests on the command socket (.socket.sock).
+
+Nothing in here depends on GTK; the GLib main loop integration lives in
+the application and only drives `EventSocketReader.read_available()`.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Field names for every event Hyprland writes to .socket2.sock.
+# The last field absorbs any remaining commas (window titles, layouts...).
+EVENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'workspace': ('name',),
+    'workspacev2': ('id', 'name'),
+    'focusedmon': ('monitor', 'workspace'),
+    'focusedmonv2': ('monitor', 'workspace_id'),
+    'activewindow': ('window_class', 'title'),
+    'activewindowv2': ('address',),
+    'fullscreen': ('state',),
+    'monitorremoved': ('name',),
+    'monitorremovedv2': ('id', 'name', 'description'),
+    'monitoradded': ('name',),
+    'monitoraddedv2': ('id', 'name', 'description'),
+    'createworkspace': ('name',),
+    'createworkspacev2': ('id', 'name'),
+    'destroyworkspace': ('name',),
+    'destroyworkspacev2': ('id', 'name'),
+    'moveworkspace': ('name', 'monitor'),
+    'moveworkspacev2': ('id', 'name', 'monitor'),
+    'renameworkspace': ('id', 'name'),
+    'activespecial': ('name', 'monitor'),
+    'activespecialv2': ('id', 'name', 'monitor'),
+    'activelayout': ('keyboard', 'layout'),
+    'openwindow': ('address', 'workspace', 'window_class', 'title'),
+    'closewindow': ('address',),
+    'movewindow': ('address', 'workspace'),
+    'movewindowv2': ('address', 'workspace_id', 'workspace'),
+    'openlayer': ('namespace',),
+    'closelayer': ('namespace',),
+    'submap': ('name',),
+    'changefloatingmode': ('address', 'floating'),
+    'urgent': ('address',),
+    'screencast': ('state', 'owner'),
+    'windowtitle': ('address',),
+    'windowtitlev2': ('address', 'title'),
+    'togglegroup': ('state', 'addresses'),
+    'moveintogroup': ('address',),
+    'moveoutofgroup': ('address',),
+    'ignoregrouplock': ('state',),
+    'lockgroups': ('state',),
+    'configreloaded': (),
+    'pin': ('address', 'state'),
+    'minimized': ('address', 'state'),
+    'bell': ('address',),
+}
+
+# Events that mean the monitor layout changed
+MONITOR_EVENTS = (
+    'monitoradded',
+    'monitoraddedv2',
+    'monitorremoved',
+    'monitorremovedv2',
+)
+
+
+def get_socket_dir() -> Optional[str]:
+    """
+    Get the directory holding the sockets of the running Hyprland instance.
+
+    Returns:
+        Socket directory, or None if Hyprland is not running
+    """
+    signature = os.environ.get('HYPRLAND_INSTANCE_SIGNATURE')
+    if not signature:
+        return None
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        path = os.path.join(runtime_dir, 'hypr', signature)
+        if os.path.isdir(path):
+            return path
+
+    # Hyprland < 0.40 kept its sockets in /tmp
+    return os.path.join('/tmp', 'hypr', signature)
+
+
+def get_event_socket_path() -> Optional[str]:
+    """Get the path of Hyprland's event socket (.socket2.sock)."""
+    socket_dir = get_socket_dir()
+    return os.path.join(socket_dir, '.socket2.sock') if socket_dir else None
+
+
+def get_request_socket_path() -> Optional[str]:
+    """Get the path of Hyprland's command socket (.socket.sock)."""
+    socket_dir = get_socket_dir()
+    return os.path.join(socket_dir, '.socket.sock') if socket_dir else None
+
+
+def send_request(command: str, path: Optional[str] = None, timeout: float = 2.0) -> Optional[str]:
+    """
+    Send a command to Hyprland, like hyprctl does.
+
+    Args:
+        command: Request such as "keyword general:gaps_in 5"
+        path: Command socket (default: the running instance's)
+        timeout: Seconds to wait for Hyprland
+
+    Returns:
+        Hyprland's reply, or None if it could not be reached
+    """
+    path = path or get_request_socket_path()
+    if not path:
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+        sock.sendall(command.encode())
+        chunks = []
+        while True:
+            chunk = sock.recv(8192)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError as e:
+        print(f"Warning: Could not send request to Hyprland: {e}")
+        return None
+    finally:
+        sock.close()
+    return b''.join(chunks).decode(errors='replace')
+
+
+def set_keywords(values: Dict[str, str], path: Optional[str] = None) -> bool:
+    """
+    Set several options in the running Hyprland with a single batch request.
+
+    Args:
+        values: Option paths and their values, written as in hyprland.conf
+        path: Command socket (default: the running instance's)
+
+    Returns:
+        True if Hyprland answered "ok" to every keyword
+    """
+    if not values:
+        return True
+    # Hyprland splits batches on ';', so values must not contain one
+    commands = [f"keyword {key} {value}" for key, value in values.items() if ';' not in value]
+    reply = send_request('[[BATCH]]' + ';'.join(commands), path)
+    if not reply:
+        return False
+    # One "ok" or error message per command
+    return len(commands) == len(values) and reply.split() == ['ok'] * len(commands)
+
+
+def reload_config(path: Optional[str] = None) -> bool:
+    """
+    Make Hyprland read its config files again, like `hyprctl reload`.
+
+    Options set with `keyword` since the last reload go back to their
+    value in the files, or to the default if no file sets them.
+
+    Returns:
+        True if Hyprland answered "ok"
+    """
+    reply = send_request('reload', path)
+    return reply is not None and reply.strip() == 'ok'
+
+
+def get_clients(path: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get the open windows, as `hyprctl clients -j` prints them.
+
+    Args:
+        path: Command socket (default: the running instance's)
+
+    Returns:
+        One dictionary per window, or None if Hyprland could not be reached
+    """
+    reply = send_request('j/clients', path)
+    if not reply:
+        return None
+    try:
+        clients = json.loads(reply)
+    except ValueError:
+        print("Warning: Could not parse the window list from Hyprland")
+        return None
+    return clients if isinstance(clients, list) else None
+
+
+class HyprEvent:
+    """A single event received from Hyprland's event socket."""
+
+    __slots__ = ('name', 'data', 'args')
+
+    def __init__(self, name: str, data: str = ''):
+        self.name = name
+        self.data = data
+
+        fields = EVENT_FIELDS.get(name)
+        if fields:
+            self.args = tuple(data.split(',', len(fields) - 1))
+        else:
+            self.args = (data,) if data else ()
+
+    def __getattr__(self, item: str) -> str:
+        # Typed access to the event fields, e.g. event.monitor
+        fields = EVENT_FIELDS.get(self.name, ())
+        if item in fields:
+            index = fields.index(item)
+            return self.args[index] if index < len(self.args) else ''
+        raise AttributeError(item)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HyprEvent):
+            return NotImplemented
+        return self.name == other.name and self.data == other.data
+
+    def __str__(self) -> str:
+        return f"HyprEvent({self.name}, {self.data!r})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class EventStreamParser:
+    """
+    Incremental parser for the `EVENT>>DATA\\n` stream of .socket2.sock.
+
+    Bytes are received straight into a fixed ring buffer; events are
+    decoded from memoryview slices of it, so no intermediate line
+    objects are created.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes not yet consumed as events."""
+        return self._end - self._start
+
+    def writable(self) -> memoryview:
+        """
+        Get the free tail of the buffer to receive into.
+
+        Call `commit()` with the number of bytes written afterwards.
+        """
+        if self._end == len(self._buffer):
+            self._make_room()
+        return self._view[self._end:]
+
+    def commit(self, size: int) -> None:
+        """Mark `size` bytes of the writable region as filled."""
+        self._end += size
+
+    def feed(self, data: bytes) -> None:
+        """Copy `data` into the buffer (for sources that hand out bytes)."""
+        offset = 0
+        while offset < len(data):
+            target = self.writable()
+            size = min(len(target), len(data) - offset)
+            target[:size] = data[offset:offset + size]
+            self.commit(size)
+            offset += size
+
+    def events(self) -> Iterator[HyprEvent]:
+        """Yield every complete event currently in the buffer."""
+        while True:
+            buffer = self._buffer
+            view = self._view
+            newline = buffer.find(b'\n', self._start, self._end)
+            if newline < 0:
+                break
+
+            start = self._start
+            self._start = newline + 1
+
+            separator = buffer.find(b'>>', start, newline)
+            if separator < 0:
+                name = str(view[start:newline], 'utf-8', 'replace')
+                data = ''
+            else:
+                name = str(view[start:separator], 'utf-8', 'replace')
+                data = str(view[separator + 2:newline], 'utf-8', 'replace')
+
+            if name:
+                yield HyprEvent(name, data)
+
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _make_room(self) -> None:
+        """Compact the buffer, growing it if a single line fills it."""
+        pending = self._end - self._start
+
+        if self._start == 0:
+            # One event is longer than the whole buffer
+            buffer = bytearray(len(self._buffer) * 2)
+            buffer[:pending] = self._view[:pending]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+            return
+
+        self._buffer[:pending] = bytes(self._view[self._start:self._end])
+        self._start = 0
+        self._end = pending
+
+
+class EventBus:
+    """Dispatches Hyprland events to subscribers by event name."""
+
+    # Subscribe to this name to receive every event
+    ALL = '*'
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callable[[HyprEvent], None]]] = {}
+
+    def subscribe(self, name: str, callback: Callable[[HyprEvent], None]) -> Callable[[], None]:
+        """
+        Subscribe a callback to an event.
+
+        Args:
+            name: Event name like "configreloaded", or EventBus.ALL
+            callback: Called with the HyprEvent
+
+        Returns:
+            Function that removes the subscription
+        """
+        self._subscribers.setdefault(name, []).append(callback)
+
+        def unsubscribe() -> None:
+            callbacks = self._subscribers.get(name, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return unsubscribe
+
+    def dispatch(self, event: HyprEvent) -> None:
+        """Call every subscriber of the event."""
+        for name in (event.name, self.ALL):
+            for callback in tuple(self._subscribers.get(name, ())):
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error: Event handler for '{event.name}' failed: {e}")
+
+
+class EventSocketReader:
+    """
+    Non-blocking reader for Hyprland's event socket.
+
+    The owner is expected to call `read_available()` whenever the socket
+    becomes readable (e.g. from a GLib fd watch).
+    """
+
+    def __init__(self, bus: EventBus, path: Optional[str] = None, parser: Optional[EventStreamParser] = None):
+        self.bus = bus
+        self.path = path or get_event_socket_path()
+        self.parser = parser or EventStreamParser()
+        self.socket: Optional[socket.socket] = None
+
+    def connect(self) -> bool:
+        """Connect to the event socket. Returns False if it is unavailable."""
+        if not self.path:
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.path)
+            sock.setblocking(False)
+        except OSError as e:
+            sock.close()
+            print(f"Warning: Could not connect to Hyprland event socket: {e}")
+            return False
+
+        self.socket = sock
+        return True
+
+    def fileno(self) -> int:
+        return self.socket.fileno() if self.socket else -1
+
+    def read_available(self) -> bool:
+        """
+        Drain the socket and dispatch all complete events.
+
+        Returns:
+            False once the connection is closed, True otherwise
+        """
+        if self.socket is None:
+            return False
+
+        while True:
+            try:
+                size = self.socket.recv_into(self.parser.writable())
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                size = 0
+
+            if size == 0:
+                self._dispatch_pending()
+                self.close()
+                return False
+
+            self.parser.commit(size)
+            self._dispatch_pending()
+
+        return True
+
+    def close(self) -> None:
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def _dispatch_pending(self) -> None:
+        for event in self.parser.events():
+            self.bus.dispatch(event)
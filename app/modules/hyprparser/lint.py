@@ -0,0 +1,381 @@
+"""
+Config audit: pluggable lint rules run over parsed configs.
+
+Rules subclass `Rule`, override the `visit_*` hooks they care about and
+are registered with `@register_rule`. The `Linter` walks a parsed config
+once and calls every rule's hooks for each entry, so adding rules does
+not add passes over the file.
+
+`audit_fleet` runs the linter over many configs in worker processes.
+"""
+
+import contextlib
+import io
+import os
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from .binds import CONFLICT_DUPLICATE, BindIndex, parse_bind, parse_combo
+from .data_types import Bezier, Keyword
+from .fleet import map_in_processes
+from .parser import HyprlandConfigParser
+from .schema import OPTIONS, SECTIONS, VALIDATORS
+from .submaps import parse_submap_line
+from .variables import VariableCycleError
+
+
+class Finding:
+    """A single problem found in a config."""
+
+    __slots__ = ('rule', 'severity', 'message', 'line')
+
+    def __init__(self, rule: str, severity: str, message: str, line: int = 0):
+        self.rule = rule
+        self.severity = severity
+        self.message = message
+        self.line = line
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {'rule': self.rule, 'severity': self.severity, 'message': self.message, 'line': self.line}
+
+    def __str__(self) -> str:
+        return f"Finding({self.rule}, {self.line}, {self.message})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class Rule:
+    """
+    Base class for lint rules.
+
+    Hooks are only called on rules that override them. Rules are reused
+    for many files, so per-file state must be reset in `begin`.
+    """
+
+    id = ''
+    description = ''
+    # SARIF levels: error, warning or note
+    severity = 'warning'
+
+    def __init__(self):
+        self._findings: List[Finding] = []
+
+    def report(self, message: str, line: int = 0):
+        """Record a finding for the file being linted."""
+        self._findings.append(Finding(self.id, self.severity, message, line))
+
+    def begin(self, parser: HyprlandConfigParser):
+        """Called before visiting a file."""
+
+    def visit_setting(self, path: str, value: Any, line: int):
+        """Called for each option, e.g. general:gaps_in."""
+
+    def visit_keyword(self, keyword: Keyword):
+        """Called for each repeatable keyword line, in file order."""
+
+    def visit_bezier(self, bezier: Bezier):
+        """Called for each bezier curve."""
+
+    def finish(self):
+        """Called after visiting a file."""
+
+
+RULES: Dict[str, Type[Rule]] = {}
+
+
+def register_rule(cls: Type[Rule]) -> Type[Rule]:
+    """Class decorator that makes a rule available to the linter."""
+    RULES[cls.id] = cls
+    return cls
+
+
+@register_rule
+class DeprecatedOptionRule(Rule):
+    id = 'deprecated-option'
+    description = 'Option was renamed or removed in newer Hyprland versions'
+
+    def visit_setting(self, path: str, value: Any, line: int):
+        spec = OPTIONS.get(path)
+        if spec is None:
+            return
+        if spec.replaced_by:
+            self.report(f"{path} is deprecated, use {spec.replaced_by}", line)
+        elif spec.removed:
+            self.report(f"{path} was removed", line)
+
+
+@register_rule
+class OptionRangeRule(Rule):
+    id = 'out-of-range'
+    description = 'Option value has the wrong type or is outside of its allowed range'
+    severity = 'error'
+
+    def visit_setting(self, path: str, value: Any, line: int):
+        validate = VALIDATORS.get(path)
+        if validate is None or value is None:
+            # No value when its variables loop, see variable-cycle
+            return
+        try:
+            validate(value)
+        except ValueError as e:
+            self.report(str(e), line)
+
+
+@register_rule
+class UnknownSectionRule(Rule):
+    id = 'unknown-section'
+    description = 'Option is in a section Hyprland does not know'
+
+    def begin(self, parser: HyprlandConfigParser):
+        self._reported = set()
+
+    def visit_setting(self, path: str, value: Any, line: int):
+        section, sep, _ = path.partition(':')
+        if sep and section not in SECTIONS and section not in self._reported:
+            self._reported.add(section)
+            self.report(f"Unknown section '{section}'", line)
+
+
+@register_rule
+class VariableCycleRule(Rule):
+    id = 'variable-cycle'
+    description = 'Variables reference each other in a loop and cannot be expanded'
+    severity = 'error'
+
+    def begin(self, parser: HyprlandConfigParser):
+        resolver = parser.resolver
+        reported = set()
+        for name in parser.variables:
+            if name in reported:
+                continue
+            try:
+                resolver.resolve(name)
+            except VariableCycleError as e:
+                reported.update(e.cycle)
+                self.report(str(e))
+
+
+@register_rule
+class DuplicateBindRule(Rule):
+    id = 'duplicate-bind'
+    description = 'Key combination is bound more than once in the same submap'
+
+    def begin(self, parser: HyprlandConfigParser):
+        self._expand = parser.expand
+        self._submap = ''
+        self._index = BindIndex()
+
+    def visit_keyword(self, keyword: Keyword):
+        name = keyword.name
+        if name == 'submap':
+            # Expanded, so `submap = $resize` is the same submap as `submap = resize`
+            try:
+                value = self._expand(keyword.value)
+            except VariableCycleError:
+                value = keyword.value
+            self._submap = parse_submap_line(value)[0]
+            return
+        if name == 'unbind':
+            combo = parse_combo(keyword.value, self._expand)
+            if combo is not None:
+                self._index.unbind(combo[0], combo[1], self._submap)
+            return
+
+        bind = parse_bind(keyword, self._submap, self._expand)
+        if bind is None:
+            return
+        conflicts = self._index.add(bind)
+        if not conflicts:
+            return
+        # Reported once, against the first bind it collides with
+        conflict = conflicts[0]
+        where = f" in submap '{self._submap}'" if self._submap else ''
+        mods = keyword.value.split(',', 2)[0].strip()
+        if conflict.kind == CONFLICT_DUPLICATE:
+            message = f"'{mods}, {bind.key}' is already bound on line {conflict.other.line}{where}"
+        elif conflict.bind is bind:
+            message = f"'{mods}, {bind.key}' is shadowed by the bind on line {conflict.other.line}{where}, which ignores modifiers"
+        else:
+            message = f"'{mods}, {bind.key}' ignores modifiers and shadows the bind on line {conflict.bind.line}{where}"
+        self.report(message, keyword.line)
+
+
+class Linter:
+    """Runs a set of rules over parsed configs in a single pass each."""
+
+    def __init__(self, rule_ids: Optional[Sequence[str]] = None):
+        """
+        Args:
+            rule_ids: Ids of the rules to run (default: all registered rules)
+        """
+        if rule_ids is None:
+            rule_ids = list(RULES)
+        unknown = [rule_id for rule_id in rule_ids if rule_id not in RULES]
+        if unknown:
+            raise ValueError(f"Unknown lint rules: {', '.join(unknown)}")
+
+        self.rules = [RULES[rule_id]() for rule_id in rule_ids]
+        # Only call the hooks each rule overrides
+        self._hooks: Dict[str, list] = {
+            hook: [getattr(rule, hook) for rule in self.rules if getattr(type(rule), hook) is not getattr(Rule, hook)]
+            for hook in ('begin', 'visit_setting', 'visit_keyword', 'visit_bezier', 'finish')
+        }
+
+    def lint(self, parser: HyprlandConfigParser) -> List[Finding]:
+        """
+        Lint a loaded config.
+
+        Args:
+            parser: Parser that has loaded the config
+
+        Returns:
+            Findings sorted by line
+        """
+        findings: List[Finding] = []
+        for rule in self.rules:
+            rule._findings = findings
+
+        hooks = self._hooks
+        for begin in hooks['begin']:
+            begin(parser)
+
+        visit_setting = hooks['visit_setting']
+        if visit_setting:
+            lines = parser.setting_lines
+            for path, setting in parser.settings.items():
+                line = lines.get(path, 0)
+                for visit in visit_setting:
+                    visit(path, setting.value, line)
+
+        visit_keyword = hooks['visit_keyword']
+        if visit_keyword:
+            for keyword in parser.keywords:
+                for visit in visit_keyword:
+                    visit(keyword)
+
+        visit_bezier = hooks['visit_bezier']
+        if visit_bezier:
+            for bezier in parser.beziers.values():
+                for visit in visit_bezier:
+                    visit(bezier)
+
+        for finish in hooks['finish']:
+            finish()
+
+        findings.sort(key=lambda finding: finding.line)
+        return findings
+
+
+# One linter per worker process and rule selection, reused for every file
+_linters: Dict[Tuple[str, ...], Linter] = {}
+
+
+def lint_file(path: str, rule_ids: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """
+    Parse and lint one config file.
+
+    Only this file's parser is kept alive while linting, so memory use
+    does not grow with the number of files.
+
+    Args:
+        path: Path to hyprland.conf
+        rule_ids: Rules to run (default: all registered rules)
+
+    Returns:
+        Dictionary with the path and a list of findings as dictionaries
+    """
+    key = tuple(RULES) if rule_ids is None else tuple(rule_ids)
+    linter = _linters.get(key)
+    if linter is None:
+        linter = _linters[key] = Linter(key)
+
+    if not os.path.isfile(path):
+        findings = [Finding('parse-error', 'error', 'config file not found')]
+        return {'path': path, 'findings': [f.to_dict() for f in findings]}
+
+    # The parser reports problems with print()
+    messages = io.StringIO()
+    with contextlib.redirect_stdout(messages):
+        parser = HyprlandConfigParser(path, create_default=False)
+        loaded = parser.load()
+
+    if not loaded:
+        findings = [Finding('parse-error', 'error', messages.getvalue().strip() or 'failed to load config')]
+    else:
+        findings = [
+            Finding('parse-warning', 'warning', message)
+            for message in messages.getvalue().splitlines() if message
+        ]
+        findings.extend(linter.lint(parser))
+
+    return {'path': path, 'findings': [f.to_dict() for f in findings]}
+
+
+def audit_fleet(
+    paths: Iterable[str],
+    rule_ids: Optional[Sequence[str]] = None,
+    jobs: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lint many configs in parallel.
+
+    Args:
+        paths: Config files, e.g. from `find_configs`
+        rule_ids: Rules to run (default: all registered rules)
+        jobs: Number of worker processes (default: number of CPUs)
+
+    Yields:
+        One result per path, in order, see `lint_file`
+    """
+    rule_ids = tuple(RULES) if rule_ids is None else tuple(rule_ids)
+    # Fail early on unknown rules instead of in every worker
+    Linter(rule_ids)
+    yield from map_in_processes(partial(lint_file, rule_ids=rule_ids), paths, jobs)
+
+
+def to_sarif(results: Iterable[Dict[str, Any]], rule_ids: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Convert lint results to a SARIF 2.1.0 log.
+
+    Args:
+        results: Results from `lint_file` or `audit_fleet`
+        rule_ids: Rules that were run (default: all registered rules)
+
+    Returns:
+        SARIF log as a JSON-serializable dictionary
+    """
+    from pathlib import Path
+
+    rule_ids = list(RULES) if rule_ids is None else list(rule_ids)
+    rules = [
+        {'id': rule_id, 'shortDescription': {'text': RULES[rule_id].description},
+         'defaultConfiguration': {'level': RULES[rule_id].severity}}
+        for rule_id in rule_ids
+    ]
+    rules.append({'id': 'parse-error', 'shortDescription': {'text': 'Config could not be read'}})
+    rules.append({'id': 'parse-warning', 'shortDescription': {'text': 'Parser warning'}})
+
+    sarif_results = []
+    for result in results:
+        uri = Path(result['path']).absolute().as_uri()
+        for finding in result['findings']:
+            location: Dict[str, Any] = {'artifactLocation': {'uri': uri}}
+            if finding['line']:
+                location['region'] = {'startLine': finding['line']}
+            sarif_results.append({
+                'ruleId': finding['rule'],
+                'level': finding['severity'],
+                'message': {'text': finding['message']},
+                'locations': [{'physicalLocation': location}],
+            })
+
+    return {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'hyprset', 'rules': rules}},
+            'results': sarif_results,
+        }],
+    }
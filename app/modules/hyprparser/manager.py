@@ -5,24 +5,205 @@ Provides backward-compatible API matching hyprparser-py for seamless integration
 with existing widgets and application code.
 """
 
-from typing import Dict, Optional, Any, Union
-from .parser import HyprlandConfigParser
-from .data_types import Setting, Color, Bezier, Gradient
+import os
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Mapping, Optional, Any, Set, Tuple, Union
+from .parser import HyprlandConfigParser, is_repeatable_section
+from .animations import Animation, AnimationTree, collect_animations, parse_animation
+from .binds import Bind, BindConflict, BindIndex, collect_binds, parse_bind
+from .data_types import Block, Setting, Color, Bezier, Gradient, Keyword
+from .defaults import DEFAULTS
+from .diff import ConfigDiff, diff_mappings, diff_parsers, unified_diff
+from .merge import changed_keys, snapshot_settings
+from .profiles import ProfileError, ProfileStore, profiles_path
+from .schema import OPTIONS, validate_option
+from .submaps import parse_submap_line
+from .variables import VARIABLE_RE, VariableCycleError
+from .windowrules import WindowRuleSet, collect_window_rules
+
+if TYPE_CHECKING:
+    # Only needed for annotations; keeps socket out of CLI startup
+    from .ipc import EventBus, HyprEvent
+
+
+OptionObserver = Callable[[str, Optional[Setting]], None]
+
+# Where a resolved option value comes from, highest precedence first
+LAYER_OVERLAY = 'overlay'
+LAYER_PROFILE = 'profile'
+LAYER_EXPLICIT = 'explicit'
+LAYER_SOURCED = 'sourced'
+LAYER_DEFAULT = 'default'
+
+# Where the per-device options of a `device { }` block are documented
+_DEVICE_OPTION_SECTIONS = ('input', 'input:touchpad', 'input:touchdevice', 'input:tablet')
+
+
+def device_option_path(option: str) -> Optional[str]:
+    """
+    Get the global option a per-device option mirrors.
+    
+    Args:
+        option: Option inside a device block, e.g. "sensitivity"
+        
+    Returns:
+        Path like "input:sensitivity", or None if there is no such option
+    """
+    for section in _DEVICE_OPTION_SECTIONS:
+        path = f"{section}:{option}"
+        if path in OPTIONS:
+            return path
+    return None
+
+
+def _coerce_value(value: Any) -> Any:
+    """Convert color strings given by callers to Color objects."""
+    if isinstance(value, str) and (value.startswith('rgba(') or value.startswith('#')):
+        try:
+            return Color.from_rgba_string(value) if value.startswith('rgba(') else Color.from_hex(value)
+        except:
+            return value
+    return value
 
 
 class HyprDataManager:
     """Main configuration manager - matches hyprparser-py HyprData API."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        lazy: bool = False,
+        defaults: Optional[Mapping[str, Any]] = None,
+        validate: bool = True,
+    ):
         self.parser = HyprlandConfigParser(config_path)
+        # Values used for options that are not set, and whether values
+        # are checked against Hyprland's option schema; other ecosystem
+        # files (hypridle.conf...) have their own options
+        self.defaults: Mapping[str, Any] = DEFAULTS if defaults is None else defaults
+        self._validate = validate
         self._loaded = False
-        self._ensure_loaded()
+        # Values as last read from / written to disk
+        self._base_settings: Dict[str, Any] = {}
+        self._base_beziers: Dict[str, Bezier] = {}
+        self._base_keywords: List[Any] = []
+        self._base_variables: Dict[str, str] = {}
+        self._base_blocks: List[Block] = []
+        # Keys edited locally since the last load or save
+        self._dirty: Set[str] = set()
+        self._observers: Dict[str, List[OptionObserver]] = {}
+        # Layered view of every option: path -> (value, layer)
+        self._resolved: Dict[str, Tuple[Any, str]] = {}
+        # Session overrides that are never saved, by name, topmost last
+        self._overlays: Dict[str, Dict[str, Any]] = {}
+        # Values of the active profile, see `switch_profile`
+        self._profiles: Optional[ProfileStore] = None
+        self._profile: Dict[str, Any] = {}
+        self._profile_name: Optional[str] = None
+        # Parsed keybinds, built on first use
+        self._binds: Optional[BindIndex] = None
+        self._window_rules: Optional[WindowRuleSet] = None
+        self._animations: Optional[AnimationTree] = None
+        # Keys changed both on disk and locally during the last sync
+        self.conflicts: Set[str] = set()
+        if not lazy:
+            self._ensure_loaded()
+    
+    def load(self) -> bool:
+        """
+        Load the configuration unless it already is.
+        
+        Safe to call from a worker thread as long as nothing else uses
+        this manager until it returns.
+        
+        Returns:
+            True if the file could be read (or does not exist)
+        """
+        if self._loaded:
+            return True
+        loaded = self.parser.load()
+        self._loaded = True
+        self._snapshot_base()
+        self._build_resolved()
+        return loaded
+    
+    def _validate_option(self, path: str, value: Any) -> Any:
+        """Check a value against Hyprland's schema, if this is hyprland.conf."""
+        return validate_option(path, value) if self._validate else value
     
     def _ensure_loaded(self):
         """Ensure configuration is loaded."""
         if not self._loaded:
-            self.parser.load()
-            self._loaded = True
+            self.load()
+    
+    def _build_resolved(self):
+        """Precompute the layered view: explicit, then sourced, then default."""
+        resolved = {path: (value, LAYER_DEFAULT) for path, value in self.defaults.items()}
+        # The last one read wins, as in _get_sourced_option
+        for setting in self._sourced_settings(self.parser):
+            resolved[setting.section] = (setting.value, LAYER_SOURCED)
+        for path, setting in self.parser.settings.items():
+            resolved[path] = (setting.value, LAYER_EXPLICIT)
+        for path, value in self._profile.items():
+            resolved[path] = (value, LAYER_PROFILE)
+        for values in self._overlays.values():
+            for path, value in values.items():
+                resolved[path] = (value, LAYER_OVERLAY)
+        self._resolved = resolved
+    
+    def _invalidate(self, path: str):
+        """Re-resolve a single option after it changed in one of the layers."""
+        for values in reversed(self._overlays.values()):
+            if path in values:
+                self._resolved[path] = (values[path], LAYER_OVERLAY)
+                return
+        if path in self._profile:
+            self._resolved[path] = (self._profile[path], LAYER_PROFILE)
+            return
+        setting = self.parser.settings.get(path)
+        if setting is not None:
+            self._resolved[path] = (setting.value, LAYER_EXPLICIT)
+            return
+        setting = self._get_sourced_option(path)
+        if setting is not None:
+            self._resolved[path] = (setting.value, LAYER_SOURCED)
+        elif path in self.defaults:
+            self._resolved[path] = (self.defaults[path], LAYER_DEFAULT)
+        else:
+            self._resolved.pop(path, None)
+    
+    def _snapshot_base(self):
+        """Remember the current model as the on-disk state."""
+        self._base_settings = snapshot_settings(self.parser.settings)
+        self._base_beziers = dict(self.parser.beziers)
+        self._base_keywords = list(self.parser.keywords)
+        self._base_variables = dict(self.parser.variables)
+        self._base_blocks = [block.copy() for block in self.parser.blocks]
+        self._dirty.clear()
+        self._binds = None
+        self._window_rules = None
+        self._animations = None
+    
+    def _mark_dirty(self, path: str):
+        """Track a local edit, forgetting it if it matches the disk value."""
+        setting = self.parser.settings.get(path)
+        if setting is None:
+            clean = path not in self._base_settings
+        else:
+            clean = path in self._base_settings and self._base_settings[path] == setting.value
+        
+        if clean:
+            self._dirty.discard(path)
+        else:
+            self._dirty.add(path)
+    
+    @property
+    def dirty(self) -> bool:
+        """Whether there are local edits that are not saved yet."""
+        self._ensure_loaded()
+        return bool(self._dirty) or self.parser.beziers != self._base_beziers \
+            or self.parser.keywords != self._base_keywords \
+            or self.parser.variables != self._base_variables \
+            or self.parser.blocks != self._base_blocks
     
     @property
     def beziers(self) -> Dict[str, Bezier]:
@@ -41,7 +222,51 @@ class HyprDataManager:
             Setting object if found, None otherwise
         """
         self._ensure_loaded()
-        return self.parser.settings.get(path)
+        setting = self.parser.settings.get(path)
+        if setting is None:
+            setting = self._get_sourced_option(path)
+        return setting
+    
+    def _source_order(self, parser: HyprlandConfigParser, own_settings: bool = True) -> List[Any]:
+        """
+        Get a file's settings and the parsers of the files it sources, in line order.
+        
+        Hyprland reads a sourced file in place of its `source =` line, so a
+        setting after that line overrides the sourced file and one before
+        it does not.
+        """
+        items = []
+        if own_settings:
+            items.extend((parser.setting_lines.get(path, 0), setting) for path, setting in parser.settings.items())
+        for keyword in parser.keywords:
+            if keyword.name == 'source':
+                for path in parser.resolve_source_paths(keyword.value):
+                    child = parser.sourced.get(path)
+                    if child is not None:
+                        items.append((keyword.line, child))
+        items.sort(key=lambda item: item[0])
+        return [item for _, item in items]
+    
+    def _sourced_settings(self, parser: HyprlandConfigParser, own_settings: bool = False) -> Iterator[Setting]:
+        """Walk the settings of the (nested) sourced files in the order Hyprland reads them."""
+        for item in self._source_order(parser, own_settings):
+            if isinstance(item, Setting):
+                yield item
+            else:
+                yield from self._sourced_settings(item, True)
+    
+    def _get_sourced_option(self, path: str, parser: Optional[HyprlandConfigParser] = None) -> Optional[Setting]:
+        """Look an option up in sourced files, the last one read winning."""
+        own_settings = parser is not None
+        for item in reversed(self._source_order(parser or self.parser, own_settings)):
+            if isinstance(item, Setting):
+                if item.section == path:
+                    return item
+                continue
+            setting = self._get_sourced_option(path, item)
+            if setting is not None:
+                return setting
+        return None
     
     def set_option(self, path: str, value: Any) -> bool:
         """
@@ -52,23 +277,32 @@ class HyprDataManager:
             value: New value for the setting
             
         Returns:
-            True if successful
+            True if successful, False if the value is invalid for the option
         """
         self._ensure_loaded()
         
-        # Convert value to appropriate type if needed
-        if isinstance(value, Color):
-            parsed_value = value
-        elif isinstance(value, str) and (value.startswith('rgba(') or value.startswith('#')):
-            try:
-                parsed_value = Color.from_rgba_string(value) if value.startswith('rgba(') else Color.from_hex(value)
-            except:
-                parsed_value = value
-        else:
-            parsed_value = value
+        # Values that use $variables keep them and are expanded
+        raw = None
+        try:
+            if isinstance(value, str) and '$' in value:
+                raw = value.strip()
+                parsed_value = self.parser._parse_value(raw)
+            else:
+                # Convert value to appropriate type if needed
+                parsed_value = _coerce_value(value)
+            self._validate_option(path, parsed_value)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return False
         
         # Create or update the setting
-        self.parser.settings[path] = Setting(path, parsed_value)
+        self.parser.settings[path] = Setting(path, parsed_value, raw)
+        if raw is not None:
+            self.parser.resolver.track(path, raw)
+        else:
+            self.parser.resolver.untrack(path)
+        self._mark_dirty(path)
+        self._invalidate(path)
         return True
     
     def new_option(self, setting: Setting) -> bool:
@@ -83,17 +317,426 @@ class HyprDataManager:
         """
         self._ensure_loaded()
         self.parser.settings[setting.section] = setting
+        self._mark_dirty(setting.section)
+        self._invalidate(setting.section)
         return True
     
-    def save_all(self) -> bool:
+    @property
+    def variables(self) -> Dict[str, str]:
+        """Get the variable definitions, as written."""
+        self._ensure_loaded()
+        return dict(self.parser.variables)
+    
+    def resolve_variable(self, name: str) -> Optional[str]:
+        """
+        Get the expanded value of a variable.
+        
+        Args:
+            name: Variable name, including the leading $
+            
+        Returns:
+            The value, or None if it is not defined or references itself
+        """
+        self._ensure_loaded()
+        try:
+            return self.parser.resolver.resolve(name)
+        except (KeyError, VariableCycleError):
+            return None
+    
+    def variable_users(self, name: str) -> List[str]:
+        """Get the options that use a variable, directly or through others."""
+        self._ensure_loaded()
+        return sorted(self.parser.resolver.users(name))
+    
+    def set_variable(self, name: str, value: str) -> List[str]:
+        """
+        Define or change a variable.
+        
+        Only the options that use the variable are resolved again, and
+        their observers told about the new value.
+        
+        Args:
+            name: Variable name, including the leading $
+            value: Raw value, may reference other variables
+            
+        Returns:
+            Paths of the options whose value changed
+            
+        Raises:
+            ValueError: If the name is invalid, the value makes variables
+                reference each other (VariableCycleError) or an option
+                using it would get an invalid value; nothing is changed then
+        """
+        self._ensure_loaded()
+        if VARIABLE_RE.fullmatch(name) is None:
+            raise ValueError(f"Invalid variable name '{name}'")
+        previous = self.parser.variables.get(name)
+        changed = self.parser.set_variable(name, value.strip())
+        for path in changed:
+            try:
+                self._validate_option(path, self.parser.settings[path].value)
+            except ValueError:
+                # Put the old definition back, as a cycle would
+                if previous is None:
+                    self.parser.remove_variable(name)
+                else:
+                    self.parser.set_variable(name, previous)
+                raise
+        # Binds are parsed with variables expanded
+        self._binds = None
+        self._window_rules = None
+        self._animations = None
+        for path in changed:
+            self._notify(path)
+        return changed
+    
+    def remove_variable(self, name: str) -> List[str]:
+        """
+        Remove a variable.
+        
+        Args:
+            name: Variable name, including the leading $
+            
+        Returns:
+            Paths of the options whose value changed
+        """
+        self._ensure_loaded()
+        changed = self.parser.remove_variable(name)
+        self._binds = None
+        self._window_rules = None
+        self._animations = None
+        for path in changed:
+            self._notify(path)
+        return changed
+    
+    def get_default(self, path: str, fallback: Any = None) -> Any:
+        """
+        Get the value Hyprland uses when an option is not set.
+        
+        Args:
+            path: Configuration path like "general:gaps_in"
+            fallback: Returned if the option has no known default
+        """
+        return self.defaults.get(path, fallback)
+    
+    def get_value(self, path: str, fallback: Any = None) -> Any:
+        """
+        Get the value Hyprland will use for an option.
+        
+        This is the value set in the config, else the one from a sourced
+        file, else Hyprland's default. Widgets show it for options missing
+        from the config, without adding them to it.
+        
+        Args:
+            path: Configuration path like "general:gaps_in"
+            fallback: Returned if the option is not set and has no known default
+        """
+        self._ensure_loaded()
+        entry = self._resolved.get(path)
+        return fallback if entry is None else entry[0]
+    
+    def get_layer(self, path: str) -> Optional[str]:
+        """
+        Get where the value of an option comes from.
+        
+        Returns:
+            LAYER_OVERLAY, LAYER_PROFILE, LAYER_EXPLICIT, LAYER_SOURCED or
+            LAYER_DEFAULT, or None if the option is not set and has no
+            known default
+        """
+        self._ensure_loaded()
+        entry = self._resolved.get(path)
+        return None if entry is None else entry[1]
+    
+    def is_explicit(self, path: str) -> bool:
+        """Whether an option is set in the config or one of its sources."""
+        return self.get_option(path) is not None
+    
+    @property
+    def overlays(self) -> List[str]:
+        """Names of the active overlays, bottom to top."""
+        return list(self._overlays)
+    
+    def push_overlay(self, name: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Put a layer of session overrides on top of the config.
+        
+        Overlays take precedence over the config files in `get_value` but
+        are never saved, e.g. to turn blur off while screen sharing.
+        
+        Args:
+            name: Name of the overlay, used to pop it again
+            values: Option paths and values to override
+            
+        Returns:
+            Options whose effective value changed, with their new value,
+            to apply to the running Hyprland
+            
+        Raises:
+            ValueError: If the name is in use or a value is invalid
+        """
+        self._ensure_loaded()
+        if name in self._overlays:
+            raise ValueError(f"Overlay '{name}' is already active")
+        
+        layer = {}
+        for path, value in values.items():
+            value = _coerce_value(value)
+            self._validate_option(path, value)
+            layer[path] = value
+        self._overlays[name] = layer
+        
+        # The new layer is on top, so it wins for all of its keys
+        changed = {}
+        for path, value in layer.items():
+            old = self._resolved.get(path)
+            self._resolved[path] = (value, LAYER_OVERLAY)
+            if old is None or old[0] != value:
+                changed[path] = value
+        for path in changed:
+            self._notify(path)
+        return changed
+    
+    @property
+    def profiles(self) -> ProfileStore:
+        """
+        Profiles of this config, loaded on first use.
+        
+        Raises:
+            ProfileError: If the profiles file is malformed
+        """
+        self._ensure_loaded()
+        if self._profiles is None:
+            store = ProfileStore(profiles_path(self.parser.config_path))
+            store.load()
+            self._profiles = store
+            # The active profile was applied to Hyprland by an earlier switch
+            self._profile = self._parse_profile(store.get(store.active))
+            self._profile_name = store.active
+            for path in self._profile:
+                self._invalidate(path)
+        return self._profiles
+    
+    @property
+    def active_profile(self) -> Optional[str]:
+        return self.profiles.active
+    
+    def _parse_profile(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the JSON values of a profile like config values."""
+        try:
+            return {
+                path: self.parser._parse_value(value) if isinstance(value, str) else value
+                for path, value in values.items()
+            }
+        except VariableCycleError as e:
+            raise ProfileError(str(e)) from e
+    
+    def _profile_switch_keys(self, name: Optional[str], new_values: Dict[str, Any]):
+        """Get the keys a switch from the active profile to `name` touches."""
+        if self._profile_name is None or self._profile_name in self.profiles:
+            return self.profiles.diff(self._profile_name, name)
+        # The active profile was deleted, so there is no stored diff
+        return set(self._profile) | set(new_values)
+    
+    def switch_profile(self, name: Optional[str]) -> Dict[str, Any]:
+        """
+        Make another profile active.
+        
+        Only the keys in the precomputed diff between the two profiles are
+        touched. The switch is recorded in the profiles file, not in
+        hyprland.conf; use `apply_to_hyprland` to send the changes to the
+        running Hyprland in one request.
+        
+        Args:
+            name: Profile to switch to, or None for the plain config
+            
+        Returns:
+            Options whose effective value changed, with their new value
+            (None if an option is no longer set and has no known default)
+            
+        Raises:
+            ProfileError: If the profile does not exist, in which case
+                nothing is changed
+        """
+        profiles = self.profiles
+        new_values = self._parse_profile(profiles.get(name))
+        keys = self._profile_switch_keys(name, new_values)
+        
+        old_active = profiles.active
+        profiles.active = name
+        try:
+            profiles.save()
+        except OSError as e:
+            profiles.active = old_active
+            raise ProfileError(f"Could not save {profiles.path}: {e}") from e
+        
+        self._profile = new_values
+        self._profile_name = name
+        changed = {}
+        for path in keys:
+            old = self._resolved.get(path)
+            self._invalidate(path)
+            new = self._resolved.get(path)
+            if new is None:
+                if old is not None:
+                    changed[path] = None
+            elif old is None or old[0] != new[0] or type(old[0]) is not type(new[0]):
+                changed[path] = new[0]
+        for path in changed:
+            self._notify(path)
+        return changed
+    
+    def preview_profile(self, name: Optional[str]) -> ConfigDiff:
+        """
+        Get the effective option values a `switch_profile` would change.
+        
+        Raises:
+            ProfileError: If the profile does not exist
+        """
+        new_values = self._parse_profile(self.profiles.get(name))
+        keys = self._profile_switch_keys(name, new_values)
+        
+        old = {path: self._resolved[path][0] for path in keys if path in self._resolved}
+        active = self._profile
+        self._profile = new_values
+        try:
+            for path in keys:
+                self._invalidate(path)
+            new = {path: self._resolved[path][0] for path in keys if path in self._resolved}
+        finally:
+            self._profile = active
+            for path in keys:
+                self._invalidate(path)
+        return ConfigDiff(settings=diff_mappings(old, new, 'setting'))
+    
+    def apply_to_hyprland(self, values: Dict[str, Any]) -> bool:
+        """
+        Set options in the running Hyprland without touching any file.
+        
+        All values are sent as one batch request. An option whose value
+        is None (no longer set anywhere and without a known default)
+        cannot be sent as a keyword, so Hyprland reloads its config files
+        first, which resets it; the profile and overlay values, which are
+        not in any file, are then sent again with the batch.
+        
+        Args:
+            values: Option paths and values, e.g. from `switch_profile`
+            
+        Returns:
+            True if Hyprland reloaded (when needed) and accepted every value
+        """
+        from .ipc import reload_config, set_keywords
+        
+        values = dict(values)
+        if any(value is None for value in values.values()):
+            if not reload_config():
+                return False
+            for path, value in self._runtime_values().items():
+                values.setdefault(path, value)
+        
+        keywords = {
+            path: self.parser._format_value(value)
+            for path, value in values.items() if value is not None
+        }
+        if not keywords:
+            return True
+        return set_keywords(keywords)
+    
+    def _runtime_values(self) -> Dict[str, Any]:
+        """Get the profile and overlay values, which only exist in the running Hyprland."""
+        self._ensure_loaded()
+        return {
+            path: value for path, (value, layer) in self._resolved.items()
+            if layer in (LAYER_PROFILE, LAYER_OVERLAY)
+        }
+    
+    def pop_overlay(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Remove an overlay.
+        
+        Args:
+            name: Overlay to remove (default: the topmost one)
+            
+        Returns:
+            Options whose effective value changed, with the value they fall
+            back to, to re-apply to the running Hyprland. Keys that are
+            still overridden by another overlay, or fall back to the same
+            value, are left out. The value is None if the option is no
+            longer set anywhere and has no known default.
+            
+        Raises:
+            KeyError: If there is no such overlay
+        """
+        self._ensure_loaded()
+        if name is None:
+            if not self._overlays:
+                raise KeyError('No overlay is active')
+            name = next(reversed(self._overlays))
+        layer = self._overlays.pop(name)
+        
+        changed = {}
+        for path in layer:
+            old_value = self._resolved[path][0]
+            self._invalidate(path)
+            new = self._resolved.get(path)
+            if new is None:
+                changed[path] = None
+            elif new[0] != old_value:
+                changed[path] = new[0]
+        for path in changed:
+            self._notify(path)
+        return changed
+    
+    def prune_defaults(self) -> List[str]:
+        """
+        Remove options that are set to Hyprland's default value.
+        
+        Options that a sourced file also sets are kept, since removing
+        them could let the sourced value take effect.
+        
+        Returns:
+            Paths of the removed options
+        """
+        self._ensure_loaded()
+        sourced_paths = {setting.section for setting in self._sourced_settings(self.parser)}
+        
+        removed = []
+        for path, setting in list(self.parser.settings.items()):
+            if path in sourced_paths:
+                continue
+            if path not in self.defaults or setting.raw is not None:
+                continue
+            default = self.defaults[path]
+            # 1 == True in Python, so a boolean never matches a numeric default
+            if isinstance(setting.value, bool) and not isinstance(default, bool):
+                continue
+            if setting.value == default:
+                self.remove_option(path)
+                removed.append(path)
+        return removed
+    
+    def save_all(self, sparse: bool = False) -> bool:
         """
         Save all configuration changes to file.
         
+        Args:
+            sparse: Leave out options that are set to Hyprland's default
+                value, see `prune_defaults`
+        
         Returns:
             True if successful
         """
         self._ensure_loaded()
-        return self.parser.save()
+        if sparse:
+            self.prune_defaults()
+        if not self.parser.save():
+            return False
+        self._snapshot_base()
+        # Keys that were also changed outside of hyprset since loading
+        self.conflicts = {conflict.key for conflict in self.parser.last_conflicts}
+        for key in self.parser.last_merged_keys:
+            self._notify(key)
+        return True
     
     def reload(self) -> bool:
         """
@@ -103,7 +746,173 @@ class HyprDataManager:
             True if successful
         """
         self._loaded = False
-        return self.parser.load()
+        self._loaded = self.parser.load()
+        self._snapshot_base()
+        self._build_resolved()
+        return self._loaded
+    
+    def watch_option(self, path: str, callback: OptionObserver) -> Callable[[], None]:
+        """
+        Get notified when an option changes on disk.
+        
+        Args:
+            path: Configuration path like "general:gaps_in"
+            callback: Called with the path and the new Setting (None if removed)
+            
+        Returns:
+            Function that removes the observer
+        """
+        self._observers.setdefault(path, []).append(callback)
+        
+        def unwatch() -> None:
+            callbacks = self._observers.get(path, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+        
+        return unwatch
+    
+    def _notify(self, path: str):
+        """Tell the observers of an option about its new value."""
+        self._invalidate(path)
+        setting = self.get_option(path)
+        for callback in tuple(self._observers.get(path, ())):
+            try:
+                callback(path, setting)
+            except Exception as e:
+                print(f"Error: Observer for '{path}' failed: {e}")
+    
+    def watched_paths(self) -> List[str]:
+        """Get the config file and every file it sources."""
+        self._ensure_loaded()
+        return self.parser.all_paths()
+    
+    def sync_file(self, path: str) -> Set[str]:
+        """
+        Re-read a single config file that changed on disk.
+        
+        Keys that changed on disk are applied to the model unless they
+        also have unsaved local edits; those are kept and recorded in
+        `conflicts`.
+        
+        Args:
+            path: The main config file or one of its sourced files
+            
+        Returns:
+            Set of option paths whose value changed
+        """
+        self._ensure_loaded()
+        path = os.path.abspath(path)
+        
+        if path == os.path.abspath(self.parser.config_path):
+            return self._sync_main_file()
+        
+        owner = self._find_source_owner(self.parser, path)
+        if owner is None:
+            return set()
+        
+        old_child = owner.sourced[path]
+        new_child = HyprlandConfigParser(path, create_default=False)
+        new_child._seen_paths = old_child._seen_paths
+        new_child._inherited_variables = old_child._inherited_variables
+        if not new_child.load():
+            return set()
+        
+        changed = changed_keys(
+            snapshot_settings(old_child.settings), snapshot_settings(new_child.settings)
+        )
+        owner.sourced[path] = new_child
+        self._binds = None
+        self._window_rules = None
+        self._animations = None
+        for key in changed:
+            self._notify(key)
+        return changed
+    
+    def _find_source_owner(self, parser: HyprlandConfigParser, path: str) -> Optional[HyprlandConfigParser]:
+        """Find the parser that sources `path`."""
+        if path in parser.sourced:
+            return parser
+        for child in parser.sourced.values():
+            owner = self._find_source_owner(child, path)
+            if owner is not None:
+                return owner
+        return None
+    
+    def _sync_main_file(self) -> Set[str]:
+        """Merge external edits of the main config file into the model."""
+        disk = HyprlandConfigParser(self.parser.config_path, create_default=False)
+        if not disk.load():
+            return set()
+        
+        disk_settings = snapshot_settings(disk.settings)
+        applied: Set[str] = set()
+        
+        for key in changed_keys(self._base_settings, disk_settings):
+            local = self.parser.settings.get(key)
+            remote = disk.settings.get(key)
+            
+            if key in self._dirty:
+                if local is not None and remote is not None and local.value == remote.value:
+                    self._dirty.discard(key)
+                elif local is None and remote is None:
+                    self._dirty.discard(key)
+                else:
+                    self.conflicts.add(key)
+                continue
+            
+            if remote is None:
+                self.parser.settings.pop(key, None)
+            else:
+                self.parser.settings[key] = remote
+            applied.add(key)
+        
+        # Beziers, variables and keywords are taken from disk unless edited here
+        if self.parser.beziers == self._base_beziers:
+            self.parser.beziers = dict(disk.beziers)
+        if self.parser.keywords == self._base_keywords:
+            self.parser.keywords = list(disk.keywords)
+            self.parser.sourced = disk.sourced
+            self._binds = None
+            self._window_rules = None
+            self._animations = None
+            # The sourced layer was re-read as a whole
+            self._build_resolved()
+        if self.parser.variables == self._base_variables:
+            self.parser.variables = dict(disk.variables)
+        if self.parser.blocks == self._base_blocks:
+            self.parser.blocks = disk.blocks
+            self.parser.reindex_blocks()
+        self.parser._resolve_variables()
+        self.parser.raw_lines = disk.raw_lines
+        self.parser.base_text = disk.base_text
+        self.parser.base_hash = disk.base_hash
+        self.parser.base_mtime_ns = disk.base_mtime_ns
+        
+        self._base_settings = disk_settings
+        self._base_beziers = dict(disk.beziers)
+        self._base_keywords = list(disk.keywords)
+        self._base_variables = dict(disk.variables)
+        self._base_blocks = [block.copy() for block in disk.blocks]
+        
+        for key in applied:
+            self._notify(key)
+        return applied
+    
+    def attach_events(self, bus: 'EventBus') -> None:
+        """
+        Subscribe the manager to Hyprland's event bus.
+        
+        Args:
+            bus: EventBus fed from Hyprland's event socket
+        """
+        bus.subscribe('configreloaded', self._on_config_reloaded)
+    
+    def _on_config_reloaded(self, event: 'HyprEvent') -> None:
+        """Hyprland re-read its config, so pick up external edits as well."""
+        for path in self.watched_paths():
+            self.sync_file(path)
+        # The reload reset the profile and overlay values, which are in no file
+        self.apply_to_hyprland(self._runtime_values())
     
     def get_all_settings(self) -> Dict[str, Setting]:
         """Get all configuration settings."""
@@ -142,6 +951,347 @@ class HyprDataManager:
             return True
         return False
     
+    @property
+    def binds(self) -> BindIndex:
+        """Get the keybinds of the config and the files it sources."""
+        self._ensure_loaded()
+        if self._binds is None:
+            self._binds = collect_binds(self.parser)
+        return self._binds
+    
+    @property
+    def window_rules(self) -> WindowRuleSet:
+        """Get the window rules of the config and the files it sources."""
+        self._ensure_loaded()
+        if self._window_rules is None:
+            self._window_rules = collect_window_rules(self.parser)
+        return self._window_rules
+    
+    @property
+    def animations(self) -> AnimationTree:
+        """Get the animation tree of the config and the files it sources."""
+        self._ensure_loaded()
+        if self._animations is None:
+            self._animations = collect_animations(self.parser)
+        return self._animations
+    
+    def _animation_positions(self, name: str) -> List[int]:
+        """Get the positions of the lines setting an animation in the main config."""
+        positions = []
+        for position, keyword in enumerate(self.parser.keywords):
+            if keyword.name != 'animation':
+                continue
+            try:
+                if parse_animation(self.parser.expand(keyword.value)).name == name:
+                    positions.append(position)
+            except ValueError:
+                continue
+        return positions
+    
+    def animation_in_config(self, name: str) -> bool:
+        """Check if the main config sets an animation node, not only a sourced file."""
+        self._ensure_loaded()
+        return bool(self._animation_positions(name))
+    
+    def set_animation(self, animation: Animation) -> List[str]:
+        """
+        Set an animation node explicitly, in place of its current line.
+        
+        Args:
+            animation: Values of the node
+            
+        Returns:
+            The nodes whose values may have changed
+            
+        Raises:
+            ValueError: If the node is not a Hyprland animation
+        """
+        self._ensure_loaded()
+        changed = self.animations.set(animation)
+        
+        keywords = self.parser.keywords
+        positions = self._animation_positions(animation.name)
+        if positions:
+            # Earlier lines for the node were overridden anyway
+            replaced = keywords[positions[-1]]
+            keyword = Keyword('animation', animation.value, replaced.section)
+            keyword.line = replaced.line
+            keywords[positions[-1]] = keyword
+            for position in reversed(positions[:-1]):
+                del keywords[position]
+        else:
+            # Next to the other animation lines, in the same section
+            others = [i for i, other in enumerate(keywords) if other.name == 'animation']
+            keyword = Keyword('animation', animation.value, keywords[others[-1]].section if others else 'animations')
+            keywords.insert(others[-1] + 1 if others else len(keywords), keyword)
+        return changed
+    
+    def unset_animation(self, name: str) -> List[str]:
+        """
+        Remove the lines setting an animation node from the main config,
+        so it inherits from its parent (or a sourced file) again.
+        
+        Returns:
+            The nodes whose values may have changed
+        """
+        self._ensure_loaded()
+        positions = self._animation_positions(name)
+        if not positions:
+            return []
+        for position in reversed(positions):
+            del self.parser.keywords[position]
+        
+        # A sourced file may set the node too
+        sourced = collect_animations(self.parser).explicit.get(name)
+        if sourced is not None:
+            return self.animations.set(sourced)
+        return self.animations.unset(name)
+    
+    def _submap_end(self, submap: str) -> Optional[int]:
+        """Get the position after the last line of a submap in the keywords."""
+        keywords = self.parser.keywords
+        current = ''
+        end = None
+        for position, keyword in enumerate(keywords):
+            if keyword.section:
+                continue
+            if keyword.name == 'submap':
+                # Expanded like collect_binds does
+                try:
+                    value = self.parser.expand(keyword.value)
+                except VariableCycleError:
+                    value = keyword.value
+                current = parse_submap_line(value)[0]
+            if current == submap:
+                end = position + 1
+        if submap == '' and current == '':
+            return len(keywords)
+        return end
+    
+    def add_bind(self, value: str, flags: str = '', submap: str = '') -> Tuple[Bind, List[BindConflict]]:
+        """
+        Add a keybind to the config.
+        
+        Args:
+            value: Bind value, e.g. "$mainMod, Q, killactive,"
+            flags: Letters after `bind`, e.g. 'e' for binde
+            submap: Submap to add the bind to ('' for the global one);
+                it is created at the end of the config if needed
+            
+        Returns:
+            The new bind and the binds it conflicts with
+            
+        Raises:
+            ValueError: If the value is not a valid bind
+        """
+        self._ensure_loaded()
+        keyword = Keyword(f'bind{flags}', value.strip())
+        bind = parse_bind(keyword, submap, self.parser.expand, self.parser.config_path)
+        if bind is None:
+            raise ValueError(f"Invalid bind '{keyword.to_config_string()}'")
+        
+        index = self.binds
+        keywords = self.parser.keywords
+        position = self._submap_end(submap)
+        if position is not None:
+            keywords.insert(position, keyword)
+        elif submap:
+            keywords.extend([Keyword('submap', submap), keyword, Keyword('submap', 'reset')])
+        else:
+            # The config ends inside a submap
+            keywords.extend([Keyword('submap', 'reset'), keyword])
+        return bind, index.add(bind)
+    
+    def replace_bind(self, bind: Bind, value: str, flags: Optional[str] = None) -> Tuple[Bind, List[BindConflict]]:
+        """
+        Change a keybind in place.
+        
+        Args:
+            bind: Bind from `binds`, in the main config file
+            value: New bind value
+            flags: New flags (default: keep the current ones)
+            
+        Returns:
+            The new bind and the binds it conflicts with
+            
+        Raises:
+            ValueError: If the value is not a valid bind or the bind is
+                not in the main config file
+        """
+        self._ensure_loaded()
+        keyword = Keyword(f'bind{bind.flags if flags is None else flags}', value.strip(), line=bind.line)
+        new = parse_bind(keyword, bind.submap, self.parser.expand, bind.source)
+        if new is None:
+            raise ValueError(f"Invalid bind '{keyword.to_config_string()}'")
+        
+        keywords = self.parser.keywords
+        for position, other in enumerate(keywords):
+            if other is bind.keyword:
+                keywords[position] = keyword
+                break
+        else:
+            raise ValueError(f"{bind} is not in {self.parser.config_path}")
+        return new, self.binds.replace(bind, new)
+    
+    def remove_bind(self, bind: Bind) -> bool:
+        """
+        Remove a keybind from the config.
+        
+        Args:
+            bind: Bind from `binds`
+            
+        Returns:
+            True if successful, False if the bind is not in the main
+            config file
+        """
+        self._ensure_loaded()
+        keywords = self.parser.keywords
+        for position, keyword in enumerate(keywords):
+            if keyword is bind.keyword:
+                del keywords[position]
+                if self._binds is not None:
+                    self._binds.remove(bind)
+                return True
+        print(f"Error: {bind} is not in {self.parser.config_path}")
+        return False
+    
+    def get_blocks(self, name: Optional[str] = None) -> List[Block]:
+        """
+        Get the repeatable blocks (device, listener, label...) in file order.
+        
+        Args:
+            name: Only get blocks of this section, e.g. "device"
+        """
+        self._ensure_loaded()
+        if name is None:
+            return list(self.parser.blocks)
+        return [block for block in self.parser.blocks if block.name == name]
+    
+    def get_block(self, block_id: int) -> Optional[Block]:
+        """Get a repeatable block by its id."""
+        self._ensure_loaded()
+        return self.parser.get_block(block_id)
+    
+    @property
+    def devices(self) -> Dict[str, Block]:
+        """Get the `device { }` blocks by device name."""
+        self._ensure_loaded()
+        return dict(self.parser.devices)
+    
+    def get_device(self, name: str) -> Optional[Block]:
+        """
+        Get the block configuring a device.
+        
+        Args:
+            name: Device name as shown by `hyprctl devices`
+        """
+        self._ensure_loaded()
+        return self.parser.devices.get(name)
+    
+    def add_block(self, name: str, options: Optional[Dict[str, Any]] = None) -> Block:
+        """
+        Add a repeatable block after the existing ones.
+        
+        Args:
+            name: Section name, e.g. "device" or "listener"
+            options: Initial options, values as in set_block_option
+            
+        Returns:
+            The new block
+            
+        Raises:
+            ValueError: If the section is not repeatable, a device block
+                has no name or another block already configures it
+        """
+        self._ensure_loaded()
+        if not is_repeatable_section(name) or ':' in name:
+            raise ValueError(f"'{name}' is not a repeatable section")
+        options = options or {}
+        if name == 'device':
+            device = str(options.get('name', '')).strip()
+            if not device:
+                raise ValueError("A device block needs a name")
+            if device in self.parser.devices:
+                raise ValueError(f"Device '{device}' is already configured")
+        
+        block = Block(name)
+        for option, value in options.items():
+            block.options[option] = self._block_setting(block, option, value)
+        self.parser.blocks.append(block)
+        self.parser.reindex_blocks()
+        return block
+    
+    def _block_setting(self, block: Block, option: str, value: Any) -> Setting:
+        """Create the setting for a block option, validating device options."""
+        if isinstance(value, str):
+            setting = self.parser.make_setting(option, value)
+        else:
+            setting = Setting(option, _coerce_value(value))
+        path = device_option_path(option) if block.name == 'device' else None
+        if path is not None:
+            validate_option(path, setting.value)
+        return setting
+    
+    def set_block_option(self, block_id: int, option: str, value: Any) -> Block:
+        """
+        Set an option of a repeatable block.
+        
+        Args:
+            block_id: Id of the block
+            option: Option name, e.g. "sensitivity" or "timeout"
+            value: Value, or text as written in the config
+            
+        Returns:
+            The block
+            
+        Raises:
+            ValueError: If there is no such block, the value is invalid or
+                the new device name is used by another block
+        """
+        self._ensure_loaded()
+        block = self.parser.get_block(block_id)
+        if block is None:
+            raise ValueError(f"No block with id {block_id}")
+        setting = self._block_setting(block, option, value)
+        if block.name == 'device' and option == 'name':
+            other = self.parser.devices.get(str(setting.value))
+            if other is not None and other is not block:
+                raise ValueError(f"Device '{setting.value}' is already configured")
+        block.options[option] = setting
+        if option == 'name':
+            self.parser.reindex_blocks()
+        return block
+    
+    def remove_block_option(self, block_id: int, option: str) -> bool:
+        """
+        Remove an option from a repeatable block.
+        
+        Returns:
+            True if the option was set; a device's name cannot be removed
+        """
+        self._ensure_loaded()
+        block = self.parser.get_block(block_id)
+        if block is None or option not in block.options or (block.name == 'device' and option == 'name'):
+            return False
+        del block.options[option]
+        return True
+    
+    def remove_block(self, block_id: int) -> bool:
+        """
+        Remove a repeatable block.
+        
+        Returns:
+            True if successful, False if there is no such block
+        """
+        self._ensure_loaded()
+        block = self.parser.get_block(block_id)
+        if block is None:
+            return False
+        # Blocks with the same options are equal, so compare identity
+        self.parser.blocks = [other for other in self.parser.blocks if other is not block]
+        self.parser.reindex_blocks()
+        return True
+    
     def get_bezier(self, name: str) -> Optional[Bezier]:
         """
         Get a bezier curve by name.
@@ -165,6 +1315,8 @@ class HyprDataManager:
         self._ensure_loaded()
         if path in self.parser.settings:
             del self.parser.settings[path]
+            self._mark_dirty(path)
+            self._invalidate(path)
             return True
         return False
     
@@ -183,8 +1335,30 @@ class HyprDataManager:
         paths_to_remove = [path for path in self.parser.settings.keys() if path.startswith(f"{section}:")]
         for path in paths_to_remove:
             del self.parser.settings[path]
+            self._mark_dirty(path)
+            self._invalidate(path)
         return True
     
+    def preview_save(self) -> ConfigDiff:
+        """
+        Get what `save_all` would change compared to the file as loaded.
+        
+        External edits of the file that are merged in while saving are
+        not included.
+        """
+        self._ensure_loaded()
+        base = self.parser._parse_text(self.parser.base_text or '')
+        changes = diff_parsers(base, self.parser, text=False)
+        changes.text = unified_diff(
+            self.parser.base_text or '', self.parser._generate_config_content(), self.parser.config_path,
+        )
+        return changes
+    
+    def preview_import(self, config_content: str) -> ConfigDiff:
+        """Get what `import_config` would change."""
+        self._ensure_loaded()
+        return diff_parsers(self.parser, self.parser._parse_text(config_content))
+    
     def export_config(self) -> str:
         """Export current configuration as string."""
         self._ensure_loaded()
@@ -200,17 +1374,25 @@ class HyprDataManager:
         Returns:
             True if successful
         """
+        self._ensure_loaded()
         try:
             # Save current config as backup
             original_lines = self.parser.raw_lines.copy()
             original_settings = self.parser.settings.copy()
             original_beziers = self.parser.beziers.copy()
+            original_blocks = list(self.parser.blocks)
             
             # Parse new config
             self.parser.raw_lines = config_content.split('\n')
             self.parser.settings.clear()
             self.parser.beziers.clear()
+            self.parser.blocks = []
             self.parser._parse_config()
+            self._dirty.update(changed_keys(self._base_settings, snapshot_settings(self.parser.settings)))
+            self._build_resolved()
+            self._binds = None
+            self._window_rules = None
+            self._animations = None
             
             return True
             
@@ -219,9 +1401,12 @@ class HyprDataManager:
             self.parser.raw_lines = original_lines
             self.parser.settings = original_settings
             self.parser.beziers = original_beziers
+            self.parser.blocks = original_blocks
+            self.parser.reindex_blocks()
             print(f"Error importing config: {e}")
             return False
 
 
-# Create singleton instance to match hyprparser-py API
-HyprData = HyprDataManager()
\ No newline at end of file
+# Create singleton instance to match hyprparser-py API. It loads on first
+# use, so importing the package (e.g. for the CLI) does not read the config.
+HyprData = HyprDataManager(lazy=True)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+Comparison and three-way merge of parsed configuration state.
+
+Used to reconcile the in-memory model with a config file that was
+edited outside of hyprset, either as it happens or at save time.
+"""
+
+import copy
+import operator
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Sequence, Set, Tuple
+
+from .data_types import Setting
+
+
+def snapshot_settings(settings: Mapping[str, Setting]) -> Dict[str, Any]:
+    """
+    Copy the values of a settings dict.
+
+    Widgets mutate some values (e.g. Color) in place, so the snapshot
+    must not share them with the live model.
+
+    Args:
+        settings: Dictionary of path -> Setting
+
+    Returns:
+        Dictionary of path -> copied value
+    """
+    return {path: copy.copy(setting.value) for path, setting in settings.items()}
+
+
+def changed_keys(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
+    """
+    Get the keys that were added, removed or changed between two dicts.
+
+    Args:
+        old: Previous key -> value mapping
+        new: Current key -> value mapping
+
+    Returns:
+        Set of keys whose value differs
+    """
+    missing = object()
+    changed = {key for key, value in new.items() if old.get(key, missing) != value}
+    changed.update(key for key in old if key not in new)
+    return changed
+
+
+class MergeConflict:
+    """A key that was changed differently on disk and in memory."""
+
+    def __init__(self, kind: str, key: str, base: Any, disk: Any, ours: Any):
+        self.kind = kind
+        self.key = key
+        self.base = base
+        self.disk = disk
+        self.ours = ours
+
+    def __str__(self) -> str:
+        return f"MergeConflict({self.kind}, {self.key})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def merge_mappings(
+    base: Mapping[str, Any],
+    disk: Mapping[str, Any],
+    ours: Mapping[str, Any],
+    kind: str = 'setting',
+    same: Callable[[Any, Any], bool] = operator.eq,
+) -> Tuple[Dict[str, Any], Set[str], List[MergeConflict]]:
+    """
+    Three-way merge of keyed entries (settings, beziers, variables).
+
+    A key changed on only one side takes that side's value. A key changed
+    on both sides to different values is a conflict and keeps our value.
+    Runs in O(len(base) + len(disk) + len(ours)).
+
+    Args:
+        base: Entries as they were loaded
+        disk: Entries currently on disk
+        ours: Entries in memory
+        kind: Label used for conflicts
+        same: Equality used to compare two entries
+
+    Returns:
+        Tuple of (merged entries, keys taken from disk, conflicts)
+    """
+    missing = object()
+
+    def equal(a: Any, b: Any) -> bool:
+        if a is missing or b is missing:
+            return a is b
+        return same(a, b)
+
+    merged: Dict[str, Any] = {}
+    from_disk: Set[str] = set()
+    conflicts: List[MergeConflict] = []
+
+    # Keep our order, then append keys that only exist on disk
+    keys = list(ours)
+    keys.extend(key for key in disk if key not in ours)
+    keys.extend(key for key in base if key not in ours and key not in disk)
+
+    for key in keys:
+        b = base.get(key, missing)
+        d = disk.get(key, missing)
+        o = ours.get(key, missing)
+
+        if equal(b, d) or equal(d, o):
+            value = o
+        elif equal(b, o):
+            value = d
+            from_disk.add(key)
+        else:
+            value = o
+            conflicts.append(MergeConflict(
+                kind, key,
+                None if b is missing else b,
+                None if d is missing else d,
+                None if o is missing else o,
+            ))
+
+        if value is not missing:
+            merged[key] = value
+
+    return merged, from_disk, conflicts
+
+
+def merge_lines(base: Sequence[Hashable], disk: Sequence[Hashable], ours: Sequence[Hashable]) -> List[Hashable]:
+    """
+    Three-way merge of ordered, repeatable lines (binds, exec-once...).
+
+    Lines removed on disk are removed from ours; lines added on disk are
+    inserted after the nearest preceding disk line that we still have.
+    Both sides' additions are kept, so this never conflicts.
+    Runs in O(len(base) + len(disk) + len(ours)).
+
+    Args:
+        base: Lines as they were loaded
+        disk: Lines currently on disk
+        ours: Lines in memory
+
+    Returns:
+        Merged list of lines
+    """
+    base_count = Counter(base)
+    disk_count = Counter(disk)
+    removed_on_disk = base_count - disk_count
+    # Lines we added ourselves as well are not inserted twice
+    added_on_disk = (disk_count - base_count) - (Counter(ours) - base_count)
+
+    result = []
+    for line in ours:
+        if removed_on_disk[line] > 0:
+            removed_on_disk[line] -= 1
+            continue
+        result.append(line)
+
+    position = {line: index for index, line in enumerate(result)}
+
+    insertions: Dict[int, List[Hashable]] = {}
+    anchor = -1
+    for line in disk:
+        if added_on_disk[line] > 0:
+            added_on_disk[line] -= 1
+            insertions.setdefault(anchor, []).append(line)
+        elif line in position:
+            anchor = position[line]
+
+    merged = list(insertions.get(-1, ()))
+    for index, line in enumerate(result):
+        merged.append(line)
+        merged.extend(insertions.get(index, ()))
+    return merged
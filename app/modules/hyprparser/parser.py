@@ -4,6 +4,7 @@ Hyprland configuration file parser.
 Handles parsing of Hyprland configuration files including:
 - Variable definitions ($var = value)
 - Section blocks (section { ... })
+- Repeatable blocks (device { ... }, listener { ... }, label { ... })
 - Inline settings (section::option = value)  
 - Comments (# comment, ## escaped #)
 - Bezier curves, colors, and other data types
@@ -11,20 +12,116 @@ Handles parsing of Hyprland configuration files including:
 
 import re
 import os
-from typing import Dict, List, Any, Optional, Union
-from pathlib import Path
-from .data_types import Setting, Color, Bezier, Gradient
+import glob
+import hashlib
+from typing import Dict, List, Any, Optional, Set, Union
+from .data_types import Block, Setting, Color, Bezier, Gradient, Keyword
+from .merge import MergeConflict, merge_lines, merge_mappings
+from .variables import VariableCycleError, VariableResolver
+
+
+# Keywords that may appear many times and are kept as ordered lines
+REPEATABLE_KEYWORDS = frozenset({
+    'animation', 'env', 'envd', 'exec', 'exec-once', 'exec-shutdown',
+    'execr', 'execr-once', 'gesture', 'layerrule', 'monitor', 'permission',
+    'plugin', 'source', 'submap', 'unbind', 'windowrule', 'windowrulev2',
+    'workspace',
+    # hyprpaper.conf
+    'preload', 'wallpaper',
+})
+
+# Sections that may appear many times, across hyprland.conf, hypridle.conf
+# and hyprlock.conf; each one is kept as a separate Block
+REPEATABLE_SECTIONS = frozenset({
+    'background', 'device', 'image', 'input-field', 'label', 'listener',
+    'monitorv2', 'shape', 'wallpaper',
+})
+
+_BIND_KEYWORD_RE = re.compile(r'^bind[a-z]*$')
+
+
+def is_repeatable_keyword(key: str) -> bool:
+    """Check if a key is a repeatable keyword (bind*, exec-once, source...)."""
+    if key in REPEATABLE_KEYWORDS:
+        return True
+    return key.startswith('bind') and _BIND_KEYWORD_RE.match(key) is not None
+
+
+def is_repeatable_section(name: str) -> bool:
+    """Check if a top level section is a repeatable block (device, listener...)."""
+    # `device:name { }` is the syntax used before Hyprland 0.38
+    return name in REPEATABLE_SECTIONS or name.startswith('device:')
+
+
+def atomic_write(path: str, text: str):
+    """
+    Replace a file's contents so readers see either the old or new text.
+    
+    The text goes to a temporary file in the same directory, which is then
+    renamed over the target. Symlinks (e.g. dotfile managers) are followed
+    and the file's permissions are kept.
+    
+    Args:
+        path: File to write
+        text: New contents
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o644
+    
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 class HyprlandConfigParser:
     """Parser for Hyprland configuration files."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, create_default: bool = True):
         self.config_path = config_path or self._get_default_config_path()
+        self.create_default = create_default
+        # First line written on save
+        self.header = "Hyprland configuration file"
         self.variables: Dict[str, str] = {}
         self.settings: Dict[str, Setting] = {}
         self.beziers: Dict[str, Bezier] = {}
+        self.keywords: List[Keyword] = []
+        # Repeatable sections in file order, indexed by id and device name
+        self.blocks: List[Block] = []
+        self._blocks_by_id: Dict[int, Block] = {}
+        self.devices: Dict[str, Block] = {}
+        # 1-based line each setting was last read from
+        self.setting_lines: Dict[str, int] = {}
         self.raw_lines: List[str] = []
+        # Parsers for files pulled in with `source = path`, by resolved path
+        self.sourced: Dict[str, 'HyprlandConfigParser'] = {}
+        self._seen_paths: Set[str] = set()
+        self._inherited_variables: Dict[str, str] = {}
+        # Dependency graph and cache of the variables
+        self.resolver = VariableResolver()
+        # The text load() read, kept as the base of a three-way merge on save
+        self.base_text: Optional[str] = None
+        self.base_mtime_ns: Optional[int] = None
+        self.base_hash: Optional[str] = None
+        # Outcome of the last save that had to merge external changes
+        self.last_conflicts: List[MergeConflict] = []
+        self.last_merged_keys: Set[str] = set()
         
     def _get_default_config_path(self) -> str:
         """Get the default Hyprland config path."""
@@ -33,15 +130,20 @@ class HyprlandConfigParser:
     
     def load(self) -> bool:
         """Load and parse the configuration file."""
+        self.clear()
         try:
             if not os.path.exists(self.config_path):
                 # Create default config if it doesn't exist
-                self._create_default_config()
+                if self.create_default:
+                    self._create_default_config()
                 return True
                 
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.raw_lines = f.readlines()
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+            text = data.decode('utf-8')
             
+            self.raw_lines = text.splitlines(keepends=True)
+            self._remember_base(text, data)
             self._parse_config()
             return True
             
@@ -58,9 +160,108 @@ class HyprlandConfigParser:
             print(f"Error: Failed to load Hyprland configuration: {e}")
             return False
     
+    def _remember_base(self, text: str, data: Optional[bytes] = None):
+        """Keep the text now on disk as the merge base."""
+        if data is None:
+            data = text.encode('utf-8')
+        self.base_text = text
+        self.base_hash = hashlib.sha1(data).hexdigest()
+        try:
+            self.base_mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            self.base_mtime_ns = None
+    
+    def _read_if_changed(self) -> Optional[str]:
+        """
+        Get the file's text if it changed on disk since it was loaded.
+        
+        The mtime is checked first so the common case costs one stat().
+        """
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+        if self.base_text is not None and mtime_ns == self.base_mtime_ns:
+            return None
+        
+        with open(self.config_path, 'rb') as f:
+            data = f.read()
+        if hashlib.sha1(data).hexdigest() == self.base_hash:
+            self.base_mtime_ns = mtime_ns
+            return None
+        return data.decode('utf-8')
+    
+    def _parse_text(self, text: str) -> 'HyprlandConfigParser':
+        """Parse config text with a fresh parser for the same path."""
+        parser = HyprlandConfigParser(self.config_path, create_default=False)
+        parser.header = self.header
+        parser._seen_paths = self._seen_paths
+        parser._inherited_variables = self._inherited_variables
+        parser.clear()
+        parser.raw_lines = text.splitlines(keepends=True)
+        parser._parse_config()
+        return parser
+    
+    def merge_disk_changes(self, disk_text: str):
+        """
+        Three-way merge the loaded text, the file on disk and the model.
+        
+        Settings, beziers and variables are merged per key, repeatable
+        keywords per line. Changes made only on disk are taken over;
+        keys changed on both sides keep the in-memory value and are
+        recorded in `last_conflicts`.
+        
+        Args:
+            disk_text: Current content of the config file
+        """
+        base = self._parse_text(self.base_text or '')
+        disk = self._parse_text(disk_text)
+        
+        settings, settings_from_disk, conflicts = merge_mappings(
+            base.settings, disk.settings, self.settings,
+            same=lambda a, b: a.value == b.value,
+        )
+        beziers, _, bezier_conflicts = merge_mappings(
+            base.beziers, disk.beziers, self.beziers, kind='bezier',
+        )
+        variables, _, variable_conflicts = merge_mappings(
+            base.variables, disk.variables, self.variables, kind='variable',
+        )
+        keywords = merge_lines(base.keywords, disk.keywords, self.keywords)
+        blocks = self.blocks
+        if blocks == base.blocks:
+            blocks = disk.blocks
+        elif disk.blocks != base.blocks and disk.blocks != blocks:
+            conflicts.append(MergeConflict('block', 'blocks', base.blocks, disk.blocks, blocks))
+        
+        self.settings = settings
+        self.beziers = beziers
+        self.variables = variables
+        self.keywords = keywords
+        self.blocks = blocks
+        self.reindex_blocks()
+        for path, child in disk.sourced.items():
+            self.sourced.setdefault(path, child)
+        
+        self._resolve_variables()
+        
+        self.last_merged_keys = settings_from_disk
+        self.last_conflicts = conflicts + bezier_conflicts + variable_conflicts
+    
     def save(self) -> bool:
-        """Save the current configuration to file."""
+        """
+        Save the current configuration to file.
+        
+        If the file changed on disk since it was loaded, the external
+        changes are merged in first (see `merge_disk_changes`).
+        """
+        self.last_conflicts = []
+        self.last_merged_keys = set()
         try:
+            disk_text = self._read_if_changed()
+            if disk_text is not None:
+                self.merge_disk_changes(disk_text)
+            
             # Create backup
             if os.path.exists(self.config_path):
                 backup_path = f"{self.config_path}.backup"
@@ -74,11 +275,14 @@ class HyprlandConfigParser:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             
             # Write to file
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                f.write(config_content)
+            atomic_write(self.config_path, config_content)
             
+            self._remember_base(config_content)
             return True
             
+        except UnicodeDecodeError as e:
+            print(f"Error: Config file on disk contains invalid characters: {e}")
+            return False
         except PermissionError:
             print("Error: Permission denied when saving Hyprland config file")
             return False
@@ -108,10 +312,12 @@ decoration {
     rounding = 10
     active_opacity = 1.0
     inactive_opacity = 1.0
-    drop_shadow = yes
-    shadow_range = 4
-    shadow_render_power = 3
-    col.shadow = rgba(1a1a1aee)
+    shadow {
+        enabled = yes
+        range = 4
+        render_power = 3
+        color = rgba(1a1a1aee)
+    }
 }
 
 animations {
@@ -130,13 +336,62 @@ animations {
             f.write(default_config)
         
         # Parse the default config
+        self._remember_base(default_config)
         self.raw_lines = default_config.split('\n')
         self._parse_config()
     
+    def clear(self):
+        """Forget everything parsed so far."""
+        self.variables.clear()
+        self.variables.update(self._inherited_variables)
+        self.settings.clear()
+        self.beziers.clear()
+        self.keywords.clear()
+        self.blocks = []
+        self.reindex_blocks()
+        self.setting_lines.clear()
+        self.sourced.clear()
+        self.resolver = VariableResolver()
+    
+    def resolve_source_paths(self, value: str) -> List[str]:
+        """
+        Resolve the value of a `source =` line to existing file paths.
+        
+        Args:
+            value: Raw source value, may contain ~, $ENV and globs
+            
+        Returns:
+            List of absolute file paths
+        """
+        path = os.path.expandvars(os.path.expanduser(value.strip()))
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(os.path.abspath(self.config_path)), path)
+        return sorted(os.path.abspath(p) for p in glob.glob(path) if os.path.isfile(p))
+    
+    def all_paths(self) -> List[str]:
+        """Get this file and every (recursively) sourced file."""
+        paths = [os.path.abspath(self.config_path)]
+        for child in self.sourced.values():
+            paths.extend(child.all_paths())
+        return paths
+    
+    def _load_source(self, value: str):
+        """Parse the files of a `source =` line with their own parsers."""
+        for path in self.resolve_source_paths(value):
+            if path in self._seen_paths or path in self.sourced:
+                continue
+            child = HyprlandConfigParser(path, create_default=False)
+            child._seen_paths = self._seen_paths | {os.path.abspath(self.config_path)}
+            child._inherited_variables = dict(self.variables)
+            child.load()
+            self.sourced[path] = child
+    
     def _parse_config(self):
         """Parse the loaded configuration lines."""
         current_section = ""
         section_stack = []
+        # Repeatable block being read, see REPEATABLE_SECTIONS
+        block: Optional[Block] = None
         
         for line_num, raw_line in enumerate(self.raw_lines):
             line = self._clean_line(raw_line)
@@ -147,6 +402,8 @@ animations {
             # Handle section opening
             if line.endswith('{'):
                 section_name = line[:-1].strip()
+                if not section_stack and is_repeatable_section(section_name):
+                    block = self._open_block(section_name, line_num + 1)
                 section_stack.append(section_name)
                 current_section = ':'.join(section_stack)
                 continue
@@ -156,6 +413,14 @@ animations {
                 if section_stack:
                     section_stack.pop()
                 current_section = ':'.join(section_stack)
+                if block is not None and not section_stack:
+                    self.blocks.append(block)
+                    block = None
+                continue
+            
+            if block is not None:
+                # Nested sections inside a block become "sub:option"
+                self._parse_block_option(block, line, ':'.join(section_stack[1:]))
                 continue
             
             # Handle variable definitions
@@ -170,29 +435,124 @@ animations {
             
             # Handle regular settings
             if '=' in line:
-                self._parse_setting(line, current_section)
+                self._parse_setting(line, current_section, line_num + 1)
+        
+        if block is not None:
+            # Unclosed at the end of the file
+            self.blocks.append(block)
+        self.reindex_blocks()
+        
+        # Variables may be defined after the lines that use them
+        self._resolve_variables()
+    
+    def _resolve_variables(self):
+        """Rebuild the variable graph and expand the settings that use it."""
+        self.resolver = VariableResolver(self.variables)
+        for path, setting in self.settings.items():
+            if setting.raw is not None:
+                self.resolver.track(path, setting.raw)
+                setting.value = self._expand_raw(setting.raw)
+        self._resolve_block_variables()
+    
+    def _resolve_block_variables(self):
+        """Expand the block options that use variables."""
+        for block in self.blocks:
+            for setting in block.options.values():
+                if setting.raw is not None:
+                    setting.value = self._expand_raw(setting.raw)
+    
+    def _expand_raw(self, raw: str) -> Any:
+        """Parse a value read from the file; None if its variables reference each other."""
+        try:
+            return self._parse_value(raw)
+        except VariableCycleError as e:
+            print(f"Warning: {e}")
+            return None
+    
+    def expand(self, text: str) -> str:
+        """
+        Expand the $variables in a value.
+        
+        Args:
+            text: Raw config value
+            
+        Returns:
+            Expanded text; unknown variables are left as they are
+            
+        Raises:
+            VariableCycleError: If a used variable references itself
+        """
+        return self.resolver.expand(text)
+    
+    def set_variable(self, name: str, value: str) -> List[str]:
+        """
+        Define or change a variable and re-resolve what uses it.
+        
+        Args:
+            name: Variable name, including the leading $
+            value: Raw value, may reference other variables
+            
+        Returns:
+            Paths of the settings whose value changed
+            
+        Raises:
+            VariableCycleError: If the value makes variables reference
+                each other; nothing is changed then
+        """
+        paths = self.resolver.set(name, value)
+        self.variables[name] = value
+        self._resolve_block_variables()
+        return self._reresolve(paths)
+    
+    def remove_variable(self, name: str) -> List[str]:
+        """
+        Remove a variable and re-resolve what used it.
+        
+        Args:
+            name: Variable name, including the leading $
+            
+        Returns:
+            Paths of the settings whose value changed
+        """
+        self.variables.pop(name, None)
+        paths = self.resolver.remove(name)
+        self._resolve_block_variables()
+        return self._reresolve(paths)
+    
+    def _reresolve(self, paths: Set[str]) -> List[str]:
+        """Expand the given settings again, returning those that changed."""
+        changed = []
+        for path in sorted(paths):
+            setting = self.settings.get(path)
+            if setting is None or setting.raw is None:
+                # Replaced by a literal value since it was parsed
+                self.resolver.untrack(path)
+                continue
+            value = self._parse_value(setting.raw)
+            if value != setting.value or value.__class__ is not setting.value.__class__:
+                self.settings[path] = Setting(path, value, setting.raw)
+                changed.append(path)
+        return changed
     
     def _clean_line(self, raw_line: str) -> str:
         """Clean a line by removing comments and whitespace."""
         line = raw_line.strip()
         
         # Handle comments (# but not ##)
-        if '#' in line:
-            # Find comment position, but ignore ## (escaped #)
-            pos = 0
-            while pos < len(line):
-                if line[pos:pos+2] == '##':
-                    pos += 2
-                elif line[pos] == '#':
-                    line = line[:pos].strip()
-                    break
-                else:
-                    pos += 1
+        pos = line.find('#')
+        if pos < 0:
+            return line
         
-        # Replace escaped ## with single #
-        line = line.replace('##', '#')
+        while pos >= 0:
+            if line.startswith('##', pos):
+                # Escaped #, keep looking after it
+                pos = line.find('#', pos + 2)
+            else:
+                line = line[:pos].strip()
+                break
         
-        return line
+        # Replace escaped ## with single #
+        return line.replace('##', '#')
     
     def _parse_variable(self, line: str):
         """Parse a variable definition."""
@@ -210,14 +570,20 @@ animations {
         except ValueError as e:
             print(f"Warning: Invalid bezier curve format in config: {e}")
     
-    def _parse_setting(self, line: str, current_section: str):
+    def _parse_setting(self, line: str, current_section: str, line_num: int = 0):
         """Parse a regular setting line."""
-        if '=' not in line:
+        key, sep, value = line.partition('=')
+        if not sep:
+            return
+        key = key.strip()
+        value = value.strip()
+        
+        # Handle repeatable keywords, keeping their raw value
+        if is_repeatable_keyword(key):
+            self.keywords.append(Keyword(key, value, current_section, line_num))
+            if key == 'source':
+                self._load_source(value)
             return
-            
-        parts = line.split('=', 1)
-        key = parts[0].strip()
-        value = parts[1].strip()
         
         # Handle inline section syntax (section::option)
         if '::' in key:
@@ -225,22 +591,67 @@ animations {
         else:
             section_path = f"{current_section}:{key}" if current_section else key
         
-        # Parse the value based on its type
-        parsed_value = self._parse_value(value)
-        
-        # Store the setting
-        self.settings[section_path] = Setting(section_path, parsed_value)
+        # Store the setting; values using variables are expanded once
+        # the whole file is read, see _resolve_variables()
+        if '$' in value:
+            self.settings[section_path] = Setting(section_path, value, value)
+        else:
+            self.settings[section_path] = Setting(section_path, self._parse_value(value))
+        self.setting_lines[section_path] = line_num
+    
+    def _open_block(self, section_name: str, line_num: int) -> Block:
+        """Start a repeatable block at its opening line."""
+        name, _, device = section_name.partition(':')
+        block = Block(name, line=line_num)
+        if device:
+            block.options['name'] = Setting('name', device.strip())
+        return block
+    
+    def _parse_block_option(self, block: Block, line: str, subsection: str = ''):
+        """Parse an option line inside a repeatable block."""
+        key, sep, value = line.partition('=')
+        if not sep:
+            return
+        key = key.strip()
+        if subsection:
+            key = f"{subsection}:{key}"
+        block.options[key] = self.make_setting(key, value)
+    
+    def make_setting(self, path: str, value: str) -> Setting:
+        """Create a setting from its text, keeping the $variables it uses."""
+        value = value.strip()
+        if '$' in value:
+            return Setting(path, self._expand_raw(value), value)
+        return Setting(path, self._parse_value(value))
+    
+    def reindex_blocks(self):
+        """Rebuild the lookups of `blocks` after it was changed."""
+        self._blocks_by_id = {block.id: block for block in self.blocks}
+        self.devices = {}
+        for block in self.blocks:
+            if block.name == 'device' and block.key is not None:
+                # The last block wins, as in Hyprland
+                self.devices[block.key] = block
+    
+    def get_block(self, block_id: int) -> Optional[Block]:
+        """Get a repeatable block by its id."""
+        return self._blocks_by_id.get(block_id)
     
     def _parse_value(self, value: str) -> Any:
-        """Parse a configuration value to the appropriate Python type."""
+        """
+        Parse a configuration value to the appropriate Python type.
+        
+        Raises:
+            VariableCycleError: If a variable in the value references itself
+        """
         value = value.strip()
         
         # Handle variable substitution
-        if value.startswith('$'):
-            return self.variables.get(value, value)
+        if '$' in value:
+            value = self.resolver.expand(value)
         
         # Handle colors
-        if value.startswith('rgba(') and value.endswith(')'):
+        if value.startswith(('rgba(', 'rgb(')) and value.endswith(')'):
             try:
                 return Color.from_rgba_string(value)
             except (ValueError, TypeError):
@@ -251,6 +662,14 @@ animations {
             except (ValueError, TypeError):
                 pass  # Invalid hex format, continue parsing
         
+        elif value.startswith('0x') and len(value) == 10:
+            # Legacy 0xAARRGGBB format
+            try:
+                int(value, 16)
+                return Color.from_hex(value[4:] + value[2:4])
+            except ValueError:
+                pass
+        
         # Handle numbers
         try:
             if '.' in value:
@@ -274,7 +693,7 @@ animations {
         lines = []
         
         # Add header comment
-        lines.append("# Hyprland configuration file")
+        lines.append(f"# {self.header}")
         lines.append("# Modified by hyprset")
         lines.append("")
         
@@ -285,8 +704,16 @@ animations {
                 lines.append(f"{var_name} = {var_value}")
             lines.append("")
         
+        # Add top-level keywords, keeping their order
+        top_level_keywords = [k for k in self.keywords if not k.section]
+        if top_level_keywords:
+            for keyword in top_level_keywords:
+                lines.append(keyword.to_config_string())
+            lines.append("")
+        
         # Group settings by section
         sections = {}
+        top_level_settings = []
         for path, setting in self.settings.items():
             parts = path.split(':')
             if len(parts) >= 2:
@@ -294,18 +721,36 @@ animations {
                 option = ':'.join(parts[1:])
                 if section not in sections:
                     sections[section] = {}
-                sections[section][option] = setting.value
+                sections[section][option] = setting
             else:
-                # Top-level setting
-                if 'general' not in sections:
-                    sections['general'] = {}
-                sections['general'][path] = setting.value
+                # Top-level setting (e.g. hyprpaper's splash)
+                top_level_settings.append(f"{path} = {self._format_setting(setting)}")
+        if top_level_settings:
+            lines.extend(top_level_settings)
+            lines.append("")
+        
+        # Keywords nested in a section (e.g. animation inside animations)
+        section_keywords: Dict[str, List[Keyword]] = {}
+        for keyword in self.keywords:
+            if keyword.section:
+                section_keywords.setdefault(keyword.section, []).append(keyword)
+                sections.setdefault(keyword.section, {})
         
         # Write sections
         for section_name, options in sections.items():
             lines.append(f"{section_name} {{")
-            for option, value in options.items():
-                lines.append(f"    {option} = {self._format_value(value)}")
+            for option, setting in options.items():
+                lines.append(f"    {option} = {self._format_setting(setting)}")
+            for keyword in section_keywords.get(section_name, []):
+                lines.append(f"    {keyword.to_config_string()}")
+            lines.append("}")
+            lines.append("")
+        
+        # Repeatable blocks, in order
+        for block in self.blocks:
+            lines.append(f"{block.name} {{")
+            for option, setting in block.options.items():
+                lines.append(f"    {option} = {self._format_setting(setting)}")
             lines.append("}")
             lines.append("")
         
@@ -318,6 +763,12 @@ animations {
         
         return '\n'.join(lines)
     
+    def _format_setting(self, setting: Setting) -> str:
+        """Format a setting's value, keeping the variables it was written with."""
+        if setting.raw is not None:
+            return setting.raw
+        return self._format_value(setting.value)
+    
     def _format_value(self, value: Any) -> str:
         """Format a value for writing to config file."""
         if isinstance(value, Color):
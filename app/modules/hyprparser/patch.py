@@ -0,0 +1,165 @@
+"""
+Option patches: a declarative set of changes applied to a config.
+
+A patch is a JSON object such as:
+
+    {
+        "set": {"general:gaps_in": 5, "general:col.active_border": "rgba(33ccffee)"},
+        "remove": ["misc:vfr"],
+        "beziers": {
+            "add": {"overshot": [0.05, 0.9, 0.1, 1.05]},
+            "remove": ["old"]
+        }
+    }
+
+Patches can also be written in TOML, where options may be nested by
+section instead of quoting the full path:
+
+    remove = ["misc:vfr"]
+
+    [set.general]
+    gaps_in = 5
+
+    [beziers.add]
+    overshot = [0.05, 0.9, 0.1, 1.05]
+"""
+
+import json
+from typing import Any, Dict, List
+
+from .data_types import Color
+from .schema import validate_option
+
+
+class PatchError(ValueError):
+    """Raised when a patch is malformed."""
+
+
+def load_patch(path: str) -> Dict[str, Any]:
+    """
+    Load and validate a patch file.
+
+    Args:
+        path: Path to a JSON patch, or a TOML patch if it ends in .toml
+
+    Returns:
+        The patch as a dictionary
+    """
+    if path.endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError as e:
+            raise PatchError("TOML patches need Python 3.11 or newer") from e
+        with open(path, 'rb') as f:
+            try:
+                patch = tomllib.load(f)
+            except tomllib.TOMLDecodeError as e:
+                raise PatchError(f"Invalid TOML in {path}: {e}") from e
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            try:
+                patch = json.load(f)
+            except json.JSONDecodeError as e:
+                raise PatchError(f"Invalid JSON in {path}: {e}") from e
+
+    if isinstance(patch, dict) and isinstance(patch.get('set'), dict):
+        patch['set'] = flatten_options(patch['set'])
+    validate_patch(patch)
+    return patch
+
+
+def flatten_options(options: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """
+    Turn nested sections into option paths.
+
+    {"general": {"gaps_in": 5}} becomes {"general:gaps_in": 5}.
+    """
+    flat = {}
+    for key, value in options.items():
+        path = f"{prefix}:{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten_options(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def validate_patch(patch: Any):
+    """Check the structure of a patch, raising PatchError if it is invalid."""
+    if not isinstance(patch, dict):
+        raise PatchError("A patch must be an object")
+
+    unknown = set(patch) - {'set', 'remove', 'beziers'}
+    if unknown:
+        raise PatchError(f"Unknown patch keys: {', '.join(sorted(unknown))}")
+
+    if not isinstance(patch.get('set', {}), dict):
+        raise PatchError("'set' must map option paths to values")
+    if not isinstance(patch.get('remove', []), list):
+        raise PatchError("'remove' must be a list of option paths")
+
+    beziers = patch.get('beziers', {})
+    if not isinstance(beziers, dict):
+        raise PatchError("'beziers' must be an object")
+    for name, points in beziers.get('add', {}).items():
+        if not isinstance(points, list) or len(points) != 4:
+            raise PatchError(f"Bezier '{name}' needs 4 points")
+    if not isinstance(beziers.get('remove', []), list):
+        raise PatchError("'beziers.remove' must be a list of names")
+
+
+def apply_patch(data, patch: Dict[str, Any]) -> List[str]:
+    """
+    Apply a patch to a HyprDataManager.
+
+    String values are parsed like config values, so "rgba(33ccffee)"
+    becomes a Color and "yes" becomes True.
+
+    Args:
+        data: HyprDataManager to modify
+        patch: Validated patch
+
+    Returns:
+        List of human readable changes that were made
+
+    Raises:
+        PatchError: If a value is invalid for its option, in which case
+            nothing should be saved
+    """
+    changes = []
+    # The config's $variables are needed to parse the values
+    data.load()
+
+    for path, value in patch.get('set', {}).items():
+        try:
+            if isinstance(value, str):
+                value = data.parser._parse_value(value)
+            validate_option(path, value)
+        except ValueError as e:
+            raise PatchError(str(e)) from e
+        if not data.set_option(path, value):
+            raise PatchError(f"Invalid value for {path}: {value!r}")
+        changes.append(f"set {path}")
+
+    for path in patch.get('remove', []):
+        if data.remove_option(path):
+            changes.append(f"remove {path}")
+
+    beziers = patch.get('beziers', {})
+    for name, points in beziers.get('add', {}).items():
+        data.add_bezier(name, *(float(p) for p in points))
+        changes.append(f"add bezier {name}")
+    for name in beziers.get('remove', []):
+        if data.remove_bezier(name):
+            changes.append(f"remove bezier {name}")
+
+    return changes
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert a parsed config value to a JSON-serializable value."""
+    if isinstance(value, Color):
+        return f"rgba({value.hex.lower()})"
+    if isinstance(value, (bool, int, float)) or value is None:
+        return value
+    return str(value)
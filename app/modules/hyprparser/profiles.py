@@ -0,0 +1,178 @@
+"""
+Named config profiles, e.g. "battery" and "performance".
+
+A profile is a delta: the options it overrides on top of the config.
+Profiles are kept in hyprset-profiles.json next to hyprland.conf, never
+in hyprland.conf itself:
+
+    {
+        "active": "battery",
+        "profiles": {
+            "battery": {"decoration:blur:enabled": false, "misc:vfr": true},
+            "performance": {"decoration:blur:enabled": true}
+        }
+    }
+
+The diff between every pair of profiles is computed whenever profiles
+are loaded or edited, so a switch only looks up the keys it has to touch.
+"""
+
+import json
+import os
+from itertools import permutations
+from typing import Any, Dict, List, Optional, Tuple
+
+from .parser import atomic_write
+from .schema import validate_option
+
+
+PROFILES_FILE = 'hyprset-profiles.json'
+# Reserved name for the plain config without a profile
+NO_PROFILE = 'none'
+
+
+class ProfileError(ValueError):
+    """Raised when a profile or the profiles file is invalid."""
+
+
+def profiles_path(config_path: str) -> str:
+    """Get the profiles file that belongs to a config."""
+    return os.path.join(os.path.dirname(os.path.abspath(config_path)), PROFILES_FILE)
+
+
+def profile_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the changes needed to go from one profile to another.
+
+    Args:
+        old: Values of the current profile
+        new: Values of the profile to switch to
+
+    Returns:
+        The keys whose value differs, with their value in `new`, or None
+        for keys that fall back to the config
+    """
+    diff = {path: None for path in old if path not in new}
+    for path, value in new.items():
+        # 1 == True, but they are written differently to Hyprland
+        if path not in old or old[path] != value or type(old[path]) is not type(value):
+            diff[path] = value
+    return diff
+
+
+class ProfileStore:
+    """Profiles of one config and which of them is active."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path of the profiles file, see `profiles_path`
+        """
+        self.path = path
+        self.active: Optional[str] = None
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        # (from, to) -> diff, where None is the plain config
+        self._diffs: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._profiles)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._profiles
+
+    def get(self, name: Optional[str]) -> Dict[str, Any]:
+        """Get the values of a profile. None is the plain config."""
+        if name is None:
+            return {}
+        if name not in self._profiles:
+            raise ProfileError(f"Unknown profile '{name}'")
+        return dict(self._profiles[name])
+
+    def diff(self, old: Optional[str], new: Optional[str]) -> Dict[str, Any]:
+        """
+        Get the precomputed diff between two profiles, see `profile_diff`.
+
+        Args:
+            old: Current profile, or None for the plain config
+            new: Profile to switch to, or None for the plain config
+        """
+        if old == new:
+            return {}
+        try:
+            return self._diffs[(old, new)]
+        except KeyError:
+            unknown = old if old is not None and old not in self._profiles else new
+            raise ProfileError(f"Unknown profile '{unknown}'") from None
+
+    def _compute_diffs(self):
+        profiles: Dict[Optional[str], Dict[str, Any]] = {None: {}}
+        profiles.update(self._profiles)
+        self._diffs = {
+            (old, new): profile_diff(profiles[old], profiles[new])
+            for old, new in permutations(profiles, 2)
+        }
+
+    def load(self) -> bool:
+        """
+        Read the profiles file. A missing file means there are no profiles.
+
+        Returns:
+            True if successful
+
+        Raises:
+            ProfileError: If the file is malformed
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {}
+        except json.JSONDecodeError as e:
+            raise ProfileError(f"Invalid JSON in {self.path}: {e}") from e
+
+        profiles = data.get('profiles', {}) if isinstance(data, dict) else None
+        if not isinstance(profiles, dict) or not all(isinstance(v, dict) for v in profiles.values()):
+            raise ProfileError(f"{self.path}: 'profiles' must map names to options")
+
+        self._profiles = profiles
+        active = data.get('active')
+        self.active = active if active in profiles else None
+        self._compute_diffs()
+        return True
+
+    def save(self):
+        """Write the profiles file."""
+        data = {'active': self.active, 'profiles': self._profiles}
+        atomic_write(self.path, json.dumps(data, indent=4) + '\n')
+
+    def set_profile(self, name: str, values: Dict[str, Any]):
+        """
+        Create or replace a profile.
+
+        Args:
+            name: Profile name
+            values: JSON values by option path, colors written as "rgba(...)"
+
+        Raises:
+            ProfileError: If a value is invalid for its option
+        """
+        if not name or name == NO_PROFILE:
+            raise ProfileError(f"Invalid profile name '{name}'")
+        for path, value in values.items():
+            try:
+                validate_option(path, value)
+            except ValueError as e:
+                raise ProfileError(str(e)) from e
+        self._profiles[name] = dict(values)
+        self._compute_diffs()
+
+    def remove_profile(self, name: str) -> bool:
+        """Delete a profile. Returns False if it does not exist."""
+        if name not in self._profiles:
+            return False
+        del self._profiles[name]
+        if self.active == name:
+            self.active = None
+        self._compute_diffs()
+        return True
@@ -0,0 +1,595 @@
+"""
+Registry of Hyprland options: type, bounds, default, allowed values and
+deprecation info. Defaults are taken from `defaults.DEFAULTS`; options
+it does not list (such as colors that fall back to another option) have
+None.
+
+Each option's validator is compiled once into a closure, so checking a
+value is a dict probe plus a call:
+
+    validate_option('general:border_size', -1)  # raises ValueError
+
+Options missing from the registry (plugins, new Hyprland versions) are
+accepted as they are.
+"""
+
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from .data_types import Color
+from .defaults import DEFAULTS
+
+
+class OptionSpec:
+    """
+    Description of a single option.
+
+    `min`/`max` are hard bounds used for validation. `ui_min`/`ui_max`
+    are the range offered by widgets, which may be narrower for options
+    that are unbounded.
+    """
+
+    __slots__ = (
+        'path', 'type', 'default', 'min', 'max', 'ui_min', 'ui_max',
+        'choices', 'replaced_by', 'removed', 'description',
+    )
+
+    def __init__(
+        self,
+        path: str,
+        type: str,
+        default: Any,
+        min: Optional[float] = None,
+        max: Optional[float] = None,
+        ui: Optional[Tuple[float, float]] = None,
+        choices: Optional[Sequence[Any]] = None,
+        description: str = '',
+    ):
+        self.path = path
+        self.type = type
+        self.default = default
+        self.min = min
+        self.max = max
+        self.ui_min, self.ui_max = ui if ui is not None else (min, max)
+        self.choices = tuple(choices) if choices is not None else None
+        # Set for deprecated options
+        self.replaced_by: Optional[str] = None
+        self.removed = False
+        self.description = description
+
+    @property
+    def deprecated(self) -> bool:
+        return self.removed or self.replaced_by is not None
+
+    @property
+    def python_type(self) -> type:
+        """The Python type widgets should edit this option as."""
+        return {'bool': bool, 'int': int, 'gaps': int, 'float': float}.get(self.type, str)
+
+    def __str__(self) -> str:
+        return f"OptionSpec({self.path}, {self.type}, {self.default})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+OPTIONS: Dict[str, OptionSpec] = {}
+
+
+def _add(path: str, type: str, min=None, max=None, ui=None, choices=None, description=''):
+    # Defaults come from the table generated from `hyprctl descriptions`
+    OPTIONS[path] = OptionSpec(path, type, DEFAULTS.get(path), min, max, ui, choices, description)
+
+
+def _bool(path: str, description: str = ''):
+    _add(path, 'bool', description=description)
+
+
+def _int(path: str, min=None, max=None, ui=None, choices=None, description: str = ''):
+    _add(path, 'int', min, max, ui, choices, description)
+
+
+def _float(path: str, min=None, max=None, ui=None, description: str = ''):
+    _add(path, 'float', min, max, ui, description=description)
+
+
+def _str(path: str, choices=None, description: str = ''):
+    _add(path, 'string', choices=choices, description=description)
+
+
+def _color(path: str, description: str = ''):
+    _add(path, 'color', description=description)
+
+
+def _gradient(path: str, description: str = ''):
+    _add(path, 'gradient', description=description)
+
+
+def _vec2(path: str, description: str = ''):
+    _add(path, 'vec2', description=description)
+
+
+def _renamed(old: str, new: str):
+    target = OPTIONS[new]
+    spec = OptionSpec(
+        old, target.type, target.default, target.min, target.max,
+        (target.ui_min, target.ui_max), target.choices, target.description,
+    )
+    spec.replaced_by = new
+    OPTIONS[old] = spec
+
+
+def _removed(old: str, type: str, default: Any):
+    spec = OptionSpec(old, type, default)
+    spec.removed = True
+    OPTIONS[old] = spec
+
+
+# general
+_int('general:border_size', min=0, ui=(0, 20), description='Size of the border around windows')
+_bool('general:no_border_on_floating')
+_add('general:gaps_in', 'gaps', min=0, ui=(0, 255), description='Gaps between windows')
+_add('general:gaps_out', 'gaps', min=0, ui=(0, 255), description='Gaps between windows and monitor edges')
+_int('general:gaps_workspaces', min=0, ui=(0, 255))
+_gradient('general:col.inactive_border')
+_gradient('general:col.active_border')
+_gradient('general:col.nogroup_border')
+_gradient('general:col.nogroup_border_active')
+_str('general:layout', choices=('dwindle', 'master'))
+_bool('general:no_focus_fallback')
+_bool('general:resize_on_border')
+_int('general:extend_border_grab_area', min=0, ui=(0, 100))
+_bool('general:hover_icon_on_border')
+_bool('general:allow_tearing')
+_int('general:resize_corner', min=0, max=4)
+_bool('general:snap:enabled')
+_int('general:snap:window_gap', min=0, ui=(0, 100))
+_int('general:snap:monitor_gap', min=0, ui=(0, 100))
+_bool('general:snap:border_overlap')
+
+# decoration
+_int('decoration:rounding', min=0, ui=(0, 50))
+_float('decoration:rounding_power', min=1.0, max=10.0)
+_float('decoration:active_opacity', min=0.0, max=1.0)
+_float('decoration:inactive_opacity', min=0.0, max=1.0)
+_float('decoration:fullscreen_opacity', min=0.0, max=1.0)
+_bool('decoration:dim_inactive')
+_float('decoration:dim_strength', min=0.0, max=1.0)
+_float('decoration:dim_special', min=0.0, max=1.0)
+_float('decoration:dim_around', min=0.0, max=1.0)
+_str('decoration:screen_shader')
+_bool('decoration:border_part_of_window')
+
+_bool('decoration:blur:enabled')
+_int('decoration:blur:size', min=1, ui=(1, 100))
+_int('decoration:blur:passes', min=1, ui=(1, 10))
+_bool('decoration:blur:ignore_opacity')
+_bool('decoration:blur:new_optimizations')
+_bool('decoration:blur:xray')
+_float('decoration:blur:noise', min=0.0, max=1.0)
+_float('decoration:blur:contrast', min=0.0, max=2.0)
+_float('decoration:blur:brightness', min=0.0, max=2.0)
+_float('decoration:blur:vibrancy', min=0.0, max=1.0)
+_float('decoration:blur:vibrancy_darkness', min=0.0, max=1.0)
+_bool('decoration:blur:special')
+_bool('decoration:blur:popups')
+_float('decoration:blur:popups_ignorealpha', min=0.0, max=1.0)
+_bool('decoration:blur:input_methods')
+_float('decoration:blur:input_methods_ignorealpha', min=0.0, max=1.0)
+
+_bool('decoration:shadow:enabled')
+_int('decoration:shadow:range', min=0, ui=(0, 100))
+_int('decoration:shadow:render_power', min=1, max=4)
+_bool('decoration:shadow:sharp')
+_bool('decoration:shadow:ignore_window')
+_color('decoration:shadow:color')
+_color('decoration:shadow:color_inactive')
+_vec2('decoration:shadow:offset')
+_float('decoration:shadow:scale', min=0.0, max=1.0)
+
+_renamed('decoration:drop_shadow', 'decoration:shadow:enabled')
+_renamed('decoration:shadow_range', 'decoration:shadow:range')
+_renamed('decoration:shadow_render_power', 'decoration:shadow:render_power')
+_renamed('decoration:shadow_ignore_window', 'decoration:shadow:ignore_window')
+_renamed('decoration:shadow_offset', 'decoration:shadow:offset')
+_renamed('decoration:shadow_scale', 'decoration:shadow:scale')
+_renamed('decoration:col.shadow', 'decoration:shadow:color')
+_renamed('decoration:col.shadow_inactive', 'decoration:shadow:color_inactive')
+
+# animations
+_bool('animations:enabled')
+_bool('animations:first_launch_animation')
+_bool('animations:workspace_wraparound')
+
+# input
+_str('input:kb_model')
+_str('input:kb_layout')
+_str('input:kb_variant')
+_str('input:kb_options')
+_str('input:kb_rules')
+_str('input:kb_file')
+_bool('input:numlock_by_default')
+_bool('input:resolve_binds_by_sym')
+_int('input:repeat_rate', min=0, ui=(1, 100))
+_int('input:repeat_delay', min=0, ui=(100, 2000))
+_float('input:sensitivity', min=-1.0, max=1.0)
+_str('input:accel_profile')
+_bool('input:force_no_accel')
+_bool('input:left_handed')
+_str('input:scroll_points')
+_str('input:scroll_method', choices=('', '2fg', 'edge', 'on_button_down', 'no_scroll'))
+_int('input:scroll_button', min=0, ui=(0, 10))
+_bool('input:scroll_button_lock')
+_float('input:scroll_factor', min=0.0, ui=(0.1, 10.0))
+_bool('input:natural_scroll')
+_int('input:follow_mouse', min=0, max=3)
+_int('input:focus_on_close', min=0, max=1)
+_bool('input:mouse_refocus')
+_int('input:float_switch_override_focus', min=0, max=2)
+_bool('input:special_fallthrough')
+_int('input:off_window_axis_events', min=0, max=3)
+_int('input:emulate_discrete_scroll', min=0, max=2)
+
+_bool('input:touchpad:disable_while_typing')
+_bool('input:touchpad:natural_scroll')
+_float('input:touchpad:scroll_factor', min=0.0, ui=(0.1, 10.0))
+_bool('input:touchpad:middle_button_emulation')
+_str('input:touchpad:tap_button_map', choices=('', 'lrm', 'lmr'))
+_bool('input:touchpad:clickfinger_behavior')
+_bool('input:touchpad:tap-to-click')
+_bool('input:touchpad:drag_lock')
+_bool('input:touchpad:tap-and-drag')
+
+_int('input:touchdevice:transform', min=-1, max=7)
+_str('input:touchdevice:output')
+_bool('input:touchdevice:enabled')
+
+_int('input:tablet:transform', min=-1, max=7)
+_str('input:tablet:output')
+_vec2('input:tablet:region_position')
+_bool('input:tablet:absolute_region_position')
+_vec2('input:tablet:region_size')
+_bool('input:tablet:relative_input')
+_bool('input:tablet:left_handed')
+_vec2('input:tablet:active_area_size')
+_vec2('input:tablet:active_area_position')
+
+# gestures
+_bool('gestures:workspace_swipe')
+_int('gestures:workspace_swipe_fingers', min=2, ui=(2, 5))
+_bool('gestures:workspace_swipe_min_fingers')
+_int('gestures:workspace_swipe_distance', min=0, ui=(100, 2000))
+_bool('gestures:workspace_swipe_touch')
+_bool('gestures:workspace_swipe_invert')
+_bool('gestures:workspace_swipe_touch_invert')
+_int('gestures:workspace_swipe_min_speed_to_force', min=0, ui=(0, 100))
+_float('gestures:workspace_swipe_cancel_ratio', min=0.0, max=1.0)
+_bool('gestures:workspace_swipe_create_new')
+_bool('gestures:workspace_swipe_direction_lock')
+_int('gestures:workspace_swipe_direction_lock_threshold', min=0, ui=(10, 500))
+_bool('gestures:workspace_swipe_forever')
+_bool('gestures:workspace_swipe_use_r')
+
+# group
+_bool('group:auto_group')
+_bool('group:insert_after_current')
+_bool('group:focus_removed_window')
+_int('group:drag_into_group', min=0, max=2)
+_bool('group:merge_groups_on_drag')
+_bool('group:merge_groups_on_groupbar')
+_bool('group:merge_floated_into_tiled_on_groupbar')
+_bool('group:group_on_movetoworkspace')
+_gradient('group:col.border_active')
+_gradient('group:col.border_inactive')
+_gradient('group:col.border_locked_active')
+_gradient('group:col.border_locked_inactive')
+
+_bool('group:groupbar:enabled')
+_str('group:groupbar:font_family')
+_int('group:groupbar:font_size', min=1, ui=(6, 72))
+_bool('group:groupbar:gradients')
+_int('group:groupbar:height', min=1, ui=(1, 100))
+_bool('group:groupbar:stacked')
+_int('group:groupbar:priority', min=0, ui=(0, 10))
+_bool('group:groupbar:render_titles')
+_bool('group:groupbar:scrolling')
+_color('group:groupbar:text_color')
+_gradient('group:groupbar:col.active')
+_gradient('group:groupbar:col.inactive')
+_gradient('group:groupbar:col.locked_active')
+_gradient('group:groupbar:col.locked_inactive')
+
+# misc
+_bool('misc:disable_hyprland_logo')
+_bool('misc:disable_splash_rendering')
+_color('misc:col.splash')
+_str('misc:font_family')
+_str('misc:splash_font_family')
+_int('misc:force_default_wallpaper', min=-1, max=2)
+_bool('misc:vfr')
+_int('misc:vrr', min=0, max=3)
+_bool('misc:mouse_move_enables_dpms')
+_bool('misc:key_press_enables_dpms')
+_bool('misc:always_follow_on_dnd')
+_bool('misc:layers_hog_keyboard_focus')
+_bool('misc:animate_manual_resizes')
+_bool('misc:animate_mouse_windowdragging')
+_bool('misc:disable_autoreload')
+_bool('misc:enable_swallow')
+_str('misc:swallow_regex')
+_str('misc:swallow_exception_regex')
+_bool('misc:focus_on_activate')
+_bool('misc:mouse_move_focuses_monitor')
+_bool('misc:render_ahead_of_time')
+_int('misc:render_ahead_safezone', min=0, ui=(0, 100))
+_bool('misc:allow_session_lock_restore')
+_color('misc:background_color')
+_bool('misc:close_special_on_empty')
+_int('misc:new_window_takes_over_fullscreen', min=0, max=2)
+_bool('misc:exit_window_retains_fullscreen')
+_int('misc:initial_workspace_tracking', min=0, max=2)
+_bool('misc:middle_click_paste')
+_int('misc:render_unfocused_fps', min=1, ui=(1, 120))
+_bool('misc:disable_xdg_env_checks')
+_bool('misc:disable_hyprland_qtutils_check')
+_int('misc:lockdead_screen_delay', min=0, ui=(0, 5000))
+_bool('misc:enable_anr_dialog')
+_int('misc:anr_missed_pings', min=1, ui=(1, 20))
+
+# binds
+_bool('binds:pass_mouse_when_bound')
+_int('binds:scroll_event_delay', min=0, ui=(0, 2000))
+_bool('binds:workspace_back_and_forth')
+_bool('binds:hide_special_on_workspace_change')
+_bool('binds:allow_workspace_cycles')
+_int('binds:workspace_center_on', min=0, max=1)
+_int('binds:focus_preferred_method', min=0, max=1)
+_bool('binds:ignore_group_lock')
+_bool('binds:movefocus_cycles_fullscreen')
+_bool('binds:movefocus_cycles_groupfirst')
+_bool('binds:disable_keybind_grabbing')
+_bool('binds:window_direction_monitor_fallback')
+_bool('binds:allow_pin_fullscreen')
+_int('binds:drag_threshold', min=0, ui=(0, 100))
+
+# xwayland
+_bool('xwayland:enabled')
+_bool('xwayland:use_nearest_neighbor')
+_bool('xwayland:force_zero_scaling')
+_bool('xwayland:create_abstract_socket')
+
+# opengl
+_bool('opengl:nvidia_anti_flicker')
+
+# render
+_int('render:explicit_sync', min=0, max=2)
+_int('render:explicit_sync_kms', min=0, max=2)
+_int('render:direct_scanout', min=0, max=2)
+_bool('render:expand_undersized_textures')
+_bool('render:xp_mode')
+_int('render:ctm_animation', min=0, max=2)
+_int('render:cm_fs_passthrough', min=0, max=2)
+_bool('render:cm_enabled')
+_bool('render:send_content_type')
+_int('render:cm_auto_hdr', min=0, max=2)
+_bool('render:new_render_scheduling')
+
+# cursor
+_bool('cursor:sync_gsettings_theme')
+_int('cursor:no_hardware_cursors', min=0, max=2)
+_int('cursor:no_break_fs_vrr', min=0, max=2)
+_int('cursor:min_refresh_rate', min=1, ui=(1, 240))
+_int('cursor:hotspot_padding', min=0, ui=(0, 20))
+_float('cursor:inactive_timeout', min=0.0, ui=(0.0, 60.0))
+_bool('cursor:no_warps')
+_bool('cursor:persistent_warps')
+_int('cursor:warp_on_change_workspace', min=0, max=2)
+_int('cursor:warp_on_toggle_special', min=0, max=2)
+_str('cursor:default_monitor')
+_float('cursor:zoom_factor', min=1.0, ui=(1.0, 10.0))
+_bool('cursor:zoom_rigid')
+_bool('cursor:enable_hyprcursor')
+_bool('cursor:hide_on_key_press')
+_bool('cursor:hide_on_touch')
+_int('cursor:use_cpu_buffer', min=0, max=2)
+_bool('cursor:warp_back_after_non_mouse_input')
+
+# ecosystem
+_bool('ecosystem:no_update_news')
+_bool('ecosystem:no_donation_nag')
+_bool('ecosystem:enforce_permissions')
+
+# quirks
+_int('quirks:prefer_hdr', min=0, max=2)
+
+# debug
+_bool('debug:overlay')
+_bool('debug:damage_blink')
+_bool('debug:disable_logs')
+_bool('debug:disable_time')
+_int('debug:damage_tracking', min=0, max=2)
+_bool('debug:enable_stdout_logs')
+_int('debug:manual_crash', min=0, max=1)
+_bool('debug:suppress_errors')
+_int('debug:watchdog_timeout', min=0, ui=(0, 60))
+_bool('debug:disable_scale_checks')
+_int('debug:error_limit', min=0, ui=(0, 50))
+_int('debug:error_position', min=0, max=1)
+_bool('debug:colored_stdout_logs')
+_bool('debug:pass')
+_bool('debug:full_cm_proto')
+
+# dwindle
+_bool('dwindle:pseudotile')
+_int('dwindle:force_split', min=0, max=2)
+_bool('dwindle:preserve_split')
+_bool('dwindle:smart_split')
+_bool('dwindle:smart_resizing')
+_bool('dwindle:permanent_direction_override')
+_float('dwindle:special_scale_factor', min=0.0, max=1.0)
+_float('dwindle:split_width_multiplier', min=0.1, ui=(0.1, 3.0))
+_bool('dwindle:use_active_for_splits')
+_float('dwindle:default_split_ratio', min=0.1, max=1.9)
+_int('dwindle:split_bias', min=0, max=1)
+_bool('dwindle:precise_mouse_move')
+
+# master
+_bool('master:allow_small_split')
+_float('master:special_scale_factor', min=0.0, max=1.0)
+_float('master:mfact', min=0.0, max=1.0)
+_str('master:new_status', choices=('master', 'slave', 'inherit'))
+_bool('master:new_on_top')
+_str('master:new_on_active', choices=('before', 'after', 'none'))
+_str('master:orientation', choices=('left', 'right', 'top', 'bottom', 'center'))
+_bool('master:inherit_fullscreen')
+_int('master:slave_count_for_center_master', min=0, ui=(0, 10))
+_str('master:center_master_fallback', choices=('left', 'right', 'top', 'bottom'))
+_bool('master:smart_resizing')
+_bool('master:drop_at_cursor')
+_bool('master:always_keep_position')
+
+# experimental
+_bool('experimental:xx_color_management_v4')
+
+# Deprecated options from older Hyprland versions
+_renamed('general:no_cursor_warps', 'cursor:no_warps')
+_renamed('general:cursor_inactive_timeout', 'cursor:inactive_timeout')
+_renamed('general:sensitivity', 'input:sensitivity')
+_renamed('misc:no_direct_scanout', 'render:direct_scanout')
+_renamed('misc:hide_cursor_on_key_press', 'cursor:hide_on_key_press')
+_renamed('misc:hide_cursor_on_touch', 'cursor:hide_on_touch')
+_renamed('misc:cursor_zoom_factor', 'cursor:zoom_factor')
+_renamed('misc:cursor_zoom_rigid', 'cursor:zoom_rigid')
+_renamed('master:new_is_master', 'master:new_status')
+_renamed('master:always_center_master', 'master:slave_count_for_center_master')
+_removed('general:apply_sens_to_raw', 'bool', False)
+_removed('misc:no_direct_scanout_fullscreen', 'bool', False)
+_removed('dwindle:no_gaps_when_only', 'int', 0)
+_removed('master:no_gaps_when_only', 'int', 0)
+
+# Top level sections, plus ones that take arbitrary keys
+SECTIONS = frozenset({path.split(':', 1)[0] for path in OPTIONS} | {'plugin', 'device'})
+
+
+def _is_variable(value: Any) -> bool:
+    return value.__class__ is str and value.startswith('$')
+
+
+def compile_validator(spec: OptionSpec) -> Callable[[Any], Any]:
+    """
+    Build the validator for an option.
+
+    The returned function takes a parsed value and returns it when it is
+    valid, or raises ValueError. Unexpanded $variables are always valid.
+
+    Args:
+        spec: Option to validate
+
+    Returns:
+        Validator function
+    """
+    path = spec.path
+    low, high = spec.min, spec.max
+    choices = spec.choices
+
+    def check_range(value):
+        if (low is not None and value < low) or (high is not None and value > high):
+            lower = '' if low is None else low
+            upper = '' if high is None else high
+            raise ValueError(f"{path} = {value} is outside of [{lower}, {upper}]")
+        return value
+
+    def wrong_type(value, expected):
+        raise ValueError(f"{path} expects {expected}, got {value!r}")
+
+    if spec.type == 'bool':
+        def validate(value):
+            # The parser reads 0 and 1 as integers
+            if value.__class__ is bool or (value.__class__ is int and value in (0, 1)) or _is_variable(value):
+                return value
+            return wrong_type(value, 'a boolean')
+
+    elif spec.type == 'int':
+        def validate(value):
+            if value.__class__ is int:
+                if choices is not None and value not in choices:
+                    raise ValueError(f"{path} must be one of {', '.join(map(str, choices))}")
+                return check_range(value)
+            if _is_variable(value):
+                return value
+            return wrong_type(value, 'an integer')
+
+    elif spec.type == 'float':
+        def validate(value):
+            if value.__class__ is float or value.__class__ is int:
+                return check_range(value)
+            if _is_variable(value):
+                return value
+            return wrong_type(value, 'a number')
+
+    elif spec.type == 'gaps':
+        def validate(value):
+            # An integer, or up to four of them like CSS margins
+            if value.__class__ is int:
+                return check_range(value)
+            if value.__class__ is str:
+                if _is_variable(value):
+                    return value
+                parts = value.replace(',', ' ').split()
+                if 1 <= len(parts) <= 4 and all(p.lstrip('-').isdigit() for p in parts):
+                    for p in parts:
+                        check_range(int(p))
+                    return value
+            return wrong_type(value, 'one to four integers')
+
+    elif spec.type in ('color', 'gradient'):
+        def validate(value):
+            # Gradients and legacy integer colors are kept as written
+            if isinstance(value, (Color, str)):
+                return value
+            if value.__class__ is int and 0 <= value <= 0xFFFFFFFF:
+                return value
+            return wrong_type(value, 'a color')
+
+    elif choices is not None:
+        def validate(value):
+            if value in choices or _is_variable(value):
+                return value
+            raise ValueError(f"{path} must be one of {', '.join(repr(c) for c in choices)}")
+
+    else:
+        def validate(value):
+            if isinstance(value, (str, int, float, bool)):
+                return value
+            return wrong_type(value, 'text')
+
+    return validate
+
+
+VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+    path: compile_validator(spec) for path, spec in OPTIONS.items()
+}
+
+
+def get_spec(path: str) -> Optional[OptionSpec]:
+    """Get the registry entry of an option, or None if it is unknown."""
+    return OPTIONS.get(path)
+
+
+def validate_option(path: str, value: Any) -> Any:
+    """
+    Check a value against the option's spec.
+
+    Args:
+        path: Option path like "general:gaps_in"
+        value: Parsed value
+
+    Returns:
+        The value, if it is valid or the option is unknown
+
+    Raises:
+        ValueError: If the value has the wrong type or is out of range
+    """
+    validate = VALIDATORS.get(path)
+    if validate is None:
+        return value
+    return validate(value)
@@ -0,0 +1,172 @@
+"""
+Submap transition graph of the keybinds.
+
+Each submap is a node; a bind that dispatches `submap, name` is an edge
+from the submap it is in to `name` (`reset` leads back to the global
+submap, ''). A submap declared as `submap = name, reset` returns to
+`reset` after any of its binds.
+
+Reachability is a breadth-first search from the global submap, linear in
+the number of submaps and transitions. The outgoing transitions of each
+submap are cached, so editing a bind only rescans the binds of its own
+submap, and the reachability results are only recomputed when that
+changes a transition.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .binds import Bind
+
+GLOBAL_SUBMAP = ''
+
+
+def submap_target(name: str) -> str:
+    """Get the submap a `submap` dispatcher or declaration leads to."""
+    name = name.strip()
+    return GLOBAL_SUBMAP if name == 'reset' else name
+
+
+def parse_submap_line(value: str) -> Tuple[str, Optional[str]]:
+    """
+    Parse the value of a `submap =` line.
+
+    Args:
+        value: e.g. "resize", "reset" or "launch, reset"
+
+    Returns:
+        The submap the following binds belong to, and the submap to
+        return to after any of them (None if not given)
+    """
+    name, sep, fallback = value.partition(',')
+    return submap_target(name), fallback.strip() if sep else None
+
+
+class SubmapGraph:
+    """Transitions between submaps and which binds can be reached."""
+
+    def __init__(self):
+        # Binds by the submap they are in
+        self._binds: Dict[str, List['Bind']] = {GLOBAL_SUBMAP: []}
+        # Submap -> where it returns to after any bind (`submap = a, reset`)
+        self._fallbacks: Dict[str, str] = {}
+        # Outgoing transitions per submap; missing entries are rescanned
+        self._edges: Dict[str, Set[str]] = {}
+        self._reachable: Optional[Set[str]] = None
+        self._returning: Optional[Set[str]] = None
+
+    @property
+    def submaps(self) -> List[str]:
+        """Get every submap that is declared or has binds, global first."""
+        return list(self._binds)
+
+    def declare(self, name: str, fallback: Optional[str] = None):
+        """
+        Record a `submap = name[, fallback]` line.
+
+        Args:
+            name: Submap name
+            fallback: Submap to return to after any bind, if declared
+        """
+        self._binds.setdefault(name, [])
+        if fallback is not None:
+            target = submap_target(fallback)
+            if self._fallbacks.get(name) != target:
+                self._fallbacks[name] = target
+                self._changed(name)
+
+    def add(self, bind: 'Bind'):
+        """Add a bind to its submap."""
+        binds = self._binds.setdefault(bind.submap, [])
+        binds.append(bind)
+        # The fallback only counts once the submap has binds
+        if bind.dispatcher == 'submap' or (len(binds) == 1 and bind.submap in self._fallbacks):
+            self._changed(bind.submap)
+
+    def remove(self, bind: 'Bind'):
+        """Remove a bind from its submap."""
+        binds = self._binds.get(bind.submap)
+        if binds is None:
+            return
+        binds[:] = [other for other in binds if other is not bind]
+        if bind.dispatcher == 'submap' or (not binds and bind.submap in self._fallbacks):
+            self._changed(bind.submap)
+
+    def _changed(self, submap: str):
+        """Rescan a submap's transitions; drop the results if they differ."""
+        old = self._edges.pop(submap, None)
+        if old is None or self.edges(submap) != old:
+            self._reachable = None
+            self._returning = None
+
+    def edges(self, submap: str) -> Set[str]:
+        """
+        Get the submaps a submap leads to.
+
+        Args:
+            submap: Submap name, '' for the global one
+
+        Returns:
+            Names of the target submaps
+        """
+        edges = self._edges.get(submap)
+        if edges is None:
+            edges = {
+                submap_target(bind.args)
+                for bind in self._binds.get(submap, ()) if bind.dispatcher == 'submap'
+            }
+            fallback = self._fallbacks.get(submap)
+            if fallback is not None and self._binds.get(submap):
+                edges.add(fallback)
+            edges.discard(submap)
+            self._edges[submap] = edges
+        return edges
+
+    def _search(self, start: str, neighbours: Dict[str, Set[str]]) -> Set[str]:
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for target in neighbours.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def reachable(self) -> Set[str]:
+        """Get the submaps that can be entered from the global one."""
+        if self._reachable is None:
+            graph = {submap: self.edges(submap) for submap in self._binds}
+            self._reachable = self._search(GLOBAL_SUBMAP, graph)
+        return self._reachable
+
+    def unreachable(self) -> List[str]:
+        """Get the submaps no bind leads to."""
+        reachable = self.reachable()
+        return [submap for submap in self._binds if submap not in reachable]
+
+    def unreachable_binds(self) -> List['Bind']:
+        """Get the binds in submaps that can never be entered."""
+        return [bind for submap in self.unreachable() for bind in self._binds[submap]]
+
+    def traps(self) -> List[str]:
+        """
+        Get the reachable submaps that have no way back to the global one.
+
+        This includes submaps that a bind enters but that have no binds,
+        which leave the keyboard stuck until Hyprland is reloaded.
+        """
+        if self._returning is None:
+            reverse: Dict[str, Set[str]] = {}
+            for submap in self._binds:
+                for target in self.edges(submap):
+                    reverse.setdefault(target, set()).add(submap)
+            self._returning = self._search(GLOBAL_SUBMAP, reverse)
+        reachable = self.reachable()
+        traps = [submap for submap in self._binds if submap in reachable and submap not in self._returning]
+        traps.extend(sorted(submap for submap in reachable if submap not in self._binds))
+        return traps
+
+    def binds(self, submap: str) -> Iterable['Bind']:
+        """Get the binds of a submap."""
+        return iter(self._binds.get(submap, ()))
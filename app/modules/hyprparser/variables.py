@@ -0,0 +1,250 @@
+"""
+Expansion of `$variables` in config values.
+
+Like Hyprland, variables are expanded anywhere in a value
+(`$mainMod SHIFT`, `rgba($accent)`, `$terminal -e btop`), and a token
+that is not defined itself uses the longest defined variable it starts
+with (`$mainModSHIFT` with only `$mainMod` defined). Definitions may
+reference other variables; the last definition of a name wins.
+
+The resolver keeps a dependency graph from each referenced token to the
+variables and settings that use it. Resolved values are memoized, and
+changing a variable only drops the cached values of, and reports, what
+depends on it.
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+VARIABLE_RE = re.compile(r'\$\w+')
+
+
+class VariableCycleError(ValueError):
+    """Variables that reference each other in a loop."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Variables reference each other: {' -> '.join(cycle)}")
+
+
+def find_tokens(text: str) -> Set[str]:
+    """
+    Get the `$tokens` in a value.
+
+    Args:
+        text: Raw config value
+
+    Returns:
+        Set of tokens, including the leading $
+    """
+    if '$' not in text:
+        return set()
+    return set(VARIABLE_RE.findall(text))
+
+
+class VariableResolver:
+    """Resolves variables and tracks which variables and settings use them."""
+
+    def __init__(self, definitions: Optional[Mapping[str, str]] = None):
+        self.definitions: Dict[str, str] = {}
+        # Token -> variables and setting paths whose text contains it
+        self._token_variables: Dict[str, Set[str]] = {}
+        self._token_settings: Dict[str, Set[str]] = {}
+        # Reverse of the above, to remove stale edges
+        self._variable_tokens: Dict[str, Set[str]] = {}
+        self._setting_tokens: Dict[str, Set[str]] = {}
+        self._cache: Dict[str, str] = {}
+        if definitions:
+            self.reset(definitions)
+
+    def reset(self, definitions: Mapping[str, str]):
+        """Replace all definitions, keeping the tracked settings."""
+        for name in list(self.definitions):
+            self._unlink(name, self._variable_tokens, self._token_variables)
+        self.definitions = dict(definitions)
+        self._cache.clear()
+        for name, value in self.definitions.items():
+            self._link(name, find_tokens(value), self._variable_tokens, self._token_variables)
+
+    def _link(self, key: str, tokens: Set[str], forward: Dict[str, Set[str]], backward: Dict[str, Set[str]]):
+        if tokens:
+            forward[key] = tokens
+        for token in tokens:
+            backward.setdefault(token, set()).add(key)
+
+    def _unlink(self, key: str, forward: Dict[str, Set[str]], backward: Dict[str, Set[str]]):
+        for token in forward.pop(key, ()):
+            users = backward.get(token)
+            if users is not None:
+                users.discard(key)
+                if not users:
+                    del backward[token]
+
+    def _lookup(self, token: str) -> Optional[str]:
+        """Get the longest defined variable `token` starts with."""
+        if token in self.definitions:
+            return token
+        for end in range(len(token) - 1, 1, -1):
+            if token[:end] in self.definitions:
+                return token[:end]
+        return None
+
+    def resolve(self, name: str) -> str:
+        """
+        Get the fully expanded value of a variable.
+
+        Args:
+            name: Variable name, including the leading $
+
+        Returns:
+            Expanded value
+
+        Raises:
+            KeyError: If the variable is not defined
+            VariableCycleError: If the variable references itself
+        """
+        cached = self._cache.get(name)
+        if cached is not None:
+            return cached
+        if name not in self.definitions:
+            raise KeyError(name)
+        return self._resolve(name, [])
+
+    def _resolve(self, name: str, stack: List[str]) -> str:
+        cached = self._cache.get(name)
+        if cached is not None:
+            return cached
+        if name in stack:
+            raise VariableCycleError(stack[stack.index(name):] + [name])
+        stack.append(name)
+        value = self._substitute(self.definitions[name], stack)
+        stack.pop()
+        self._cache[name] = value
+        return value
+
+    def _substitute(self, text: str, stack: List[str]) -> str:
+        if '$' not in text:
+            return text
+
+        def replace(match: 're.Match[str]') -> str:
+            token = match.group(0)
+            name = self._lookup(token)
+            if name is None:
+                return token
+            return self._resolve(name, stack) + token[len(name):]
+
+        return VARIABLE_RE.sub(replace, text)
+
+    def expand(self, text: str) -> str:
+        """
+        Expand every variable in a value.
+
+        Unknown variables are left as they are.
+
+        Args:
+            text: Raw config value
+
+        Returns:
+            Expanded value
+
+        Raises:
+            VariableCycleError: If a used variable references itself
+        """
+        return self._substitute(text, [])
+
+    def track(self, path: str, text: str):
+        """
+        Record the variables a setting's raw value uses.
+
+        Args:
+            path: Option path
+            text: Raw value, before expansion
+        """
+        self._unlink(path, self._setting_tokens, self._token_settings)
+        self._link(path, find_tokens(text), self._setting_tokens, self._token_settings)
+
+    def untrack(self, path: str):
+        """Forget the variables a setting used."""
+        self._unlink(path, self._setting_tokens, self._token_settings)
+
+    def _affected(self, name: str) -> Tuple[Set[str], Set[str]]:
+        """Get the variables and settings whose value depends on `name`."""
+        names = {name}
+        paths: Set[str] = set()
+        queue = [name]
+        while queue:
+            current = queue.pop()
+            # Tokens that may resolve to `current`; longer tokens can
+            # fall back to it (or stop doing so when it is redefined)
+            tokens = [token for token in self._tokens() if token.startswith(current)]
+            for token in tokens:
+                paths.update(self._token_settings.get(token, ()))
+                for dependent in self._token_variables.get(token, ()):
+                    if dependent not in names:
+                        names.add(dependent)
+                        queue.append(dependent)
+        return names, paths
+
+    def _tokens(self) -> Iterable[str]:
+        yield from self._token_variables
+        yield from (token for token in self._token_settings if token not in self._token_variables)
+
+    def dependents(self, name: str) -> Set[str]:
+        """Get the variables that use `name`, directly or through others."""
+        return self._affected(name)[0] - {name}
+
+    def users(self, name: str) -> Set[str]:
+        """Get the setting paths that use `name`, directly or through others."""
+        return self._affected(name)[1]
+
+    def set(self, name: str, value: str) -> Set[str]:
+        """
+        Define or redefine a variable.
+
+        Args:
+            name: Variable name, including the leading $
+            value: Raw value, may reference other variables
+
+        Returns:
+            Setting paths whose value has to be re-resolved
+
+        Raises:
+            VariableCycleError: If the new value creates a loop; the
+                previous definition is kept
+        """
+        previous = self.definitions.get(name)
+        names, paths = self._affected(name)
+        for dependent in names:
+            self._cache.pop(dependent, None)
+
+        self._unlink(name, self._variable_tokens, self._token_variables)
+        self.definitions[name] = value
+        self._link(name, find_tokens(value), self._variable_tokens, self._token_variables)
+        try:
+            self._resolve(name, [])
+        except VariableCycleError:
+            if previous is None:
+                self.remove(name)
+            else:
+                self.set(name, previous)
+            raise
+        return paths
+
+    def remove(self, name: str) -> Set[str]:
+        """
+        Remove a variable.
+
+        Args:
+            name: Variable name, including the leading $
+
+        Returns:
+            Setting paths whose value has to be re-resolved
+        """
+        if name not in self.definitions:
+            return set()
+        names, paths = self._affected(name)
+        for dependent in names:
+            self._cache.pop(dependent, None)
+        self._unlink(name, self._variable_tokens, self._token_variables)
+        del self.definitions[name]
+        return paths
@@ -0,0 +1,350 @@
+"""
+Window rules parsed into matchers and evaluated against open windows.
+
+`windowrulev2 = RULE, PROP:VALUE, ...` lines (and `windowrule` lines,
+old or new syntax) become `WindowRule`s with one matcher per property.
+Regexes are compiled once, and shared by every rule that uses the same
+pattern. Like Hyprland, a regex has to match the whole value and may be
+negated with `negative:`.
+
+`WindowRuleSet` indexes rules whose class is a plain name (such as
+`^(kitty|foot)$`) by that name, so a window is only checked against the
+rules for its class plus the rules that match any class.
+
+Windows are given as the dictionaries of `hyprctl clients -j`.
+"""
+
+import json
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from .data_types import Keyword
+
+# Properties matched with a regex, and the client field they read
+REGEX_FIELDS = {
+    'class': 'class',
+    'title': 'title',
+    'initialclass': 'initialClass',
+    'initialtitle': 'initialTitle',
+    'tag': 'tags',
+}
+
+# Properties matched as 0/1 against a client field
+FLAG_FIELDS = {
+    'floating': 'floating',
+    'xwayland': 'xwayland',
+    'pinned': 'pinned',
+    'fullscreen': 'fullscreen',
+    'pseudo': 'pseudo',
+}
+
+# Every property a windowrulev2 may use; the ones that depend on
+# compositor state a client snapshot does not have are not evaluated
+KNOWN_PROPS = frozenset(REGEX_FIELDS) | frozenset(FLAG_FIELDS) | frozenset({
+    'workspace', 'focus', 'group', 'fullscreenstate', 'onworkspace', 'content', 'xdgtag',
+})
+UNSUPPORTED_PROPS = frozenset({'onworkspace', 'content', 'xdgtag'})
+
+_PROP_RE = re.compile(r'\s*([A-Za-z]+):')
+# Literal class names: word characters, dashes and escaped dots
+_LITERAL_RE = re.compile(r'(?:[\w\- ]|\\\.)+')
+
+# Compiled patterns, shared by all rules
+_compiled: Dict[str, Pattern] = {}
+
+
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compile a rule regex, once per distinct pattern.
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    compiled = _compiled.get(pattern)
+    if compiled is None:
+        compiled = _compiled[pattern] = re.compile(pattern)
+    return compiled
+
+
+def literal_names(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Get the names a regex matches if it is only a list of literals.
+
+    Args:
+        pattern: e.g. "^(kitty|foot)$", "firefox" or "org\\.gnome\\.Nautilus"
+
+    Returns:
+        The names, or None if the pattern uses other regex syntax
+    """
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+    if pattern.endswith('$') and not pattern.endswith('\\$'):
+        pattern = pattern[:-1]
+    if pattern.startswith('(') and pattern.endswith(')'):
+        pattern = pattern[1:-1]
+        if pattern.startswith('?:'):
+            pattern = pattern[2:]
+    names = []
+    for part in pattern.split('|'):
+        if not part or _LITERAL_RE.fullmatch(part) is None:
+            return None
+        names.append(part.replace('\\.', '.'))
+    return frozenset(names)
+
+
+class Matcher:
+    """A single `prop:value` condition of a window rule."""
+
+    __slots__ = ('prop', 'value', 'negative', 'regex', 'literals')
+
+    def __init__(self, prop: str, value: str):
+        self.prop = prop
+        self.negative = False
+        if prop in REGEX_FIELDS and value.startswith('negative:'):
+            self.negative = True
+            value = value[len('negative:'):]
+        self.value = value
+        self.regex: Optional[Pattern] = None
+        # Exact class names for the prefilter index
+        self.literals: Optional[FrozenSet[str]] = None
+        if prop in REGEX_FIELDS:
+            self.regex = compile_pattern(value)
+            if prop == 'class' and not self.negative:
+                self.literals = literal_names(value)
+
+    def matches(self, client: Dict[str, Any]) -> bool:
+        """Check the condition against a `hyprctl clients -j` entry."""
+        prop = self.prop
+        if self.regex is not None:
+            field = client.get(REGEX_FIELDS[prop])
+            if prop == 'tag':
+                # Dynamic tags end with '*' in hyprctl output
+                found = any(self.regex.fullmatch(tag.rstrip('*')) for tag in field or ())
+            else:
+                found = self.regex.fullmatch(field or '') is not None
+            return found != self.negative
+        if prop in FLAG_FIELDS:
+            return bool(client.get(FLAG_FIELDS[prop])) == (self.value.strip() == '1')
+        if prop == 'focus':
+            return (client.get('focusHistoryID') == 0) == (self.value.strip() == '1')
+        if prop == 'group':
+            return bool(client.get('grouped')) == (self.value.strip() == '1')
+        if prop == 'workspace':
+            workspace = client.get('workspace') or {}
+            value = self.value.strip()
+            if value.startswith('name:'):
+                return workspace.get('name') == value[5:]
+            return str(workspace.get('id')) == value
+        if prop == 'fullscreenstate':
+            states = self.value.split()
+            actual = (client.get('fullscreen'), client.get('fullscreenClient'))
+            return all(want == '*' or str(int(have or 0)) == want for want, have in zip(states, actual))
+        return False
+
+    def __str__(self) -> str:
+        negative = 'negative:' if self.negative else ''
+        return f"{self.prop}:{negative}{self.value}"
+
+    def __repr__(self) -> str:
+        return f"Matcher({self.__str__()})"
+
+
+class WindowRule:
+    """A parsed window rule: what it does and which windows it applies to."""
+
+    __slots__ = ('effect', 'matchers', 'unsupported', 'keyword', 'source', 'order')
+
+    def __init__(self, effect: str, matchers: List[Matcher], keyword: Optional[Keyword] = None, source: str = ''):
+        # e.g. "float" or "opacity 0.9 0.8"
+        self.effect = effect
+        self.matchers = matchers
+        # Properties that cannot be checked against a client snapshot
+        self.unsupported = [m.prop for m in matchers if m.prop in UNSUPPORTED_PROPS]
+        self.keyword = keyword
+        self.source = source
+        # Position in the rule set, which is also the order rules apply in
+        self.order = 0
+
+    @property
+    def line(self) -> int:
+        return self.keyword.line if self.keyword is not None else 0
+
+    @property
+    def classes(self) -> Optional[FrozenSet[str]]:
+        """Class names the rule is limited to, if its class is a literal."""
+        for matcher in self.matchers:
+            if matcher.literals is not None:
+                return matcher.literals
+        return None
+
+    def matches(self, client: Dict[str, Any]) -> bool:
+        """
+        Check the rule against a `hyprctl clients -j` entry.
+
+        Rules with properties that need compositor state never match.
+        """
+        if self.unsupported:
+            return False
+        for matcher in self.matchers:
+            if not matcher.matches(client):
+                return False
+        return True
+
+    def __str__(self) -> str:
+        return f"{self.effect}, {', '.join(str(m) for m in self.matchers)}"
+
+    def __repr__(self) -> str:
+        return f"WindowRule({self.__str__()})"
+
+
+def _split_props(text: str) -> List[Tuple[str, str]]:
+    """Split "class:a,b, title:c" into properties; commas may be part of a regex."""
+    props: List[Tuple[str, str]] = []
+    for part in text.split(','):
+        match = _PROP_RE.match(part)
+        if match is not None and match.group(1).lower() in KNOWN_PROPS:
+            props.append((match.group(1).lower(), part[match.end():].strip()))
+        elif props:
+            name, value = props[-1]
+            props[-1] = (name, f"{value},{part}")
+        elif part.strip():
+            raise ValueError(f"Unknown window rule property '{part.strip()}'")
+    return [(name, value.strip()) for name, value in props]
+
+
+def parse_window_rule(keyword: Keyword, source: str = '', expand=None) -> WindowRule:
+    """
+    Parse a `windowrule` or `windowrulev2` line.
+
+    Args:
+        keyword: The line
+        source: Config file the line was read from
+        expand: Function that expands $variables
+
+    Returns:
+        The parsed rule
+
+    Raises:
+        ValueError: If the line is not a valid rule or a regex is invalid
+    """
+    value = expand(keyword.value) if expand is not None else keyword.value
+    effect, sep, rest = value.partition(',')
+    effect = effect.strip()
+    if not sep or not effect or not rest.strip():
+        raise ValueError(f"Invalid window rule '{keyword.to_config_string()}'")
+
+    props = None
+    if keyword.name == 'windowrule':
+        # The old syntax takes one class regex, or title:regex
+        stripped = rest.strip()
+        if stripped.startswith('title:') and ',' not in stripped:
+            props = [('title', stripped[len('title:'):])]
+        elif _PROP_RE.match(stripped) is None or _PROP_RE.match(stripped).group(1).lower() not in KNOWN_PROPS:
+            props = [('class', stripped)]
+    try:
+        matchers = [Matcher(name, regex) for name, regex in (props or _split_props(rest))]
+    except re.error as e:
+        raise ValueError(f"Invalid regex in '{keyword.to_config_string()}': {e}") from None
+    if not matchers:
+        raise ValueError(f"Window rule without conditions '{keyword.to_config_string()}'")
+    return WindowRule(effect, matchers, keyword, source)
+
+
+class WindowRuleSet:
+    """Window rules in config order, with a prefilter index by class name."""
+
+    def __init__(self, rules: Iterable[WindowRule] = ()):
+        self.rules: List[WindowRule] = []
+        # Lines that could not be parsed, with the reason
+        self.errors: List[Tuple[Keyword, str]] = []
+        self._by_class: Dict[str, List[WindowRule]] = {}
+        # Rules that may match any class
+        self._any_class: List[WindowRule] = []
+        for rule in rules:
+            self.add(rule)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def add(self, rule: WindowRule):
+        """Add a rule after the existing ones."""
+        rule.order = len(self.rules)
+        self.rules.append(rule)
+        classes = rule.classes
+        if classes is None:
+            self._any_class.append(rule)
+        else:
+            for name in classes:
+                self._by_class.setdefault(name, []).append(rule)
+
+    def candidates(self, client: Dict[str, Any]) -> List[WindowRule]:
+        """Get the rules that may match a window, in config order."""
+        specific = self._by_class.get(client.get('class') or '')
+        if not specific:
+            return self._any_class
+        if not self._any_class:
+            return specific
+        return sorted(specific + self._any_class, key=lambda rule: rule.order)
+
+    def match(self, client: Dict[str, Any]) -> List[WindowRule]:
+        """
+        Get the rules that apply to a window, in the order Hyprland applies them.
+
+        Args:
+            client: Entry of `hyprctl clients -j`
+        """
+        return [rule for rule in self.candidates(client) if rule.matches(client)]
+
+    def match_clients(self, clients: Iterable[Dict[str, Any]]) -> Dict[str, List[WindowRule]]:
+        """
+        Match every window of a `hyprctl clients -j` snapshot.
+
+        Returns:
+            Window address -> rules that apply to it
+        """
+        return {client.get('address', ''): self.match(client) for client in clients}
+
+
+def load_clients(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse the output of `hyprctl clients -j`.
+
+    Raises:
+        ValueError: If the text is not a list of clients
+    """
+    clients = json.loads(text)
+    if not isinstance(clients, list) or not all(isinstance(client, dict) for client in clients):
+        raise ValueError('Expected a JSON list of clients')
+    return clients
+
+
+def collect_window_rules(parser) -> WindowRuleSet:
+    """
+    Parse the window rules of a config and the files it sources, in order.
+
+    Args:
+        parser: HyprlandConfigParser that has loaded the config
+
+    Returns:
+        The rules; lines that could not be parsed are in `errors`
+    """
+    rules = WindowRuleSet()
+    _collect(parser, rules)
+    return rules
+
+
+def _collect(parser, rules: WindowRuleSet):
+    for keyword in parser.keywords:
+        if keyword.name == 'source':
+            for path in parser.resolve_source_paths(keyword.value):
+                child = parser.sourced.get(path)
+                if child is not None:
+                    _collect(child, rules)
+        elif keyword.name in ('windowrule', 'windowrulev2'):
+            try:
+                rules.add(parse_window_rule(keyword, parser.config_path, parser.expand))
+            except ValueError as e:
+                rules.errors.append((keyword, str(e)))
@@ -0,0 +1,255 @@
+"""
+All configs of the Hyprland ecosystem, edited as one workspace.
+
+hyprland.conf, hypridle.conf, hyprlock.conf and hyprpaper.conf each get
+their own HyprDataManager. Options of the other tools are addressed with
+the tool as prefix, so pages and widgets use a single namespace:
+
+    general:gaps_in                     -> hyprland.conf, general:gaps_in
+    hypridle:general:lock_cmd           -> hypridle.conf, general:lock_cmd
+    hyprpaper:splash                    -> hyprpaper.conf, splash
+
+The files are loaded concurrently on a thread pool, and saving only
+writes the files that have changes.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .data_types import Setting
+from .diff import ConfigDiff
+from .manager import HyprData, HyprDataManager
+
+HYPRLAND = 'hyprland'
+
+# Tool -> config file in the config directory
+CONFIG_FILES = {
+    HYPRLAND: 'hyprland.conf',
+    'hypridle': 'hypridle.conf',
+    'hyprlock': 'hyprlock.conf',
+    'hyprpaper': 'hyprpaper.conf',
+}
+
+# Values the other tools use for options that are not set
+ECOSYSTEM_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'hypridle': {
+        'general:lock_cmd': '',
+        'general:unlock_cmd': '',
+        'general:on_lock_cmd': '',
+        'general:on_unlock_cmd': '',
+        'general:before_sleep_cmd': '',
+        'general:after_sleep_cmd': '',
+        'general:ignore_dbus_inhibit': False,
+        'general:ignore_systemd_inhibit': False,
+        'general:ignore_wayland_inhibit': False,
+        'general:inhibit_sleep': 2,
+    },
+    'hyprlock': {
+        'general:hide_cursor': False,
+        'general:grace': 0,
+        'general:ignore_empty_input': False,
+        'general:immediate_render': False,
+        'general:text_trim': True,
+        'general:fractional_scaling': 2,
+        'general:screencopy_mode': 0,
+        'general:fail_timeout': 2000,
+    },
+    'hyprpaper': {
+        'ipc': True,
+        'splash': False,
+        'splash_offset': 2.0,
+    },
+}
+
+
+class HyprWorkspace:
+    """The hyprland, hypridle, hyprlock and hyprpaper configs of one user."""
+
+    def __init__(self, config_dir: Optional[str] = None, hyprland: Optional[HyprDataManager] = None):
+        if config_dir is None:
+            config_dir = os.path.dirname(hyprland.parser.config_path) if hyprland is not None \
+                else os.path.join(os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config')), 'hypr')
+        self.config_dir = config_dir
+        self.managers: Dict[str, HyprDataManager] = {}
+        for tool, filename in CONFIG_FILES.items():
+            path = os.path.join(config_dir, filename)
+            if tool == HYPRLAND:
+                self.managers[tool] = hyprland if hyprland is not None else HyprDataManager(path, lazy=True)
+                continue
+            manager = HyprDataManager(path, lazy=True, defaults=ECOSYSTEM_DEFAULTS[tool], validate=False)
+            # Only hyprland.conf gets a template; the others start empty
+            manager.parser.create_default = False
+            manager.parser.header = f"{tool} configuration file"
+            self.managers[tool] = manager
+
+    @property
+    def hyprland(self) -> HyprDataManager:
+        return self.managers[HYPRLAND]
+
+    def manager(self, tool: str) -> HyprDataManager:
+        """
+        Get the manager of one tool's config.
+
+        Raises:
+            KeyError: If the tool is not part of the workspace
+        """
+        return self.managers[tool]
+
+    def load(self, max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Load every config that is not loaded yet, concurrently.
+
+        Args:
+            max_workers: Size of the thread pool (default: one per file)
+
+        Returns:
+            Tool -> whether its config could be read
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or len(self.managers)) as pool:
+            futures = {tool: pool.submit(manager.load) for tool, manager in self.managers.items()}
+            return {tool: future.result() for tool, future in futures.items()}
+
+    def route(self, path: str) -> Tuple[HyprDataManager, str]:
+        """
+        Find the config an option belongs to.
+
+        Args:
+            path: Option path, prefixed with the tool for the other
+                configs, e.g. "hypridle:general:lock_cmd"
+
+        Returns:
+            The manager of the config and the path within it
+        """
+        tool, sep, option = path.partition(':')
+        if sep and tool != HYPRLAND and tool in self.managers:
+            return self.managers[tool], option
+        return self.hyprland, path
+
+    def _prefix(self, tool: str) -> str:
+        return '' if tool == HYPRLAND else f"{tool}:"
+
+    def get_option(self, path: str) -> Optional[Setting]:
+        """Get an option as written in its config."""
+        manager, option = self.route(path)
+        return manager.get_option(option)
+
+    def get_value(self, path: str, fallback: Any = None) -> Any:
+        """Get the value the tool will use for an option."""
+        manager, option = self.route(path)
+        return manager.get_value(option, fallback)
+
+    def get_default(self, path: str, fallback: Any = None) -> Any:
+        """Get the value the tool uses when an option is not set."""
+        manager, option = self.route(path)
+        return manager.get_default(option, fallback)
+
+    def has_option(self, path: str) -> bool:
+        """Check if an option is set in its config."""
+        manager, option = self.route(path)
+        return manager.has_option(option)
+
+    def set_option(self, path: str, value: Any) -> bool:
+        """
+        Set an option in the config it belongs to.
+
+        Returns:
+            True if successful, False if the value is invalid for the option
+        """
+        manager, option = self.route(path)
+        return manager.set_option(option, value)
+
+    def remove_option(self, path: str) -> bool:
+        """Remove an option from the config it belongs to."""
+        manager, option = self.route(path)
+        return manager.remove_option(option)
+
+    def watch_option(self, path: str, callback: Callable[[str, Optional[Setting]], None]) -> Callable[[], None]:
+        """
+        Get notified when an option changes on disk.
+
+        The callback gets the path as given here, with the tool prefix.
+
+        Returns:
+            Function that removes the observer
+        """
+        manager, option = self.route(path)
+        if manager is self.hyprland:
+            return manager.watch_option(option, callback)
+        return manager.watch_option(option, lambda _, setting: callback(path, setting))
+
+    @property
+    def dirty(self) -> bool:
+        """Whether any config has unsaved changes."""
+        return any(manager.dirty for manager in self.managers.values())
+
+    def dirty_files(self) -> List[str]:
+        """Get the tools whose config has unsaved changes."""
+        return [tool for tool, manager in self.managers.items() if manager.dirty]
+
+    def save_all(self, sparse: bool = False) -> bool:
+        """
+        Save the configs that have changes; the others are not written.
+
+        Args:
+            sparse: Leave out hyprland.conf options set to their default
+
+        Returns:
+            True if every changed config was saved
+        """
+        saved = True
+        for tool in self.dirty_files():
+            manager = self.managers[tool]
+            if not manager.save_all(sparse=sparse and tool == HYPRLAND):
+                saved = False
+        return saved
+
+    @property
+    def conflicts(self) -> Set[str]:
+        """Options changed both on disk and locally during the last sync or save."""
+        conflicts = set()
+        for tool, manager in self.managers.items():
+            prefix = self._prefix(tool)
+            conflicts.update(prefix + key for key in manager.conflicts)
+        return conflicts
+
+    def watched_paths(self) -> List[str]:
+        """Get every config file and the files they source."""
+        paths = []
+        for manager in self.managers.values():
+            paths.extend(manager.watched_paths())
+        return paths
+
+    def sync_file(self, path: str) -> Set[str]:
+        """
+        Re-read a config file that changed on disk.
+
+        Returns:
+            Paths of the options whose value changed, with tool prefix
+        """
+        path = os.path.abspath(path)
+        for tool, manager in self.managers.items():
+            if path in manager.watched_paths():
+                prefix = self._prefix(tool)
+                return {prefix + key for key in manager.sync_file(path)}
+        return set()
+
+    def preview_save(self) -> ConfigDiff:
+        """Get what `save_all` would change, across all configs."""
+        combined = ConfigDiff()
+        for tool in self.dirty_files():
+            changes = self.managers[tool].preview_save()
+            prefix = self._prefix(tool)
+            for edit in changes.settings + changes.blocks + changes.variables + changes.beziers:
+                edit.key = prefix + str(edit.key)
+            combined.settings.extend(changes.settings)
+            combined.blocks.extend(changes.blocks)
+            combined.variables.extend(changes.variables)
+            combined.beziers.extend(changes.beziers)
+            combined.keywords.extend(changes.keywords)
+            combined.text += changes.text
+        return combined
+
+
+# The workspace of the HyprData singleton, loaded on first use like it
+Workspace = HyprWorkspace(hyprland=HyprData)
@@ -7,8 +7,17 @@ import re
 import string
 
 gi.require_versions({"Adw": "1", "GdkPixbuf": "2.0", "Gdk": "4.0", "Gtk": "4.0"})
-from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk, cairo, GObject
-from .hyprparser import Bezier, Color, Gradient, HyprData, Setting
+from gi.repository import Adw, Gdk, GdkPixbuf, Gio, GLib, Gtk, Pango, cairo, GObject
+from .hyprparser import Bezier, Bind, Color, Gradient, HyprData, ProfileError, Setting, Workspace, format_modmask, get_spec
+
+# Read hyprland.conf and the hypridle, hyprlock and hyprpaper configs in
+# parallel before the pages ask for their values
+Workspace.load()
+
+# Lists the folders pickers show (wallpapers, cursor themes) off the main loop
+from .scanner import DirectoryIndex, DirectoryScanner
+
+Scanner = DirectoryScanner(GLib.idle_add, DirectoryIndex(DirectoryIndex.default_path()))
 
 Gtk.Settings.get_default().set_property("gtk-icon-theme-name", "Adwaita")  # type: ignore
 
@@ -0,0 +1,361 @@
+"""
+Color palettes of wallpapers, to suggest matching border colors.
+
+The image is decoded small (the widget asks GdkPixbuf for about 128
+pixels wide, which JPEG decodes at a fraction of the full size), its
+pixels are clustered with k-means in CIE Lab, where distances follow
+perceived differences, and each cluster center becomes a swatch weighted
+by its share of the image.
+
+NumPy is optional: with it the clustering is vectorized, without it the
+same algorithm runs on fewer samples in plain Python.
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from .hyprparser import Color
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Clusters per image, and the iterations k-means may take to settle
+PALETTE_SIZE = 6
+MAX_ITERATIONS = 20
+
+# Pixels clustered; the decoded image is already small
+MAX_SAMPLES = 16384
+MAX_SAMPLES_PYTHON = 2048
+
+# Centers closer than this (CIE76 delta E) are shown as one swatch
+MERGE_DISTANCE = 10.0
+
+# Options the palette suggests values for, and what they should look like
+SUGGESTED_OPTIONS = {
+    'general:col.active_border': 'accent',
+    'group:col.border_active': 'accent',
+    'misc:background_color': 'background',
+}
+
+Lab = Tuple[float, float, float]
+RGB = Tuple[int, int, int]
+
+# D65 white point
+_WHITE = (0.95047, 1.0, 1.08883)
+
+
+class Swatch:
+    """A color of the palette and the share of the image it covers."""
+
+    def __init__(self, rgb: RGB, weight: float, lab: Lab):
+        self.rgb = rgb
+        self.weight = weight
+        self.lab = lab
+
+    @property
+    def color(self) -> Color:
+        return Color(self.rgb[0], self.rgb[1], self.rgb[2], 255)
+
+    @property
+    def chroma(self) -> float:
+        return math.hypot(self.lab[1], self.lab[2])
+
+    def __repr__(self) -> str:
+        return f"Swatch(#{self.color.hex[:6]}, {self.weight:.2f})"
+
+
+# Color conversion, one pixel at a time (the plain Python path)
+
+def _linear(channel: float) -> float:
+    channel /= 255.0
+    return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _f(t: float) -> float:
+    return t ** (1 / 3) if t > 0.008856 else 7.787 * t + 16 / 116
+
+
+def rgb_to_lab(rgb: Sequence[float]) -> Lab:
+    """Convert an sRGB color (0-255) to CIE Lab."""
+    r, g, b = (_linear(c) for c in rgb)
+    x = (0.4124 * r + 0.3576 * g + 0.1805 * b) / _WHITE[0]
+    y = (0.2126 * r + 0.7152 * g + 0.0722 * b) / _WHITE[1]
+    z = (0.0193 * r + 0.1192 * g + 0.9505 * b) / _WHITE[2]
+    fx, fy, fz = _f(x), _f(y), _f(z)
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+def lab_to_rgb(lab: Sequence[float]) -> RGB:
+    """Convert a CIE Lab color to sRGB (0-255), clipping what sRGB cannot show."""
+    fy = (lab[0] + 16) / 116
+    fx = fy + lab[1] / 500
+    fz = fy - lab[2] / 200
+
+    def inverse(t: float) -> float:
+        return t ** 3 if t > 0.206893 else (t - 16 / 116) / 7.787
+
+    x, y, z = inverse(fx) * _WHITE[0], inverse(fy) * _WHITE[1], inverse(fz) * _WHITE[2]
+    rgb = (
+        3.2406 * x - 1.5372 * y - 0.4986 * z,
+        -0.9689 * x + 1.8758 * y + 0.0415 * z,
+        0.0557 * x - 0.2040 * y + 1.0570 * z,
+    )
+    out = []
+    for c in rgb:
+        c = max(0.0, min(1.0, c))
+        c = 12.92 * c if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+        out.append(int(round(c * 255)))
+    return (out[0], out[1], out[2])
+
+
+# Vectorized versions
+
+def _rgb_to_lab_array(rgb):
+    c = rgb / 255.0
+    c = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    matrix = np.array([
+        [0.4124, 0.3576, 0.1805],
+        [0.2126, 0.7152, 0.0722],
+        [0.0193, 0.1192, 0.9505],
+    ])
+    xyz = c @ matrix.T / np.array(_WHITE)
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16 / 116)
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2]),
+    ], axis=1)
+
+
+def _kmeans_array(lab, k: int):
+    rng = np.random.default_rng(0)
+    # k-means++ seeding: spread the first centers over the image
+    centers = [lab[rng.integers(len(lab))]]
+    nearest = ((lab - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = nearest.sum()
+        if total == 0:
+            break
+        centers.append(lab[rng.choice(len(lab), p=nearest / total)])
+        nearest = np.minimum(nearest, ((lab - centers[-1]) ** 2).sum(axis=1))
+    centers = np.array(centers)
+
+    # |p - c|^2 = |p|^2 - 2 p.c + |c|^2, and |p|^2 does not change the argmin
+    labels = None
+    for _ in range(MAX_ITERATIONS):
+        distances = (centers ** 2).sum(axis=1) - 2 * lab @ centers.T
+        new_labels = distances.argmin(axis=1)
+        if labels is not None and np.array_equal(labels, new_labels):
+            break
+        labels = new_labels
+        counts = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, lab[:, axis], len(centers)) for axis in range(3)], axis=1)
+        filled = counts > 0
+        centers[filled] = sums[filled] / counts[filled, None]
+
+    counts = np.bincount(labels, minlength=len(centers))
+    return [(tuple(float(v) for v in center), int(count)) for center, count in zip(centers, counts)]
+
+
+def _pixels_array(data: bytes, width: int, height: int, rowstride: int, n_channels: int):
+    # The last row of a GdkPixbuf may be shorter than the rowstride
+    buffer = np.zeros(height * rowstride, dtype=np.uint8)
+    raw = np.frombuffer(data, dtype=np.uint8)[:len(buffer)]
+    buffer[:len(raw)] = raw
+    pixels = buffer.reshape(height, rowstride)[:, :width * n_channels].reshape(-1, n_channels)
+    if n_channels == 4:
+        pixels = pixels[pixels[:, 3] >= 128]
+    step = max(1, len(pixels) // MAX_SAMPLES)
+    return pixels[::step, :3].astype(np.float64)
+
+
+# Plain Python versions
+
+def _kmeans_python(lab: List[Lab], k: int) -> List[Tuple[Lab, int]]:
+    def distance(a: Sequence[float], b: Sequence[float]) -> float:
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+    # Deterministic farthest-point seeding instead of random k-means++
+    centers = [lab[len(lab) // 2]]
+    nearest = [distance(p, centers[0]) for p in lab]
+    for _ in range(1, k):
+        index = max(range(len(lab)), key=nearest.__getitem__)
+        if nearest[index] == 0:
+            break
+        centers.append(lab[index])
+        nearest = [min(d, distance(p, centers[-1])) for d, p in zip(nearest, lab)]
+
+    labels: Optional[List[int]] = None
+    counts = [0] * len(centers)
+    for _ in range(MAX_ITERATIONS):
+        new_labels = [min(range(len(centers)), key=lambda i: distance(p, centers[i])) for p in lab]
+        if new_labels == labels:
+            break
+        labels = new_labels
+        sums = [[0.0, 0.0, 0.0] for _ in centers]
+        counts = [0] * len(centers)
+        for p, label in zip(lab, labels):
+            s = sums[label]
+            s[0] += p[0]
+            s[1] += p[1]
+            s[2] += p[2]
+            counts[label] += 1
+        centers = [
+            (s[0] / n, s[1] / n, s[2] / n) if n else center
+            for s, n, center in zip(sums, counts, centers)
+        ]
+    return list(zip(centers, counts))
+
+
+def _pixels_python(data: bytes, width: int, height: int, rowstride: int, n_channels: int) -> List[RGB]:
+    count = width * height
+    step = max(1, count // MAX_SAMPLES_PYTHON)
+    pixels = []
+    for index in range(0, count, step):
+        y, x = divmod(index, width)
+        offset = y * rowstride + x * n_channels
+        if offset + n_channels > len(data):
+            break
+        if n_channels == 4 and data[offset + 3] < 128:
+            continue
+        pixels.append((data[offset], data[offset + 1], data[offset + 2]))
+    return pixels
+
+
+def extract_palette(
+    data: bytes,
+    width: int,
+    height: int,
+    rowstride: int,
+    n_channels: int = 3,
+    k: int = PALETTE_SIZE,
+    vectorized: Optional[bool] = None,
+) -> List[Swatch]:
+    """
+    Find the main colors of an image.
+
+    Args:
+        data: 8-bit RGB or RGBA pixels, as GdkPixbuf.get_pixels() returns them
+        width, height, rowstride, n_channels: Layout of `data`
+        k: Clusters to look for
+        vectorized: Use NumPy (default: if it is installed)
+
+    Returns:
+        Swatches, the largest share of the image first
+    """
+    if vectorized is None:
+        vectorized = np is not None
+    if vectorized and np is None:
+        raise RuntimeError("NumPy is not installed")
+
+    if vectorized:
+        pixels = _pixels_array(data, width, height, rowstride, n_channels)
+        if not len(pixels):
+            return []
+        clusters = _kmeans_array(_rgb_to_lab_array(pixels), min(k, len(pixels)))
+    else:
+        pixels = _pixels_python(data, width, height, rowstride, n_channels)
+        if not pixels:
+            return []
+        clusters = _kmeans_python([rgb_to_lab(p) for p in pixels], min(k, len(pixels)))
+
+    total = sum(count for _, count in clusters)
+    swatches: List[Swatch] = []
+    for lab, count in sorted(clusters, key=lambda cluster: -cluster[1]):
+        if not count:
+            continue
+        weight = count / total
+        for swatch in swatches:
+            if math.dist(swatch.lab, lab) < MERGE_DISTANCE:
+                swatch.weight += weight
+                break
+        else:
+            swatches.append(Swatch(lab_to_rgb(lab), weight, lab))
+    swatches.sort(key=lambda swatch: -swatch.weight)
+    return swatches
+
+
+def rank_for(option: str, palette: List[Swatch]) -> List[Swatch]:
+    """
+    Order a palette by how well each color suits an option.
+
+    Accents (active borders) want colorful swatches of mid lightness;
+    backgrounds want the dark colors that cover much of the image.
+    """
+    kind = SUGGESTED_OPTIONS.get(option, 'accent')
+    if kind == 'background':
+        def score(swatch: Swatch) -> float:
+            return swatch.weight * (100 - swatch.lab[0])
+    else:
+        def score(swatch: Swatch) -> float:
+            lightness = 1 - abs(swatch.lab[0] - 60) / 60
+            return swatch.chroma * max(lightness, 0.1) * math.sqrt(swatch.weight)
+    return sorted(palette, key=score, reverse=True)
+
+
+def image_key(path: str) -> str:
+    """Hash identifying an image as it is now (its path, size and mtime)."""
+    stat = os.stat(path)
+    text = f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class PaletteCache:
+    """Palettes by image hash, kept in memory and optionally in a JSON file."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 512):
+        self.path = path
+        self.max_entries = max_entries
+        self._palettes: 'OrderedDict[str, List[Tuple[str, float]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        if path is not None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                for key, swatches in data.items():
+                    self._palettes[key] = [(str(color), float(weight)) for color, weight in swatches]
+            except (OSError, ValueError, TypeError, AttributeError):
+                self._palettes.clear()
+
+    @staticmethod
+    def default_path() -> str:
+        cache = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(cache, 'hyprset', 'palettes.json')
+
+    def get(self, key: str) -> Optional[List[Swatch]]:
+        with self._lock:
+            stored = self._palettes.get(key)
+            if stored is None:
+                return None
+            self._palettes.move_to_end(key)
+        swatches = []
+        for hex_color, weight in stored:
+            color = Color.from_hex(hex_color)
+            rgb = (color.r, color.g, color.b)
+            swatches.append(Swatch(rgb, weight, rgb_to_lab(rgb)))
+        return swatches
+
+    def put(self, key: str, palette: List[Swatch]) -> None:
+        with self._lock:
+            self._palettes[key] = [(swatch.color.hex[:6], round(swatch.weight, 4)) for swatch in palette]
+            self._palettes.move_to_end(key)
+            while len(self._palettes) > self.max_entries:
+                self._palettes.popitem(last=False)
+            data = dict(self._palettes)
+        if self.path is None:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: Cannot save palettes {self.path}: {e}")
@@ -0,0 +1,274 @@
+"""
+Directory listings that do not block the main loop.
+
+A folder is listed with os.scandir on a worker thread and handed to the
+main loop in batches. The batches of a scan wait in a queue that a
+single idle source drains, one batch per main loop iteration, so a
+folder with thousands of wallpapers or /usr/share/icons fills its list
+while the UI keeps drawing. Listings are kept in a persistent index keyed by the
+directory's mtime: a folder whose entries did not change since the last
+scan is not read again.
+
+Nothing here depends on GTK; the scanner gets the function that runs
+callbacks on the main loop (GLib.idle_add).
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# Entries handed to the main loop per idle callback
+DEFAULT_BATCH_SIZE = 200
+
+INDEX_VERSION = 1
+
+
+class DirEntry:
+    """A file or directory found by a scan."""
+
+    __slots__ = ('name', 'path', 'is_dir')
+
+    def __init__(self, name: str, path: str, is_dir: bool):
+        self.name = name
+        self.path = path
+        self.is_dir = is_dir
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DirEntry):
+            return NotImplemented
+        return (self.path, self.is_dir) == (other.path, other.is_dir)
+
+    def __repr__(self) -> str:
+        return f"DirEntry({self.path!r}, is_dir={self.is_dir})"
+
+
+class DirectoryIndex:
+    """
+    Listings of scanned directories, saved between runs.
+
+    A listing is only used while the directory's mtime is unchanged,
+    which is the case until an entry is added, removed or renamed.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: JSON file the index is saved to; None keeps it in memory
+        """
+        self.path = path
+        self._dirs: Dict[str, Tuple[int, List[Tuple[str, bool]]]] = {}
+        self._lock = threading.Lock()
+        self._changed = False
+        if path is not None:
+            self._read()
+
+    @staticmethod
+    def default_path() -> str:
+        cache = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(cache, 'hyprset', 'scan-index.json')
+
+    def _read(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != INDEX_VERSION:
+            return
+        for directory, entry in data.get('dirs', {}).items():
+            try:
+                mtime_ns, entries = entry
+                self._dirs[directory] = (int(mtime_ns), [(str(name), bool(is_dir)) for name, is_dir in entries])
+            except (TypeError, ValueError):
+                continue
+
+    def lookup(self, directory: str, mtime_ns: int) -> Optional[List[Tuple[str, bool]]]:
+        """
+        Get the listing of a directory if it is still current.
+
+        Returns:
+            (name, is_dir) of each entry, or None if it has to be scanned
+        """
+        with self._lock:
+            cached = self._dirs.get(directory)
+        if cached is None or cached[0] != mtime_ns:
+            return None
+        return cached[1]
+
+    def store(self, directory: str, mtime_ns: int, entries: List[Tuple[str, bool]]) -> None:
+        with self._lock:
+            self._dirs[directory] = (mtime_ns, entries)
+            self._changed = True
+
+    def save(self) -> bool:
+        """
+        Write the index if it changed.
+
+        Returns:
+            False if it could not be written
+        """
+        if self.path is None:
+            return True
+        with self._lock:
+            if not self._changed:
+                return True
+            data = {
+                'version': INDEX_VERSION,
+                'dirs': {directory: [mtime_ns, entries] for directory, (mtime_ns, entries) in self._dirs.items()},
+            }
+            self._changed = False
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: Cannot save scan index {self.path}: {e}")
+            return False
+        return True
+
+
+class ScanJob:
+    """A running scan; cancel it when its list is no longer shown."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # Whether the listing came from the index
+        self.cached = False
+        self.error: Optional[OSError] = None
+        self._cancelled = threading.Event()
+        # Callbacks waiting for the main loop, and whether a source drains them
+        self._pending: Deque[Tuple[Callable, Any]] = deque()
+        self._draining = False
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop the scan; no more batches are delivered."""
+        self._cancelled.set()
+
+
+class DirectoryScanner:
+    """Lists directories on a worker thread and streams the entries to the main loop."""
+
+    def __init__(
+        self,
+        dispatch: Callable[[Callable[[], bool]], object],
+        index: Optional[DirectoryIndex] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = 1,
+    ):
+        """
+        Args:
+            dispatch: Runs a function on the main loop until it returns
+                False (e.g. GLib.idle_add)
+            index: Listings reused while their directory is unchanged
+            batch_size: Entries delivered per main loop callback
+            max_workers: Directories listed at the same time
+        """
+        self.dispatch = dispatch
+        self.index = index if index is not None else DirectoryIndex()
+        self.batch_size = batch_size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scanner')
+
+    def scan(
+        self,
+        directory: str,
+        on_batch: Callable[[List[DirEntry]], None],
+        on_done: Optional[Callable[[ScanJob], None]] = None,
+        accept: Optional[Callable[[DirEntry], bool]] = None,
+    ) -> ScanJob:
+        """
+        List a directory in the background.
+
+        Args:
+            directory: Directory to list
+            on_batch: Gets the entries, a batch at a time, on the main loop
+            on_done: Called on the main loop once every batch was delivered
+                (also when the directory could not be read, see `job.error`)
+            accept: Filter run on the worker, e.g. to check an entry's contents
+
+        Returns:
+            The job, to cancel the scan
+        """
+        job = ScanJob(os.path.abspath(directory))
+        self._pool.submit(self._run, job, on_batch, on_done, accept)
+        return job
+
+    def _list(self, job: ScanJob) -> List[Tuple[str, bool]]:
+        mtime_ns = os.stat(job.directory).st_mtime_ns
+        cached = self.index.lookup(job.directory, mtime_ns)
+        if cached is not None:
+            job.cached = True
+            return cached
+
+        entries = []
+        with os.scandir(job.directory) as it:
+            for entry in it:
+                if job.cancelled:
+                    # Incomplete, so not stored
+                    return entries
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                entries.append((entry.name, is_dir))
+        entries.sort()
+        self.index.store(job.directory, mtime_ns, entries)
+        self.index.save()
+        return entries
+
+    def _run(self, job: ScanJob, on_batch, on_done, accept) -> None:
+        try:
+            listing = self._list(job)
+        except OSError as e:
+            job.error = e
+            listing = []
+
+        batch: List[DirEntry] = []
+        for name, is_dir in listing:
+            if job.cancelled:
+                return
+            entry = DirEntry(name, os.path.join(job.directory, name), is_dir)
+            if accept is not None and not accept(entry):
+                continue
+            batch.append(entry)
+            if len(batch) == self.batch_size:
+                self._deliver(job, on_batch, batch)
+                batch = []
+        if batch:
+            self._deliver(job, on_batch, batch)
+        if on_done is not None:
+            self._deliver(job, on_done, job)
+
+    def _deliver(self, job: ScanJob, callback: Callable, arg: object) -> None:
+        with job._lock:
+            job._pending.append((callback, arg))
+            if job._draining:
+                return
+            job._draining = True
+        self.dispatch(lambda: self._drain(job))
+
+    def _drain(self, job: ScanJob) -> bool:
+        """Run the next queued callback; stays scheduled (True) while more are queued."""
+        with job._lock:
+            callback, arg = job._pending.popleft()
+        if not job.cancelled:
+            callback(arg)
+        with job._lock:
+            if job._pending and not job.cancelled:
+                return True
+            job._pending.clear()
+            job._draining = False
+            return False
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
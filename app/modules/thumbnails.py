@@ -0,0 +1,279 @@
+"""
+Wallpaper thumbnails, decoded in the background.
+
+Thumbnails are shared with other apps through the freedesktop thumbnail
+cache ($XDG_CACHE_HOME/thumbnails): the file name is the md5 of the
+image's URI, and the Thumb::URI and Thumb::MTime text chunks of the PNG
+tell whether it still matches the image. Decoded thumbnails are kept in
+memory too, up to a byte budget.
+
+Nothing here depends on GTK: the widget gives the loader its decode
+function and the way results get back to the main loop.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+# Size flavors of the thumbnail spec, by largest edge
+THUMBNAIL_SIZES = {
+    'normal': 128,
+    'large': 256,
+    'x-large': 512,
+    'xx-large': 1024,
+}
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Memory kept for decoded thumbnails by default
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+ThumbnailKey = Tuple[str, int]
+
+
+def cache_root() -> str:
+    """Get the freedesktop thumbnail directory."""
+    cache = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache, 'thumbnails')
+
+
+def size_name(size: int) -> str:
+    """Get the smallest size flavor that holds thumbnails of `size` pixels."""
+    for name, pixels in THUMBNAIL_SIZES.items():
+        if size <= pixels:
+            return name
+    return 'xx-large'
+
+
+def file_uri(path: str) -> str:
+    """Get the URI of a file, as thumbnails are keyed by it."""
+    return Path(os.path.abspath(path)).as_uri()
+
+
+def thumbnail_path(uri: str, size: int, root: Optional[str] = None) -> str:
+    """
+    Get where the thumbnail of an image is cached.
+
+    Args:
+        uri: URI of the image
+        size: Largest edge of the thumbnail in pixels
+        root: Thumbnail directory (default: $XDG_CACHE_HOME/thumbnails)
+    """
+    digest = hashlib.md5(uri.encode('utf-8')).hexdigest()
+    return os.path.join(root or cache_root(), size_name(size), f"{digest}.png")
+
+
+def read_png_text(path: str) -> Dict[str, str]:
+    """
+    Read the tEXt chunks of a PNG file, stopping at the image data.
+
+    Returns:
+        Keyword -> text, empty if the file is missing or not a PNG
+    """
+    text = {}
+    try:
+        with open(path, 'rb') as f:
+            if f.read(8) != PNG_SIGNATURE:
+                return text
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    break
+                length, kind = struct.unpack('>I4s', header)
+                if kind in (b'IDAT', b'IEND'):
+                    break
+                data = f.read(length)
+                f.seek(4, os.SEEK_CUR)  # CRC
+                if kind == b'tEXt' and b'\0' in data:
+                    keyword, _, value = data.partition(b'\0')
+                    text[keyword.decode('latin-1')] = value.decode('latin-1')
+    except OSError:
+        pass
+    return text
+
+
+def is_current(thumbnail: str, uri: str, mtime: float) -> bool:
+    """Check if a cached thumbnail was made from the image as it is now."""
+    text = read_png_text(thumbnail)
+    return text.get('Thumb::URI') == uri and text.get('Thumb::MTime') == str(int(mtime))
+
+
+def thumbnail_text(uri: str, mtime: float, size: Optional[int] = None) -> Dict[str, str]:
+    """Get the text chunks a new thumbnail is saved with."""
+    text = {
+        'Thumb::URI': uri,
+        'Thumb::MTime': str(int(mtime)),
+        'Software': 'hyprset',
+    }
+    if size is not None:
+        text['Thumb::Size'] = str(size)
+    return text
+
+
+class ByteLRU:
+    """
+    Least recently used cache limited by the total size of its values.
+
+    Not thread-safe: the loader only touches it from the main loop.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int] = len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self._items: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Any:
+        """Get a value and mark it as recently used (None if not cached)."""
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Cache a value, evicting the least recently used ones to make room.
+
+        Returns:
+            False if the value alone is larger than the budget and was not cached
+        """
+        size = self.sizeof(value)
+        self.discard(key)
+        if size > self.max_bytes:
+            return False
+        while self._items and self.nbytes + size > self.max_bytes:
+            _, (_, evicted) = self._items.popitem(last=False)
+            self.nbytes -= evicted
+        self._items[key] = (value, size)
+        self.nbytes += size
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.nbytes -= item[1]
+
+    def clear(self) -> None:
+        self._items.clear()
+        self.nbytes = 0
+
+
+class _Job:
+    def __init__(self, key: ThumbnailKey):
+        self.key = key
+        self.callbacks: List[Callable[[Any], None]] = []
+        self.cancelled = threading.Event()
+        self.future: Optional[Future] = None
+
+
+class ThumbnailLoader:
+    """
+    Decodes thumbnails on a bounded pool of worker threads.
+
+    Requests for the same image share one decode. Cancelling a request
+    that has not started yet drops it from the queue, so scrolling past
+    thousands of images only decodes the ones that stay in view.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[str, int], Any],
+        dispatch: Callable[[Callable[[], None]], Any],
+        max_workers: int = 2,
+        max_bytes: int = DEFAULT_CACHE_BYTES,
+        sizeof: Callable[[Any], int] = len,
+    ):
+        """
+        Args:
+            decode: Makes the thumbnail of (path, size), called on a worker;
+                may raise or return None if the image cannot be read
+            dispatch: Runs a function on the main loop (e.g. GLib.idle_add)
+            max_workers: Images decoded at the same time
+            max_bytes: Memory budget of decoded thumbnails
+            sizeof: Size of a decoded thumbnail in bytes
+        """
+        self.decode = decode
+        self.dispatch = dispatch
+        self.cache = ByteLRU(max_bytes, sizeof)
+        self.failed: Set[ThumbnailKey] = set()
+        self._jobs: Dict[ThumbnailKey, _Job] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='thumbnails')
+
+    @property
+    def pending(self) -> int:
+        """Number of requested thumbnails not decoded yet."""
+        return len(self._jobs)
+
+    def request(self, path: str, size: int, callback: Callable[[Any], None]) -> Any:
+        """
+        Get a thumbnail, decoding it in the background if needed.
+
+        Returns:
+            The thumbnail if it is in memory; otherwise None, and `callback`
+            gets the thumbnail (or None if it failed) on the main loop
+        """
+        key = (path, size)
+        cached = self.cache.get(key)
+        if cached is not None or key in self.failed:
+            return cached
+
+        job = self._jobs.get(key)
+        if job is None:
+            job = self._jobs[key] = _Job(key)
+            job.future = self._pool.submit(self._run, job)
+        job.callbacks.append(callback)
+        return None
+
+    def cancel(self, path: str, size: int, callback: Callable[[Any], None]) -> None:
+        """Withdraw a request; the decode stops if nobody else waits for it."""
+        key = (path, size)
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        if callback in job.callbacks:
+            job.callbacks.remove(callback)
+        if not job.callbacks:
+            job.cancelled.set()
+            job.future.cancel()
+            del self._jobs[key]
+
+    def _run(self, job: _Job) -> None:
+        if job.cancelled.is_set():
+            return
+        try:
+            result = self.decode(*job.key)
+        except Exception as e:
+            print(f"Warning: Cannot make thumbnail of {job.key[0]}: {e}")
+            result = None
+        self.dispatch(lambda: self._finish(job, result))
+
+    def _finish(self, job: _Job, result: Any) -> None:
+        if result is None:
+            self.failed.add(job.key)
+        else:
+            # Kept even if cancelled meanwhile: the work is already done
+            self.cache.put(job.key, result)
+        if job.cancelled.is_set() or self._jobs.get(job.key) is not job:
+            return
+        del self._jobs[job.key]
+        for callback in job.callbacks:
+            callback(result)
+
+    def shutdown(self) -> None:
+        """Drop the queued decodes and stop the workers."""
+        for job in self._jobs.values():
+            job.cancelled.set()
+        self._jobs.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
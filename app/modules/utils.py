@@ -133,22 +133,18 @@ class ParseColor:
 
 
 # idk how else obtain a gtk theme var, so
-
-tmp = Gtk.Box()
-tmp.add_css_class('custom-box')
-
-ctx = tmp.get_style_context()
-
-provider = Gtk.CssProvider.new()
-
-provider.load_from_data('.custom-box {color: @accent_color; }')
-ctx.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-accent_color: Gdk.RGBA = ctx.get_color()   # type: ignore
-
-provider.load_from_data('.custom-box {color: @card_bg_color; }')
-ctx.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-bg_color: Gdk.RGBA = ctx.get_color()   # type: ignore
-
-provider.load_from_data('.custom-box {color: @card_fg_color; }')
-ctx.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-fg_color: Gdk.RGBA = ctx.get_color()   # type: ignore
+def theme_color(name: str) -> Gdk.RGBA:
+    """Read a named color (e.g. accent_color) of the current theme."""
+    box = Gtk.Box()
+    box.add_css_class('custom-box')
+    provider = Gtk.CssProvider.new()
+    provider.load_from_data(f'.custom-box {{color: @{name}; }}')
+    ctx = box.get_style_context()
+    ctx.add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    return ctx.get_color()   # type: ignore
+
+
+# As the app started; widgets that follow theme changes call theme_color
+accent_color: Gdk.RGBA = theme_color('accent_color')
+bg_color: Gdk.RGBA = theme_color('card_bg_color')
+fg_color: Gdk.RGBA = theme_color('card_fg_color')
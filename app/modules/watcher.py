@@ -0,0 +1,80 @@
+from .imports import Gio, GLib, Workspace
+from .widgets import ToastOverlay
+from typing import Dict
+
+# Editors usually write a file in several steps (truncate, write, rename)
+DEBOUNCE_MS = 250
+
+
+class ConfigWatcher:
+    """Watches the config file and its sourced fragments for external edits."""
+
+    def __init__(self) -> None:
+        self._monitors: Dict[str, Gio.FileMonitor] = {}
+        self._pending: Dict[str, int] = {}
+
+    def start(self) -> None:
+        wanted = set(Workspace.watched_paths())
+
+        for path in list(self._monitors):
+            if path not in wanted:
+                self._monitors.pop(path).cancel()
+
+        for path in wanted - self._monitors.keys():
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_file(
+                    Gio.FileMonitorFlags.WATCH_MOVES, None
+                )
+            except GLib.Error as e:
+                print(f'Warning: Cannot watch {path}: {e.message}')
+                continue
+            monitor.connect('changed', self.on_changed, path)
+            self._monitors[path] = monitor
+
+    def stop(self) -> None:
+        for monitor in self._monitors.values():
+            monitor.cancel()
+        for source_id in self._pending.values():
+            GLib.source_remove(source_id)
+        self._monitors.clear()
+        self._pending.clear()
+
+    def on_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        _file: Gio.File,
+        _other: Gio.File,
+        event: Gio.FileMonitorEvent,
+        path: str,
+    ) -> None:
+        if event not in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+            Gio.FileMonitorEvent.RENAMED,
+            Gio.FileMonitorEvent.MOVED_IN,
+        ):
+            return
+
+        if path in self._pending:
+            GLib.source_remove(self._pending[path])
+        self._pending[path] = GLib.timeout_add(DEBOUNCE_MS, self.on_settled, path)
+
+    def on_settled(self, path: str) -> bool:
+        self._pending.pop(path, None)
+        conflicts = set(Workspace.conflicts)
+
+        Workspace.sync_file(path)
+
+        # A `source =` line may have been added or removed
+        self.start()
+
+        new_conflicts = Workspace.conflicts - conflicts
+        if new_conflicts:
+            ToastOverlay.show_message(
+                f'{len(new_conflicts)} option(s) changed on disk were kept at your unsaved values.'
+            )
+        return GLib.SOURCE_REMOVE
+
+
+MyConfigWatcher = ConfigWatcher()
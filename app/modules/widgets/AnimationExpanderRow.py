@@ -0,0 +1,154 @@
+from .CustomToastOverlay import ToastOverlay
+from ..imports import Adw, HyprData, List, Optional
+from ..hyprparser.animations import ANIMATION_TREE, Animation
+from typing import Any, Callable
+
+# What each node animates, from the Hyprland wiki
+DESCRIPTIONS = {
+    'global': 'Every animation that is not set.',
+    'windows': 'Windows, with styles slide, popin and gnomed.',
+    'windowsIn': 'Window open.',
+    'windowsOut': 'Window close.',
+    'windowsMove': 'Everything in between, moving, dragging and resizing.',
+    'layers': 'Layers, with styles slide, popin and fade.',
+    'layersIn': 'Layer open.',
+    'layersOut': 'Layer close.',
+    'fade': 'Fades.',
+    'fadeIn': 'Fade in for window open.',
+    'fadeOut': 'Fade out for window close.',
+    'fadeSwitch': 'Fade on changing the active window and its opacity.',
+    'fadeShadow': 'Fade on changing the active window for shadows.',
+    'fadeDim': 'Dimming of inactive windows.',
+    'fadeLayers': 'Fade on layers.',
+    'fadeLayersIn': 'Fade in for layer open.',
+    'fadeLayersOut': 'Fade out for layer close.',
+    'fadePopups': 'Fade on popups.',
+    'fadePopupsIn': 'Fade in for popup open.',
+    'fadePopupsOut': 'Fade out for popup close.',
+    'fadeDpms': 'Fade on turning monitors on and off.',
+    'border': 'Border color switches.',
+    'borderangle': 'Border gradient angle, with styles once and loop.',
+    'workspaces': 'Workspaces, with styles slide, slidevert, fade, slidefade and slidefadevert.',
+    'workspacesIn': 'Workspace shown.',
+    'workspacesOut': 'Workspace hidden.',
+    'specialWorkspace': 'Special workspaces, with the same styles as workspaces.',
+    'specialWorkspaceIn': 'Special workspace shown.',
+    'specialWorkspaceOut': 'Special workspace hidden.',
+    'zoomFactor': 'Cursor zoom.',
+    'monitorAdded': 'Monitor added.',
+}
+
+
+class AnimationExpanderRow(Adw.ExpanderRow):
+    """One node of the animation tree; nodes that are not set show what they inherit."""
+
+    def __init__(self, name: str, on_changed: Callable[[List[str]], None]) -> None:
+        super().__init__()
+
+        ToastOverlay.register_instance(self)
+
+        self.name = name
+        self.on_changed = on_changed
+        # Value as last saved (None if the node was not set), and whether it differs
+        self._default: Optional[Animation] = HyprData.animations.explicit.get(name)
+        self._changed = False
+        self._updating = False
+
+        self.set_title(name)
+
+        self.override_row = Adw.SwitchRow(title='Set', subtitle='Off to inherit from the parent animation')
+        self.enabled_row = Adw.SwitchRow(title='Enabled')
+        self.speed_row = Adw.SpinRow.new_with_range(0.1, 100, 0.5)
+        self.speed_row.set_title('Speed')
+        self.speed_row.set_subtitle('In tenths of a second')
+        self.speed_row.set_digits(1)
+        self.curve_row = Adw.EntryRow(title='Curve')
+        self.curve_row.set_show_apply_button(True)
+        self.style_row = Adw.EntryRow(title='Style')
+        self.style_row.set_show_apply_button(True)
+
+        self.override_row.connect('notify::active', self.on_override)
+        self.enabled_row.connect('notify::active', self.on_value_changed)
+        self.speed_row.connect('notify::value', self.on_value_changed)
+        self.curve_row.connect('apply', self.on_value_changed)
+        self.style_row.connect('apply', self.on_value_changed)
+
+        for row in [self.override_row, self.enabled_row, self.speed_row, self.curve_row, self.style_row]:
+            self.add_row(row)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Show the node's current values."""
+        tree = HyprData.animations
+        animation = tree.get(self.name)
+        explicit = tree.is_explicit(self.name)
+
+        summary = f'{animation.speed:g} ({animation.duration_ms:g} ms), {animation.bezier}'
+        if animation.style:
+            summary += f', {animation.style}'
+        if not animation.enabled:
+            summary = 'Disabled'
+        source = tree.source_of(self.name)
+        if not explicit and ANIMATION_TREE[self.name] is not None:
+            summary += f' · from {source}'
+        self.set_subtitle(f'{DESCRIPTIONS.get(self.name, "")}\n{summary}')
+
+        # Only a sourced file sets the node, so there is no line here to remove;
+        # editing its values adds one that overrides it
+        sourced_only = explicit and not HyprData.animation_in_config(self.name)
+        self.override_row.set_sensitive(not sourced_only)
+        self.override_row.set_subtitle(
+            'Set in a sourced file' if sourced_only else 'Off to inherit from the parent animation'
+        )
+
+        self._updating = True
+        self.override_row.set_active(explicit)
+        self.enabled_row.set_active(animation.enabled)
+        self.speed_row.set_value(animation.speed)
+        self.curve_row.set_text(animation.bezier)
+        self.style_row.set_text(animation.style)
+        self._updating = False
+
+        for row in [self.enabled_row, self.speed_row, self.curve_row, self.style_row]:
+            row.set_sensitive(explicit)
+
+    def on_override(self, *_: Any) -> None:
+        if self._updating:
+            return
+        if self.override_row.get_active():
+            # Start from what the node inherits
+            current = HyprData.animations.get(self.name)
+            nodes = HyprData.set_animation(
+                Animation(self.name, current.enabled, current.speed, current.bezier, current.style)
+            )
+        else:
+            nodes = HyprData.unset_animation(self.name)
+        self.commit(nodes)
+
+    def on_value_changed(self, *_: Any) -> None:
+        if self._updating or not HyprData.animations.is_explicit(self.name):
+            return
+        animation = Animation(
+            self.name,
+            self.enabled_row.get_active(),
+            round(self.speed_row.get_value(), 1),
+            self.curve_row.get_text().strip() or 'default',
+            self.style_row.get_text().strip(),
+        )
+        if animation == HyprData.animations.explicit[self.name]:
+            return
+        self.commit(HyprData.set_animation(animation))
+
+    def commit(self, nodes: List[str]) -> None:
+        changed = HyprData.animations.explicit.get(self.name) != self._default
+        if changed and not self._changed:
+            ToastOverlay.add_change()
+        elif not changed and self._changed:
+            ToastOverlay.del_change()
+        self._changed = changed
+        self.on_changed(nodes or [self.name])
+
+    def update_default(self, *_: Any) -> None:
+        """Update the default value (called after saving)."""
+        self._default = HyprData.animations.explicit.get(self.name)
+        self._changed = False
@@ -0,0 +1,234 @@
+from ..imports import Adw, Gdk, GLib, Gtk, HyprData, Optional, Tuple
+from ..hyprparser.animations import BUILTIN_BEZIERS, Animation, playback_phase
+from ..hyprparser.curves import BezierCurve, curve_for
+from ..utils import accent_color, fg_color, theme_color
+from ..constants import ANIMATION_PREVIEW_HEIGHT, ANIMATION_PREVIEW_HOLD_MS
+from typing import Dict
+import cairo
+import math
+
+# Title of each lane and the animations it plays in and out
+LANES = (
+    ('Windows', 'windowsIn', 'windowsOut'),
+    ('Fade', 'fadeIn', 'fadeOut'),
+    ('Workspaces', 'workspacesIn', 'workspacesOut'),
+    ('Border Angle', 'borderangle', 'borderangle'),
+)
+LANE_GAP = 12
+LABEL_HEIGHT = 22
+RADIUS = 8
+
+
+def rounded_rectangle(cr, x: float, y: float, width: float, height: float, radius: float) -> None:
+    radius = max(min(radius, width / 2, height / 2), 0)
+    cr.new_sub_path()
+    cr.arc(x + width - radius, y + radius, radius, -math.pi / 2, 0)
+    cr.arc(x + width - radius, y + height - radius, radius, 0, math.pi / 2)
+    cr.arc(x + radius, y + height - radius, radius, math.pi / 2, math.pi)
+    cr.arc(x + radius, y + radius, radius, math.pi, 3 * math.pi / 2)
+    cr.close_path()
+
+
+class AnimationPreview(Gtk.DrawingArea):
+    """
+    Plays the window, fade, workspace and border angle animations of the config.
+
+    Driven by the frame clock while mapped. Each frame only reads the
+    curves' lookup tables, and paints the moving shapes over a background
+    rendered once per size.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.set_content_height(ANIMATION_PREVIEW_HEIGHT)
+        self.set_hexpand(True)
+
+        self.tracks: Dict[str, Tuple[Animation, BezierCurve]] = {}
+        self.painters = (self.paint_window, self.paint_fade, self.paint_workspaces, self.paint_border_angle)
+        self.background: Optional[cairo.Surface] = None
+        self.background_size = (0, 0)
+        # Theme colors, read again with the background
+        self.fg_color: Gdk.RGBA = fg_color
+        self.accent_color: Gdk.RGBA = accent_color
+        self.start_time: Optional[int] = None
+        self.elapsed_ms = 0.0
+        self.tick_id = 0
+
+        self.set_draw_func(self.do_draw)
+        self.connect('map', self.on_map)
+        self.connect('unmap', self.on_unmap)
+        self.connect('resize', self.on_resize)
+        Adw.StyleManager.get_default().connect('notify::dark', self.on_resize)
+        self.update()
+
+    def update(self) -> None:
+        """Read the animations and their curves again, e.g. after one was edited."""
+        animations = HyprData.animations
+        beziers = HyprData.beziers
+        self.tracks = {}
+        for _, *names in LANES:
+            for name in names:
+                animation = animations.get(name)
+                bezier = beziers.get(animation.bezier)
+                if bezier is not None:
+                    curve = bezier.curve
+                else:
+                    curve = curve_for(BUILTIN_BEZIERS.get(animation.bezier, BUILTIN_BEZIERS['default']))
+                self.tracks[name] = (animation, curve)
+        self.start_time = None
+        self.queue_draw()
+
+    def on_map(self, *_) -> None:
+        self.start_time = None
+        if not self.tick_id:
+            self.tick_id = self.add_tick_callback(self.on_tick)
+
+    def on_unmap(self, *_) -> None:
+        # Nothing to play while hidden, so let the frame clock idle
+        if self.tick_id:
+            self.remove_tick_callback(self.tick_id)
+            self.tick_id = 0
+
+    def on_resize(self, *_) -> None:
+        # Also on theme changes
+        self.background = None
+        self.queue_draw()
+
+    def on_tick(self, _: Gtk.Widget, frame_clock) -> bool:
+        now = frame_clock.get_frame_time()
+        if self.start_time is None:
+            self.start_time = now
+        self.elapsed_ms = (now - self.start_time) / 1000
+        self.queue_draw()
+        return GLib.SOURCE_CONTINUE
+
+    def lane_rectangle(self, index: int, width: int, height: int) -> Tuple[float, float, float, float]:
+        lane_width = (width - LANE_GAP * (len(LANES) - 1)) / len(LANES)
+        return index * (lane_width + LANE_GAP), 0, lane_width, height - LABEL_HEIGHT
+
+    def render_background(self, cr, width: int, height: int) -> cairo.Surface:
+        self.fg_color = theme_color('card_fg_color')
+        self.accent_color = theme_color('accent_color')
+
+        surface = cr.get_target().create_similar(cairo.Content.COLOR_ALPHA, width, height)
+        background = cairo.Context(surface)
+        background.set_font_size(11)
+        for index, (title, *_) in enumerate(LANES):
+            x, y, lane_width, lane_height = self.lane_rectangle(index, width, height)
+            rounded_rectangle(background, x, y, lane_width, lane_height, RADIUS)
+            background.set_source_rgba(
+                self.fg_color.red, self.fg_color.green, self.fg_color.blue, 0.06  # type: ignore
+            )
+            background.fill()
+
+            extents = background.text_extents(title)
+            background.move_to(x + (lane_width - extents.width) / 2 - extents.x_bearing, height - 6)
+            background.set_source_rgba(
+                self.fg_color.red, self.fg_color.green, self.fg_color.blue, 0.7  # type: ignore
+            )
+            background.show_text(title)
+        self.background_size = (width, height)
+        return surface
+
+    def do_draw(self, _, cr, width: int, height: int) -> None:
+        if self.background is None or self.background_size != (width, height):
+            self.background = self.render_background(cr, width, height)
+        cr.set_source_surface(self.background, 0, 0)
+        cr.paint()
+
+        for index, (_, name_in, name_out) in enumerate(LANES):
+            animation_in, animation_out = self.tracks[name_in][0], self.tracks[name_out][0]
+            duration = max(animation_in.duration_ms, animation_out.duration_ms)
+            playing_in, elapsed = playback_phase(self.elapsed_ms, duration, ANIMATION_PREVIEW_HOLD_MS)
+            animation, curve = self.tracks[name_in if playing_in else name_out]
+            progress = curve.at(animation.time_at(elapsed))
+
+            x, y, lane_width, lane_height = self.lane_rectangle(index, width, height)
+            cr.save()
+            rounded_rectangle(cr, x, y, lane_width, lane_height, RADIUS)
+            cr.clip()
+            cr.translate(x, y)
+            self.painters[index](cr, lane_width, lane_height, animation, playing_in, progress)
+            cr.restore()
+
+    def window(self, cr, x: float, y: float, width: float, height: float, alpha: float = 1.0) -> None:
+        rounded_rectangle(cr, x, y, width, height, 4)
+        cr.set_source_rgba(
+            self.accent_color.red, self.accent_color.green, self.accent_color.blue, 0.8 * alpha  # type: ignore
+        )
+        cr.fill()
+
+    def paint_window(self, cr, width: float, height: float, animation: Animation, playing_in: bool, progress: float) -> None:
+        # How much of the window is shown, past 1 when the curve overshoots
+        shown = progress if playing_in else 1 - progress
+        x, y, window_width, window_height = width * 0.2, height * 0.15, width * 0.6, height * 0.7
+
+        style = animation.style_name
+        if style == 'slide':
+            parts = animation.style.split()
+            side = parts[1] if len(parts) > 1 else 'bottom'
+            offset = 1 - shown
+            if side == 'left':
+                x -= offset * (x + window_width)
+            elif side == 'right':
+                x += offset * (width - x)
+            elif side == 'top':
+                y -= offset * (y + window_height)
+            else:
+                y += offset * (height - y)
+            return self.window(cr, x, y, window_width, window_height)
+
+        if style == 'gnomed':
+            scale_x, scale_y = 1.0, shown
+        else:
+            # popin, Hyprland's fallback; scaled from its percentage (0 by default)
+            start = animation.style_value or 0.0
+            scale_x = scale_y = start + (1 - start) * shown
+        center_x, center_y = x + window_width / 2, y + window_height / 2
+        scaled_width, scaled_height = window_width * max(scale_x, 0), window_height * max(scale_y, 0)
+        self.window(cr, center_x - scaled_width / 2, center_y - scaled_height / 2, scaled_width, scaled_height)
+
+    def paint_fade(self, cr, width: float, height: float, animation: Animation, playing_in: bool, progress: float) -> None:
+        alpha = progress if playing_in else 1 - progress
+        self.window(cr, width * 0.2, height * 0.15, width * 0.6, height * 0.7, min(max(alpha, 0.0), 1.0))
+
+    def paint_workspaces(self, cr, width: float, height: float, animation: Animation, playing_in: bool, progress: float) -> None:
+        # 0 shows the first workspace, 1 the second
+        position = progress if playing_in else 1 - progress
+        style = animation.style_name or 'slide'
+        vertical = style.endswith('vert')
+        distance = height if vertical else width
+        if style.startswith('slidefade'):
+            distance *= animation.style_value if animation.style_value is not None else 0.2
+        fade = style == 'fade' or style.startswith('slidefade')
+        if style == 'fade':
+            distance = 0
+
+        for workspace, offset in ((0, -position), (1, 1 - position)):
+            shift = offset * distance
+            dx, dy = (0, shift) if vertical else (shift, 0)
+            alpha = min(max(1 - abs(offset), 0.0), 1.0) if fade else 1.0
+            if workspace == 0:
+                self.window(cr, dx + width * 0.08, dy + height * 0.1, width * 0.4, height * 0.8, alpha)
+                self.window(cr, dx + width * 0.52, dy + height * 0.1, width * 0.4, height * 0.8, alpha)
+            else:
+                self.window(cr, dx + width * 0.08, dy + height * 0.1, width * 0.84, height * 0.8, alpha)
+
+    def paint_border_angle(self, cr, width: float, height: float, animation: Animation, playing_in: bool, progress: float) -> None:
+        if animation.style_name == 'loop' and animation.enabled:
+            # Turns the whole time instead of once per change
+            time = (self.elapsed_ms % animation.duration_ms) / animation.duration_ms
+            progress = self.tracks[animation.name][1].at(time)
+        angle = 2 * math.pi * progress
+        x, y, window_width, window_height = width * 0.2, height * 0.15, width * 0.6, height * 0.7
+        center_x, center_y = x + window_width / 2, y + window_height / 2
+        reach = max(window_width, window_height) / 2
+        dx, dy = math.cos(angle) * reach, math.sin(angle) * reach
+
+        gradient = cairo.LinearGradient(center_x - dx, center_y - dy, center_x + dx, center_y + dy)
+        gradient.add_color_stop_rgba(0, self.accent_color.red, self.accent_color.green, self.accent_color.blue, 1)  # type: ignore
+        gradient.add_color_stop_rgba(1, self.fg_color.red, self.fg_color.green, self.fg_color.blue, 0.2)  # type: ignore
+        rounded_rectangle(cr, x, y, window_width, window_height, 4)
+        cr.set_source(gradient)
+        cr.set_line_width(3)
+        cr.stroke()
@@ -1,12 +1,15 @@
-from ..imports import Gtk, Gdk, Adw, GObject, Bezier, Tuple, Union
-from ..utils import fg_color, accent_color
+from ..imports import Gtk, Gdk, Adw, GObject, Bezier, Optional, Tuple, Union
+from ..utils import fg_color, accent_color, theme_color
 from ..constants import (
     BEZIER_EDITOR_WIDTH, BEZIER_EDITOR_HEIGHT, BEZIER_EDITOR_WINDOW_HEIGHT,
     BEZIER_CONTROL_POINT_RADIUS, BEZIER_GRID_SIZE, BEZIER_CANVAS_SIZE,
     BEZIER_CANVAS_OFFSET
 )
+from ..frametimes import FrameTimes
 from dataclasses import dataclass
+import cairo
 import math
+import time
 
 
 @dataclass
@@ -36,30 +39,68 @@ class BezierEditor(Gtk.DrawingArea):
         self.add_controller(self.controller)
         self.set_draw_func(self.do_draw)
 
-    def do_draw(self, _, cr, *__):
-        grid_size = 20
-        for x in range(50, 350, grid_size):
-            cr.move_to(x, 50)
-            cr.line_to(x, 350)
-        for y in range(50, 350, grid_size):
-            cr.move_to(50, y)
-            cr.line_to(350, y)
-
-        cr.set_source_rgba(
-            fg_color.red, fg_color.green, fg_color.blue, 0.1  # type: ignore
+        # Grid, diagonal and frame, drawn once per size and theme
+        self.static_layer: Optional[cairo.Surface] = None
+        self.static_size = (0, 0)
+        # Theme colors, read again with the static layer
+        self.fg_color: Gdk.RGBA = fg_color
+        self.accent_color: Gdk.RGBA = accent_color
+        self.connect('resize', self.on_static_layer_changed)
+        Adw.StyleManager.get_default().connect('notify::dark', self.on_static_layer_changed)
+
+        self.frame_times = FrameTimes.from_environment('bezier editor')
+
+    def on_static_layer_changed(self, *_) -> None:
+        self.static_layer = None
+        self.queue_draw()
+
+    def render_static_layer(self, cr, width: int, height: int) -> cairo.Surface:
+        self.fg_color = theme_color('card_fg_color')
+        self.accent_color = theme_color('accent_color')
+
+        surface = cr.get_target().create_similar(cairo.Content.COLOR_ALPHA, width, height)
+        layer = cairo.Context(surface)
+        start = BEZIER_CANVAS_OFFSET
+        end = BEZIER_CANVAS_OFFSET + BEZIER_CANVAS_SIZE
+
+        for x in range(start, end, BEZIER_GRID_SIZE):
+            layer.move_to(x, start)
+            layer.line_to(x, end)
+        for y in range(start, end, BEZIER_GRID_SIZE):
+            layer.move_to(start, y)
+            layer.line_to(end, y)
+
+        layer.set_source_rgba(
+            self.fg_color.red, self.fg_color.green, self.fg_color.blue, 0.1  # type: ignore
         )
-        cr.set_line_width(1)
-        cr.stroke()
+        layer.set_line_width(1)
+        layer.stroke()
 
         # Diagonal Line
-        cr.move_to(50, 350)
-        cr.line_to(350, 50)
-        cr.set_line_width(2)
-        cr.stroke()
+        layer.move_to(start, end)
+        layer.line_to(end, start)
+        layer.set_line_width(2)
+        layer.stroke()
+
+        # Square
+        layer.rectangle(start, start, BEZIER_CANVAS_SIZE, BEZIER_CANVAS_SIZE)
+        layer.set_line_width(3)
+        layer.stroke()
+
+        self.static_size = (width, height)
+        return surface
+
+    def do_draw(self, _, cr, width: int, height: int):
+        started = time.perf_counter()
+
+        if self.static_layer is None or self.static_size != (width, height):
+            self.static_layer = self.render_static_layer(cr, width, height)
+        cr.set_source_surface(self.static_layer, 0, 0)
+        cr.paint()
 
         # Dots
         cr.set_source_rgba(
-            fg_color.red, fg_color.green, fg_color.blue, 0.8  # type: ignore
+            self.fg_color.red, self.fg_color.green, self.fg_color.blue, 0.8  # type: ignore
         )
         cr.set_line_width(3)
         for initial, point in zip(self.initial_positions, self.points):
@@ -79,15 +120,7 @@ class BezierEditor(Gtk.DrawingArea):
             50,
         )
         cr.set_source_rgba(
-            accent_color.red, accent_color.green, accent_color.blue, 1  # type: ignore
-        )
-        cr.set_line_width(3)
-        cr.stroke()
-
-        # Square
-        cr.rectangle(50, 50, 300, 300)
-        cr.set_source_rgba(
-            fg_color.red, fg_color.green, fg_color.blue, 0.1  # type: ignore
+            self.accent_color.red, self.accent_color.green, self.accent_color.blue, 1  # type: ignore
         )
         cr.set_line_width(3)
         cr.stroke()
@@ -96,10 +129,13 @@ class BezierEditor(Gtk.DrawingArea):
         for point in self.points:
             cr.arc(point.x, point.y, 10, 0, 2 * math.pi)
             cr.set_source_rgba(
-                fg_color.red, fg_color.green, fg_color.blue, 1  # type: ignore
+                self.fg_color.red, self.fg_color.green, self.fg_color.blue, 1  # type: ignore
             )
             cr.fill()
 
+        if self.frame_times is not None:
+            self.frame_times.record(time.perf_counter() - started)
+
     def on_event(self, newEvent: Gtk.EventControllerLegacy, _) -> None:
         Event: Gdk.Event = Gtk.EventController.get_current_event(newEvent)
 
@@ -126,6 +162,8 @@ class BezierEditor(Gtk.DrawingArea):
                 pass
 
     def on_button_release(self, _):
+        if self.dragging is not None and self.frame_times is not None:
+            print(self.frame_times.report())
         self.dragging = None
 
     def on_button_press(self, event: Gdk.Event):
@@ -134,12 +172,18 @@ class BezierEditor(Gtk.DrawingArea):
         for i, point in enumerate(self.points):
             if (x - point.x) ** 2 + (y - point.y) ** 2 <= 10**2:
                 self.dragging = i
+                if self.frame_times is not None:
+                    # Only report the frames of this drag
+                    self.frame_times.samples.clear()
                 break
 
     def on_motion_notify(self, event: Gdk.MotionEvent):
         if self.dragging is not None:
             x = min(max(self.get_eventpos(event)[0], 50), 350)   # type: ignore
             y = self.get_eventpos(event)[1]   # type: ignore
+            point = self.points[self.dragging]
+            if (point.x, point.y) == (x, y):
+                return
 
             self.points[self.dragging].x = x
             self.points[self.dragging].y = y
@@ -100,11 +100,13 @@ class BezierPreviewRow(Adw.ActionRow):
         self.copy_button = Gtk.Button.new_from_icon_name('edit-copy-symbolic')
 
         self.set_title(self.bezier.name)
-        self.set_subtitle(
-            'cubic-bezier({})'.format(
-                ', '.join(map(str, self.bezier.points))
-            )
+        subtitle = 'cubic-bezier({})'.format(
+            ', '.join(map(str, self.bezier.points))
         )
+        if self.bezier.curve.overshoots:
+            low, high = self.bezier.curve.extent
+            subtitle += f' · overshoots ({low:.2f} to {high:.2f})'
+        self.set_subtitle(subtitle)
 
         for i in [
             self.copy_button,
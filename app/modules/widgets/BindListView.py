@@ -0,0 +1,162 @@
+from .CustomToastOverlay import ToastOverlay
+from ..imports import Bind, Gio, GObject, Gtk, HyprData, Pango, format_modmask
+import os
+from typing import Any, Set
+
+
+class BindItem(GObject.Object):
+    """List model item wrapping a parsed bind."""
+
+    __gtype_name__ = 'HyprsetBindItem'
+
+    def __init__(self, bind: Bind) -> None:
+        super().__init__()
+        self.bind = bind
+        # Lower-cased text the search entry is matched against
+        self.search_text = ' '.join((
+            format_modmask(bind.mods), bind.key, bind.dispatcher, bind.args,
+            bind.description, bind.submap,
+        )).lower()
+
+
+class BindListView(Gtk.Box):
+    """
+    Searchable list of every keybind.
+
+    A Gtk.ListView only creates widgets for the visible rows and reuses
+    them while scrolling, so thousands of binds stay smooth.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        self.conflicting: Set[int] = set()
+        self.unreachable: Set[int] = set()
+
+        self.search = Gtk.SearchEntry.new()
+        self.search.set_placeholder_text('Search binds')
+        self.search.connect('search-changed', self.on_search_changed)
+        self.append(self.search)
+
+        # Submaps that are entered but cannot be left
+        self.status = Gtk.Label.new('')
+        self.status.set_xalign(0)
+        self.status.set_wrap(True)
+        self.status.add_css_class('warning')
+        self.append(self.status)
+
+        self.store = Gio.ListStore.new(BindItem)
+        self.filter = Gtk.CustomFilter.new(self.matches)
+        filtered = Gtk.FilterListModel.new(self.store, self.filter)
+
+        factory = Gtk.SignalListItemFactory.new()
+        factory.connect('setup', self.on_setup_row)
+        factory.connect('bind', self.on_bind_row)
+        self.list_view = Gtk.ListView.new(Gtk.NoSelection.new(filtered), factory)
+        self.list_view.add_css_class('boxed-list')
+
+        scrolled = Gtk.ScrolledWindow.new()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_min_content_height(420)
+        scrolled.set_child(self.list_view)
+        self.append(scrolled)
+
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read the binds from the config."""
+        index = HyprData.binds
+        self.conflicting = {id(conflict.bind) for conflict in index.conflicts}
+        self.conflicting.update(id(conflict.other) for conflict in index.conflicts)
+        self.store.splice(0, self.store.get_n_items(), [BindItem(bind) for bind in index])
+        self.update_submaps()
+
+    def update_submaps(self) -> None:
+        """Mark binds in submaps that no bind enters."""
+        submaps = HyprData.binds.submaps
+        unreachable = {id(bind) for bind in submaps.unreachable_binds()}
+        traps = submaps.traps()
+        self.status.set_text(
+            'No bind leads back from submap ' + ', '.join(f"'{name}'" for name in traps) if traps else ''
+        )
+        self.status.set_visible(bool(traps))
+
+        if unreachable != self.unreachable:
+            self.unreachable = unreachable
+            # Only the visible rows are bound again
+            count = self.store.get_n_items()
+            self.store.items_changed(0, count, count)
+
+    def add_bind(self, text: str) -> bool:
+        """Add a bind typed as "MODS, key, dispatcher, args" and show it."""
+        try:
+            bind, conflicts = HyprData.add_bind(text)
+        except ValueError as e:
+            ToastOverlay.show_message(str(e))
+            return False
+
+        if conflicts:
+            self.conflicting.add(id(bind))
+            self.conflicting.update(id(conflict.other) for conflict in conflicts)
+            ToastOverlay.show_message(f'{bind.combo} is already bound on line {conflicts[0].other.line}')
+        self.store.append(BindItem(bind))
+        # Cheap unless the bind enters or leaves a submap
+        self.update_submaps()
+        ToastOverlay.add_change()
+        return True
+
+    def matches(self, item: BindItem) -> bool:
+        text = self.search.get_text().strip().lower()
+        return not text or text in item.search_text
+
+    def on_search_changed(self, *_: Any) -> None:
+        self.filter.changed(Gtk.FilterChange.DIFFERENT)
+
+    def on_setup_row(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        row = Gtk.Box.new(Gtk.Orientation.HORIZONTAL, 12)
+        row.set_margin_top(6)
+        row.set_margin_bottom(6)
+        row.set_margin_start(12)
+        row.set_margin_end(12)
+
+        combo = Gtk.Label.new('')
+        combo.set_xalign(0)
+        combo.set_width_chars(24)
+        combo.add_css_class('monospace')
+
+        action = Gtk.Label.new('')
+        action.set_xalign(0)
+        action.set_hexpand(True)
+        action.set_ellipsize(Pango.EllipsizeMode.END)
+
+        origin = Gtk.Label.new('')
+        origin.add_css_class('dim-label')
+
+        warning = Gtk.Image.new_from_icon_name('dialog-warning-symbolic')
+
+        for child in (combo, action, origin, warning):
+            row.append(child)
+        item.set_child(row)
+
+    def on_bind_row(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        bind = item.get_item().bind
+        combo = item.get_child().get_first_child()
+        action = combo.get_next_sibling()
+        origin = action.get_next_sibling()
+        warning = origin.get_next_sibling()
+
+        flags = f'bind{bind.flags}'
+        submap = f'[{bind.submap}] ' if bind.submap else ''
+        combo.set_text(f'{submap}{bind.combo}')
+        action.set_text(bind.description or f'{bind.dispatcher} {bind.args}'.strip())
+        action.set_tooltip_text(f'{flags} = {bind.keyword.value}' if bind.keyword else flags)
+        origin.set_text(f'{os.path.basename(bind.source)}:{bind.line}' if bind.line else 'new')
+
+        unreachable = id(bind) in self.unreachable
+        if unreachable:
+            item.get_child().add_css_class('dim-label')
+            warning.set_tooltip_text(f"Submap '{bind.submap}' is never entered, so this bind cannot be used")
+        else:
+            item.get_child().remove_css_class('dim-label')
+            warning.set_tooltip_text('Bound more than once in this submap')
+        warning.set_visible(unreachable or id(bind) in self.conflicting)
+
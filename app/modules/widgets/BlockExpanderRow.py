@@ -0,0 +1,100 @@
+from .CustomToastOverlay import ToastOverlay
+from ..imports import Adw, Gtk
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple
+
+# (option, title, kind) with kind "switch", "spin", "int" or "text"
+BlockOption = Tuple[str, str, str]
+
+
+class BlockExpanderRow(Adw.ExpanderRow):
+    """Options of one repeatable block (device, listener...), edited through its id."""
+
+    def __init__(
+        self,
+        data: Any,
+        block_id: int,
+        options: Sequence[BlockOption],
+        on_removed: Callable[["BlockExpanderRow"], None],
+        fallback: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        super().__init__()
+
+        ToastOverlay.register_instance(self)
+
+        # Manager of the config the block is in
+        self.data = data
+        self.block_id = block_id
+        self.on_removed = on_removed
+        self.fallback = fallback
+        # Values as last saved, and the options edited since
+        self._defaults: Dict[str, Any] = {}
+        self._changed: Set[str] = set()
+
+        remove = Gtk.Button.new_from_icon_name("user-trash-symbolic")
+        remove.set_valign(Gtk.Align.CENTER)
+        remove.add_css_class("flat")
+        remove.set_tooltip_text("Remove")
+        remove.connect("clicked", self.on_remove)
+        self.add_suffix(remove)
+
+        for option, title, kind in options:
+            self.add_row(self.create_row(option, title, kind))
+
+    def value(self, option: str) -> Any:
+        """Get the block's value, or the fallback for options it does not set."""
+        block = self.data.get_block(self.block_id)
+        value = block.get(option) if block is not None else None
+        if value is None and self.fallback is not None:
+            value = self.fallback(option)
+        return value
+
+    def create_row(self, option: str, title: str, kind: str) -> Adw.PreferencesRow:
+        value = self._defaults[option] = self.value(option)
+
+        if kind == "switch":
+            row = Adw.SwitchRow(title=title)
+            row.set_active(True if value is None else bool(value))
+            row.connect("notify::active", lambda r, *_: self.on_changed(option, r.get_active()))
+        elif kind == "spin":
+            row = Adw.SpinRow.new_with_range(-1.0, 1.0, 0.05)
+            row.set_title(title)
+            row.set_digits(2)
+            row.set_value(value if isinstance(value, (int, float)) else 0.0)
+            row.connect("notify::value", lambda r, *_: self.on_changed(option, round(r.get_value(), 2)))
+        elif kind == "int":
+            row = Adw.SpinRow.new_with_range(0, 86400, 1)
+            row.set_title(title)
+            row.set_value(value if isinstance(value, (int, float)) else 0)
+            row.connect("notify::value", lambda r, *_: self.on_changed(option, int(r.get_value())))
+        else:
+            row = Adw.EntryRow(title=title)
+            row.set_show_apply_button(True)
+            row.set_text("" if value is None else str(value))
+            row.connect("apply", lambda r: self.on_changed(option, r.get_text().strip()))
+        return row
+
+    def on_changed(self, option: str, new: Any) -> None:
+        try:
+            self.data.set_block_option(self.block_id, option, new)
+        except ValueError as e:
+            ToastOverlay.show_message(str(e))
+            return
+
+        changed = new != self._defaults[option]
+        if changed and option not in self._changed:
+            self._changed.add(option)
+            ToastOverlay.add_change()
+        elif not changed and option in self._changed:
+            self._changed.discard(option)
+            ToastOverlay.del_change()
+
+    def on_remove(self, *_: Any) -> None:
+        if self.data.remove_block(self.block_id):
+            ToastOverlay.add_change()
+            self.on_removed(self)
+
+    def update_default(self, *_: Any) -> None:
+        """Update the default value (called after saving)."""
+        for option in self._changed:
+            self._defaults[option] = self.value(option)
+        self._changed.clear()
@@ -1,6 +1,8 @@
 from .CustomToastOverlay import ToastOverlay
-from ..imports import Adw, Gtk, HyprData, Setting, Color
+from ..imports import Adw, Gtk, Workspace, Setting, Color
+from ..palette import SUGGESTED_OPTIONS
 from ..utils import ParseColor
+from .PaletteSwatches import PaletteSwatches
 
 
 class ColorEntryRow(Adw.ActionRow):
@@ -19,6 +21,10 @@ class ColorEntryRow(Adw.ActionRow):
         self.colorbutton.set_use_alpha(True)
         self.gdkcolor = self.colorbutton.get_rgba()   # type:ignore
 
+        # Colors of the wallpaper, for the options they are suggested for
+        if section in SUGGESTED_OPTIONS:
+            self.add_suffix(PaletteSwatches(section, self.on_swatch))
+
         self.add_suffix(self.stack)
         self.add_suffix(self.button_showcolor)
 
@@ -36,23 +42,38 @@ class ColorEntryRow(Adw.ActionRow):
         self.stack.set_transition_type(Gtk.StackTransitionType.CROSSFADE)
 
         self.section = section
-        opt = HyprData.get_option(self.section)
-
-        if not opt:
-            opt = Setting(self.section, Color('00', '00', '00', '00'))
-            HyprData.new_option(opt)
+        # Missing options show Hyprland's default but are not added to the config
+        value = Workspace.get_value(self.section)
 
-        if isinstance(opt.value, (Color)):
-            self.color: Color = opt.value
+        if isinstance(value, (Color)):
+            self.color: Color = value
 
             self.entry.set_text('#' + self.color.hex)
             self.gdkcolor = ParseColor.hex_to_gdk_rgba(self.color.hex)
             self.colorbutton.set_rgba(self.gdkcolor)   # type: ignore
 
         self._default = (self.entry.get_text(), False)   # type: ignore
+        self._syncing = False
         self.entry.connect('changed', self.on_changed)
         self.colorbutton.connect('color-set', self.on_color_set)
         self.button_showcolor.connect('toggled', self.on_toggled)
+        Workspace.watch_option(self.section, self.on_external_change)
+
+    def on_external_change(self, _: str, setting: Setting) -> None:
+        value = Workspace.get_value(self.section)
+        if not isinstance(value, Color):
+            return
+        self._syncing = True
+        self.color = value
+        self.entry.set_text('#' + self.color.hex)
+        self.gdkcolor = ParseColor.hex_to_gdk_rgba(self.color.hex)
+        self.colorbutton.set_rgba(self.gdkcolor)   # type: ignore
+        self._default = (self.entry.get_text(), False)   # type: ignore
+        self._syncing = False
+
+    def on_swatch(self, color: Color) -> None:
+        # Goes through on_changed, which saves it
+        self.entry.set_text('#' + color.hex)
 
     def on_toggled(self, _: Gtk.ToggleButton) -> None:
         if self.button_showcolor.get_active():
@@ -60,6 +81,8 @@ class ColorEntryRow(Adw.ActionRow):
         return self.stack.set_visible_child_name('color-button')
 
     def on_changed(self, _: Gtk.Entry) -> None:
+        if self._syncing:
+            return
 
         if not self.gdkcolor.parse(self.entry.get_text()):   # type: ignore
             return
@@ -67,27 +90,20 @@ class ColorEntryRow(Adw.ActionRow):
         self.colorbutton.set_rgba(self.gdkcolor)   # type: ignore
 
         color = ParseColor.gdk_rgba_to_hex(self.gdkcolor).removeprefix('#')
-        self.color.r = color[0:2]
-        self.color.g = color[2:4]
-        self.color.b = color[4:6]
-        self.color.a = color[6:8]
+        self.color = Color.from_hex(color)
 
-        HyprData.set_option(self.section, self.color)
+        Workspace.set_option(self.section, self.color)
 
         return self.add_change()
 
     def on_color_set(self, _: Gtk.ColorButton) -> None:
 
         color = ParseColor.gdk_rgba_to_hex(self.gdkcolor).removeprefix('#')
-
-        self.color.r = color[0:2]
-        self.color.g = color[2:4]
-        self.color.b = color[4:6]
-        self.color.a = color[6:8]
+        self.color = Color.from_hex(color)
 
         self.entry.set_text(ParseColor.gdk_rgba_to_hex(self.gdkcolor))
 
-        HyprData.set_option(self.section, self.color)
+        Workspace.set_option(self.section, self.color)
 
         return self.add_change()
 
@@ -1,7 +1,9 @@
 from gi.repository import Gdk
-from ..imports import Adw, Gtk, HyprData, Gradient, Color, Setting
+from ..imports import Adw, Gtk, Workspace, Gradient, Color
+from ..palette import SUGGESTED_OPTIONS
 from ..utils import ParseColor
 from .CustomToastOverlay import ToastOverlay
+from .PaletteSwatches import PaletteSwatches
 
 
 class ColorExpanderRow(Adw.ExpanderRow):
@@ -32,7 +34,7 @@ class ColorExpanderRow(Adw.ExpanderRow):
             self.connect('changed', self.on_changed)
 
         def on_clicked(self, *_: Gtk.Button):
-            return self.parent.remove(self)
+            return self.parent.remove_color(self)
 
         def on_changed(self, *_: 'ColorExpanderRow.ColorEntryRow'):
             if self.gdkcolor.parse(self.get_text()):
@@ -65,25 +67,41 @@ class ColorExpanderRow(Adw.ExpanderRow):
         self.set_title(title)
         self.set_subtitle(subtitle)
         self.add_row(self.button)
-        self.button.connect(
-            'activated',
-            lambda *_: self.add_row(
-                ColorExpanderRow.ColorEntryRow(self, '#777777FF')
-            ),
-        )
+        self.button.connect('activated', lambda *_: self.add_color('#777777FF'))
+        self.color_rows = []
 
-        opt = HyprData.get_option(self.section)
+        # Colors of the wallpaper, for the options they are suggested for
+        if section in SUGGESTED_OPTIONS:
+            suggestions = Adw.ActionRow.new()
+            suggestions.set_title('From Wallpaper')
+            suggestions.set_subtitle('Use a color of the current wallpaper.')
+            suggestions.add_suffix(PaletteSwatches(section, self.on_swatch))
+            self.add_row(suggestions)
 
-        if not opt:
-            opt = Setting(self.section, 0)
-            HyprData.new_option(opt)
+        value = Workspace.get_value(self.section)
 
-        if isinstance(opt.value, (Gradient)):
+        if isinstance(value, (Gradient)):
             color: Color
-            for color in opt.value.colors:
-                self.add_row(
-                    ColorExpanderRow.ColorEntryRow(self, '#' + color.hex)
-                )
+            for color in value.colors:
+                self.add_color('#' + color.hex)
+
+    def add_color(self, color: str) -> None:
+        row = ColorExpanderRow.ColorEntryRow(self, color)
+        self.color_rows.append(row)
+        self.add_row(row)
+
+    def remove_color(self, row: 'ColorExpanderRow.ColorEntryRow') -> None:
+        self.color_rows.remove(row)
+        self.remove(row)
+
+    def on_swatch(self, color: Color) -> None:
+        # A single color replaces the gradient
+        if not Workspace.set_option(self.section, color):
+            return
+        for row in list(self.color_rows):
+            self.remove_color(row)
+        self.add_color('#' + color.hex)
+        ToastOverlay.add_change()
 
     def update_default(self) -> None:
         pass
@@ -1,5 +1,6 @@
-from ..imports import Adw, HyprData
+from ..imports import Adw, Workspace
 from ..constants import TOAST_TIMEOUT_INFINITE
+from .ReviewChangesDialog import ReviewChangesDialog
 import weakref
 from typing import List, Any
 
@@ -11,8 +12,8 @@ class CustomToastOverlay:
         self.changes = 0
         self._instance = Adw.ToastOverlay.new()
         self.toast = Adw.Toast.new('You have 0 unsaved changes!')
-        self.toast.connect('button-clicked', self.save_changes)
-        self.toast.set_button_label('Save now')
+        self.toast.connect('button-clicked', self.review_changes)
+        self.toast.set_button_label('Review changes')
         self.toast.set_timeout(TOAST_TIMEOUT_INFINITE)
 
     @property
@@ -25,6 +26,15 @@ class CustomToastOverlay:
     def hide_toast(self) -> None:
         self.toast.dismiss()
 
+    def show_message(self, message: str) -> None:
+        self.instance.add_toast(Adw.Toast.new(message))
+
+    def review_changes(self, *_) -> None:
+        # The toast is dismissed when its button is clicked
+        dialog = ReviewChangesDialog(self.save_changes)
+        dialog.connect('closed', lambda *_: self.changes and self.show_toast())
+        dialog.review(self.instance)
+
     def add_change(self) -> None:
         self.changes += 1
         self.toast.set_title(f'You have {self.changes} unsaved changes!')
@@ -59,7 +69,14 @@ class CustomToastOverlay:
                 live_instances.append(ref)
         
         self._instances = live_instances
-        return HyprData.save_all()
+        saved = Workspace.save_all()
+
+        if Workspace.conflicts:
+            self.show_message(
+                'Kept your values for options also changed on disk: '
+                + ', '.join(sorted(Workspace.conflicts))
+            )
+        return saved
 
 
 ToastOverlay = CustomToastOverlay()
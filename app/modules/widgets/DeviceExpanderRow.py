@@ -0,0 +1,30 @@
+from .BlockExpanderRow import BlockExpanderRow
+from ..imports import Workspace
+from typing import Any, Callable
+
+# Per-device options shown for every device block: option, title, kind
+DEVICE_OPTIONS = (
+    ("enabled", "Enabled", "switch"),
+    ("sensitivity", "Sensitivity", "spin"),
+    ("accel_profile", "Acceleration Profile", "text"),
+    ("natural_scroll", "Natural Scroll", "switch"),
+    ("left_handed", "Left Handed", "switch"),
+    ("kb_layout", "Keyboard Layout", "text"),
+)
+
+
+def input_fallback(option: str) -> Any:
+    """Get the global input option a device option overrides."""
+    return Workspace.get_value(f"input:{option}", Workspace.get_value(f"input:touchpad:{option}"))
+
+
+class DeviceExpanderRow(BlockExpanderRow):
+    """Options of one `device { }` block in hyprland.conf."""
+
+    def __init__(self, block_id: int, on_removed: Callable[["DeviceExpanderRow"], None]) -> None:
+        # Device blocks only exist in hyprland.conf
+        super().__init__(Workspace.hyprland, block_id, DEVICE_OPTIONS, on_removed, input_fallback)
+
+        block = Workspace.hyprland.get_block(block_id)
+        self.set_title(block.key or "")
+        self.set_subtitle("Overrides the input options for this device")
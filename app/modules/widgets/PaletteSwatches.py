@@ -0,0 +1,103 @@
+from ..imports import GdkPixbuf, GLib, Gtk, Color
+from ..palette import PaletteCache, Swatch, extract_palette, image_key, rank_for
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+# Size the wallpaper is decoded at; JPEG scales down while decoding, so an
+# 8K image never exists at full size in memory
+PALETTE_DECODE_SIZE = 128
+
+# Swatches shown per row
+MAX_SWATCHES = 5
+
+
+class WallpaperPalette:
+    """Palette of the chosen wallpaper, shared by the color rows that suggest from it."""
+
+    def __init__(self) -> None:
+        self.palette: List[Swatch] = []
+        self.path: Optional[str] = None
+        self.cache = PaletteCache(PaletteCache.default_path())
+        self._observers: List[Callable[[List[Swatch]], None]] = []
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='palette')
+
+    def watch(self, callback: Callable[[List[Swatch]], None]) -> None:
+        self._observers.append(callback)
+        if self.palette:
+            callback(self.palette)
+
+    def extract(self, path: str) -> None:
+        """Find the palette of a wallpaper in the background."""
+        self.path = path
+        self._pool.submit(self._run, path)
+
+    def _run(self, path: str) -> None:
+        try:
+            key = image_key(path)
+            palette = self.cache.get(key)
+            if palette is None:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                    path, PALETTE_DECODE_SIZE, PALETTE_DECODE_SIZE, True
+                )
+                palette = extract_palette(
+                    pixbuf.get_pixels(),
+                    pixbuf.get_width(),
+                    pixbuf.get_height(),
+                    pixbuf.get_rowstride(),
+                    pixbuf.get_n_channels(),
+                )
+                self.cache.put(key, palette)
+        except (GLib.Error, OSError) as e:
+            print(f'Warning: Cannot read the colors of {path}: {e}')
+            return
+        GLib.idle_add(self._set, path, palette)
+
+    def _set(self, path: str, palette: List[Swatch]) -> bool:
+        # Another wallpaper was chosen meanwhile
+        if path == self.path:
+            self.palette = palette
+            for callback in self._observers:
+                callback(palette)
+        return False
+
+
+Palette = WallpaperPalette()
+
+
+class PaletteSwatches(Gtk.Box):
+    """One-click colors from the wallpaper, best suited to the option first."""
+
+    def __init__(self, section: str, on_picked: Callable[[Color], None]) -> None:
+        super().__init__(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
+        self.section = section
+        self.on_picked = on_picked
+        self.set_valign(Gtk.Align.CENTER)
+        self.set_visible(False)
+        Palette.watch(self.update)
+
+    def update(self, palette: List[Swatch]) -> None:
+        while (child := self.get_first_child()) is not None:
+            self.remove(child)
+        for swatch in rank_for(self.section, palette)[:MAX_SWATCHES]:
+            self.append(self.create_button(swatch))
+        self.set_visible(bool(palette))
+
+    def create_button(self, swatch: Swatch) -> Gtk.Button:
+        r, g, b = (channel / 255 for channel in swatch.rgb)
+
+        def draw(_area: Gtk.DrawingArea, cr, width: int, height: int) -> None:
+            cr.set_source_rgb(r, g, b)
+            cr.rectangle(0, 0, width, height)
+            cr.fill()
+
+        area = Gtk.DrawingArea.new()
+        area.set_content_width(16)
+        area.set_content_height(16)
+        area.set_draw_func(draw)
+
+        button = Gtk.Button.new()
+        button.set_child(area)
+        button.add_css_class('flat')
+        button.set_tooltip_text(f'#{swatch.color.hex[:6]} ({swatch.weight:.0%} of the wallpaper)')
+        button.connect('clicked', lambda *_: self.on_picked(swatch.color))
+        return button
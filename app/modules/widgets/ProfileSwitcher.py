@@ -0,0 +1,52 @@
+from ..imports import Gtk, HyprData, ProfileError
+from .CustomToastOverlay import ToastOverlay
+
+# Label of the entry for the config without a profile
+NO_PROFILE_LABEL = 'No profile'
+
+
+class ProfileSwitcher(Gtk.DropDown):
+    """Header bar drop-down that switches between config profiles."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.set_tooltip_text('Profile')
+        self.set_valign(Gtk.Align.CENTER)
+        self._syncing = False
+        self.names = []
+        self.reload()
+        self.connect('notify::selected', self.on_selected)
+
+    def reload(self) -> None:
+        """Re-read the profiles and select the active one."""
+        try:
+            self.names = HyprData.profiles.names
+            active = HyprData.active_profile
+        except ProfileError as e:
+            ToastOverlay.show_message(str(e))
+            self.names, active = [], None
+
+        self._syncing = True
+        self.set_model(Gtk.StringList.new([NO_PROFILE_LABEL] + self.names))
+        self.set_selected(self.names.index(active) + 1 if active in self.names else 0)
+        self._syncing = False
+        self.set_visible(bool(self.names))
+
+    def on_selected(self, *_) -> None:
+        if self._syncing:
+            return
+        index = self.get_selected()
+        name = self.names[index - 1] if index > 0 else None
+
+        try:
+            changed = HyprData.switch_profile(name)
+        except ProfileError as e:
+            ToastOverlay.show_message(str(e))
+            return self.reload()
+
+        # Only the options that differ are sent, in a single request
+        if not HyprData.apply_to_hyprland(changed):
+            ToastOverlay.show_message('Could not apply the profile to Hyprland')
+        else:
+            label = name or NO_PROFILE_LABEL.lower()
+            ToastOverlay.show_message(f'Switched to {label}: {len(changed)} options changed')
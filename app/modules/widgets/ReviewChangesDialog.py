@@ -0,0 +1,143 @@
+from ..imports import Adw, Gtk, Workspace
+from typing import Callable
+
+# Edits of each kind are listed under this heading
+KIND_TITLES = {
+    'variable': 'Variables',
+    'setting': 'Options',
+    'block': 'Devices and other blocks',
+    'bezier': 'Curves',
+    'keyword': 'Binds, rules and other lines',
+}
+OP_SYMBOLS = {'add': '+', 'remove': '−', 'change': '~'}
+
+
+class ReviewChangesDialog(Adw.Dialog):
+    """Shows what saving will change, as a list of edits and as a file diff."""
+
+    def __init__(self, on_save: Callable[[], None]) -> None:
+        super().__init__()
+        self.on_save = on_save
+
+        self.set_title('Review Changes')
+        self.set_content_width(720)
+        self.set_content_height(560)
+
+        self.root = Adw.ToolbarView.new()
+        self.top_bar = Adw.HeaderBar.new()
+        self.stack = Adw.ViewStack.new()
+        self.switcher = Adw.ViewSwitcher.new()
+        self.switcher.set_stack(self.stack)
+        self.switcher.set_policy(Adw.ViewSwitcherPolicy.WIDE)
+        self.top_bar.set_title_widget(self.switcher)
+
+        # Edits, one row each; a ListView only creates rows that are visible
+        self.edits = Gtk.StringList.new([])
+        factory = Gtk.SignalListItemFactory.new()
+        factory.connect('setup', self.on_setup_row)
+        factory.connect('bind', self.on_bind_row)
+        self.edit_list = Gtk.ListView.new(Gtk.NoSelection.new(self.edits), factory)
+        self.edit_list.add_css_class('navigation-sidebar')
+        edits_window = Gtk.ScrolledWindow.new()
+        edits_window.set_child(self.edit_list)
+        edits_window.set_vexpand(True)
+        self.stack.add_titled_with_icon(edits_window, 'edits', 'Changes', 'view-list-symbolic')
+
+        self.text_view = Gtk.TextView.new()
+        self.text_view.set_editable(False)
+        self.text_view.set_cursor_visible(False)
+        self.text_view.set_monospace(True)
+        self.text_view.set_left_margin(12)
+        self.text_view.set_top_margin(12)
+        buffer = self.text_view.get_buffer()
+        self.tags = {
+            '+': buffer.create_tag('added', foreground='#26a269'),
+            '-': buffer.create_tag('removed', foreground='#c01c28'),
+            '@': buffer.create_tag('hunk', foreground='#1c71d8'),
+        }
+        text_window = Gtk.ScrolledWindow.new()
+        text_window.set_child(self.text_view)
+        text_window.set_vexpand(True)
+        self.stack.add_titled_with_icon(text_window, 'text', 'File', 'text-x-generic-symbolic')
+
+        self.bottom_bar = Gtk.Box.new(Gtk.Orientation.HORIZONTAL, 12)
+        self.bottom_bar.set_halign(Gtk.Align.END)
+        self.bottom_bar.set_margin_top(12)
+        self.bottom_bar.set_margin_bottom(12)
+        self.bottom_bar.set_margin_end(12)
+        self.cancel_button = Gtk.Button.new_with_label('Cancel')
+        self.cancel_button.connect('clicked', lambda *_: self.close())
+        self.save_button = Gtk.Button.new_with_label('Save')
+        self.save_button.add_css_class('suggested-action')
+        self.save_button.connect('clicked', self.on_save_clicked)
+        self.bottom_bar.append(self.cancel_button)
+        self.bottom_bar.append(self.save_button)
+
+        self.root.add_top_bar(self.top_bar)
+        self.root.add_bottom_bar(self.bottom_bar)
+        self.root.set_content(self.stack)
+        self.set_child(self.root)
+
+    def on_setup_row(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        label = Gtk.Label.new('')
+        label.set_xalign(0)
+        label.set_wrap(True)
+        label.set_margin_top(6)
+        label.set_margin_bottom(6)
+        item.set_child(label)
+
+    def on_bind_row(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        text = item.get_item().get_string()
+        label = item.get_child()
+        # Headings start with a tab, see refresh()
+        if text.startswith('\t'):
+            label.set_markup(f'<b>{text[1:]}</b>')
+        else:
+            label.set_text(text)
+
+    def refresh(self) -> None:
+        """Diff the model against the file as it was loaded."""
+        changes = Workspace.preview_save()
+
+        rows = []
+        for kind, title in KIND_TITLES.items():
+            edits = getattr(changes, f'{kind}s')
+            if not edits:
+                continue
+            rows.append(f'\t{title}')
+            for edit in edits:
+                name = edit.key if kind != 'keyword' else (edit.new or edit.old).name
+                if edit.op == 'add':
+                    rows.append(f'{OP_SYMBOLS[edit.op]} {name} = {_format(edit.new)}')
+                elif edit.op == 'remove':
+                    rows.append(f'{OP_SYMBOLS[edit.op]} {name} = {_format(edit.old)}')
+                else:
+                    rows.append(f'{OP_SYMBOLS[edit.op]} {name}: {_format(edit.old)} → {_format(edit.new)}')
+        self.edits.splice(0, self.edits.get_n_items(), rows)
+
+        buffer = self.text_view.get_buffer()
+        buffer.set_text('')
+        end = buffer.get_end_iter()
+        for line in changes.text.splitlines(keepends=True):
+            tag = self.tags.get(line[:1]) if not line.startswith(('+++', '---')) else None
+            if tag is not None:
+                buffer.insert_with_tags(end, line, tag)
+            else:
+                buffer.insert(end, line)
+
+        count = len(changes)
+        self.set_title(f'Review {count} Change{"s" if count != 1 else ""}')
+
+    def on_save_clicked(self, _: Gtk.Button) -> None:
+        self.close()
+        self.on_save()
+
+    def review(self, parent: Gtk.Widget) -> None:
+        self.refresh()
+        self.stack.set_visible_child_name('edits')
+        return self.present(parent)
+
+
+def _format(value) -> str:
+    # A keyword's name is already shown as the row's key
+    return str(getattr(value, 'value', value))
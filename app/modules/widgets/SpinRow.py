@@ -1,14 +1,34 @@
 from types import new_class
-from ..imports import Gtk, Union, Type, Adw, Setting, HyprData
+from ..imports import Gtk, Union, Type, Optional, Adw, Setting, Workspace, get_spec
 from .CustomToastOverlay import ToastOverlay
 
 
+def spin_range(
+    section: Union[str, None],
+    data_type: Optional[Type[Union[int, float]]] = None,
+    min: Optional[Union[int, float]] = None,
+    max: Optional[Union[int, float]] = None,
+):
+    # Anything not given explicitly comes from the option schema
+    spec = get_spec(section) if section is not None else None
+
+    if data_type is None:
+        data_type = float if spec is not None and spec.type == "float" else int
+    if min is None:
+        min = spec.ui_min if spec is not None and spec.ui_min is not None else 0
+    if max is None:
+        max = spec.ui_max if spec is not None and spec.ui_max is not None else 255
+
+    return data_type, min, max
+
+
 def Adjustment(
     section: Union[str, None],
-    data_type: Type[Union[int, float]] = int,
-    min: Union[int, float] = 0,
-    max: Union[int, float] = 255,
+    data_type: Optional[Type[Union[int, float]]] = None,
+    min: Optional[Union[int, float]] = None,
+    max: Optional[Union[int, float]] = None,
 ):
+    data_type, min, max = spin_range(section, data_type, min, max)
     new_adjustment = Gtk.Adjustment(lower=min, upper=max, page_size=0)
 
     new_adjustment.data_type = data_type
@@ -24,23 +44,25 @@ def Adjustment(
     ToastOverlay.register_instance(new_adjustment)
 
     if new_adjustment.section is not None:
-        opt = HyprData.get_option(new_adjustment.section)
+        # Missing options show Hyprland's default but are not added to the config
+        value = Workspace.get_value(new_adjustment.section, min)
 
-        if not opt:
-            opt = Setting(new_adjustment.section, 1)
-            HyprData.new_option(opt)
+        if isinstance(value, (int, float)):
+            new_adjustment.set_value(value)
 
-        if isinstance(opt.value, (int, float)):
-            new_adjustment.set_value(opt.value)
-
-        new_adjustment._default = (opt.value, False)
+        new_adjustment._default = (value, False)
     else:
         new_adjustment._default = (0, False)
 
+    new_adjustment._syncing = False
+
     def update_default(*args, **kwargs) -> None:
         new_adjustment._default = (new_adjustment.get_value(), False)
 
     def on_value_changed(self):
+        if new_adjustment._syncing:
+            return
+
         if new_adjustment._default[0] != new_adjustment.get_value():
             if not new_adjustment._default[1]:
                 ToastOverlay.add_change()
@@ -53,13 +75,24 @@ def Adjustment(
             return
 
         if self.data_type.__name__ == "int":
-            return HyprData.set_option(
+            return Workspace.set_option(
                 new_adjustment.section, round(new_adjustment.get_value())
             )
-        return HyprData.set_option(new_adjustment.section, new_adjustment.get_value())
+        return Workspace.set_option(new_adjustment.section, new_adjustment.get_value())
+
+    def on_external_change(_: str, setting: Setting) -> None:
+        value = Workspace.get_value(new_adjustment.section)
+        if not isinstance(value, (int, float)):
+            return
+        new_adjustment._syncing = True
+        new_adjustment.set_value(value)
+        new_adjustment._default = (new_adjustment.get_value(), False)
+        new_adjustment._syncing = False
 
     new_adjustment.update_default = update_default
     new_adjustment.connect("value-changed", on_value_changed)
+    if new_adjustment.section is not None:
+        Workspace.watch_option(new_adjustment.section, on_external_change)
 
     return new_adjustment
 
@@ -68,11 +101,12 @@ def SpinRow(
     title: str,
     subtitle: str,
     section: str,
-    data_type: Type[Union[int, float]] = int,
-    min: Union[int, float] = 0,
-    max: Union[int, float] = 255,
+    data_type: Optional[Type[Union[int, float]]] = None,
+    min: Optional[Union[int, float]] = None,
+    max: Optional[Union[int, float]] = None,
     decimal_digits: int = 2,
 ):
+    data_type, min, max = spin_range(section, data_type, min, max)
     new_spinrow = Adw.SpinRow(adjustment=Adjustment(section, data_type, min, max),title=title,
     subtitle=subtitle
     )
@@ -110,16 +144,12 @@ class _Adjustment(Gtk.Adjustment):
         self.section = section
 
         if self.section is not None:
-            opt = HyprData.get_option(self.section)
-
-            if not opt:
-                opt = Setting(self.section, 1)
-                HyprData.new_option(opt)
+            value = Workspace.get_value(self.section, min)
 
-            if isinstance(opt.value, (int, float)):
-                self.set_value(opt.value)
+            if isinstance(value, (int, float)):
+                self.set_value(value)
 
-            self._default = (opt.value, False)
+            self._default = (value, False)
         else:
             self._default = (0, False)
 
@@ -138,8 +168,8 @@ class _Adjustment(Gtk.Adjustment):
             return
 
         if self.data_type.__name__ == "int":
-            return HyprData.set_option(self.section, round(self.get_value()))
-        return HyprData.set_option(self.section, self.get_value())
+            return Workspace.set_option(self.section, round(self.get_value()))
+        return Workspace.set_option(self.section, self.get_value())
 
     def update_default(self) -> None:
         self._default = (self.get_value(), False)
@@ -1,5 +1,5 @@
 from .CustomToastOverlay import ToastOverlay
-from ..imports import Adw, HyprData, Setting
+from ..imports import Adw, Workspace, Setting
 from typing import Any
 
 
@@ -11,36 +11,45 @@ def SwitchRow(title: str, subtitle: str, section: str, *, invert: bool = False)
     new_switchrow.section = section
 
 
-    opt = HyprData.get_option(new_switchrow.section)
-
-    if not opt:
-        opt = Setting(new_switchrow.section, False)
-        HyprData.new_option(opt)
+    # Missing options show Hyprland's default but are not added to the config
+    value = Workspace.get_value(new_switchrow.section, False)
 
     if new_switchrow._invert:
-        new_switchrow.set_active(not opt.value)
+        new_switchrow.set_active(not value)
     else:
-        new_switchrow.set_active(bool(opt.value))
+        new_switchrow.set_active(bool(value))
 
     new_switchrow._default = new_switchrow.get_active()
+    new_switchrow._syncing = False
 
     def on_active(*args: Any, **kwargs: Any) -> bool:
+        if new_switchrow._syncing:
+            return False
+
         if new_switchrow.get_active() != new_switchrow._default:
             ToastOverlay.add_change()
         else:
             ToastOverlay.del_change()
 
         if new_switchrow._invert:
-            return HyprData.set_option(
+            return Workspace.set_option(
                 new_switchrow.section, not new_switchrow.get_active()
             )
 
-        return HyprData.set_option(new_switchrow.section, new_switchrow.get_active())
+        return Workspace.set_option(new_switchrow.section, new_switchrow.get_active())
 
     def update_default(*args: Any, **kwargs: Any) -> None:
         new_switchrow._default = new_switchrow.get_active()
 
+    def on_external_change(_: str, setting: Setting) -> None:
+        value = bool(Workspace.get_value(section, False))
+        new_switchrow._syncing = True
+        new_switchrow.set_active(not value if new_switchrow._invert else value)
+        new_switchrow._default = new_switchrow.get_active()
+        new_switchrow._syncing = False
+
     new_switchrow.connect("notify::active", on_active)
+    Workspace.watch_option(section, on_external_change)
     new_switchrow.update_default = update_default
     return new_switchrow
 
@@ -1,5 +1,5 @@
 from .CustomToastOverlay import ToastOverlay
-from ..imports import Adw, Gtk, HyprData, Setting
+from ..imports import Adw, Gtk, Workspace, Setting
 from typing import Any
 
 
@@ -23,21 +23,20 @@ class TextEntryRow(Adw.ActionRow):
         
         self.section = section
         
-        # Load current value from config
-        opt = HyprData.get_option(self.section)
-        
-        if not opt:
-            opt = Setting(self.section, "")
-            HyprData.new_option(opt)
+        # Load current value from config, or show Hyprland's default
+        # without adding it to the config
+        value = Workspace.get_value(self.section, "")
         
         # Set current value
-        current_value = str(opt.value) if opt.value else ""
+        current_value = str(value) if value else ""
         self.entry.set_text(current_value)
         self._default = current_value
         
         # Connect signals
+        self._syncing = False
         self.entry.connect("activate", self.on_activated)
         self.entry.connect("changed", self.on_changed)
+        Workspace.watch_option(self.section, self.on_external_change)
     
     def on_activated(self, *_: Any) -> None:
         """Called when enter is pressed."""
@@ -45,6 +44,8 @@ class TextEntryRow(Adw.ActionRow):
     
     def on_changed(self, *_: Any) -> None:
         """Called when text changes."""
+        if self._syncing:
+            return
         # Update toast based on whether value changed
         current_text = self.entry.get_text()
         if current_text != self._default:
@@ -55,7 +56,16 @@ class TextEntryRow(Adw.ActionRow):
     def save_value(self) -> None:
         """Save the current value to config."""
         current_text = self.entry.get_text()
-        HyprData.set_option(self.section, current_text)
+        Workspace.set_option(self.section, current_text)
+    
+    def on_external_change(self, _: str, setting: Setting) -> None:
+        """Called when the option was edited outside of hyprset."""
+        value = Workspace.get_value(self.section, "")
+        value = str(value) if value else ""
+        self._syncing = True
+        self.entry.set_text(value)
+        self._default = value
+        self._syncing = False
     
     def update_default(self, *_: Any) -> None:
         """Update the default value (called after saving)."""
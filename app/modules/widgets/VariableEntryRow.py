@@ -0,0 +1,58 @@
+from .CustomToastOverlay import ToastOverlay
+from ..imports import Adw, HyprData
+from typing import Any
+
+
+class VariableEntryRow(Adw.EntryRow):
+    """Edits the value of a `$variable`; options that use it follow."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+
+        ToastOverlay.register_instance(self)
+
+        self.name = name
+        self.set_title(name)
+        self.set_show_apply_button(True)
+
+        self._default = HyprData.variables.get(name, "")
+        self._changed = False
+        self.set_text(self._default)
+        self.update_tooltip()
+
+        self.connect("apply", self.on_apply)
+
+    def update_tooltip(self) -> None:
+        """Show what the variable expands to and how many options use it."""
+        value = HyprData.resolve_variable(self.name)
+        users = len(HyprData.variable_users(self.name))
+        if value is None:
+            self.set_tooltip_text("References itself through other variables")
+        else:
+            self.set_tooltip_text(f"{value}\nUsed by {users} option{'s' if users != 1 else ''}")
+
+    def on_apply(self, *_: Any) -> None:
+        """Called when the apply button or enter is pressed."""
+        text = self.get_text().strip()
+        try:
+            # Only the options that use the variable are resolved again
+            changed = HyprData.set_variable(self.name, text)
+        except ValueError as e:
+            ToastOverlay.show_message(str(e))
+            self.set_text(HyprData.variables.get(self.name, ""))
+            return
+
+        self.update_tooltip()
+        if (text != self._default) != self._changed:
+            self._changed = not self._changed
+            if self._changed:
+                ToastOverlay.add_change()
+            else:
+                ToastOverlay.del_change()
+        if changed:
+            ToastOverlay.show_message(f"Updated {len(changed)} option{'s' if len(changed) != 1 else ''} using {self.name}")
+
+    def update_default(self, *_: Any) -> None:
+        """Update the default value (called after saving)."""
+        self._default = self.get_text().strip()
+        self._changed = False
@@ -0,0 +1,172 @@
+from ..imports import Gdk, GdkPixbuf, GLib, Gtk, Pango, Scanner
+from ..scanner import DirEntry, ScanJob
+from ..thumbnails import ThumbnailLoader, file_uri, is_current, thumbnail_path, thumbnail_text
+import os
+import threading
+from typing import Callable, List, Optional
+
+# Thumbnails fit in the spec's "large" flavor
+THUMBNAIL_SIZE = 256
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif', '.tif', '.tiff', '.jxl', '.avif'}
+
+
+def store_thumbnail(pixbuf: GdkPixbuf.Pixbuf, path: str, text: dict) -> None:
+    """Write a thumbnail to the shared cache, atomically as the spec asks."""
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        pixbuf.savev(tmp, 'png', [f'tEXt::{key}' for key in text], list(text.values()))
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except (GLib.Error, OSError) as e:
+        print(f'Warning: Cannot cache thumbnail {path}: {e}')
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def decode_thumbnail(path: str, size: int) -> Optional[GdkPixbuf.Pixbuf]:
+    """Load a thumbnail from the cache, or decode the image at thumbnail size (on a worker)."""
+    uri = file_uri(path)
+    stat = os.stat(path)
+    cached = thumbnail_path(uri, size)
+    if is_current(cached, uri, stat.st_mtime):
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file(cached)
+        except GLib.Error:
+            pass  # Broken, made again below
+
+    # Decodes straight to the target size instead of the full 4K/8K image
+    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+    store_thumbnail(pixbuf, cached, thumbnail_text(uri, stat.st_mtime, stat.st_size))
+    return pixbuf
+
+
+def is_image(entry: DirEntry) -> bool:
+    return not entry.is_dir and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+
+
+class WallpaperGrid(Gtk.Box):
+    """
+    Grid of the images in a folder.
+
+    Gtk.GridView only creates tiles for the visible images, and a tile
+    asks for its thumbnail when it is bound to an image. When it scrolls
+    out of view the request is cancelled, so only what the user looks at
+    gets decoded.
+    """
+
+    def __init__(self, on_activated: Callable[[str], None]) -> None:
+        super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        self.on_activated = on_activated
+        self._scan: Optional[ScanJob] = None
+
+        self.loader = ThumbnailLoader(
+            decode_thumbnail,
+            GLib.idle_add,
+            max_workers=min(4, os.cpu_count() or 1),
+            sizeof=lambda pixbuf: pixbuf.get_byte_length(),
+        )
+
+        self.status = Gtk.Label.new('')
+        self.status.set_xalign(0)
+        self.status.add_css_class('dim-label')
+        self.append(self.status)
+
+        self.paths = Gtk.StringList.new([])
+
+        factory = Gtk.SignalListItemFactory.new()
+        factory.connect('setup', self.on_setup_tile)
+        factory.connect('bind', self.on_bind_tile)
+        factory.connect('unbind', self.on_unbind_tile)
+        self.grid = Gtk.GridView.new(Gtk.SingleSelection.new(self.paths), factory)
+        self.grid.set_min_columns(2)
+        self.grid.set_max_columns(8)
+        self.grid.set_single_click_activate(True)
+        self.grid.connect('activate', self.on_activate)
+
+        scrolled = Gtk.ScrolledWindow.new()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_min_content_height(420)
+        scrolled.set_child(self.grid)
+        self.append(scrolled)
+
+        self.connect('destroy', self.on_destroy)
+
+    def set_folder(self, folder: str) -> None:
+        """Show the images in a folder, as the scanner finds them."""
+        if self._scan is not None:
+            self._scan.cancel()
+        self.paths.splice(0, self.paths.get_n_items(), [])
+        self.status.set_text('Loading...')
+        self._scan = Scanner.scan(folder, self.on_images, self.on_scan_done, is_image)
+
+    def on_images(self, entries: List[DirEntry]) -> None:
+        self.paths.splice(self.paths.get_n_items(), 0, [entry.path for entry in entries])
+
+    def on_scan_done(self, job: ScanJob) -> None:
+        self._scan = None
+        if job.error is not None:
+            self.status.set_text(f'Cannot open {job.directory}: {job.error.strerror}')
+            return
+        count = self.paths.get_n_items()
+        self.status.set_text(f'{count} images' if count else 'No images in this folder')
+
+    def on_setup_tile(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        tile = Gtk.Box.new(Gtk.Orientation.VERTICAL, 6)
+        tile.set_margin_top(6)
+        tile.set_margin_bottom(6)
+        tile.set_margin_start(6)
+        tile.set_margin_end(6)
+
+        picture = Gtk.Picture.new()
+        picture.set_content_fit(Gtk.ContentFit.COVER)
+        picture.set_size_request(160, 100)
+        picture.add_css_class('card')
+
+        name = Gtk.Label.new('')
+        name.set_ellipsize(Pango.EllipsizeMode.MIDDLE)
+        name.set_max_width_chars(20)
+        name.add_css_class('caption')
+
+        tile.append(picture)
+        tile.append(name)
+        # Image shown, and the callback its thumbnail request waits with
+        tile.path = None
+        tile.callback = None
+        item.set_child(tile)
+
+    def on_bind_tile(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        path = item.get_item().get_string()
+        tile = item.get_child()
+        picture = tile.get_first_child()
+        tile.get_last_child().set_text(os.path.basename(path))
+        tile.set_tooltip_text(path)
+        picture.set_paintable(None)
+
+        tile.path = path
+        tile.callback = lambda pixbuf: self.show_thumbnail(tile, path, pixbuf)
+        pixbuf = self.loader.request(path, THUMBNAIL_SIZE, tile.callback)
+        if pixbuf is not None:
+            self.show_thumbnail(tile, path, pixbuf)
+
+    def on_unbind_tile(self, _: Gtk.SignalListItemFactory, item: Gtk.ListItem) -> None:
+        # Scrolled out of view: decoding it is no longer needed
+        tile = item.get_child()
+        if tile.callback is not None:
+            self.loader.cancel(tile.path, THUMBNAIL_SIZE, tile.callback)
+        tile.path = None
+        tile.callback = None
+
+    def show_thumbnail(self, tile: Gtk.Box, path: str, pixbuf: Optional[GdkPixbuf.Pixbuf]) -> None:
+        if tile.path != path or pixbuf is None:
+            return
+        tile.get_first_child().set_paintable(Gdk.Texture.new_for_pixbuf(pixbuf))
+
+    def on_destroy(self, *_) -> None:
+        if self._scan is not None:
+            self._scan.cancel()
+        self.loader.shutdown()
+
+    def on_activate(self, _: Gtk.GridView, position: int) -> None:
+        self.on_activated(self.paths.get_string(position))
@@ -15,8 +15,17 @@ from .SwitchRow import SwitchRow
 from .ColorEntryRow import ColorEntryRow
 from .ColorExpanderRow import ColorExpanderRow
 from .TextEntryRow import TextEntryRow
+from .VariableEntryRow import VariableEntryRow
 from .CheckButtonImage import CheckButtonImage
 from .PreferencesGroup import PreferencesGroup
 from .SpinRow import SpinRow
 from .InfoButton import InfoButton
 from .ExpanderRow import ExpanderRow
+from .ProfileSwitcher import ProfileSwitcher
+from .BindListView import BindListView
+from .BlockExpanderRow import BlockExpanderRow
+from .DeviceExpanderRow import DeviceExpanderRow
+from .WallpaperGrid import WallpaperGrid
+from .PaletteSwatches import Palette, PaletteSwatches
+from .AnimationPreview import AnimationPreview
+from .AnimationExpanderRow import AnimationExpanderRow
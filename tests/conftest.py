@@ -0,0 +1,61 @@
+"""Shared fixtures, and the opt-in timing benchmarks (pytest --benchmark)."""
+
+import time
+
+import pytest
+
+from app.modules.hyprparser.manager import HyprDataManager
+
+
+def pytest_addoption(parser):
+    parser.addoption('--benchmark', action='store_true', help='also run the tests marked benchmark')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: measures how long something takes, run with --benchmark')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='timing benchmark, run with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def load_config(tmp_path):
+    """
+    Write a config to tmp_path and load it.
+
+    Returns:
+        load(text, files=None), which writes text to hyprland.conf and
+        every other file in files (name -> text) next to it, and returns
+        (path of hyprland.conf, HyprDataManager)
+    """
+    def load(text, files=None):
+        for name, content in (files or {}).items():
+            (tmp_path / name).write_text(content)
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(text)
+        return config, HyprDataManager(str(config))
+    return load
+
+
+@pytest.fixture
+def timed():
+    """
+    Call a function, print how long it took and check it against a limit.
+
+    Returns:
+        run(label, function, limit in seconds), which returns the function's result
+    """
+    def run(label, function, limit):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        print(f"\n{label}: {elapsed * 1000:.1f} ms")
+        assert elapsed < limit, f"{label} took {elapsed * 1000:.0f} ms"
+        return result
+    return run
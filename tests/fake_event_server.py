@@ -0,0 +1,124 @@
+"""Fake Hyprland sockets: a recorded event stream and a command socket."""
+
+import os
+import socket
+import threading
+from typing import Optional
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+RECORDED_EVENTS = os.path.join(FIXTURES_DIR, 'events.log')
+
+
+class FakeEventServer:
+    """
+    Serves a recorded .socket2.sock stream to the first client.
+
+    The stream is repeated `repeat` times and written in `chunk_size`
+    pieces, so event boundaries land at arbitrary offsets of a read.
+    """
+
+    def __init__(self, path: str, recording: str = RECORDED_EVENTS, repeat: int = 1, chunk_size: int = 4096):
+        with open(recording, 'rb') as f:
+            self.recording = f.read()
+        self.path = path
+        self.repeat = repeat
+        self.chunk_size = chunk_size
+        self.events_per_replay = self.recording.count(b'\n')
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def total_events(self) -> int:
+        return self.events_per_replay * self.repeat
+
+    def start(self) -> None:
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(1)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        if self._server is not None:
+            self._server.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _serve(self) -> None:
+        client, _ = self._server.accept()
+        stream = self.recording * self.repeat
+        with client:
+            for offset in range(0, len(stream), self.chunk_size):
+                client.sendall(stream[offset:offset + self.chunk_size])
+
+    def __enter__(self) -> 'FakeEventServer':
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+
+class FakeRequestServer:
+    """
+    Answers requests on a fake .socket.sock like Hyprland does.
+
+    Every command of a [[BATCH]] gets an "ok", except keywords whose
+    option is in `unknown`. Requests are recorded in `requests`.
+    """
+
+    def __init__(self, path: str, unknown: tuple = ()):
+        self.path = path
+        self.unknown = unknown
+        self.requests = []
+        self._server: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen(1)
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is not None:
+            try:
+                # Wakes up the accept() of the serving thread
+                self._server.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._server.close()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def _reply(self, command: str) -> str:
+        parts = command.split()
+        if len(parts) >= 2 and parts[0] == 'keyword' and parts[1] in self.unknown:
+            return f"config option <{parts[1]}> does not exist."
+        return 'ok'
+
+    def _serve(self) -> None:
+        # Like hyprctl, every request comes on a new connection
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            with client:
+                request = client.recv(65536).decode()
+                self.requests.append(request)
+                commands = request[len('[[BATCH]]'):].split(';') if request.startswith('[[BATCH]]') else [request]
+                client.sendall('\n\n'.join(self._reply(c) for c in commands).encode())
+
+    def __enter__(self) -> 'FakeRequestServer':
+        self.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
@@ -0,0 +1,160 @@
+"""Tests for animation parsing and preview timing."""
+
+import pytest
+
+from app.modules.hyprparser.animations import (
+    ANIMATION_TREE,
+    Animation,
+    AnimationTree,
+    parse_animation,
+    playback_phase,
+)
+from app.modules.hyprparser.manager import HyprDataManager
+
+CONFIG = """\
+$speed = 7
+bezier = myBezier, 0.05, 0.9, 0.1, 1.05
+
+animations {
+    enabled = yes
+    animation = windows, 1, $speed, myBezier
+    animation = windowsOut, 1, 7, default, popin 80%
+    animation = fade, 0
+    animation = nope, 1, 7, default
+    animation = workspaces, 1, 6, default, slidefade 20%
+}
+source = more.conf
+"""
+
+SOURCED = """\
+animation = workspaces, 1, 3, default, slidevert
+"""
+
+
+class TestParsing:
+    def test_line(self):
+        animation = parse_animation('windowsOut, 1, 7, default, popin 80%')
+        assert (animation.name, animation.enabled, animation.speed, animation.bezier) == \
+            ('windowsOut', True, 7.0, 'default')
+        assert animation.style_name == 'popin' and animation.style_value == pytest.approx(0.8)
+        # Hyprland's speed units are 100 ms
+        assert animation.duration_ms == 700
+        assert animation.to_config_string() == 'animation = windowsOut, 1, 7, default, popin 80%'
+
+    def test_disabled(self):
+        animation = parse_animation('fade, 0')
+        assert not animation.enabled and animation.time_at(0) == 1
+        assert animation.to_config_string() == 'animation = fade, 0'
+
+    @pytest.mark.parametrize('value', ['nope, 1, 7, default', 'windows, 2, 7, default', 'windows, 1, fast, default', 'windows, 1, 7'])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_animation(value)
+
+    def test_tree_reaches_global(self):
+        for name in ANIMATION_TREE:
+            node, depth = name, 0
+            while ANIMATION_TREE[node] is not None:
+                node, depth = ANIMATION_TREE[node], depth + 1
+            assert node == 'global' and depth < 4
+
+
+FILES = {'more.conf': SOURCED}
+
+
+class TestTree:
+    def test_inherits_from_parents(self, load_config):
+        _, data = load_config(CONFIG, FILES)
+        tree = data.animations
+        assert set(tree.explicit) == {'windows', 'windowsOut', 'fade', 'workspaces'}
+
+        windows_in = tree.get('windowsIn')
+        assert (windows_in.name, windows_in.speed, windows_in.bezier) == ('windowsIn', 7.0, 'myBezier')
+        assert tree.get('windowsOut').style == 'popin 80%'
+        assert not tree.get('fadeIn').enabled and tree.source_of('fadeLayersIn') == 'fade'
+        # The sourced line comes later, so it wins
+        assert tree.get('specialWorkspaceIn').style == 'slidevert'
+        assert tree.get('borderangle') == Animation('borderangle')
+
+    def test_memoized_per_subtree(self):
+        tree = AnimationTree({'windows': Animation('windows', speed=5)})
+        windows_in, fade_in = tree.get('windowsIn'), tree.get('fadeIn')
+        assert tree.get('windowsIn') is windows_in
+
+        changed = tree.set(Animation('windows', speed=3))
+        assert changed == ['windows', 'windowsIn', 'windowsOut', 'windowsMove']
+        # Only the subtree was resolved again
+        assert tree.get('fadeIn') is fade_in
+        assert tree.get('windowsIn') is not windows_in and tree.get('windowsIn').speed == 3
+
+        assert tree.unset('windowsIn') == []
+        tree.unset('windows')
+        assert tree.get('windowsIn') == Animation('windowsIn') and tree.source_of('windowsIn') == 'global'
+
+        with pytest.raises(ValueError):
+            tree.set(Animation('nope'))
+
+    def test_resolving_sets_nothing(self):
+        tree = AnimationTree()
+        tree.set(Animation('fadeIn', speed=2))
+        tree.set(Animation('windows', False))
+        for name in ANIMATION_TREE:
+            tree.get(name)
+        # Only what was set, never the inherited values
+        assert tree.explicit == {'fadeIn': Animation('fadeIn', speed=2), 'windows': Animation('windows', False)}
+
+
+class TestEditing:
+    def test_set_and_save(self, load_config):
+        config, data = load_config(CONFIG, FILES)
+        assert data.set_animation(Animation('windowsIn', speed=4, bezier='myBezier')) == ['windowsIn']
+        data.set_animation(Animation('windows', speed=2, bezier='default'))
+        assert data.animations.get('windowsMove').speed == 2
+        data.unset_animation('fade')
+        assert data.animations.get('fadeIn').enabled
+        assert data.save_all()
+
+        text = config.read_text()
+        lines = [line.strip() for line in text.splitlines() if line.strip().startswith('animation =')]
+        assert lines == [
+            'animation = windows, 1, 2, default',
+            'animation = windowsOut, 1, 7, default, popin 80%',
+            'animation = nope, 1, 7, default',
+            'animation = workspaces, 1, 6, default, slidefade 20%',
+            'animation = windowsIn, 1, 4, myBezier',
+        ]
+        again = HyprDataManager(str(config)).animations
+        assert again.get('windowsIn') == data.animations.get('windowsIn')
+        assert again.get('windowsMove').speed == 2 and again.get('fadeIn').enabled
+
+    def test_unset_falls_back_to_sourced(self, load_config):
+        _, data = load_config(CONFIG, FILES)
+        data.set_animation(Animation('workspaces', speed=9))
+        assert data.animations.get('workspaces').speed == 9
+        data.unset_animation('workspaces')
+        # Still set by more.conf
+        assert data.animations.get('workspaces').style == 'slidevert'
+        assert data.animations.is_explicit('workspaces')
+        assert not data.animation_in_config('workspaces')
+        assert data.unset_animation('workspaces') == []
+
+    def test_top_level_lines_stay_top_level(self, load_config):
+        config, data = load_config('animation = windows, 1, 4, default\nanimation = fade, 0\n')
+        data.set_animation(Animation('windows', speed=2))
+        data.set_animation(Animation('border', speed=3))
+        assert data.save_all()
+        assert 'animations {' not in config.read_text()
+        assert data.animation_in_config('border')
+
+
+class TestPlayback:
+    def test_phases(self):
+        assert playback_phase(0, 700, 300) == (True, 0)
+        assert playback_phase(350, 700, 300) == (True, 350)
+        assert playback_phase(1100, 700, 300) == (False, 100)
+        # Loops
+        assert playback_phase(2000 + 350, 700, 300) == (True, 350)
+
+    def test_time(self):
+        animation = Animation('windows', speed=5)
+        assert [animation.time_at(ms) for ms in (-10, 250, 500, 900)] == [0, 0.5, 1, 1]
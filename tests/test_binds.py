@@ -0,0 +1,252 @@
+"""Tests for the keybind model."""
+
+import pytest
+
+from app.modules.hyprparser.binds import (
+    CONFLICT_DUPLICATE,
+    CONFLICT_SHADOWED,
+    MOD_ALT,
+    MOD_CTRL,
+    MOD_SHIFT,
+    MOD_SUPER,
+    BindIndex,
+    collect_binds,
+    format_modmask,
+    parse_bind,
+    parse_modmask,
+)
+from app.modules.hyprparser.data_types import Keyword
+from app.modules.hyprparser.manager import HyprDataManager
+from app.modules.hyprparser.parser import HyprlandConfigParser
+
+
+CONFIG = """$mainMod = SUPER
+bind = $mainMod, Q, killactive,
+bindd = $mainMod SHIFT, Return, Open a terminal, exec, kitty -e btop, --hold
+bindel = , XF86AudioRaiseVolume, exec, wpctl set-volume @DEFAULT_AUDIO_SINK@ 5%+
+bindm = $mainMod, mouse:272, movewindow
+bind = SUPER_SHIFT, code:36, exec, foot
+source = ./binds.conf
+bind = WIN, q, exec, kitty
+submap = resize
+binde = , right, resizeactive, 10 0
+bind = , escape, submap, reset
+submap = reset
+"""
+
+SOURCED = """bindr = $mainMod, SUPER_L, exec, pkill rofi || rofi
+"""
+
+
+def bind(value, name='bind', submap=''):
+    return parse_bind(Keyword(name, value), submap)
+
+
+def many_binds():
+    binds = [
+        bind(f'{mods}, {key}, exec, app{i}')
+        for i, (mods, key) in enumerate(
+            (mods, f'k{n}') for n in range(1250) for mods in ('SUPER', 'ALT', 'SUPER SHIFT', 'CTRL')
+        )
+    ]
+    binds.append(bind('SUPER SHIFT, k7, exec, other'))
+    return binds
+
+
+def index_all(binds):
+    index = BindIndex()
+    for entry in binds:
+        index.add(entry)
+    return index
+
+
+def submap_chain(count):
+    """Submaps s1 to s{count}, each entered from the one before, and one nobody enters."""
+    index = BindIndex()
+    for i in range(count):
+        index.add(bind(f'SUPER, k, submap, s{i + 1}', submap=f's{i}' if i else ''))
+    index.add(bind(', k, exec, never', submap='unused'))
+    return index
+
+
+class TestParsing:
+    def test_modmask(self):
+        assert parse_modmask('SUPER SHIFT') == MOD_SUPER | MOD_SHIFT
+        assert parse_modmask('super_shift') == parse_modmask('SUPERSHIFT') == MOD_SUPER | MOD_SHIFT
+        assert parse_modmask('WIN CONTROL MOD1') == MOD_SUPER | MOD_CTRL | MOD_ALT
+        assert parse_modmask('') == 0
+        assert format_modmask(MOD_SHIFT | MOD_SUPER) == 'SUPER SHIFT'
+
+    def test_fields(self):
+        parsed = bind('SUPER, code:024, exec, kitty -e sh -c "a, b"', 'binde')
+        assert (parsed.flags, parsed.mods, parsed.key, parsed.keycode) == ('e', MOD_SUPER, 'code:24', 24)
+        assert (parsed.dispatcher, parsed.args) == ('exec', 'kitty -e sh -c "a, b"')
+
+        described = bind('SUPER, F, Toggle fullscreen, fullscreen, 0', 'bindd')
+        assert (described.description, described.dispatcher, described.args) == ('Toggle fullscreen', 'fullscreen', '0')
+
+        assert bind('SUPER, Q, killactive,').args == ''
+        assert bind('SUPER, Q') is None
+        assert bind('SUPER, Q, exec, kitty', 'bindx') is None
+
+    def test_collect(self, tmp_path):
+        (tmp_path / 'binds.conf').write_text(SOURCED)
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+
+        index = collect_binds(parser)
+        assert [(b.flags, format_modmask(b.mods), b.key, b.submap) for b in index] == [
+            ('', 'SUPER', 'q', ''),
+            ('d', 'SUPER SHIFT', 'return', ''),
+            ('el', '', 'xf86audioraisevolume', ''),
+            ('m', 'SUPER', 'mouse:272', ''),
+            ('', 'SUPER SHIFT', 'code:36', ''),
+            ('r', 'SUPER', 'super_l', ''),
+            ('', 'SUPER', 'q', ''),
+            ('e', '', 'right', 'resize'),
+            ('', '', 'escape', 'resize'),
+        ]
+        sourced = index.binds[5]
+        assert (sourced.source, sourced.line) == (str(tmp_path / 'binds.conf'), 1)
+        assert index.binds[1].args == 'kitty -e btop, --hold'
+
+        [conflict] = index.conflicts
+        assert conflict.kind == CONFLICT_DUPLICATE
+        assert (conflict.bind.line, conflict.other.line) == (8, 2)
+        assert index.find(MOD_SUPER, 'q') == [index.binds[0], index.binds[6]]
+
+
+class TestIndex:
+    def test_conflicts(self):
+        index = BindIndex()
+        first = bind('SUPER, Q, killactive,')
+        assert index.add(first) == []
+        # Mouse, release and submap binds do not collide with key presses
+        assert index.add(bind('SUPER, Q, exec, kitty', 'bindr')) == []
+        assert index.add(bind('SUPER, Q, exec, kitty', submap='resize')) == []
+
+        [duplicate] = index.add(bind('WIN, q, exec, kitty'))
+        assert (duplicate.kind, duplicate.other) == (CONFLICT_DUPLICATE, first)
+
+        ignoring = bind('SUPER SHIFT, Q, exec, foot', 'bindi')
+        conflicts = index.add(ignoring)
+        assert {conflict.kind for conflict in conflicts} == {CONFLICT_SHADOWED}
+        assert {conflict.other for conflict in conflicts} == {ignoring}
+        [shadowed] = index.add(bind('ALT, Q, exec, foot'))
+        assert shadowed.other is ignoring
+
+        assert index.remove(first)
+        assert not index.remove(first)
+        assert all(first not in (c.bind, c.other) for c in index.conflicts)
+        assert len(index.unbind(MOD_SUPER, 'q')) == 2
+        assert index.find(MOD_SUPER, 'q') == []
+
+    def test_many_binds(self):
+        assert len(index_all(many_binds()).conflicts) == 1
+
+    @pytest.mark.benchmark
+    def test_indexing_time(self, timed):
+        binds = many_binds()
+        timed(f'indexing {len(binds)} binds', lambda: index_all(binds), 0.5)
+
+
+class TestManagerBinds:
+    def test_add_and_remove(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG.replace('source = ./binds.conf\n', ''))
+        data = HyprDataManager(str(config))
+        assert len(data.binds) == 8
+
+        new, conflicts = data.add_bind('SUPER, Q, exec, foot')
+        assert conflicts[0].other.line == 2
+        data.add_bind(', left, resizeactive, -10 0', 'e', 'resize')
+        data.add_bind('SUPER, R, submap, launch')
+        data.add_bind(', f, exec, firefox', submap='launch')
+        assert data.dirty
+        assert data.remove_bind(new)
+        assert data.save_all()
+
+        reloaded = HyprDataManager(str(config))
+        assert [(b.key, b.submap) for b in reloaded.binds][-5:] == [
+            ('right', 'resize'), ('escape', 'resize'), ('left', 'resize'), ('r', ''), ('f', 'launch'),
+        ]
+        assert [c.bind.args for c in reloaded.binds.conflicts] == ['kitty']
+
+    def test_variables_are_expanded(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG.replace('source = ./binds.conf\n', ''))
+        data = HyprDataManager(str(config))
+        data.set_variable('$mainMod', 'ALT')
+        assert format_modmask(data.binds.binds[0].mods) == 'ALT'
+
+    def test_add_to_submap_named_by_variable(self, load_config):
+        config, data = load_config('$resize = resize\nsubmap = $resize\nbind = , left, resizeactive, -10 0\nsubmap = reset\n')
+        data.add_bind(', right, resizeactive, 10 0', submap='resize')
+        assert data.save_all()
+        text = config.read_text()
+        assert text.count('submap = ') == 2
+        assert [(bind.key, bind.submap) for bind in data.binds] == [('left', 'resize'), ('right', 'resize')]
+
+
+SUBMAPS = """bind = SUPER, R, submap, resize
+bind = SUPER, L, submap, launch
+bind = SUPER, T, submap, trap
+submap = resize
+binde = , right, resizeactive, 10 0
+bind = , escape, submap, reset
+submap = reset
+submap = orphan
+bind = , x, exec, never
+submap = reset
+submap = launch, reset
+bind = , f, exec, firefox
+submap = trap
+bind = , y, exec, stuck
+submap = reset
+"""
+
+
+class TestSubmaps:
+    def test_reachability(self, load_config):
+        _, data = load_config(SUBMAPS)
+        graph = data.binds.submaps
+        assert graph.submaps == ['', 'resize', 'orphan', 'launch', 'trap']
+        assert graph.edges('') == {'resize', 'launch', 'trap'}
+        # `submap = launch, reset` leaves after any bind
+        assert graph.edges('launch') == {''}
+        assert graph.unreachable() == ['orphan']
+        assert [bind.args for bind in graph.unreachable_binds()] == ['never']
+        assert graph.traps() == ['trap']
+
+    def test_edits_only_rescan_their_submap(self, load_config):
+        _, data = load_config(SUBMAPS)
+        graph = data.binds.submaps
+        reachable = graph.reachable()
+        resize = [bind for bind in data.binds if bind.key == 'right'][0]
+
+        # Not a transition: the results are kept
+        data.replace_bind(resize, ', right, resizeactive, 20 0')
+        assert graph.reachable() is reachable
+        assert [bind.key for bind in data.binds][:4] == ['r', 'l', 't', 'right']
+
+        trap = [bind for bind in data.binds if bind.key == 'y'][0]
+        data.replace_bind(trap, ', y, submap, reset')
+        assert graph.reachable() is not reachable
+        assert graph.traps() == []
+
+        data.add_bind('SUPER, O, submap, orphan')
+        assert graph.unreachable() == []
+        data.add_bind('SUPER, M, submap, missing')
+        assert graph.traps() == ['orphan', 'missing']
+
+    def test_many_submaps(self):
+        index = submap_chain(20000)
+        assert index.submaps.unreachable() == ['unused']
+        assert len(index.submaps.traps()) == 20000
+
+    @pytest.mark.benchmark
+    def test_reachability_time(self, timed):
+        index = submap_chain(20000)
+        timed('reachability of 20000 submaps', index.submaps.unreachable, 1)
@@ -0,0 +1,171 @@
+"""Tests for the headless hyprset command line interface."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.parser import HyprlandConfigParser
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFIG = """$mainMod = SUPER
+general {
+    gaps_in = 5
+    col.active_border = rgba(33ccffee)
+}
+bezier = myBezier, 0.05, 0.9, 0.1, 1.05
+bind = $mainMod, Q, killactive,
+"""
+
+
+def write_large_config(path, blocks=500):
+    """Write a config of roughly 10 lines per block."""
+    lines = ["$mainMod = SUPER", "$terminal = kitty"]
+    for i in range(blocks):
+        lines.append("decoration {" if i % 2 else "general {")
+        for j in range(5):
+            lines.append(f"    option_{i}_{j} = {i * j}  # comment")
+        lines.append("    col.border = rgba(33ccffee)")
+        lines.append("}")
+        lines.append(f"bind = $mainMod, {i}, exec, $terminal")
+    lines.append("general {\n    gaps_in = 5\n}")
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestCommands:
+    def test_get(self, tmp_path, capsys):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        assert main(['-c', str(config), 'get', 'general:gaps_in']) == 0
+        assert capsys.readouterr().out == '5\n'
+
+        assert main(['get', 'general:col.active_border', '--json', '-c', str(config)]) == 0
+        assert json.loads(capsys.readouterr().out) == 'rgba(33ccffee)'
+
+        assert main(['-c', str(config), 'get', 'general:missing']) == 1
+
+    def test_set(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        assert main(['-c', str(config), 'set', 'general:gaps_in', '8']) == 0
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        assert parser.settings['general:gaps_in'].value == 8
+        # Colors survive the round trip
+        assert parser.settings['general:col.active_border'].value.hex == '33CCFFEE'
+
+    def test_set_expands_config_variables(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text('$a = abc\n$b = 4\n' + CONFIG)
+
+        assert main(['-c', str(config), 'set', 'general:border_size', '$a']) == 1
+        # Nothing is rewritten
+        assert config.read_text() == '$a = abc\n$b = 4\n' + CONFIG
+
+        patch = tmp_path / 'patch.json'
+        patch.write_text(json.dumps({'set': {'general:border_size': '$a'}}))
+        assert main(['-c', str(config), 'apply', str(patch)]) == 1
+        assert config.read_text() == '$a = abc\n$b = 4\n' + CONFIG
+
+        assert main(['-c', str(config), 'set', 'general:border_size', '$b']) == 0
+        assert 'border_size = $b' in config.read_text()
+
+    def test_set_sparse(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        # 20 is Hyprland's default, so neither option is written
+        assert main(['-c', str(config), 'set', 'general:gaps_out', '20', '--sparse']) == 0
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        assert 'general:gaps_out' not in parser.settings
+        assert 'general:gaps_in' not in parser.settings
+        assert parser.settings['general:col.active_border'].value.hex == '33CCFFEE'
+
+    def test_export_json(self, tmp_path, capsys):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        assert main(['-c', str(config), 'export', '--json']) == 0
+        exported = json.loads(capsys.readouterr().out)
+        assert exported['settings']['general:gaps_in'] == 5
+        assert exported['beziers']['myBezier'] == [0.05, 0.9, 0.1, 1.05]
+        assert exported['keywords'][0]['value'] == '$mainMod, Q, killactive,'
+
+    def test_apply(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+        patch = tmp_path / 'patch.json'
+        patch.write_text(json.dumps({
+            'set': {'general:gaps_out': 12, 'misc:vfr': 'yes'},
+            'remove': ['general:gaps_in'],
+            'beziers': {'add': {'overshot': [0.05, 0.9, 0.1, 1.1]}, 'remove': ['myBezier']},
+        }))
+
+        assert main(['-c', str(config), 'apply', str(patch)]) == 0
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        assert parser.settings['general:gaps_out'].value == 12
+        assert parser.settings['misc:vfr'].value is True
+        assert 'general:gaps_in' not in parser.settings
+        assert list(parser.beziers) == ['overshot']
+
+    def test_invalid_patch(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+        patch = tmp_path / 'patch.json'
+        patch.write_text(json.dumps({'unset': []}))
+
+        assert main(['-c', str(config), 'apply', str(patch)]) == 1
+
+    def test_missing_config_is_not_created(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        assert main(['-c', str(config), 'get', 'general:gaps_in']) == 1
+        assert not config.exists()
+
+
+class TestStartup:
+    def test_does_not_import_gtk(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-m', 'app', '-c', str(config), 'get', 'general:gaps_in'],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        assert result.returncode == 0
+        imported = {line.rsplit('|', 1)[-1].strip() for line in result.stderr.splitlines()}
+        assert 'gi' not in imported
+        assert 'app.modules.imports' not in imported
+
+    @pytest.mark.benchmark
+    def test_startup_time(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        write_large_config(config)
+
+        # Measure an installed setup, where bytecode is cached
+        env = dict(os.environ)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+        def best_of(command, runs=5):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                subprocess.run(command, cwd=ROOT, env=env, capture_output=True, check=True)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        # Measure what hyprset adds on top of starting the interpreter
+        interpreter = best_of([sys.executable, '-c', 'pass'])
+        command = best_of([sys.executable, '-m', 'app', '-c', str(config), 'get', 'general:gaps_in'])
+        overhead = command - interpreter
+        print(f"\nget on a {len(config.read_text().splitlines())}-line config: {overhead * 1000:.1f} ms")
+        assert overhead < 0.1
@@ -0,0 +1,123 @@
+"""Tests for bezier evaluation and the shared lookup tables."""
+
+import subprocess
+import sys
+
+import pytest
+
+from app.modules.hyprparser import curves
+from app.modules.hyprparser.curves import (
+    BezierCurve,
+    curve_for,
+    similar_curves,
+    solve_t,
+)
+from app.modules.hyprparser.data_types import Bezier
+
+EASE = (0.25, 0.1, 0.25, 1.0)
+OVERSHOT = (0.05, 0.9, 0.1, 1.1)
+
+HAS_NUMPY = curves._numpy() is not None
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(curves, '_np', None)
+    monkeypatch.setattr(curves, '_np_checked', True)
+
+
+class TestEvaluation:
+    def test_linear(self):
+        curve = BezierCurve((0, 0, 1, 1))
+        for time_ in (0.0, 0.1, 0.5, 0.93, 1.0):
+            assert curve.progress(time_) == pytest.approx(time_, abs=1e-6)
+
+    def test_css_ease(self):
+        # Reference values of the CSS `ease` timing function
+        curve = BezierCurve(EASE)
+        assert curve.progress(0.5) == pytest.approx(0.8024, abs=1e-4)
+        assert curve.progress(0.25) == pytest.approx(0.4085, abs=1e-4)
+
+    def test_flat_curve_falls_back_to_bisection(self):
+        # x'(t) is 0 at both ends, where Newton's method stalls
+        for x in (0.001, 0.5, 0.999):
+            t = solve_t(x, 1.0, 0.0)
+            assert curves._coord(t, 1.0, 0.0) == pytest.approx(x, abs=1e-6)
+
+    def test_lut_matches_exact(self):
+        curve = BezierCurve(EASE)
+        for i in range(101):
+            assert curve.at(i / 100) == pytest.approx(curve.progress(i / 100), abs=1e-3)
+        assert curve.at(-1) == 0 and curve.at(2) == pytest.approx(1)
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason='NumPy is not installed')
+    def test_backends_agree(self, monkeypatch):
+        vectorized = list(BezierCurve(OVERSHOT).lut)
+        monkeypatch.setattr(curves, '_np', None)
+        plain = BezierCurve(OVERSHOT).lut
+        assert vectorized == pytest.approx(plain, abs=1e-5)
+
+    def test_sample_without_numpy(self, no_numpy):
+        curve = BezierCurve(EASE)
+        assert curve.sample([0.0, 0.5, 1.0]) == pytest.approx([0.0, curve.at(0.5), 1.0])
+
+    def test_many_samples(self):
+        curve = BezierCurve(EASE)
+        samples = curve.sample([i / 100_000 for i in range(100_000)])
+        assert samples[50_000] == pytest.approx(curve.progress(0.5), abs=1e-3)
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(not HAS_NUMPY, reason='NumPy is not installed')
+    def test_sample_time(self, timed):
+        curve = BezierCurve(EASE)
+        times = [i / 100_000 for i in range(100_000)]
+        curve.sample(times)
+        timed('100k samples', lambda: curve.sample(times), 0.1)
+
+
+class TestOvershoot:
+    def test_extent(self):
+        curve = BezierCurve(OVERSHOT)
+        low, high = curve.extent
+        assert low == 0 and high > 1
+        assert curve.overshoots
+        # The table sees the same peak
+        assert max(curve.lut) == pytest.approx(high, abs=1e-3)
+
+    def test_no_overshoot(self):
+        assert BezierCurve(EASE).extent == (0, 1)
+        assert not BezierCurve(EASE).overshoots
+        assert BezierCurve((0.3, -0.5, 0.7, 1)).overshoots
+
+
+class TestSharing:
+    def test_cached_by_points(self):
+        assert curve_for((0, 0, 1, 1)) is curve_for([0.0, 0.0, 1.0, 1.0])
+        assert curve_for(EASE) is not curve_for(OVERSHOT)
+
+    def test_beziers_share_tables(self):
+        one, other = Bezier('one', EASE), Bezier('other', EASE)
+        assert one.curve is other.curve
+        assert one.curve.lut is other.curve.lut
+
+    def test_similar_curves(self):
+        named = {
+            'ease': curve_for(EASE),
+            'almostEase': curve_for((0.25, 0.1, 0.26, 1.0)),
+            'bounce': curve_for(OVERSHOT),
+        }
+        pairs = similar_curves(named)
+        assert [(a, b) for a, b, _ in pairs] == [('almostEase', 'ease')]
+        assert curve_for(EASE).difference(curve_for(OVERSHOT)) > 0.1
+
+
+def test_numpy_is_imported_on_first_use():
+    # Keeps NumPy out of the CLI's startup
+    code = (
+        'import sys\n'
+        'from app.modules.hyprparser.data_types import Bezier\n'
+        'Bezier("ease", (0.25, 0.1, 0.25, 1)).curve.progress(0.5)\n'
+        'print("numpy" in sys.modules)'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
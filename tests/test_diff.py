@@ -0,0 +1,116 @@
+"""Tests for the config diff engine."""
+
+import difflib
+import random
+
+import pytest
+
+from app.modules.hyprparser.data_types import Keyword
+from app.modules.hyprparser.diff import Edit, diff_mappings, diff_sequences, unified_diff
+
+
+CONFIG = """$mainMod = SUPER
+general {
+    gaps_in = 5
+    border_size = 1
+}
+bezier = myBezier, 0.05, 0.9, 0.1, 1.05
+bind = $mainMod, Q, killactive,
+bind = $mainMod, E, exec, nautilus
+"""
+
+
+def apply_script(old, edits):
+    """Replay an edit script from diff_sequences."""
+    removed = {edit.key for edit in edits if edit.op == 'remove'}
+    added = {edit.key: edit.new for edit in edits if edit.op == 'add'}
+    kept = iter(entry for index, entry in enumerate(old) if index not in removed)
+    result = []
+    for index in range(len(old) - len(removed) + len(added)):
+        result.append(added[index] if index in added else next(kept))
+    return result
+
+
+def large_configs():
+    """A 100k-line config, and the same with one line changed and one removed."""
+    old = ''.join(f'    option_{i} = {i}\n' for i in range(100000))
+    new = old.replace('option_500 = 500', 'option_500 = 7').replace('    option_90000 = 90000\n', '')
+    return old, new
+
+
+class TestDiffs:
+    def test_mappings(self):
+        edits = diff_mappings({'a': 1, 'b': 2, 'c': 3}, {'a': 1, 'b': 4, 'd': 5}, 'setting')
+        assert edits == [
+            Edit('change', 'setting', 'b', 2, 4),
+            Edit('add', 'setting', 'd', new=5),
+            Edit('remove', 'setting', 'c', old=3),
+        ]
+
+    def test_minimal_script(self):
+        old = [Keyword('bind', f'SUPER, {i}, workspace, {i}') for i in range(10)]
+        new = list(old)
+        new[3] = Keyword('bind', 'SUPER, 3, exec, kitty')
+        del new[7]
+        new.append(Keyword('exec-once', 'waybar'))
+
+        edits = diff_sequences(old, new, 'keyword')
+        assert [(edit.op, edit.key) for edit in edits] == [
+            ('remove', 3), ('add', 3), ('remove', 7), ('add', 9),
+        ]
+        assert apply_script(old, edits) == new
+
+    def test_repeated_entries(self):
+        rng = random.Random(4)
+        for _ in range(300):
+            old = [rng.choice('abcde') for _ in range(rng.randrange(20))]
+            new = list(old)
+            for _ in range(rng.randrange(5)):
+                if new and rng.random() < 0.5:
+                    del new[rng.randrange(len(new))]
+                else:
+                    new.insert(rng.randrange(len(new) + 1), rng.choice('abcxy'))
+            assert apply_script(old, diff_sequences(old, new, 'line')) == new
+
+    def test_unified_diff_matches_difflib(self):
+        old = ''.join(f'line {i}\n' for i in range(40))
+        new = old.replace('line 5\n', 'line five\n').replace('line 30\n', '')
+        expected = ''.join(difflib.unified_diff(
+            old.splitlines(keepends=True), new.splitlines(keepends=True), 'a.conf', 'a.conf',
+        ))
+        assert unified_diff(old, new, 'a.conf') == expected
+        assert unified_diff(old, old, 'a.conf') == ''
+
+    def test_large_config(self):
+        assert unified_diff(*large_configs(), 'hyprland.conf').count('@@ ') == 2
+
+    @pytest.mark.benchmark
+    def test_large_config_time(self, timed):
+        old, new = large_configs()
+        timed('diff of 100k lines', lambda: unified_diff(old, new, 'hyprland.conf'), 2)
+
+
+class TestPreview:
+    def test_preview_save(self, tmp_path, load_config):
+        _, data = load_config(CONFIG)
+        assert not data.preview_save()
+
+        data.set_option('general:gaps_in', 8)
+        data.remove_bezier('myBezier')
+        changes = data.preview_save()
+        assert [str(edit) for edit in changes] == [
+            '~ setting general:gaps_in: 5 -> 8',
+            '- bezier myBezier: Bezier(myBezier, (0.05, 0.9, 0.1, 1.05))',
+        ]
+        assert '-    gaps_in = 5\n' in changes.text
+        assert '+    gaps_in = 8\n' in changes.text
+        # Nothing is written
+        assert (tmp_path / 'hyprland.conf').read_text() == CONFIG
+
+    def test_preview_import(self, load_config):
+        _, data = load_config(CONFIG)
+        changes = data.preview_import(CONFIG.replace('nautilus', 'thunar').replace('$mainMod = SUPER', '$mainMod = ALT'))
+        assert [(edit.op, edit.kind) for edit in changes] == [
+            ('change', 'variable'), ('remove', 'keyword'), ('add', 'keyword'),
+        ]
+        assert data.get_option('general:gaps_in').value == 5
@@ -0,0 +1,135 @@
+"""Tests for applying patches to many config trees."""
+
+import json
+import os
+import stat
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.fleet import apply_fleet, apply_to_config, find_configs
+from app.modules.hyprparser.parser import HyprlandConfigParser, atomic_write
+from app.modules.hyprparser.patch import load_patch
+
+
+CONFIG = """general {
+    gaps_in = 5
+}
+bezier = myBezier, 0.05, 0.9, 0.1, 1.05
+"""
+
+PATCH = {
+    'set': {'general:gaps_in': 8, 'general:col.active_border': 'rgba(33ccffee)'},
+    'beziers': {'remove': ['myBezier']},
+}
+
+
+def make_fleet(tmp_path, count=4):
+    roots = []
+    for i in range(count):
+        root = tmp_path / f'user{i}' / 'hypr'
+        root.mkdir(parents=True)
+        (root / 'hyprland.conf').write_text(CONFIG)
+        roots.append(root)
+    return roots
+
+
+def load(path):
+    parser = HyprlandConfigParser(str(path))
+    parser.load()
+    return parser
+
+
+class TestFindConfigs:
+    def test_globs_and_directories(self, tmp_path):
+        roots = make_fleet(tmp_path, 3)
+        extra = roots[0] / 'hyprland.conf'
+
+        paths = find_configs([str(tmp_path / 'user*' / 'hypr'), str(extra)])
+        assert paths == [str(root / 'hyprland.conf') for root in roots]
+
+    def test_unmatched_root_is_kept(self, tmp_path):
+        # So that it is reported as an error instead of silently skipped
+        assert find_configs([str(tmp_path / 'missing')]) == [str(tmp_path / 'missing')]
+
+
+class TestApply:
+    def test_apply(self, tmp_path):
+        path = str(make_fleet(tmp_path, 1)[0] / 'hyprland.conf')
+
+        result = apply_to_config(path, PATCH)
+        assert result['status'] == 'changed'
+        assert 'set general:gaps_in' in result['changes']
+        parser = load(path)
+        assert parser.settings['general:gaps_in'].value == 8
+        assert parser.beziers == {}
+
+        assert apply_to_config(path, PATCH)['status'] == 'unchanged'
+
+    def test_dry_run(self, tmp_path):
+        path = str(make_fleet(tmp_path, 1)[0] / 'hyprland.conf')
+
+        result = apply_to_config(path, PATCH, dry_run=True)
+        assert result['status'] == 'changed'
+        assert '-    gaps_in = 5\n' in result['diff']
+        assert '+    gaps_in = 8\n' in result['diff']
+        assert open(path).read() == CONFIG
+
+    def test_missing_config(self, tmp_path):
+        result = apply_to_config(str(tmp_path / 'hyprland.conf'), PATCH)
+        assert result['status'] == 'error'
+        assert not (tmp_path / 'hyprland.conf').exists()
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        make_fleet(tmp_path, 6)
+        paths = find_configs([str(tmp_path / 'user*' / 'hypr')])
+        paths.append(str(tmp_path / 'missing.conf'))
+
+        sequential = list(apply_fleet(paths, PATCH, dry_run=True, jobs=1))
+        parallel = list(apply_fleet(paths, PATCH, dry_run=True, jobs=3))
+        assert parallel == sequential
+        assert [r['status'] for r in parallel] == ['changed'] * 6 + ['error']
+
+
+class TestAtomicWrite:
+    def test_keeps_mode_and_symlink(self, tmp_path):
+        target = tmp_path / 'dotfiles' / 'hyprland.conf'
+        target.parent.mkdir()
+        target.write_text('old\n')
+        os.chmod(target, 0o600)
+        link = tmp_path / 'hyprland.conf'
+        link.symlink_to(target)
+
+        atomic_write(str(link), 'new\n')
+
+        assert link.is_symlink()
+        assert target.read_text() == 'new\n'
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o600
+        assert os.listdir(target.parent) == ['hyprland.conf']
+
+
+class TestFleetCommand:
+    def test_toml_patch(self, tmp_path):
+        patch = tmp_path / 'patch.toml'
+        patch.write_text(
+            'remove = ["misc:vfr"]\n'
+            '[set.general]\n'
+            'gaps_in = 8\n'
+            '"col.active_border" = "rgba(33ccffee)"\n'
+        )
+        assert load_patch(str(patch))['set'] == {
+            'general:gaps_in': 8,
+            'general:col.active_border': 'rgba(33ccffee)',
+        }
+
+    def test_json_lines(self, tmp_path, capsys):
+        roots = make_fleet(tmp_path, 2)
+        patch = tmp_path / 'patch.json'
+        patch.write_text(json.dumps(PATCH))
+        roots_file = tmp_path / 'roots.txt'
+        roots_file.write_text(f'{roots[1]}\n\n')
+
+        assert main(['fleet', str(patch), str(roots[0]), '--from', str(roots_file), '-j', '2']) == 0
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r['path'] for r in results] == [str(root / 'hyprland.conf') for root in roots]
+        assert all(r['status'] == 'changed' for r in results)
+
+        assert main(['fleet', str(patch), str(tmp_path / 'nowhere')]) == 1
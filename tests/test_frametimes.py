@@ -0,0 +1,30 @@
+"""Tests for frame time measurements."""
+
+import pytest
+
+from app.modules.frametimes import ENV_VARIABLE, FrameTimes
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(ENV_VARIABLE, raising=False)
+    assert FrameTimes.from_environment('editor') is None
+    monkeypatch.setenv(ENV_VARIABLE, '0')
+    assert FrameTimes.from_environment('editor') is None
+    monkeypatch.setenv(ENV_VARIABLE, '1')
+    assert FrameTimes.from_environment('editor').name == 'editor'
+
+
+def test_stats_and_report():
+    times = FrameTimes('editor', max_samples=100)
+    assert times.stats() == {} and times.report() == 'editor: no frames'
+
+    # Only the latest frames are kept
+    for ms in [50] * 20 + list(range(1, 101)):
+        times.record(ms / 1000)
+    stats = times.stats()
+    assert stats['frames'] == 100
+    assert stats['mean'] == pytest.approx(50.5)
+    assert stats['p95'] == pytest.approx(96) and stats['max'] == pytest.approx(100)
+
+    assert times.report() == 'editor: 100 frames, mean 50.50 ms, p95 96.00 ms, max 100.00 ms'
+    assert times.stats() == {}
@@ -4,6 +4,8 @@ import pytest
 import tempfile
 import os
 from app.modules.hyprparser import Setting, Color, Bezier, HyprData
+from app.modules.hyprparser.manager import HyprDataManager
+from app.modules.hyprparser.merge import merge_lines
 from app.modules.hyprparser.parser import HyprlandConfigParser
 
 
@@ -109,5 +111,377 @@ class TestHyprlandConfigParser:
         assert parser._parse_value('false') is False
 
 
+
+class TestKeywords:
+    def test_repeatable_keywords_are_kept(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(
+            "$mainMod = SUPER\n"
+            "bind = $mainMod, Q, killactive,\n"
+            "bind = $mainMod, F, togglefloating,\n"
+            "exec-once = waybar\n"
+            "animations {\n"
+            "    animation = windows, 1, 7, default\n"
+            "}\n"
+        )
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+
+        assert [k.name for k in parser.keywords] == ['bind', 'bind', 'exec-once', 'animation']
+        # Keyword values keep their variables
+        assert parser.keywords[0].value == '$mainMod, Q, killactive,'
+        assert parser.keywords[3].section == 'animations'
+
+        content = parser._generate_config_content()
+        assert 'bind = $mainMod, F, togglefloating,' in content
+        assert '    animation = windows, 1, 7, default' in content
+
+    def test_sourced_files(self, tmp_path):
+        (tmp_path / 'colors.conf').write_text("general {\n    border_size = 3\n}\n")
+        config = tmp_path / 'hyprland.conf'
+        config.write_text("source = ./colors.conf\ngeneral {\n    gaps_in = 4\n}\n")
+
+        data = HyprDataManager(str(config))
+        assert data.get_option('general:border_size').value == 3
+        assert str(tmp_path / 'colors.conf') in data.watched_paths()
+        # Sourced options are not written into the main file
+        assert 'border_size' not in data.export_config()
+
+
+BLOCKS = """$sens = -0.5
+input {
+    sensitivity = 0
+}
+device {
+    name = epic-mouse-v1
+    sensitivity = $sens
+}
+device {
+    name = wacom-tablet
+    output = DP-1
+}
+device:logitech-usb-receiver {
+    natural_scroll = yes
+}
+listener {
+    timeout = 150
+    on-timeout = brightnessctl -s set 10
+}
+listener {
+    timeout = 300
+    on-timeout = loginctl lock-session
+}
+"""
+
+
+class TestBlocks:
+    def test_repeated_blocks_are_kept(self, load_config):
+        _, data = load_config(BLOCKS)
+        blocks = data.get_blocks()
+        assert [(b.name, b.key) for b in blocks] == [
+            ('device', 'epic-mouse-v1'), ('device', 'wacom-tablet'), ('device', 'logitech-usb-receiver'),
+            ('listener', None), ('listener', None),
+        ]
+        assert [b.get('timeout') for b in data.get_blocks('listener')] == [150, 300]
+        assert len({b.id for b in blocks}) == 5
+        # Block options do not leak into the section settings
+        assert data.get_option('input:sensitivity').value == 0
+        assert not data.has_option('device:sensitivity')
+
+        mouse = data.get_device('epic-mouse-v1')
+        assert mouse.get('sensitivity') == -0.5
+        assert mouse.options['sensitivity'].raw == '$sens'
+        assert data.get_device('logitech-usb-receiver').get('natural_scroll') is True
+
+    def test_edit_and_save(self, load_config):
+        config, data = load_config(BLOCKS)
+        mouse = data.get_device('epic-mouse-v1')
+        tablet = data.get_device('wacom-tablet')
+        first, second = data.get_blocks('listener')
+
+        data.set_block_option(mouse.id, 'accel_profile', 'flat')
+        data.set_block_option(tablet.id, 'name', 'wacom-intuos')
+        assert data.get_device('wacom-tablet') is None
+        assert data.get_device('wacom-intuos') is tablet
+        assert data.remove_block(first.id)
+        # Ids keep pointing at the same block
+        assert data.get_block(second.id).get('timeout') == 300
+        data.add_block('device', {'name': 'keychron', 'kb_layout': 'us,de'})
+        assert data.dirty
+        assert data.preview_save().blocks
+
+        with pytest.raises(ValueError):
+            data.set_block_option(mouse.id, 'sensitivity', 5)
+        with pytest.raises(ValueError):
+            data.set_block_option(mouse.id, 'name', 'keychron')
+        with pytest.raises(ValueError):
+            data.add_block('device', {'sensitivity': 0.2})
+        with pytest.raises(ValueError):
+            data.add_block('general')
+
+        assert data.save_all()
+        assert not data.dirty
+        text = config.read_text()
+        assert 'device:' not in text and 'sensitivity = $sens' in text
+
+        reloaded = HyprDataManager(str(config))
+        assert list(reloaded.devices) == ['epic-mouse-v1', 'wacom-intuos', 'logitech-usb-receiver', 'keychron']
+        assert reloaded.get_device('epic-mouse-v1').get('accel_profile') == 'flat'
+        assert [b.get('timeout') for b in reloaded.get_blocks('listener')] == [300]
+
+    def test_variables_and_external_edits(self, load_config):
+        config, data = load_config(BLOCKS)
+        data.set_variable('$sens', '0.25')
+        assert data.get_device('epic-mouse-v1').get('sensitivity') == 0.25
+
+        config, data = load_config(BLOCKS)
+        config.write_text(BLOCKS.replace('timeout = 300', 'timeout = 600'))
+        data.sync_file(str(config))
+        assert [b.get('timeout') for b in data.get_blocks('listener')] == [150, 600]
+        assert not data.dirty
+
+
+class TestExternalEdits:
+    def write(self, path, gaps_in, gaps_out):
+        path.write_text(f"general {{\n    gaps_in = {gaps_in}\n    gaps_out = {gaps_out}\n}}\n")
+
+    def test_sync_applies_external_changes(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        self.write(config, 5, 10)
+        data = HyprDataManager(str(config))
+        seen = []
+        data.watch_option('general:gaps_out', lambda path, setting: seen.append(setting.value))
+
+        self.write(config, 5, 20)
+        assert data.sync_file(str(config)) == {'general:gaps_out'}
+        assert data.get_option('general:gaps_out').value == 20
+        assert seen == [20]
+        assert not data.dirty
+
+    def test_sync_keeps_local_edits(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        self.write(config, 5, 10)
+        data = HyprDataManager(str(config))
+        data.set_option('general:gaps_in', 8)
+
+        # Non-conflicting external change is applied, the local edit stays
+        self.write(config, 5, 20)
+        data.sync_file(str(config))
+        assert data.get_option('general:gaps_in').value == 8
+        assert data.get_option('general:gaps_out').value == 20
+        assert not data.conflicts
+
+        # Both sides changed gaps_in: the local value wins and it is reported
+        self.write(config, 6, 20)
+        data.sync_file(str(config))
+        assert data.get_option('general:gaps_in').value == 8
+        assert data.conflicts == {'general:gaps_in'}
+
+    def test_sync_sourced_file(self, tmp_path):
+        colors = tmp_path / 'colors.conf'
+        colors.write_text("general {\n    border_size = 3\n}\n")
+        config = tmp_path / 'hyprland.conf'
+        config.write_text("source = colors.conf\n")
+        data = HyprDataManager(str(config))
+
+        colors.write_text("general {\n    border_size = 4\n}\n")
+        assert data.sync_file(str(colors)) == {'general:border_size'}
+        assert data.get_option('general:border_size').value == 4
+
+
+
+class TestMergeOnSave:
+    def test_external_changes_are_kept(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(
+            "general {\n    gaps_in = 5\n    gaps_out = 10\n}\n"
+            "bind = SUPER, Q, killactive,\n"
+        )
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        parser.settings['general:gaps_in'] = Setting('general:gaps_in', 8)
+
+        # Edited in another editor meanwhile
+        config.write_text(
+            "general {\n    gaps_in = 5\n    gaps_out = 20\n}\n"
+            "bind = SUPER, Q, killactive,\n"
+            "bind = SUPER, F, togglefloating,\n"
+        )
+        os.utime(config, ns=(0, 0))
+        assert parser.save()
+        assert parser.last_conflicts == []
+        assert parser.last_merged_keys == {'general:gaps_out'}
+
+        reloaded = HyprlandConfigParser(str(config))
+        reloaded.load()
+        assert reloaded.settings['general:gaps_in'].value == 8
+        assert reloaded.settings['general:gaps_out'].value == 20
+        assert [k.value for k in reloaded.keywords] == [
+            'SUPER, Q, killactive,',
+            'SUPER, F, togglefloating,',
+        ]
+
+    def test_true_conflicts_are_reported(self, tmp_path):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text("general {\n    gaps_in = 5\n}\n")
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        parser.settings['general:gaps_in'] = Setting('general:gaps_in', 8)
+
+        config.write_text("general {\n    gaps_in = 6\n}\n")
+        os.utime(config, ns=(0, 0))
+        assert parser.save()
+        assert [c.key for c in parser.last_conflicts] == ['general:gaps_in']
+        assert parser.last_conflicts[0].disk.value == 6
+        assert parser.settings['general:gaps_in'].value == 8
+
+    def test_merge_lines(self):
+        base = ['a', 'b', 'c']
+        disk = ['a', 'x', 'c', 'y']
+        ours = ['a', 'b', 'c', 'z']
+        assert merge_lines(base, disk, ours) == ['a', 'x', 'c', 'y', 'z']
+        # A line added on both sides is only kept once
+        assert merge_lines(['a'], ['a', 'b'], ['a', 'b']) == ['a', 'b']
+
+
+class TestSparseSave:
+    CONFIG = (
+        "source = colors.conf\n"
+        "general {\n    gaps_in = 5\n    border_size = 1\n    layout = master\n}\n"
+        "misc {\n    vfr = 1\n    vrr = true\n}\n"
+    )
+    FILES = {'colors.conf': "general {\n    border_size = 3\n}\n"}
+
+    def test_get_default(self, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        assert data.get_default('general:gaps_out') == 20
+        assert data.get_default('plugin:foo:bar', 'x') == 'x'
+        assert not data.is_explicit('general:gaps_out')
+        assert data.is_explicit('general:border_size')
+
+    def test_prune_defaults(self, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        # border_size is also set in a sourced file, so it must stay;
+        # vrr = true is not the integer default 0
+        assert data.prune_defaults() == ['general:gaps_in', 'misc:vfr']
+
+    def test_sparse_save(self, load_config):
+        config, data = load_config(self.CONFIG, self.FILES)
+        assert data.save_all(sparse=True)
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        assert 'general:gaps_in' not in parser.settings
+        assert parser.settings['general:layout'].value == 'master'
+
+        # A normal save keeps explicit defaults
+        data.set_option('general:gaps_in', 5)
+        assert data.save_all()
+        parser.load()
+        assert parser.settings['general:gaps_in'].value == 5
+
+
+
+class TestLayeredLookup:
+    CONFIG = "source = colors.conf\ngeneral {\n    border_size = 2\n}\n"
+    FILES = {'colors.conf': "general {\n    border_size = 3\n    gaps_out = 8\n}\n"}
+
+    def test_layers(self, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        assert (data.get_value('general:border_size'), data.get_layer('general:border_size')) == (2, 'explicit')
+        assert (data.get_value('general:gaps_out'), data.get_layer('general:gaps_out')) == (8, 'sourced')
+        assert (data.get_value('general:gaps_in'), data.get_layer('general:gaps_in')) == (5, 'default')
+        assert data.get_value('plugin:foo:bar', 'x') == 'x'
+        assert data.get_layer('plugin:foo:bar') is None
+
+    def test_edits_fall_through_layers(self, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        data.set_option('general:gaps_in', 7)
+        assert data.get_value('general:gaps_in') == 7
+        data.remove_option('general:border_size')
+        assert data.get_value('general:border_size') == 3
+        data.clear_section('general')
+        assert data.get_value('general:gaps_in') == 5
+
+    def test_sourced_file_change(self, tmp_path, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        (tmp_path / 'colors.conf').write_text("general {\n    border_size = 4\n}\n")
+        assert data.sync_file(str(tmp_path / 'colors.conf')) == {'general:border_size', 'general:gaps_out'}
+        # The explicit value still wins; the unset sourced one falls back to the default
+        assert data.get_value('general:border_size') == 2
+        assert (data.get_value('general:gaps_out'), data.get_layer('general:gaps_out')) == (20, 'default')
+
+    def test_nested_sources(self, load_config):
+        _, data = load_config(self.CONFIG, {
+            'colors.conf': "source = more.conf\ngeneral {\n    border_size = 3\n}\nsource = last.conf\n",
+            'more.conf': "general {\n    gaps_in = 17\n    border_size = 6\n    gaps_out = 9\n}\n",
+            'last.conf': "general {\n    gaps_out = 11\n}\n",
+        })
+        assert (data.get_value('general:gaps_in'), data.get_layer('general:gaps_in')) == (17, 'sourced')
+        assert data.get_option('general:gaps_in').value == 17
+        # Nested files are read in place of their source line
+        assert data.get_value('general:gaps_out') == 11
+        data.remove_option('general:border_size')
+        assert data.get_value('general:border_size') == 3
+        assert data.get_option('general:border_size').value == 3
+
+    def test_lookup_is_cached(self, load_config):
+        _, data = load_config(self.CONFIG, self.FILES)
+        data.get_value('general:gaps_out')
+        # Only the edited key is re-resolved
+        resolved = dict(data._resolved)
+        data.set_option('general:gaps_in', 9)
+        changed = {key for key in data._resolved if data._resolved[key] != resolved.get(key)}
+        assert changed == {'general:gaps_in'}
+
+
+class TestOverlays:
+    CONFIG = "decoration {\n    blur {\n        enabled = true\n        size = 10\n    }\n}\n"
+
+    def test_push_and_pop(self, load_config):
+        config, data = load_config(self.CONFIG)
+        changed = data.push_overlay('screenshare', {'decoration:blur:enabled': False, 'decoration:blur:size': 10})
+        # size already is 10, so only blur needs to be applied
+        assert changed == {'decoration:blur:enabled': False}
+        assert data.get_value('decoration:blur:enabled') is False
+        assert data.get_layer('decoration:blur:enabled') == 'overlay'
+        assert data.overlays == ['screenshare']
+
+        assert data.pop_overlay() == {'decoration:blur:enabled': True}
+        assert data.get_layer('decoration:blur:enabled') == 'explicit'
+        assert data.overlays == []
+
+    def test_pop_only_yields_uncovered_keys(self, load_config):
+        _, data = load_config(self.CONFIG)
+        data.push_overlay('low', {'decoration:blur:enabled': False, 'misc:vfr': False})
+        data.push_overlay('high', {'decoration:blur:enabled': False, 'general:gaps_in': 0})
+        # blur stays off through 'high'
+        assert data.pop_overlay('low') == {'misc:vfr': True}
+        assert data.pop_overlay('high') == {'decoration:blur:enabled': True, 'general:gaps_in': 5}
+
+    def test_overlays_are_not_saved(self, load_config):
+        config, data = load_config(self.CONFIG)
+        data.push_overlay('screenshare', {'decoration:blur:enabled': False})
+        data.set_option('decoration:blur:size', 4)
+        assert data.save_all()
+        parser = HyprlandConfigParser(str(config))
+        parser.load()
+        assert parser.settings['decoration:blur:enabled'].value is True
+        # Edits below an overlay show up once it is popped
+        data.push_overlay('gapless', {'general:gaps_in': 0})
+        data.set_option('general:gaps_in', 3)
+        assert data.get_value('general:gaps_in') == 0
+        assert data.pop_overlay('gapless') == {'general:gaps_in': 3}
+
+    def test_errors(self, load_config):
+        _, data = load_config(self.CONFIG)
+        with pytest.raises(ValueError):
+            data.push_overlay('bad', {'general:border_size': -1})
+        assert data.overlays == []
+        data.push_overlay('a', {})
+        with pytest.raises(ValueError):
+            data.push_overlay('a', {})
+        with pytest.raises(KeyError):
+            data.pop_overlay('b')
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
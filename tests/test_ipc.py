@@ -0,0 +1,111 @@
+"""Tests for the Hyprland event socket reader and command requests."""
+
+import os
+import selectors
+import tempfile
+
+import pytest
+
+from app.modules.hyprparser.ipc import (
+    EventBus,
+    EventSocketReader,
+    EventStreamParser,
+    HyprEvent,
+    set_keywords,
+)
+from tests.fake_event_server import FakeEventServer, FakeRequestServer
+
+
+class TestHyprEvent:
+    def test_typed_fields(self):
+        event = HyprEvent('openwindow', '55d1,2,firefox,Mozilla Firefox, Private')
+        assert event.address == '55d1'
+        assert event.window_class == 'firefox'
+        # The last field keeps its commas
+        assert event.title == 'Mozilla Firefox, Private'
+
+    def test_unknown_event(self):
+        event = HyprEvent('somefutureevent', 'a,b')
+        assert event.args == ('a,b',)
+        with pytest.raises(AttributeError):
+            event.monitor
+
+
+class TestEventStreamParser:
+    def test_split_across_reads(self):
+        parser = EventStreamParser(capacity=16)
+        parser.feed(b'workspace>>1\nconfigrel')
+        assert list(parser.events()) == [HyprEvent('workspace', '1')]
+
+        parser.feed(b'oaded>>\nactivelayout>>kb,English (US)\n')
+        events = list(parser.events())
+        assert [e.name for e in events] == ['configreloaded', 'activelayout']
+        assert events[1].layout == 'English (US)'
+        assert parser.pending == 0
+
+    def test_line_longer_than_buffer(self):
+        parser = EventStreamParser(capacity=8)
+        title = 'x' * 100
+        parser.feed(f'windowtitlev2>>ab,{title}\n'.encode())
+        (event,) = parser.events()
+        assert event.title == title
+
+
+class TestEventBus:
+    def test_dispatch_and_unsubscribe(self):
+        bus = EventBus()
+        seen = []
+        unsubscribe = bus.subscribe('configreloaded', seen.append)
+        bus.subscribe(EventBus.ALL, lambda e: seen.append(e.name))
+
+        bus.dispatch(HyprEvent('configreloaded'))
+        unsubscribe()
+        bus.dispatch(HyprEvent('configreloaded'))
+
+        assert seen == [HyprEvent('configreloaded'), 'configreloaded', 'configreloaded']
+
+
+class TestEventSocketReader:
+    def test_replay_burst(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, '.socket2.sock')
+            with FakeEventServer(path, repeat=5000, chunk_size=4093) as server:
+                bus = EventBus()
+                counts = {'all': 0, 'configreloaded': 0}
+
+                def count_all(_):
+                    counts['all'] += 1
+
+                def count_reloads(_):
+                    counts['configreloaded'] += 1
+
+                bus.subscribe(EventBus.ALL, count_all)
+                bus.subscribe('configreloaded', count_reloads)
+
+                reader = EventSocketReader(bus, path)
+                assert reader.connect()
+
+                selector = selectors.DefaultSelector()
+                selector.register(reader.fileno(), selectors.EVENT_READ)
+                while reader.read_available():
+                    selector.select(timeout=5)
+                selector.close()
+
+        assert counts['all'] == server.total_events
+        assert counts['configreloaded'] == server.repeat
+
+
+class TestSetKeywords:
+    def test_single_batch(self, tmp_path):
+        path = str(tmp_path / '.socket.sock')
+        with FakeRequestServer(path) as server:
+            assert set_keywords({'decoration:blur:enabled': 'no', 'misc:vfr': 'yes'}, path)
+        assert server.requests == ['[[BATCH]]keyword decoration:blur:enabled no;keyword misc:vfr yes']
+
+    def test_rejected_keyword(self, tmp_path):
+        path = str(tmp_path / '.socket.sock')
+        with FakeRequestServer(path, unknown=('plugin:foo:bar',)):
+            assert not set_keywords({'misc:vfr': 'yes', 'plugin:foo:bar': '1'}, path)
+
+    def test_not_running(self, tmp_path):
+        assert not set_keywords({'misc:vfr': 'yes'}, str(tmp_path / 'missing.sock'))
@@ -0,0 +1,155 @@
+"""Tests for config auditing."""
+
+import json
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.lint import (
+    RULES,
+    Linter,
+    Rule,
+    audit_fleet,
+    lint_file,
+    register_rule,
+    to_sarif,
+)
+from app.modules.hyprparser.parser import HyprlandConfigParser
+
+
+CONFIG = """$mainMod = SUPER
+general {
+    gaps_in = 5
+}
+decoration {
+    drop_shadow = true
+    active_opacity = 1.5
+}
+fancy {
+    option = 1
+}
+bind = $mainMod, Q, killactive,
+bind = SUPER, q, exec, kitty
+bindm = $mainMod, mouse:272, movewindow
+bind = SUPER, mouse:272, exec, kitty
+submap = resize
+bind = SUPER, Q, exec, kitty
+submap = reset
+bezier = broken
+"""
+
+
+def lint_text(tmp_path, text=CONFIG, rule_ids=None):
+    path = tmp_path / 'hyprland.conf'
+    path.write_text(text)
+    return lint_file(str(path), rule_ids)['findings']
+
+
+class TestRules:
+    def test_findings(self, tmp_path):
+        findings = [(f['rule'], f['line']) for f in lint_text(tmp_path) if f['rule'] != 'parse-warning']
+        assert findings == [
+            ('deprecated-option', 6),
+            ('out-of-range', 7),
+            ('unknown-section', 10),
+            ('duplicate-bind', 13),
+        ]
+
+    def test_variable_cycle(self, tmp_path):
+        findings = lint_text(tmp_path, '$a = $b\n$b = $a\ngeneral {\n    gaps_in = $a\n}\n')
+        assert [f['rule'] for f in findings] == ['parse-warning', 'variable-cycle']
+
+    def test_parse_warnings(self, tmp_path):
+        findings = lint_text(tmp_path)
+        assert findings[0]['rule'] == 'parse-warning'
+        assert 'bezier' in findings[0]['message']
+
+    def test_duplicate_bind_message(self, tmp_path):
+        [finding] = [f for f in lint_text(tmp_path, rule_ids=('duplicate-bind',)) if f['rule'] == 'duplicate-bind']
+        assert finding['message'] == "'SUPER, q' is already bound on line 12"
+
+    def test_submap_names_are_expanded(self, tmp_path):
+        text = (
+            "$resize = resize\n"
+            "submap = $resize\nbind = , left, resizeactive, -10 0\nsubmap = reset\n"
+            "submap = resize\nbind = , left, resizeactive, -20 0\nsubmap = reset\n"
+        )
+        [finding] = lint_text(tmp_path, text, rule_ids=('duplicate-bind',))
+        assert finding['message'] == "', left' is already bound on line 3 in submap 'resize'"
+
+    def test_unbind_allows_rebinding(self, tmp_path):
+        text = "bind = SUPER, Q, killactive,\nunbind = SUPER, Q\nbind = SUPER, Q, exec, kitty\n"
+        assert lint_text(tmp_path, text) == []
+
+    def test_missing_file(self, tmp_path):
+        [finding] = lint_file(str(tmp_path / 'missing.conf'))['findings']
+        assert finding['rule'] == 'parse-error'
+
+    def test_custom_rule_runs_in_same_pass(self, tmp_path):
+        calls = []
+
+        @register_rule
+        class CountRule(Rule):
+            id = 'count-settings'
+
+            def visit_setting(self, path, value, line):
+                calls.append(path)
+
+            def finish(self):
+                self.report(f"{len(calls)} settings")
+
+        try:
+            parser = HyprlandConfigParser(str(tmp_path / 'hyprland.conf'), create_default=False)
+            (tmp_path / 'hyprland.conf').write_text(CONFIG)
+            parser.load()
+            linter = Linter()
+            findings = linter.lint(parser)
+            assert len(calls) == len(parser.settings)
+            assert [f.message for f in findings if f.rule == 'count-settings'] == ['4 settings']
+            # Only rules that override a hook are called for it
+            assert len(linter._hooks['visit_keyword']) == 1
+        finally:
+            del RULES['count-settings']
+
+
+class TestAudit:
+    def make_configs(self, tmp_path, count):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f'{i}.conf'
+            path.write_text(CONFIG if i % 2 else "general {\n    gaps_in = 5\n}\n")
+            paths.append(str(path))
+        return paths
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        paths = self.make_configs(tmp_path, 8)
+        assert list(audit_fleet(iter(paths), jobs=3)) == list(audit_fleet(paths, jobs=1))
+
+    def test_sarif(self, tmp_path):
+        paths = self.make_configs(tmp_path, 2)
+        sarif = to_sarif(audit_fleet(paths, jobs=1))
+        run = sarif['runs'][0]
+        assert sarif['version'] == '2.1.0'
+        assert {rule['id'] for rule in run['tool']['driver']['rules']} >= set(RULES)
+        result = next(r for r in run['results'] if r['ruleId'] == 'out-of-range')
+        assert result['level'] == 'error'
+        location = result['locations'][0]['physicalLocation']
+        assert location['artifactLocation']['uri'] == (tmp_path / '1.conf').as_uri()
+        assert location['region'] == {'startLine': 7}
+
+    def test_command(self, tmp_path, capsys):
+        paths = self.make_configs(tmp_path, 2)
+
+        assert main(['audit', paths[0]]) == 0
+        assert json.loads(capsys.readouterr().out) == {'path': paths[0], 'findings': []}
+
+        assert main(['audit', str(tmp_path / '*.conf'), '--rules', 'out-of-range', '--format', 'sarif']) == 1
+        sarif = json.loads(capsys.readouterr().out)
+        # Parser warnings are reported whichever rules are selected
+        assert [r['ruleId'] for r in sarif['runs'][0]['results']] == ['parse-warning', 'out-of-range']
+
+        assert main(['audit', paths[0], '--rules', 'nope']) == 1
+
+    def test_many_files(self, tmp_path):
+        paths = self.make_configs(tmp_path, 200)
+
+        results = list(audit_fleet(paths))
+        assert len(results) == len(paths)
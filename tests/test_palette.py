@@ -0,0 +1,108 @@
+"""Tests for wallpaper palette extraction."""
+
+import os
+import random
+
+import pytest
+
+from app.modules import palette
+from app.modules.palette import (
+    PaletteCache,
+    extract_palette,
+    image_key,
+    lab_to_rgb,
+    rank_for,
+    rgb_to_lab,
+)
+
+NAVY, ORANGE, TEAL = (20, 24, 40), (230, 120, 30), (30, 170, 160)
+
+BACKENDS = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(palette.np is None, reason='NumPy is not installed')),
+]
+
+
+def make_image(width=128, height=72, channels=3, padding=0, transparent=0.0):
+    """Noisy image: 60% navy, 25% orange, 15% teal, in rows padded like a GdkPixbuf."""
+    rng = random.Random(1)
+    rowstride = width * channels + padding
+    data = bytearray()
+    for _ in range(height):
+        row = bytearray()
+        for _ in range(width):
+            r = rng.random()
+            color = NAVY if r < 0.6 else ORANGE if r < 0.85 else TEAL
+            row += bytes(max(0, min(255, c + rng.randint(-6, 6))) for c in color)
+            if channels == 4:
+                row.append(0 if rng.random() < transparent else 255)
+        data += row + bytes(padding)
+    # The last row is not padded
+    return bytes(data[:len(data) - padding]), width, height, rowstride, channels
+
+
+def close(rgb, expected, tolerance=12):
+    return all(abs(a - b) <= tolerance for a, b in zip(rgb, expected))
+
+
+class TestExtraction:
+    def test_lab_round_trip(self):
+        for rgb in ((0, 0, 0), (255, 255, 255), (12, 200, 99), (230, 120, 30)):
+            assert lab_to_rgb(rgb_to_lab(rgb)) == rgb
+        assert rgb_to_lab((255, 255, 255))[0] == pytest.approx(100, abs=0.01)
+
+    @pytest.mark.parametrize('vectorized', BACKENDS)
+    def test_palette(self, vectorized):
+        swatches = extract_palette(*make_image(padding=3), vectorized=vectorized)
+        # Noise around the same color is merged into one swatch
+        assert len(swatches) == 3
+        assert [s.weight for s in swatches] == pytest.approx([0.6, 0.25, 0.15], abs=0.02)
+        for swatch, expected in zip(swatches, (NAVY, ORANGE, TEAL)):
+            assert close(swatch.rgb, expected)
+
+    @pytest.mark.parametrize('vectorized', BACKENDS)
+    def test_transparent_pixels_are_ignored(self, vectorized):
+        swatches = extract_palette(*make_image(channels=4, transparent=0.5), vectorized=vectorized)
+        assert close(swatches[0].rgb, NAVY)
+        assert extract_palette(b'\0\0\0\0' * 4, 2, 2, 8, 4, vectorized=vectorized) == []
+
+    def test_suggestions(self):
+        swatches = extract_palette(*make_image(), vectorized=False)
+        assert close(rank_for('general:col.active_border', swatches)[0].rgb, ORANGE)
+        assert close(rank_for('misc:background_color', swatches)[0].rgb, NAVY)
+
+    @pytest.mark.benchmark
+    @pytest.mark.skipif(palette.np is None, reason='NumPy is not installed')
+    def test_time(self, timed):
+        # What GdkPixbuf decodes an 8K (7680x4320) wallpaper to
+        image = make_image(128, 72)
+        extract_palette(*image)
+        timed('palette of a 128x72 decode', lambda: extract_palette(*image), 0.1)
+
+
+class TestCache:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / 'palettes.json')
+        swatches = extract_palette(*make_image(), vectorized=False)
+        PaletteCache(path).put('key', swatches)
+
+        cached = PaletteCache(path).get('key')
+        assert [s.rgb for s in cached] == [s.rgb for s in swatches]
+        assert cached[0].weight == pytest.approx(swatches[0].weight, abs=1e-3)
+        assert PaletteCache(path).get('other') is None
+
+    def test_bounded(self):
+        cache = PaletteCache(max_entries=2)
+        swatches = extract_palette(*make_image(8, 8), vectorized=False)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, swatches)
+        assert cache.get('a') is None and cache.get('c') is not None
+
+    def test_image_key(self, tmp_path):
+        image = tmp_path / 'wall.png'
+        image.write_bytes(b'one')
+        key = image_key(str(image))
+        assert image_key(str(image)) == key
+        stat = os.stat(image)
+        os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert image_key(str(image)) != key
@@ -0,0 +1,220 @@
+"""Tests for config profiles."""
+
+import json
+import selectors
+
+import pytest
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.ipc import EventBus, EventSocketReader
+from app.modules.hyprparser.manager import HyprDataManager
+from app.modules.hyprparser.profiles import ProfileError, ProfileStore
+from tests.fake_event_server import FakeEventServer, FakeRequestServer
+
+
+CONFIG = """decoration {
+    blur {
+        enabled = true
+    }
+}
+animations {
+    enabled = true
+}
+"""
+
+PROFILES = {
+    'active': None,
+    'profiles': {
+        'battery': {'decoration:blur:enabled': False, 'animations:enabled': False, 'misc:vfr': True},
+        'performance': {'decoration:blur:enabled': True, 'misc:vfr': False},
+    },
+}
+
+
+def make_config(tmp_path, profiles=PROFILES):
+    config = tmp_path / 'hyprland.conf'
+    config.write_text(CONFIG)
+    (tmp_path / 'hyprset-profiles.json').write_text(json.dumps(profiles))
+    return config
+
+
+class TestProfileStore:
+    FILES = {'hyprset-profiles.json': json.dumps(PROFILES)}
+
+    def test_precomputed_diffs(self, load_config):
+        _, data = load_config(CONFIG, self.FILES)
+        store = data.profiles
+        assert store.names == ['battery', 'performance']
+        assert store.diff('battery', 'performance') == {
+            'animations:enabled': None,
+            'decoration:blur:enabled': True,
+            'misc:vfr': False,
+        }
+        assert store.diff(None, 'performance') == PROFILES['profiles']['performance']
+        assert store.diff('performance', None) == {'decoration:blur:enabled': None, 'misc:vfr': None}
+        assert store.diff('battery', 'battery') == {}
+        with pytest.raises(ProfileError):
+            store.diff('battery', 'missing')
+
+    def test_edits_update_diffs(self, load_config):
+        _, data = load_config(CONFIG, self.FILES)
+        store = data.profiles
+        store.set_profile('battery', {'misc:vfr': True})
+        assert store.diff('battery', 'performance') == {'decoration:blur:enabled': True, 'misc:vfr': False}
+        store.remove_profile('performance')
+        assert ('battery', 'performance') not in store._diffs
+        with pytest.raises(ProfileError):
+            store.set_profile('bad', {'general:border_size': -1})
+        with pytest.raises(ProfileError):
+            store.set_profile('none', {})
+
+    def test_missing_and_malformed_file(self, tmp_path):
+        store = ProfileStore(str(tmp_path / 'hyprset-profiles.json'))
+        assert store.load() and store.names == []
+        (tmp_path / 'hyprset-profiles.json').write_text('{"profiles": []}')
+        with pytest.raises(ProfileError):
+            store.load()
+
+
+class TestSwitchProfile:
+    def test_switch_applies_only_differences(self, tmp_path):
+        config = make_config(tmp_path)
+        data = HyprDataManager(str(config))
+
+        assert data.switch_profile('battery') == {
+            'decoration:blur:enabled': False,
+            'animations:enabled': False,
+        }
+        assert data.get_layer('misc:vfr') == 'profile'
+        assert data.switch_profile('performance') == {
+            'decoration:blur:enabled': True,
+            'animations:enabled': True,
+            'misc:vfr': False,
+        }
+        assert data.switch_profile(None) == {'misc:vfr': True}
+        assert data.get_layer('misc:vfr') == 'default'
+
+        # Profiles never reach hyprland.conf
+        data.switch_profile('battery')
+        data.set_option('general:gaps_in', 8)
+        assert data.save_all()
+        assert 'blur' in config.read_text() and 'vfr' not in config.read_text()
+
+    def test_active_profile_is_remembered(self, tmp_path):
+        config = make_config(tmp_path)
+        HyprDataManager(str(config)).switch_profile('battery')
+
+        data = HyprDataManager(str(config))
+        assert data.active_profile == 'battery'
+        assert data.get_value('decoration:blur:enabled') is False
+        assert data.switch_profile('battery') == {}
+
+    def test_preview(self, tmp_path):
+        data = HyprDataManager(str(make_config(tmp_path)))
+        changes = data.preview_profile('battery')
+        assert [str(edit) for edit in changes] == [
+            '~ setting decoration:blur:enabled: True -> False',
+            '~ setting animations:enabled: True -> False',
+        ]
+        assert data.active_profile is None
+        assert data.get_layer('misc:vfr') == 'default'
+
+    def test_unknown_profile_changes_nothing(self, tmp_path):
+        config = make_config(tmp_path)
+        data = HyprDataManager(str(config))
+        with pytest.raises(ProfileError):
+            data.switch_profile('missing')
+        assert data.active_profile is None
+        assert data.get_value('decoration:blur:enabled') is True
+
+    def test_apply_to_hyprland_in_one_batch(self, tmp_path, monkeypatch):
+        data = HyprDataManager(str(make_config(tmp_path)))
+        socket_dir = tmp_path / 'hypr' / 'instance'
+        socket_dir.mkdir(parents=True)
+        monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+        monkeypatch.setenv('HYPRLAND_INSTANCE_SIGNATURE', 'instance')
+
+        with FakeRequestServer(str(socket_dir / '.socket.sock')) as server:
+            assert data.apply_to_hyprland(data.switch_profile('battery'))
+        assert server.requests == [
+            '[[BATCH]]keyword decoration:blur:enabled no;keyword animations:enabled no'
+        ]
+
+
+    def test_unset_options_are_reset_by_reloading(self, tmp_path, monkeypatch):
+        profiles = {'active': None, 'profiles': {
+            # A plugin option has no default known to hyprset
+            'focus': {'plugin:hyprbars:enabled': False, 'misc:vfr': True},
+        }}
+        data = HyprDataManager(str(make_config(tmp_path, profiles)))
+        socket_dir = tmp_path / 'hypr' / 'instance'
+        socket_dir.mkdir(parents=True)
+        monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+        monkeypatch.setenv('HYPRLAND_INSTANCE_SIGNATURE', 'instance')
+        data.switch_profile('focus')
+        data.push_overlay('game', {'decoration:blur:enabled': False})
+
+        changed = data.switch_profile(None)
+        assert changed['plugin:hyprbars:enabled'] is None
+        with FakeRequestServer(str(socket_dir / '.socket.sock')) as server:
+            assert data.apply_to_hyprland(changed)
+        # The overlay is not in any file, so it is sent again after the reload
+        assert server.requests == [
+            'reload',
+            '[[BATCH]]keyword decoration:blur:enabled no',
+        ]
+
+    def test_profile_is_sent_again_after_a_reload(self, tmp_path, monkeypatch):
+        data = HyprDataManager(str(make_config(tmp_path)))
+        socket_dir = tmp_path / 'hypr' / 'instance'
+        socket_dir.mkdir(parents=True)
+        monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+        monkeypatch.setenv('HYPRLAND_INSTANCE_SIGNATURE', 'instance')
+        data.switch_profile('battery')
+        bus = EventBus()
+        data.attach_events(bus)
+
+        recording = tmp_path / 'events.log'
+        recording.write_text('activewindow>>kitty,~\nconfigreloaded>>\n')
+        with FakeRequestServer(str(socket_dir / '.socket.sock')) as server, \
+                FakeEventServer(str(socket_dir / '.socket2.sock'), str(recording)):
+            reader = EventSocketReader(bus, str(socket_dir / '.socket2.sock'))
+            assert reader.connect()
+            selector = selectors.DefaultSelector()
+            selector.register(reader.fileno(), selectors.EVENT_READ)
+            while reader.read_available():
+                selector.select(timeout=5)
+            selector.close()
+        assert server.requests == [
+            '[[BATCH]]keyword decoration:blur:enabled no;keyword animations:enabled no;keyword misc:vfr yes'
+        ]
+
+    def test_failed_reload_is_reported(self, tmp_path, monkeypatch):
+        profiles = {'active': 'focus', 'profiles': {'focus': {'plugin:hyprbars:enabled': False}}}
+        data = HyprDataManager(str(make_config(tmp_path, profiles)))
+        # Hyprland is not running
+        monkeypatch.delenv('HYPRLAND_INSTANCE_SIGNATURE', raising=False)
+        assert not data.apply_to_hyprland(data.switch_profile(None))
+
+
+class TestProfileCommand:
+    def test_commands(self, tmp_path, capsys):
+        config = str(make_config(tmp_path, {'profiles': {}}))
+
+        assert main(['profile', 'save', 'battery', 'misc:vfr=yes', 'decoration:blur:enabled = no', '-c', config]) == 0
+        assert main(['-c', config, 'profile', 'save', 'battery', 'misc:vfr']) == 2
+        assert main(['-c', config, 'profile', 'list']) == 0
+        assert capsys.readouterr().out == '  battery\n'
+
+        assert main(['-c', config, 'profile', 'diff', 'none', 'battery']) == 0
+        assert capsys.readouterr().out == 'misc:vfr = yes\ndecoration:blur:enabled = no\n'
+
+        assert main(['-c', config, 'profile', 'switch', 'battery', '--no-apply']) == 0
+        assert capsys.readouterr().out == 'decoration:blur:enabled = no\n'
+        assert main(['-c', config, 'profile', 'list']) == 0
+        assert capsys.readouterr().out == '* battery\n'
+
+        assert main(['-c', config, 'profile', 'switch', 'missing']) == 1
+        assert main(['-c', config, 'profile', 'delete', 'battery']) == 0
+        assert main(['-c', config, 'profile', 'list']) == 0
+        assert capsys.readouterr().out == ''
@@ -0,0 +1,130 @@
+"""Tests for the background directory scanner and its index."""
+
+import os
+import threading
+import time
+
+from app.modules.scanner import DirectoryIndex, DirectoryScanner
+
+
+class Main:
+    """Stands in for the main loop: dispatched functions run on `run()`."""
+
+    def __init__(self):
+        self.queue = []
+        self.lock = threading.Lock()
+
+    def dispatch(self, function):
+        with self.lock:
+            self.queue.append(function)
+
+    def iterate(self):
+        """One main loop iteration: every ready source runs once."""
+        with self.lock:
+            queued, self.queue = self.queue, []
+        for function in queued:
+            # Like GLib, a callback returning True is run again
+            if function():
+                with self.lock:
+                    self.queue.append(function)
+        return len(queued)
+
+    def run_until(self, done, timeout=5):
+        deadline = time.monotonic() + timeout
+        ticks = 0
+        while not done() and time.monotonic() < deadline:
+            ticks += self.iterate()
+            time.sleep(0.001)
+        return ticks
+
+
+def make_folder(path, count):
+    path.mkdir()
+    for i in range(count):
+        (path / f'{i:05}.jpg').write_bytes(b'')
+    (path / 'sub').mkdir()
+    return path
+
+
+def scan(scanner, main, folder, **kwargs):
+    batches, jobs = [], []
+    job = scanner.scan(str(folder), batches.append, jobs.append, **kwargs)
+    ticks = main.run_until(lambda: jobs)
+    return job, batches, ticks
+
+
+class TestScanner:
+    def test_batches(self, tmp_path):
+        folder = make_folder(tmp_path / 'walls', 450)
+        main = Main()
+        scanner = DirectoryScanner(main.dispatch, batch_size=100)
+
+        job, batches, ticks = scan(scanner, main, folder, accept=lambda entry: not entry.is_dir)
+        assert [len(batch) for batch in batches] == [100, 100, 100, 100, 50]
+        # One batch per main loop callback, then the completion
+        assert ticks == 6
+        assert batches[0][0].path == str(folder / '00000.jpg') and not job.cached
+        scanner.shutdown()
+
+    def test_one_batch_per_iteration(self, tmp_path):
+        folder = make_folder(tmp_path / 'walls', 1000)
+        main = Main()
+        scanner = DirectoryScanner(main.dispatch, batch_size=100)
+        batches, jobs = [], []
+        scanner.scan(str(folder), batches.append, jobs.append)
+        scanner.shutdown(wait=True)
+
+        # The worker is done and every batch is waiting, yet they come one at a time
+        assert len(main.queue) == 1
+        main.iterate()
+        assert len(batches) == 1
+        main.run_until(lambda: jobs)
+        assert len(batches) == 11 and sum(map(len, batches)) == 1001
+        assert main.queue == []
+
+    def test_index_skips_unchanged_folders(self, tmp_path):
+        folder = make_folder(tmp_path / 'walls', 20)
+        index_path = str(tmp_path / 'cache' / 'index.json')
+        main = Main()
+
+        scanner = DirectoryScanner(main.dispatch, DirectoryIndex(index_path))
+        scan(scanner, main, folder)
+        scanner.shutdown()
+        assert os.path.exists(index_path)
+
+        # Read back on the next start
+        scanner = DirectoryScanner(main.dispatch, DirectoryIndex(index_path))
+        job, batches, _ = scan(scanner, main, folder)
+        assert job.cached and len(batches[0]) == 21
+
+        (folder / 'new.png').write_bytes(b'')
+        stat = os.stat(folder)
+        # Make sure the mtime differs on coarse file systems
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        job, batches, _ = scan(scanner, main, folder)
+        assert not job.cached and 'new.png' in [entry.name for entry in batches[0]]
+        scanner.shutdown()
+
+    def test_cancel(self, tmp_path):
+        folder = make_folder(tmp_path / 'walls', 50)
+        main = Main()
+        scanner = DirectoryScanner(main.dispatch, batch_size=10)
+        batches, jobs = [], []
+        job = scanner.scan(str(folder), batches.append, jobs.append)
+        job.cancel()
+        # Whatever was dispatched before cancelling is dropped too
+        main.run_until(lambda: False, timeout=0.2)
+        assert batches == [] and jobs == []
+        scanner.shutdown()
+
+    def test_missing_folder(self, tmp_path):
+        main = Main()
+        scanner = DirectoryScanner(main.dispatch)
+        job, batches, _ = scan(scanner, main, tmp_path / 'missing')
+        assert batches == [] and isinstance(job.error, FileNotFoundError)
+        scanner.shutdown()
+
+    def test_corrupt_index(self, tmp_path):
+        index_path = tmp_path / 'index.json'
+        index_path.write_text('{"version": 1, "dirs": {"/a": "oops"}')
+        assert DirectoryIndex(str(index_path)).lookup('/a', 0) is None
@@ -0,0 +1,130 @@
+"""Tests for the option schema registry."""
+
+import json
+import os
+
+import pytest
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.data_types import Color
+from app.modules.hyprparser.defaults import DEFAULTS, TABLE_PATH, from_descriptions, render_table
+from app.modules.hyprparser.manager import HyprDataManager
+from app.modules.hyprparser.patch import PatchError, apply_patch
+from app.modules.hyprparser.schema import OPTIONS, SECTIONS, VALIDATORS, get_spec, validate_option
+
+
+DESCRIPTIONS = os.path.join(os.path.dirname(__file__), 'fixtures', 'hyprctl_descriptions.json')
+
+
+class TestRegistry:
+    def test_every_option_has_a_validator(self):
+        assert VALIDATORS.keys() == OPTIONS.keys()
+        for path, spec in OPTIONS.items():
+            assert spec.path == path
+            if spec.default is not None and not spec.deprecated:
+                VALIDATORS[path](spec.default)
+
+    def test_specs(self):
+        spec = get_spec('gestures:workspace_swipe_fingers')
+        assert (spec.type, spec.default, spec.min) == ('int', 3, 2)
+        assert (spec.ui_min, spec.ui_max) == (2, 5)
+        assert get_spec('general:col.active_border').default == Color(255, 255, 255, 255)
+        assert get_spec('decoration:shadow:color').default.hex == '1A1A1AEE'
+        # Not in the generated table: falls back to decoration:shadow:color
+        assert get_spec('decoration:shadow:color_inactive').default is None
+        assert get_spec('plugin:foo:bar') is None
+        assert 'decoration' in SECTIONS
+
+    def test_deprecated(self):
+        spec = get_spec('decoration:drop_shadow')
+        assert spec.deprecated and spec.replaced_by == 'decoration:shadow:enabled'
+        assert spec.type == 'bool'
+        assert get_spec('dwindle:no_gaps_when_only').removed
+
+
+class TestValidators:
+    def test_bool(self):
+        assert validate_option('misc:vfr', True) is True
+        assert validate_option('misc:vfr', 0) == 0
+        with pytest.raises(ValueError, match='expects a boolean'):
+            validate_option('misc:vfr', 2)
+
+    def test_ranges(self):
+        assert validate_option('decoration:active_opacity', 1) == 1
+        with pytest.raises(ValueError, match=r'outside of \[0.0, 1.0\]'):
+            validate_option('decoration:active_opacity', 1.5)
+        with pytest.raises(ValueError, match=r'outside of \[0, \]'):
+            validate_option('general:border_size', -1)
+        with pytest.raises(ValueError, match='expects an integer'):
+            validate_option('general:border_size', 1.5)
+
+    def test_gaps(self):
+        assert validate_option('general:gaps_out', '5 10 5 10') == '5 10 5 10'
+        with pytest.raises(ValueError):
+            validate_option('general:gaps_out', '5 -10')
+        with pytest.raises(ValueError):
+            validate_option('general:gaps_out', 'wide')
+
+    def test_choices(self):
+        assert validate_option('general:layout', 'master') == 'master'
+        with pytest.raises(ValueError, match='must be one of'):
+            validate_option('general:layout', 'spiral')
+
+    def test_variables_and_unknown_options(self):
+        assert validate_option('general:border_size', '$border') == '$border'
+        assert validate_option('plugin:foo:bar', object) is object
+
+
+class TestConsumers:
+    def test_set_option_rejects_invalid_values(self, tmp_path):
+        data = HyprDataManager(str(tmp_path / 'hyprland.conf'))
+        assert data.set_option('general:border_size', 3)
+        assert not data.set_option('general:border_size', -3)
+        assert data.get_option('general:border_size').value == 3
+
+    def test_patch_rejects_invalid_values(self, tmp_path):
+        data = HyprDataManager(str(tmp_path / 'hyprland.conf'))
+        with pytest.raises(PatchError):
+            apply_patch(data, {'set': {'input:follow_mouse': 7}})
+
+    def test_cli(self, tmp_path, capsys):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text('general {\n    border_size = 1\n}\n')
+
+        assert main(['-c', str(config), 'set', 'general:border_size', '-2']) == 1
+        assert 'outside of' in capsys.readouterr().err
+
+        assert main(['describe', 'input:follow_mouse', '--json']) == 0
+        info = json.loads(capsys.readouterr().out)
+        assert (info['type'], info['default'], info['min'], info['max']) == ('int', 1, 0, 3)
+
+        assert main(['describe', 'decoration:drop_shadow']) == 0
+        assert 'replaced_by: decoration:shadow:enabled' in capsys.readouterr().out
+
+
+class TestDefaults:
+    def load_descriptions(self):
+        with open(DESCRIPTIONS) as f:
+            return json.load(f)
+
+    def test_table_is_generated_from_fixture(self):
+        values = from_descriptions(self.load_descriptions())
+        with open(TABLE_PATH) as f:
+            assert f.read() == render_table(values)
+        assert dict(DEFAULTS) == values
+
+    def test_table_is_frozen(self):
+        with pytest.raises(TypeError):
+            DEFAULTS['general:border_size'] = 2
+
+    def test_matches_registry(self):
+        for path, value in DEFAULTS.items():
+            spec = get_spec(path)
+            assert spec is not None and not spec.deprecated, path
+            assert spec.default == value and type(spec.default) is type(value), path
+
+    def test_value_types(self):
+        assert DEFAULTS['general:layout'] == 'dwindle'
+        assert DEFAULTS['decoration:shadow:color'] == Color(0x1A, 0x1A, 0x1A, 0xEE)
+        assert DEFAULTS['decoration:shadow:offset'] == '0 0'
+        assert DEFAULTS['misc:vfr'] is True
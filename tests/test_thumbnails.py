@@ -0,0 +1,200 @@
+"""Tests for the thumbnail cache and background loader."""
+
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+
+from app.modules.thumbnails import (
+    ByteLRU,
+    ThumbnailLoader,
+    file_uri,
+    is_current,
+    read_png_text,
+    size_name,
+    thumbnail_path,
+    thumbnail_text,
+)
+
+
+def chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def write_png(path, text):
+    """Write a 1x1 PNG with tEXt chunks, like GdkPixbuf saves thumbnails."""
+    chunks = [chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0))]
+    chunks += [chunk(b'tEXt', f'{key}\0{value}'.encode('latin-1')) for key, value in text.items()]
+    chunks += [chunk(b'IDAT', zlib.compress(b'\0\0\0\0')), chunk(b'IEND', b'')]
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n' + b''.join(chunks))
+
+
+class Main:
+    """Stands in for the main loop: dispatched functions run on `run()`."""
+
+    def __init__(self):
+        self.queue = []
+        self.lock = threading.Lock()
+
+    def dispatch(self, function):
+        with self.lock:
+            self.queue.append(function)
+
+    def run(self, count, timeout=5):
+        deadline = time.monotonic() + timeout
+        done = 0
+        while done < count and time.monotonic() < deadline:
+            with self.lock:
+                queued, self.queue = self.queue, []
+            for function in queued:
+                function()
+                done += 1
+            time.sleep(0.001)
+        return done
+
+
+class TestDiskCache:
+    def test_path(self, tmp_path):
+        uri = file_uri('/home/user/Pictures/a b.jpg')
+        assert uri == 'file:///home/user/Pictures/a%20b.jpg'
+        digest = hashlib.md5(uri.encode()).hexdigest()
+        assert thumbnail_path(uri, 256, str(tmp_path)) == str(tmp_path / 'large' / f'{digest}.png')
+        assert [size_name(size) for size in (64, 128, 200, 512, 4096)] == [
+            'normal', 'normal', 'large', 'x-large', 'xx-large',
+        ]
+
+    def test_validation(self, tmp_path):
+        thumbnail = tmp_path / 'thumb.png'
+        uri = 'file:///wallpapers/city.png'
+        write_png(thumbnail, thumbnail_text(uri, 1700000000.7, 1234))
+        assert read_png_text(str(thumbnail))['Thumb::Size'] == '1234'
+        assert is_current(str(thumbnail), uri, 1700000000)
+        # Image changed, or a different image with the same hash
+        assert not is_current(str(thumbnail), uri, 1700000001)
+        assert not is_current(str(thumbnail), 'file:///wallpapers/other.png', 1700000000)
+        assert not is_current(str(tmp_path / 'missing.png'), uri, 1700000000)
+
+        thumbnail.write_bytes(b'not a png')
+        assert read_png_text(str(thumbnail)) == {}
+
+
+class TestByteLRU:
+    def test_budget(self):
+        cache = ByteLRU(10)
+        cache.put('a', b'1234')
+        cache.put('b', b'1234')
+        assert cache.get('a') == b'1234'
+        cache.put('c', b'1234')
+        # b was used least recently
+        assert 'b' not in cache and 'a' in cache and cache.nbytes == 8
+        assert not cache.put('huge', b'x' * 11)
+        cache.put('a', b'1')
+        assert cache.nbytes == 5 and len(cache) == 2
+
+
+class TestLoader:
+    def test_shared_and_cached(self):
+        main = Main()
+        decoded = []
+
+        def decode(path, size):
+            decoded.append(path)
+            return path.encode() * size
+
+        loader = ThumbnailLoader(decode, main.dispatch, max_workers=2, max_bytes=1000)
+        results = []
+        assert loader.request('a', 2, results.append) is None
+        assert loader.request('a', 2, results.append) is None
+        assert main.run(1) == 1
+        assert results == [b'aa', b'aa'] and decoded == ['a']
+        assert loader.request('a', 2, results.append) == b'aa'
+        assert loader.pending == 0
+        loader.shutdown()
+
+    def test_failures_are_not_retried(self):
+        main = Main()
+        calls = []
+
+        def decode(path, size):
+            calls.append(path)
+            raise OSError('truncated file')
+
+        loader = ThumbnailLoader(decode, main.dispatch, max_workers=1)
+        results = []
+        loader.request('broken.jpg', 128, results.append)
+        main.run(1)
+        assert results == [None]
+        assert loader.request('broken.jpg', 128, results.append) is None
+        assert calls == ['broken.jpg'] and results == [None]
+        loader.shutdown()
+
+    def test_scrolled_out_of_view(self):
+        main = Main()
+        started = threading.Event()
+        release = threading.Event()
+        decoded = []
+
+        def decode(path, size):
+            if path == 'first':
+                started.set()
+                release.wait(5)
+            decoded.append(path)
+            return b'x'
+
+        loader = ThumbnailLoader(decode, main.dispatch, max_workers=1)
+        callbacks = {path: [] for path in ('first', 'a', 'b', 'c')}
+        loader.request('first', 128, callbacks['first'].append)
+        assert started.wait(5)
+        for path in ('a', 'b', 'c'):
+            loader.request(path, 128, callbacks[path].append)
+
+        # a and b leave the view while the only worker is busy
+        loader.cancel('a', 128, callbacks['a'].append)
+        loader.cancel('b', 128, callbacks['b'].append)
+        release.set()
+        main.run(2)
+        assert decoded == ['first', 'c']
+        assert callbacks == {'first': [b'x'], 'a': [], 'b': [], 'c': [b'x']}
+        loader.shutdown()
+
+    def test_cancel_keeps_other_requests(self):
+        main = Main()
+        loader = ThumbnailLoader(lambda path, size: b'x', main.dispatch, max_workers=1)
+        first, second = [], []
+        loader.request('a', 128, first.append)
+        loader.request('a', 128, second.append)
+        loader.cancel('a', 128, first.append)
+        main.run(1)
+        assert first == [] and second == [b'x']
+        loader.shutdown()
+
+    def test_many_images(self, tmp_path):
+        """Only the images still in view get decoded."""
+        main = Main()
+        decoded = []
+        gate = threading.Event()
+
+        def decode(path, size):
+            gate.wait(5)
+            decoded.append(path)
+            return b'x' * 1024
+
+        loader = ThumbnailLoader(decode, main.dispatch, max_workers=2, max_bytes=64 * 1024)
+        # Scroll through 5000 images, 20 visible at a time
+        visible = []
+        for i in range(5000):
+            path = os.path.join(str(tmp_path), f'{i}.jpg')
+            loader.request(path, 256, visible.append)
+            if i >= 20:
+                loader.cancel(os.path.join(str(tmp_path), f'{i - 20}.jpg'), 256, visible.append)
+        gate.set()
+        deadline = time.monotonic() + 5
+        while loader.pending and time.monotonic() < deadline:
+            main.run(1, timeout=0.1)
+        # The two images the workers had already picked up, and the last 20
+        assert 20 <= len(decoded) <= 22
+        assert loader.pending == 0 and loader.cache.nbytes <= 64 * 1024
+        loader.shutdown()
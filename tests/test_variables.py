@@ -0,0 +1,137 @@
+"""Tests for $variable expansion."""
+
+import pytest
+
+from app.modules.hyprparser.data_types import Color
+from app.modules.hyprparser.variables import VariableCycleError, VariableResolver
+
+
+CONFIG = """$accent = $red
+$mainMod = SUPER
+$terminal = kitty
+general {
+    col.active_border = rgba($accent)
+    gaps_in = $gap
+    border_size = 2
+}
+misc {
+    background_color = rgba($base)
+}
+bind = $mainMod SHIFT, Return, exec, $terminal -e btop
+$red = ff0000ee
+$gap = 4
+$base = 1e1e2eff
+"""
+
+
+class TestResolver:
+    def test_expansion_inside_values(self):
+        resolver = VariableResolver({'$mainMod': 'SUPER', '$terminal': 'kitty', '$accent': 'ff0000ee'})
+        assert resolver.expand('$mainMod SHIFT') == 'SUPER SHIFT'
+        assert resolver.expand('rgba($accent)') == 'rgba(ff0000ee)'
+        assert resolver.expand('$terminal -e btop') == 'kitty -e btop'
+        # Like Hyprland, the longest defined name a token starts with is used
+        assert resolver.expand('$mainModALT') == 'SUPERALT'
+        assert resolver.expand('$unknown, $mainMod') == '$unknown, SUPER'
+
+    def test_nested_variables(self):
+        resolver = VariableResolver({'$a': '$b $b', '$b': '$c-x', '$c': '1'})
+        assert resolver.resolve('$a') == '1-x 1-x'
+        assert resolver.dependents('$c') == {'$a', '$b'}
+
+        resolver.set('$c', '2')
+        assert resolver.resolve('$a') == '2-x 2-x'
+
+    def test_cycles(self):
+        resolver = VariableResolver({'$a': '$b', '$b': '$c', '$c': '$a'})
+        with pytest.raises(VariableCycleError) as info:
+            resolver.resolve('$a')
+        assert info.value.cycle == ['$a', '$b', '$c', '$a']
+
+        resolver = VariableResolver({'$a': '$b', '$b': '1'})
+        with pytest.raises(VariableCycleError):
+            resolver.set('$b', 'x$a')
+        # The previous definition is kept
+        assert resolver.definitions['$b'] == '1'
+        assert resolver.resolve('$a') == '1'
+
+    def test_only_users_are_reported(self):
+        resolver = VariableResolver({'$a': '1', '$b': '$a', '$c': '3'})
+        resolver.track('general:gaps_in', '$b')
+        resolver.track('general:gaps_out', '$c')
+        resolver.track('misc:vfr', '$aa')
+        assert resolver.set('$a', '2') == {'general:gaps_in', 'misc:vfr'}
+        assert resolver.set('$c', '5') == {'general:gaps_out'}
+        # Defining $aa changes what misc:vfr uses
+        assert resolver.set('$aa', '1') == {'misc:vfr'}
+        assert resolver.remove('$b') == {'general:gaps_in'}
+
+
+class TestParserVariables:
+    def test_values_are_expanded(self, load_config):
+        _, data = load_config(CONFIG)
+        border = data.get_option('general:col.active_border').value
+        assert isinstance(border, Color) and border.hex == 'FF0000EE'
+        assert data.get_value('general:gaps_in') == 4
+        assert data.parser.expand(data.parser.keywords[0].value) == 'SUPER SHIFT, Return, exec, kitty -e btop'
+
+    def test_save_keeps_references(self, load_config):
+        config, data = load_config(CONFIG)
+        data.set_option('general:border_size', 3)
+        data.set_option('misc:background_color', 'rgba($accent)')
+        assert data.save_all()
+        text = config.read_text()
+        assert 'col.active_border = rgba($accent)' in text
+        assert 'gaps_in = $gap' in text
+        assert 'background_color = rgba($accent)' in text
+
+    def test_set_variable_re_resolves_dependents(self, load_config):
+        _, data = load_config(CONFIG)
+        seen = []
+        for path in ('general:col.active_border', 'general:gaps_in', 'misc:background_color'):
+            data.watch_option(path, lambda path, setting: seen.append((path, setting.value)))
+
+        assert data.set_variable('$red', '00ff00ff') == ['general:col.active_border']
+        assert [(path, value.hex) for path, value in seen] == [('general:col.active_border', '00FF00FF')]
+        assert data.get_value('general:col.active_border').hex == '00FF00FF'
+        assert data.variable_users('$red') == ['general:col.active_border']
+        assert data.dirty
+
+        # A changed definition that expands to the same value changes nothing
+        assert data.set_variable('$four', '4') == []
+        assert data.set_variable('$gap', '$four') == []
+
+        with pytest.raises(VariableCycleError):
+            data.set_variable('$red', '$accent')
+        assert data.resolve_variable('$accent') == '00ff00ff'
+        with pytest.raises(ValueError):
+            data.set_variable('red', '1')
+
+    def test_invalid_dependent_rolls_back(self, load_config):
+        _, data = load_config(CONFIG)
+        seen = []
+        data.watch_option('general:gaps_in', lambda path, setting: seen.append(setting.value))
+
+        with pytest.raises(ValueError):
+            data.set_variable('$gap', 'abc')
+        assert data.get_value('general:gaps_in') == 4
+        assert data.variables['$gap'] == '4'
+        assert seen == []
+
+        # A new variable that an option already uses is removed again
+        _, data = load_config('general {\n    gaps_in = $outer\n}\n')
+        with pytest.raises(ValueError):
+            data.set_variable('$outer', 'abc')
+        assert '$outer' not in data.variables
+        assert data.get_option('general:gaps_in').raw == '$outer'
+
+    def test_cycles_do_not_become_values(self, load_config):
+        config, data = load_config('$a = $b\n$b = $a\ngeneral {\n    gaps_in = $a\n}\n')
+        assert data.get_option('general:gaps_in').value is None
+        assert not data.set_option('general:gaps_out', '$a')
+        assert data.get_option('general:gaps_out') is None
+
+        # The line is written back as it was
+        assert data.set_option('general:border_size', 3)
+        assert data.save_all()
+        assert 'gaps_in = $a' in config.read_text()
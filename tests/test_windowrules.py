@@ -0,0 +1,163 @@
+"""Tests for window rule parsing and matching."""
+
+import json
+import os
+
+import pytest
+
+from app.modules.hyprparser.cli import main
+from app.modules.hyprparser.data_types import Keyword
+from app.modules.hyprparser.windowrules import (
+    WindowRuleSet,
+    literal_names,
+    load_clients,
+    parse_window_rule,
+)
+
+
+CLIENTS = os.path.join(os.path.dirname(__file__), 'fixtures', 'hyprctl_clients.json')
+
+CONFIG = """$term = kitty
+windowrulev2 = opacity 0.9 0.8, class:^($term)$
+windowrulev2 = float, class:^(org\\.gnome\\.Nautilus|pavucontrol)$
+windowrulev2 = pin, class:firefox, title:^(Picture-in-Picture)$
+windowrulev2 = size 640 360, tag:video
+windowrulev2 = immediate, class:^(steam_app_\\d+)$, fullscreen:1
+windowrulev2 = noblur, xwayland:1, workspace:name:special:magic
+windowrulev2 = bordersize 0, floating:0, focus:1
+windowrulev2 = dimaround, class:negative:^(kitty|firefox)$, floating:1
+windowrule = workspace 2, firefox
+windowrulev2 = float, onworkspace:w[tv1]
+windowrulev2 = float, class:^(broken
+source = ./rules.conf
+"""
+
+SOURCED = """windowrulev2 = rounding 0, title:^(.*ELDEN RING.*)$
+"""
+
+
+def rule(value, name='windowrulev2'):
+    return parse_window_rule(Keyword(name, value))
+
+
+@pytest.fixture
+def clients():
+    with open(CLIENTS, 'r', encoding='utf-8') as f:
+        return load_clients(f.read())
+
+
+def many_rules(clients):
+    """1000 rules of every kind, and 500 windows to match them against."""
+    rules = WindowRuleSet()
+    for i in range(1000):
+        if i % 4 == 0:
+            rules.add(rule(f'opacity 0.9, class:^(app{i}|app{i}-beta)$'))
+        elif i % 4 == 1:
+            rules.add(rule(f'float, class:org\\.example\\.App{i}, title:^(Settings)$'))
+        elif i % 4 == 2:
+            rules.add(rule(f'size 800 600, title:^(.*Window {i}.*)$, floating:1'))
+        else:
+            rules.add(rule(f'workspace {i % 10}, initialClass:^(tool{i})$'))
+    windows = []
+    for i in range(500):
+        window = dict(clients[i % len(clients)])
+        window['class'] = f'app{i * 4}' if i % 2 else window['class']
+        window['title'] = f'Window {i}'
+        window['address'] = f'0x{i:x}'
+        windows.append(window)
+    return rules, windows
+
+
+class TestParsing:
+    def test_props(self):
+        parsed = rule('opacity 0.9 0.8, class:^(kitty)$, title:negative:^(vim, nano)$, floating:0')
+        assert parsed.effect == 'opacity 0.9 0.8'
+        # The comma inside the title regex does not start a new property
+        assert [str(m) for m in parsed.matchers] == [
+            'class:^(kitty)$', 'title:negative:^(vim, nano)$', 'floating:0',
+        ]
+        assert parsed.classes == {'kitty'}
+
+    def test_old_syntax(self):
+        assert [str(m) for m in rule('float, ^(pavucontrol)$', 'windowrule').matchers] == ['class:^(pavucontrol)$']
+        assert [str(m) for m in rule('float, title:Open File', 'windowrule').matchers] == ['title:Open File']
+        assert [str(m) for m in rule('float, class:a, title:b', 'windowrule').matchers] == ['class:a', 'title:b']
+
+    def test_invalid(self):
+        for value in ('float', 'float, ', 'float, size:2', 'float, class:^(a'):
+            with pytest.raises(ValueError):
+                rule(value)
+
+    def test_literal_names(self):
+        assert literal_names('^(kitty|foot)$') == {'kitty', 'foot'}
+        assert literal_names('org\\.gnome\\.Nautilus') == {'org.gnome.Nautilus'}
+        assert literal_names('^(?:firefox)$') == {'firefox'}
+        assert literal_names('^(steam_app_\\d+)$') is None
+        assert literal_names('kitty.*') is None
+
+    def test_patterns_are_compiled_once(self):
+        assert rule('float, class:^(kitty)$').matchers[0].regex is rule('tile, class:^(kitty)$').matchers[0].regex
+
+
+class TestMatching:
+    def test_snapshot(self, tmp_path, clients, load_config):
+        _, data = load_config(CONFIG, {'rules.conf': SOURCED})
+        rules = data.window_rules
+        assert len(rules) == 11
+        [(keyword, error)] = rules.errors
+        assert keyword.line == 12 and 'Invalid regex' in error
+        assert rules.rules[-1].source == str(tmp_path / 'rules.conf')
+
+        matches = rules.match_clients(clients)
+        effects = {
+            client['class']: [rule.effect for rule in matches[client['address']]] for client in clients
+        }
+        assert effects == {
+            'kitty': ['opacity 0.9 0.8', 'bordersize 0'],
+            'firefox': ['pin', 'size 640 360', 'workspace 2'],
+            'org.gnome.Nautilus': ['float', 'dimaround'],
+            'steam_app_1245620': ['immediate', 'noblur', 'rounding 0'],
+        }
+
+    def test_fullscreen_and_unsupported(self, clients):
+        game = clients[3]
+        assert not rule('immediate, class:^(steam_app_\\d+)$, fullscreen:0').matches(game)
+        assert rule('immediate, fullscreenstate:2 *').matches(game)
+        # Needs the workspace's window count, which a snapshot does not have
+        unsupported = rule('float, onworkspace:w[tv1]')
+        assert unsupported.unsupported == ['onworkspace'] and not unsupported.matches(game)
+
+    def test_prefilter_keeps_config_order(self, clients):
+        rules = WindowRuleSet([
+            rule('float, title:.*'),
+            rule('tile, class:^(kitty)$'),
+            rule('pin, class:kitty.*'),
+            rule('center, class:^(kitty|foot)$'),
+        ])
+        assert [r.effect for r in rules.candidates(clients[1])] == ['float', 'pin']
+        assert [r.effect for r in rules.match(clients[0])] == ['float', 'tile', 'pin', 'center']
+
+    def test_many_rules(self, clients):
+        rules, windows = many_rules(clients)
+        matches = rules.match_clients(windows)
+        assert [r.effect for r in matches['0x1']] == ['opacity 0.9']
+
+    @pytest.mark.benchmark
+    def test_matching_time(self, clients, timed):
+        rules, windows = many_rules(clients)
+        timed(f'matching {len(rules)} rules against {len(windows)} windows',
+              lambda: rules.match_clients(windows), 2)
+
+
+class TestCommand:
+    def test_rules(self, tmp_path, capsys):
+        config = tmp_path / 'hyprland.conf'
+        config.write_text(CONFIG)
+
+        assert main(['-c', str(config), 'rules', '--clients', CLIENTS, '--json']) == 0
+        output = capsys.readouterr()
+        matched = json.loads(output.out)
+        assert [entry['line'] for entry in matched['0x55d1c2a0e1b0']] == [2, 8]
+        assert 'Invalid regex' in output.err
+
+        assert main(['-c', str(config), 'rules', '--clients', str(tmp_path / 'missing.json')]) == 1
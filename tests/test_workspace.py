@@ -0,0 +1,108 @@
+"""Tests for the hyprland/hypridle/hyprlock/hyprpaper workspace."""
+
+import os
+
+from app.modules.hyprparser.workspace import HyprWorkspace
+
+
+HYPRLAND = """general {
+    gaps_in = 5
+}
+"""
+
+HYPRIDLE = """general {
+    lock_cmd = pidof hyprlock || hyprlock
+    ignore_dbus_inhibit = false
+}
+
+listener {
+    timeout = 150
+    on-timeout = brightnessctl -s set 10
+    on-resume = brightnessctl -r
+}
+
+listener {
+    timeout = 300
+    on-timeout = loginctl lock-session
+}
+"""
+
+HYPRPAPER = """preload = ~/Pictures/a.jpg
+preload = ~/Pictures/b.png
+wallpaper = DP-1,~/Pictures/a.jpg
+wallpaper = ,~/Pictures/b.png
+splash = false
+"""
+
+
+def make_workspace(tmp_path):
+    (tmp_path / 'hyprland.conf').write_text(HYPRLAND)
+    (tmp_path / 'hypridle.conf').write_text(HYPRIDLE)
+    (tmp_path / 'hyprpaper.conf').write_text(HYPRPAPER)
+    workspace = HyprWorkspace(str(tmp_path))
+    return workspace, workspace.load()
+
+
+class TestWorkspace:
+    def test_load(self, tmp_path):
+        workspace, loaded = make_workspace(tmp_path)
+        assert loaded == {'hyprland': True, 'hypridle': True, 'hyprlock': True, 'hyprpaper': True}
+        assert workspace.get_value('general:gaps_in') == 5
+        assert workspace.get_value('hypridle:general:lock_cmd') == 'pidof hyprlock || hyprlock'
+        assert workspace.get_value('hyprpaper:splash') is False
+        # Missing file: the tool's defaults, and nothing is created
+        assert workspace.get_value('hyprlock:general:fail_timeout') == 2000
+        assert not (tmp_path / 'hyprlock.conf').exists()
+
+    def test_route(self, tmp_path):
+        workspace, _ = make_workspace(tmp_path)
+        assert workspace.route('hypridle:general:lock_cmd') == (workspace.manager('hypridle'), 'general:lock_cmd')
+        assert workspace.route('general:gaps_in') == (workspace.hyprland, 'general:gaps_in')
+        # Unknown prefixes are hyprland sections
+        assert workspace.route('decoration:blur:size') == (workspace.hyprland, 'decoration:blur:size')
+
+    def test_options_go_to_their_file(self, tmp_path):
+        workspace, _ = make_workspace(tmp_path)
+        hyprland = (tmp_path / 'hyprland.conf').read_text()
+        assert workspace.set_option('hypridle:general:ignore_dbus_inhibit', True)
+        assert workspace.dirty_files() == ['hypridle']
+
+        assert workspace.save_all()
+        assert (tmp_path / 'hyprland.conf').read_text() == hyprland
+        assert 'ignore_dbus_inhibit = yes' in (tmp_path / 'hypridle.conf').read_text()
+        assert not (tmp_path / 'hyprlock.conf').exists()
+        assert not workspace.dirty
+
+    def test_blocks_and_keywords_are_kept(self, tmp_path):
+        workspace, _ = make_workspace(tmp_path)
+        idle = workspace.manager('hypridle')
+        [_, lock] = idle.get_blocks('listener')
+        idle.set_block_option(lock.id, 'timeout', 600)
+        workspace.set_option('hyprpaper:splash', True)
+        assert workspace.save_all()
+
+        reloaded = HyprWorkspace(str(tmp_path))
+        reloaded.load()
+        listeners = reloaded.manager('hypridle').get_blocks('listener')
+        assert [block.get('timeout') for block in listeners] == [150, 600]
+        assert listeners[0].get('on-resume') == 'brightnessctl -r'
+        text = (tmp_path / 'hyprpaper.conf').read_text()
+        assert text.count('preload = ') == 2 and 'wallpaper = ,~/Pictures/b.png' in text
+        assert 'splash = yes' in text and 'general' not in text
+
+    def test_sync_and_conflicts(self, tmp_path):
+        workspace, _ = make_workspace(tmp_path)
+        path = tmp_path / 'hypridle.conf'
+        assert os.path.abspath(str(path)) in workspace.watched_paths()
+
+        workspace.set_option('hypridle:general:lock_cmd', 'hyprlock')
+        path.write_text(HYPRIDLE.replace('pidof hyprlock || hyprlock', 'swaylock'))
+        workspace.sync_file(str(path))
+        assert workspace.conflicts == {'hypridle:general:lock_cmd'}
+
+    def test_preview_save(self, tmp_path):
+        workspace, _ = make_workspace(tmp_path)
+        workspace.set_option('general:gaps_in', 8)
+        workspace.set_option('hypridle:general:ignore_dbus_inhibit', True)
+        keys = {str(edit.key) for edit in workspace.preview_save().settings}
+        assert keys == {'general:gaps_in', 'hypridle:general:ignore_dbus_inhibit'}